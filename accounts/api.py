@@ -1913,13 +1913,16 @@ def whoami(request, user_id: int):
         user_id = request.user.id
 
     try:
-        user = User.objects.get(id=user_id)
-        profile, _ = Profile.objects.get_or_create(user=user)
+        # Profile and materialized stats come back in the same query;
+        # the fallbacks only run for accounts that predate them
+        user = User.objects.select_related("profile", "stats").get(id=user_id)
+        try:
+            profile = user.profile
+        except Profile.DoesNotExist:
+            profile, _ = Profile.objects.get_or_create(user=user)
 
-        # [SUCCESS] Profile picture
-        from accounts.models import ProfilePicture
-        active_pic = ProfilePicture.objects.filter(profile=profile, is_active=True).first()
-        pic_url = active_pic.image.url if active_pic and active_pic.image else ""
+        from accounts.user_stats import get_user_stats
+        stats = get_user_stats(user)
 
         # [SUCCESS] Account details (if exist)
         account_details = None
@@ -1931,40 +1934,6 @@ def whoami(request, user_id: int):
                 "account_holder": profile.account_details.get("account_holder", user.get_full_name()),
             }
 
-        # [SUCCESS] Calculate real statistics
-        from jobs.models import Job, Application
-        from django.db.models import Count, Q
-
-        # Job statistics (for clients)
-        jobs_posted = Job.objects.filter(client=user)
-        total_jobs_posted = jobs_posted.count()
-        total_completed_jobs = jobs_posted.filter(status=Job.Status.COMPLETED).count()
-        total_cancelled_jobs = jobs_posted.filter(status=Job.Status.CANCELED).count()
-
-        # Workers engaged (unique applicants who applied to client's jobs)
-        total_workers_engaged = Application.objects.filter(
-            job__client=user
-        ).values('applicant').distinct().count()
-
-        # Activity statistics (for applicants)
-        applications = Application.objects.filter(applicant=user)
-        total_applied_jobs = applications.count()
-
-        # Employers worked with (unique clients whose jobs the user applied to and got accepted)
-        total_employers_worked_with = applications.filter(
-            status=Application.Status.ACCEPTED
-        ).values('job__client').distinct().count()
-
-        # Get actual rating from profile
-        actual_rating = profile.rating if profile else 5.0
-
-        # Get review count
-        try:
-            from rating.models import Review
-            review_count = Review.objects.filter(reviewed=user).count()
-        except ImportError:
-            review_count = 0
-
         response = {
             "user_id": int(user.id),
             "username": str(user.username),
@@ -1977,18 +1946,18 @@ def whoami(request, user_id: int):
             "role": str(getattr(profile, 'role', 'client')),
             "wallet_balance": str(get_wallet_balance(user)),
             "badges": list(getattr(profile, 'badges', []) or []),
-            "profile_pic_url": str(pic_url),
-            "rating": float(actual_rating),
-            "review_count": int(review_count),
+            "profile_pic_url": str(stats.profile_pic_url),
+            "rating": stats.rating_for(profile),
+            "review_count": int(stats.review_count),
             "job_stats": {
-                "total_jobs_posted": total_jobs_posted,
-                "total_workers_engaged": total_workers_engaged,
-                "total_completed_jobs": total_completed_jobs,
-                "total_cancelled_jobs": total_cancelled_jobs,
+                "total_jobs_posted": stats.total_jobs_posted,
+                "total_workers_engaged": stats.total_workers_engaged,
+                "total_completed_jobs": stats.total_completed_jobs,
+                "total_cancelled_jobs": stats.total_cancelled_jobs,
             },
             "activity_stats": {
-                "total_applied_jobs": total_applied_jobs,
-                "total_employers_worked_with": total_employers_worked_with,
+                "total_applied_jobs": stats.total_applied_jobs,
+                "total_employers_worked_with": stats.total_employers_worked_with,
             },
             # [SUCCESS] Include account details
             "account_details": account_details,
@@ -0,0 +1,73 @@
+import logging
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from accounts.models import UserStats
+from accounts.user_stats import STATS_FIELDS, compute_user_stats, refresh_user_stats
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the materialized per-user statistics read by whoami'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            help='Rebuild only a specific user by ID',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Users aggregated per batch',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report rows that have drifted without writing them',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        users = User.objects.order_by('id')
+        if options.get('user_id'):
+            users = users.filter(id=options['user_id'])
+
+        started = time.time()
+        processed = drifted = 0
+        last_id = 0
+        # Walk users by primary key so each batch is an index range scan
+        while True:
+            user_ids = list(users.filter(id__gt=last_id).values_list('id', flat=True)[:batch_size])
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+
+            if options['dry_run']:
+                drifted += self._count_drift(user_ids)
+            else:
+                refresh_user_stats(user_ids, batch_size=batch_size)
+            processed += len(user_ids)
+
+        elapsed = time.time() - started
+        if options['dry_run']:
+            self.stdout.write(
+                self.style.WARNING(f'Dry run: {drifted} of {processed} users have stale or missing stats')
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt stats for {processed} users in {elapsed:.2f}s'))
+
+    def _count_drift(self, user_ids):
+        stored = {stats.user_id: stats for stats in UserStats.objects.filter(user_id__in=user_ids)}
+        drifted = 0
+        for fresh in compute_user_stats(user_ids):
+            current = stored.get(fresh.user_id)
+            if current is None or any(getattr(current, f) != getattr(fresh, f) for f in STATS_FIELDS):
+                drifted += 1
+        return drifted
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-16 20:20
+
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_temporaryotp'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_jobs_posted', models.PositiveIntegerField(default=0)),
+                ('total_completed_jobs', models.PositiveIntegerField(default=0)),
+                ('total_cancelled_jobs', models.PositiveIntegerField(default=0)),
+                ('total_workers_engaged', models.PositiveIntegerField(default=0)),
+                ('total_applied_jobs', models.PositiveIntegerField(default=0)),
+                ('total_employers_worked_with', models.PositiveIntegerField(default=0)),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('average_rating', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=3)),
+                ('profile_pic_url', models.CharField(blank=True, default='', max_length=500)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'user statistics',
+                'verbose_name_plural': 'user statistics',
+            },
+        ),
+    ]
@@ -873,3 +873,51 @@ class ProfilePicture(models.Model):
     @property
     def url(self):
         return self.image.url if self.image else None
+
+
+class UserStats(models.Model):
+    """
+    Materialized per-user counters shown by the whoami endpoint.
+
+    Rows are refreshed from the Job, Application, Review, Payment and
+    ProfilePicture signal handlers (see accounts.user_stats) so reading a
+    profile costs one query regardless of account history. The
+    ``rebuild_user_stats`` command recomputes them in bulk.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+
+    # Client side
+    total_jobs_posted = models.PositiveIntegerField(default=0)
+    total_completed_jobs = models.PositiveIntegerField(default=0)
+    total_cancelled_jobs = models.PositiveIntegerField(default=0)
+    total_workers_engaged = models.PositiveIntegerField(default=0)
+
+    # Applicant side
+    total_applied_jobs = models.PositiveIntegerField(default=0)
+    total_employers_worked_with = models.PositiveIntegerField(default=0)
+
+    # Reviews received
+    review_count = models.PositiveIntegerField(default=0)
+    average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=Decimal("0.00"))
+
+    profile_pic_url = models.CharField(max_length=500, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("user statistics")
+        verbose_name_plural = _("user statistics")
+
+    def __str__(self):
+        return f"Stats for user {self.user_id}"
+
+    def rating_for(self, profile):
+        """Review average, falling back to the profile's manual rating like Profile.rating."""
+        if self.average_rating and self.average_rating > 0:
+            return float(self.average_rating)
+        return float(profile.manual_rating) if profile and profile.manual_rating else 0.0
@@ -1,7 +1,7 @@
 # Django Imports
 from django.contrib.auth import get_user_model
 from django.db import connection, transaction
-from django.db.models.signals import post_save, post_migrate
+from django.db.models.signals import post_delete, post_save, post_migrate
 from django.dispatch import receiver
 import logging
 from decimal import Decimal
@@ -11,7 +11,8 @@ from allauth.account.signals import user_signed_up
 
 # Local Imports
 from payment.models import Wallet
-from .models import Role, Profile, CustomUser
+from .models import Role, Profile, CustomUser, ProfilePicture
+from .user_stats import schedule_stats_refresh
 
 logger = logging.getLogger(__name__)
 
@@ -211,3 +212,53 @@ def populate_social_profile(request, user, **kwargs):
 
         except Exception as e:
             logger.error(f"Error in populate_social_profile for {user.email}: {str(e)}")
+
+
+# ==
+# Materialized whoami statistics (accounts.user_stats)
+# ==
+# Senders are given as "app_label.Model" strings so this module does not
+# import the jobs, rating and payment models at load time.
+
+@receiver(post_save, sender="jobs.Job")
+@receiver(post_delete, sender="jobs.Job")
+def refresh_stats_on_job_change(sender, instance, **kwargs):
+    """Job counts by status belong to the client."""
+    schedule_stats_refresh(instance.client_id)
+
+
+@receiver(post_save, sender="jobs.Application")
+@receiver(post_delete, sender="jobs.Application")
+def refresh_stats_on_application_change(sender, instance, **kwargs):
+    """Applications count for the applicant and as workers engaged for the job's client."""
+    try:
+        client_id = instance.job.client_id
+    except Exception:
+        client_id = None
+    schedule_stats_refresh(instance.applicant_id, client_id)
+
+
+@receiver(post_save, sender="rating.Review")
+@receiver(post_delete, sender="rating.Review")
+def refresh_stats_on_review_change(sender, instance, **kwargs):
+    schedule_stats_refresh(instance.reviewed_id)
+
+
+@receiver(post_save, sender="payment.Payment")
+def refresh_stats_on_payment(sender, instance, **kwargs):
+    """
+    A paid payment moves its job's status with a queryset update, which
+    bypasses the Job handlers above, so refresh the client from here.
+    """
+    if instance.status == "paid" and instance.job_id:
+        schedule_stats_refresh(instance.job.client_id)
+
+
+@receiver(post_save, sender=ProfilePicture)
+@receiver(post_delete, sender=ProfilePicture)
+def refresh_stats_on_picture_change(sender, instance, **kwargs):
+    try:
+        user_id = instance.profile.user_id
+    except Profile.DoesNotExist:
+        return
+    schedule_stats_refresh(user_id)
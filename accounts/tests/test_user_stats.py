@@ -0,0 +1,123 @@
+"""
+Tests for the materialized per-user statistics behind whoami.
+"""
+from datetime import time, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.api import whoami
+from accounts.models import Profile, UserStats
+from jobs.models import Application, Job
+from rating.models import Review
+
+User = get_user_model()
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def make_user(username, role):
+    user = User.objects.create_user(
+        username=username, email=f"{username}@example.com", password="testpass123"
+    )
+    Profile.objects.update_or_create(user=user, defaults={"role": role})
+    return user
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class UserStatsTests(TestCase):
+
+    def setUp(self):
+        self.client_user = make_user("statsclient", "client")
+        self.applicants = [make_user(f"statsapplicant{i}", "applicant") for i in range(3)]
+
+    def make_job(self, **extra):
+        today = timezone.now().date()
+        return Job.objects.create(
+            client=self.client_user,
+            created_by=self.client_user,
+            title="Stats job",
+            description="Shift",
+            location="Lagos",
+            latitude=Decimal("6.450000"),
+            longitude=Decimal("3.400000"),
+            start_date=today + timedelta(days=1),
+            end_date=today + timedelta(days=1),
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            shift_type="day",
+            rate=Decimal("1500.00"),
+            **extra,
+        )
+
+    def build_history(self):
+        jobs = [self.make_job() for _ in range(3)]
+        Job.objects.filter(pk=jobs[1].pk).update(status=Job.Status.COMPLETED)
+        Job.objects.filter(pk=jobs[2].pk).update(status=Job.Status.CANCELED)
+        Application.objects.create(job=jobs[0], applicant=self.applicants[0], status=Application.Status.ACCEPTED)
+        Application.objects.create(job=jobs[1], applicant=self.applicants[0], status=Application.Status.ACCEPTED)
+        Application.objects.create(job=jobs[1], applicant=self.applicants[1], status=Application.Status.PENDING)
+        Review.objects.create(reviewer=self.applicants[0], reviewed=self.client_user, job=jobs[0], rating=4)
+        Review.objects.create(reviewer=self.applicants[1], reviewed=self.client_user, job=jobs[1], rating=5)
+        return jobs
+
+    def call_whoami(self, user):
+        response = whoami(RequestFactory().get("/whoami"), user.id)
+        self.assertEqual(response[0], 200)
+        return response[1]
+
+    def test_signals_keep_stats_current(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.build_history()
+        with self.captureOnCommitCallbacks(execute=True):
+            # Statuses written through the ORM save path are picked up too
+            job = Job.objects.filter(client=self.client_user, status=Job.Status.PENDING).first()
+            job.status = Job.Status.COMPLETED
+            job.save()
+
+        client_stats = UserStats.objects.get(user=self.client_user)
+        self.assertEqual(client_stats.total_jobs_posted, 3)
+        self.assertEqual(client_stats.total_completed_jobs, 2)
+        self.assertEqual(client_stats.total_cancelled_jobs, 1)
+        self.assertEqual(client_stats.total_workers_engaged, 2)
+        self.assertEqual(client_stats.review_count, 2)
+        self.assertEqual(client_stats.average_rating, Decimal("4.50"))
+
+        applicant_stats = UserStats.objects.get(user=self.applicants[0])
+        self.assertEqual(applicant_stats.total_applied_jobs, 2)
+        self.assertEqual(applicant_stats.total_employers_worked_with, 1)
+
+    def test_whoami_query_count_is_independent_of_history(self):
+        fresh = make_user("statsfresh", "client")
+        self.call_whoami(fresh)
+        with CaptureQueriesContext(connection) as empty:
+            self.call_whoami(fresh)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.build_history()
+        with CaptureQueriesContext(connection) as busy:
+            data = self.call_whoami(self.client_user)
+
+        self.assertEqual(len(busy.captured_queries), len(empty.captured_queries))
+        self.assertEqual(data.job_stats["total_jobs_posted"], 3)
+        self.assertEqual(data.review_count, 2)
+        self.assertEqual(data.rating, 4.5)
+
+    def test_rebuild_command_repairs_drift(self):
+        # Without the commit callbacks no stats are written
+        self.build_history()
+        self.assertFalse(UserStats.objects.filter(user=self.client_user).exists())
+
+        call_command("rebuild_user_stats", batch_size=2, stdout=StringIO())
+
+        self.assertEqual(UserStats.objects.count(), User.objects.count())
+        client_stats = UserStats.objects.get(user=self.client_user)
+        self.assertEqual(client_stats.total_jobs_posted, 3)
+        self.assertEqual(client_stats.total_cancelled_jobs, 1)
+        self.assertEqual(UserStats.objects.get(user=self.applicants[1]).total_applied_jobs, 1)
@@ -26,6 +26,7 @@ from django.db.models import Avg, Count, Q, Sum
 from django.utils import timezone
 
 from accounts.models import UserActivityLog
+from core.write_behind import write_behind
 from gamification.models import UserActivity, UserPoints
 
 User = get_user_model()
@@ -55,10 +56,10 @@ def track_user_login(user: User, ip_address: Optional[str] = None) -> None:
         ip_address: Optional IP address
     """
     try:
-        # Record login activity
-        UserActivityLog.objects.create(
+        # Record login activity (batched when write-behind is enabled)
+        write_behind.add(UserActivityLog(
             user=user, activity_type=LOGIN_ACTIVITY, ip_address=ip_address
-        )
+        ))
 
         # Record in gamification system
         UserActivity.objects.create(
@@ -145,10 +146,10 @@ def track_user_activity(
         points: Gamification points to award
     """
     try:
-        # Record activity in log
-        UserActivityLog.objects.create(
+        # Record activity in log (batched when write-behind is enabled)
+        write_behind.add(UserActivityLog(
             user=user, activity_type=activity_type, ip_address=ip_address
-        )
+        ))
 
         # Record in gamification system if points are awarded
         if points > 0:
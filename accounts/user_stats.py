@@ -0,0 +1,178 @@
+"""
+Maintenance of the materialized ``UserStats`` rows read by whoami.
+
+Distinct counts (workers engaged, employers worked with) and the review
+average cannot be adjusted with a simple ``F() + 1``, so a change recomputes
+the affected users' rows with a handful of grouped aggregates instead. Work
+is deferred to ``transaction.on_commit`` and coalesced per thread: a request
+that saves many applications refreshes each touched user once, after the
+data it depends on is visible.
+
+Usage:
+    from accounts.user_stats import schedule_stats_refresh
+    schedule_stats_refresh(job.client_id)
+"""
+
+import logging
+import threading
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+
+from .models import ProfilePicture, UserStats
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+STATS_FIELDS = (
+    "total_jobs_posted",
+    "total_completed_jobs",
+    "total_cancelled_jobs",
+    "total_workers_engaged",
+    "total_applied_jobs",
+    "total_employers_worked_with",
+    "review_count",
+    "average_rating",
+    "profile_pic_url",
+)
+
+_pending = threading.local()
+
+
+def compute_user_stats(user_ids):
+    """Build unsaved ``UserStats`` rows for ``user_ids`` with one grouped query per source."""
+    from jobs.models import Application, Job
+    from rating.models import Review
+
+    user_ids = list(User.objects.filter(id__in=set(user_ids)).values_list("id", flat=True))
+    stats = {user_id: UserStats(user_id=user_id) for user_id in user_ids}
+    if not stats:
+        return []
+
+    jobs = (
+        Job.objects.filter(client_id__in=user_ids)
+        .values("client_id")
+        .annotate(
+            posted=Count("id"),
+            completed=Count("id", filter=Q(status=Job.Status.COMPLETED)),
+            cancelled=Count("id", filter=Q(status=Job.Status.CANCELED)),
+        )
+        .order_by()
+    )
+    for row in jobs:
+        row_stats = stats[row["client_id"]]
+        row_stats.total_jobs_posted = row["posted"]
+        row_stats.total_completed_jobs = row["completed"]
+        row_stats.total_cancelled_jobs = row["cancelled"]
+
+    workers = (
+        Application.objects.filter(job__client_id__in=user_ids)
+        .values("job__client_id")
+        .annotate(workers=Count("applicant", distinct=True))
+        .order_by()
+    )
+    for row in workers:
+        stats[row["job__client_id"]].total_workers_engaged = row["workers"]
+
+    applications = (
+        Application.objects.filter(applicant_id__in=user_ids)
+        .values("applicant_id")
+        .annotate(
+            applied=Count("id"),
+            employers=Count("job__client", distinct=True, filter=Q(status=Application.Status.ACCEPTED)),
+        )
+        .order_by()
+    )
+    for row in applications:
+        row_stats = stats[row["applicant_id"]]
+        row_stats.total_applied_jobs = row["applied"]
+        row_stats.total_employers_worked_with = row["employers"]
+
+    reviews = (
+        Review.objects.filter(reviewed_id__in=user_ids)
+        .values("reviewed_id")
+        .annotate(count=Count("id"), average=Avg("rating"))
+        .order_by()
+    )
+    for row in reviews:
+        row_stats = stats[row["reviewed_id"]]
+        row_stats.review_count = row["count"]
+        if row["average"] is not None:
+            # Same rounding as Review.get_average_rating
+            row_stats.average_rating = Decimal(str(row["average"])).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+
+    # Newest active picture wins, as ProfilePicture's default ordering does
+    storage = ProfilePicture._meta.get_field("image").storage
+    pictures = (
+        ProfilePicture.objects.filter(profile__user_id__in=user_ids, is_active=True)
+        .exclude(image="")
+        .values_list("profile__user_id", "image")
+        .order_by("profile__user_id", "-uploaded_at", "-id")
+    )
+    seen = set()
+    for user_id, image in pictures:
+        if user_id not in seen:
+            seen.add(user_id)
+            stats[user_id].profile_pic_url = storage.url(image)
+
+    return list(stats.values())
+
+
+def refresh_user_stats(user_ids, batch_size=1000):
+    """Recompute and upsert the stats rows of ``user_ids``. Returns the number of rows written."""
+    user_ids = [user_id for user_id in set(user_ids) if user_id]
+    written = 0
+    for start in range(0, len(user_ids), batch_size):
+        rows = compute_user_stats(user_ids[start:start + batch_size])
+        UserStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=[*STATS_FIELDS, "updated_at"],
+        )
+        written += len(rows)
+    return written
+
+
+def get_user_stats(user):
+    """The stats row for ``user``, materializing it on first access."""
+    try:
+        return user.stats
+    except UserStats.DoesNotExist:
+        refresh_user_stats([user.id])
+        return UserStats.objects.get(user_id=user.id)
+
+
+def _flush_pending():
+    user_ids = getattr(_pending, "user_ids", None)
+    _pending.user_ids = set()
+    if not user_ids:
+        return
+    try:
+        refresh_user_stats(user_ids)
+    except Exception as e:
+        # Stale counters are repaired by rebuild_user_stats; never fail the write
+        logger.error(f"Failed to refresh user stats for {sorted(user_ids)}: {str(e)}")
+
+
+def schedule_stats_refresh(*user_ids):
+    """
+    Refresh the stats of ``user_ids`` once the current transaction commits.
+
+    Ids collected before a commit are refreshed together by the first
+    callback to run; the rest find nothing pending. Ids left behind by a
+    rolled back transaction are refreshed with the next commit, which is
+    harmless since rows are always recomputed from the database.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id}
+    if not user_ids:
+        return
+    if getattr(_pending, "user_ids", None) is None:
+        _pending.user_ids = set()
+    _pending.user_ids.update(user_ids)
+    transaction.on_commit(_flush_pending)
@@ -18,6 +18,15 @@ class CoreConfig(AppConfig):
         # Import signals
         import core.signals
 
+        # Apply SQLite PRAGMAs to new connections
+        import core.db_tuning
+
+        # Count Redis calls per request for core.metrics
+        from django.conf import settings
+        if getattr(settings, "METRICS_ENABLED", True):
+            from core.metrics import install_redis_instrumentation
+            install_redis_instrumentation()
+
         # Import cache signals for Phase 2.2c
         try:
             import core.cache_signals
@@ -55,6 +55,7 @@ try:
         set_cached_data,
         delete_cached_data,
         invalidate_cache_pattern,
+        invalidate_cache_tag,
         cache_permanently,
         get_permanent_cache,
         delete_permanent_cache,
@@ -73,6 +74,9 @@ except ImportError:
     def invalidate_cache_pattern(pattern):
         pass
 
+    def invalidate_cache_tag(*tags):
+        pass
+
     def cache_permanently(key, data):
         pass
 
@@ -141,15 +145,13 @@ def get_cache_stats():
     Get cache statistics.
 
     Returns:
-        Dictionary with cache statistics
+        Dictionary with Redis tier hit counts and per-tier ("l1", "redis")
+        statistics for this process
     """
-    # This is a placeholder - in a real implementation, you would
-    # get actual statistics from Redis
-    return {
-        "hits": 0,
-        "misses": 0,
-        "hit_rate": 0,
-    }
+    from core.redis.cache import get_tier_stats
+
+    tiers = get_tier_stats()
+    return {**tiers["redis"], "tiers": tiers}
 
 # Re-export all functions
 __all__ = [
@@ -3,172 +3,267 @@ Cache telemetry and monitoring utilities.
 
 This module provides utilities for monitoring cache performance and health,
 including hit rates, latency, and consistency metrics.
+
+Operations are aggregated in process memory: a count, error, hit and miss
+counter plus a fixed-bucket latency histogram per (model, operation).
+Recording an operation only updates those counters. Every
+TELEMETRY_FLUSH_INTERVAL seconds the aggregates are added to Redis hashes
+(one per model, operation and aggregation interval) in a single pipelined
+write, and ``get_cache_telemetry`` reads those hashes back.
 """
 
-import json
+import atexit
 import logging
 import time
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from datetime import timedelta
 from functools import wraps
-from typing import Dict, List, Optional, Set, Tuple, Union, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.conf import settings
-from django.core.cache import cache
 from django.utils import timezone
 
+from core.metrics import note_cache_lookup
+
 logger = logging.getLogger(__name__)
 
 # Constants
 TELEMETRY_ENABLED = getattr(settings, 'CACHE_TELEMETRY_ENABLED', True)
-TELEMETRY_SAMPLE_RATE = getattr(settings, 'CACHE_TELEMETRY_SAMPLE_RATE', 0.1)  # 10% of operations
 TELEMETRY_RETENTION_DAYS = getattr(settings, 'CACHE_TELEMETRY_RETENTION_DAYS', 7)
 TELEMETRY_AGGREGATION_INTERVAL = getattr(settings, 'CACHE_TELEMETRY_AGGREGATION_INTERVAL', 300)  # 5 minutes
+TELEMETRY_FLUSH_INTERVAL = getattr(settings, 'CACHE_TELEMETRY_FLUSH_INTERVAL', 10)  # seconds
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+OPERATIONS = ('get', 'set', 'delete')
 
 # Redis keys
-TELEMETRY_HIT_RATE_KEY = 'cache:telemetry:hit_rate'
-TELEMETRY_LATENCY_KEY = 'cache:telemetry:latency'
-TELEMETRY_ERRORS_KEY = 'cache:telemetry:errors'
+TELEMETRY_STATS_KEY = 'cache:telemetry:stats'
+TELEMETRY_INDEX_KEY = 'cache:telemetry:index'
 TELEMETRY_CONSISTENCY_KEY = 'cache:telemetry:consistency'
-TELEMETRY_OPERATIONS_KEY = 'cache:telemetry:operations'
+
+# Keeps the lower ('min') or higher ('max') of a hash field and a new value
+MIN_MAX_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+local value = tonumber(ARGV[2])
+if not current or (ARGV[1] == 'min' and value < tonumber(current))
+        or (ARGV[1] == 'max' and value > tonumber(current)) then
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+# Slots of an aggregate row
+_COUNT, _ERRORS, _HITS, _MISSES, _LATENCY_SUM, _BUCKETS = range(6)
+_BUCKET_FIELDS = [f"le_{bound:g}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+
+
+def _default_client():
+    from core.redis.cache import redis_client
+
+    return redis_client
+
+
+def _current_interval(timestamp: Optional[float] = None) -> int:
+    timestamp = int(timestamp if timestamp is not None else time.time())
+    return timestamp - (timestamp % TELEMETRY_AGGREGATION_INTERVAL)
+
+
+def _model_name(key: str) -> str:
+    model_name, separator, _ = key.partition(':')
+    return model_name if separator else 'unknown'
+
+
+class TelemetryAggregator:
+    """
+    Per-process cache operation counters and latency histograms.
+
+    ``record`` does no I/O and takes no lock: rows are plain lists updated
+    under the GIL, and ``flush`` swaps in a fresh table before writing the
+    old one. An increment racing with the swap may be lost, which is
+    acceptable for telemetry.
+    """
+
+    def __init__(self, flush_interval: float = TELEMETRY_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._rows: Dict[Tuple[str, str], List[float]] = {}
+        self._consistency: Dict[str, List[float]] = {}
+        self._next_flush = time.monotonic() + flush_interval
+
+    def record(self, operation: str, key: str, success: bool, latency_ms: float) -> None:
+        row_key = (_model_name(key), operation)
+        row = self._rows.get(row_key)
+        if row is None:
+            row = self._rows.setdefault(row_key, [0] * (_BUCKETS + len(_BUCKET_FIELDS)))
+        row[_COUNT] += 1
+        if operation == 'get':
+            row[_HITS if success else _MISSES] += 1
+        elif not success:
+            row[_ERRORS] += 1
+        row[_LATENCY_SUM] += latency_ms
+        row[_BUCKETS + bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+        if time.monotonic() >= self._next_flush:
+            self.flush()
+
+    def record_consistency(self, model_name: str, consistency_ratio: float) -> None:
+        row = self._consistency.setdefault(model_name, [0, 0.0, consistency_ratio, consistency_ratio])
+        row[0] += 1
+        row[1] += consistency_ratio
+        row[2] = min(row[2], consistency_ratio)
+        row[3] = max(row[3], consistency_ratio)
+
+    def flush(self, client=None) -> int:
+        """
+        Add the aggregates collected since the last flush to Redis.
+
+        Returns:
+            The number of (model, operation) rows written
+        """
+        self._next_flush = time.monotonic() + self.flush_interval
+        rows, self._rows = self._rows, {}
+        consistency, self._consistency = self._consistency, {}
+        if not rows and not consistency:
+            return 0
+
+        client = client or _default_client()
+        if client is None:
+            return 0
+
+        interval = _current_interval()
+        ttl = TELEMETRY_RETENTION_DAYS * 86400
+        index_key = f"{TELEMETRY_INDEX_KEY}:{interval}"
+        try:
+            pipe = client.pipeline(transaction=False)
+            for (model_name, operation), row in rows.items():
+                stats_key = f"{TELEMETRY_STATS_KEY}:{model_name}:{operation}:{interval}"
+                pipe.hincrby(stats_key, 'count', row[_COUNT])
+                pipe.hincrby(stats_key, 'errors', row[_ERRORS])
+                pipe.hincrby(stats_key, 'hits', row[_HITS])
+                pipe.hincrby(stats_key, 'misses', row[_MISSES])
+                pipe.hincrbyfloat(stats_key, 'latency_sum_ms', row[_LATENCY_SUM])
+                for field, count in zip(_BUCKET_FIELDS, row[_BUCKETS:]):
+                    if count:
+                        pipe.hincrby(stats_key, field, count)
+                pipe.expire(stats_key, ttl)
+                pipe.sadd(index_key, f"{model_name}:{operation}")
+            for model_name, (count, total, low, high) in consistency.items():
+                consistency_key = f"{TELEMETRY_CONSISTENCY_KEY}:{model_name}:{interval}"
+                pipe.hincrby(consistency_key, 'count', count)
+                pipe.hincrbyfloat(consistency_key, 'sum', total)
+                pipe.eval(MIN_MAX_SCRIPT, 1, consistency_key, 'min', low)
+                pipe.eval(MIN_MAX_SCRIPT, 1, consistency_key, 'max', high)
+                pipe.expire(consistency_key, ttl)
+                pipe.sadd(index_key, f"{model_name}:consistency")
+            pipe.expire(index_key, ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error flushing cache telemetry: {str(e)}")
+            return 0
+        return len(rows)
+
+
+# Shared by every caller in this process
+_aggregator = TelemetryAggregator()
+atexit.register(_aggregator.flush)
 
 
 def record_cache_operation(operation, key, success, latency_ms, data_size=None):
     """
     Record a cache operation for telemetry.
-    
+
     Args:
         operation: Operation type ('get', 'set', 'delete')
         key: Cache key
-        success: Whether the operation was successful
+        success: Whether the operation was successful (a hit, for 'get')
         latency_ms: Operation latency in milliseconds
-        data_size: Size of data in bytes (for 'set' operations)
+        data_size: Size of data in bytes (for 'set' operations); not aggregated
     """
-    if not TELEMETRY_ENABLED:
-        return
-    
-    # Only sample a percentage of operations to reduce overhead
-    import random
-    if random.random() > TELEMETRY_SAMPLE_RATE:
-        return
-    
-    try:
-        # Get current timestamp
-        now = timezone.now()
-        timestamp = int(now.timestamp())
-        
-        # Round timestamp to aggregation interval
-        interval_timestamp = timestamp - (timestamp % TELEMETRY_AGGREGATION_INTERVAL)
-        
-        # Extract model name from key if possible
-        model_name = 'unknown'
-        if ':' in key:
-            parts = key.split(':')
-            if len(parts) >= 2:
-                model_name = parts[0]
-        
-        # Create telemetry data
-        telemetry_data = {
-            'operation': operation,
-            'key': key,
-            'model': model_name,
-            'success': success,
-            'latency_ms': latency_ms,
-            'timestamp': timestamp,
-        }
-        
-        if data_size is not None:
-            telemetry_data['data_size'] = data_size
-        
-        # Record operation
-        operations_key = f"{TELEMETRY_OPERATIONS_KEY}:{interval_timestamp}"
-        cache.lpush(operations_key, json.dumps(telemetry_data))
-        cache.expire(operations_key, TELEMETRY_RETENTION_DAYS * 86400)
-        
-        # Update hit rate
-        if operation == 'get':
-            hit_rate_key = f"{TELEMETRY_HIT_RATE_KEY}:{model_name}:{interval_timestamp}"
-            if success:
-                cache.hincrby(hit_rate_key, 'hits', 1)
-            else:
-                cache.hincrby(hit_rate_key, 'misses', 1)
-            cache.expire(hit_rate_key, TELEMETRY_RETENTION_DAYS * 86400)
-        
-        # Update latency
-        latency_key = f"{TELEMETRY_LATENCY_KEY}:{model_name}:{operation}:{interval_timestamp}"
-        cache.lpush(latency_key, latency_ms)
-        cache.ltrim(latency_key, 0, 999)  # Keep only the last 1000 latency measurements
-        cache.expire(latency_key, TELEMETRY_RETENTION_DAYS * 86400)
-        
-        # Update errors
-        if not success:
-            errors_key = f"{TELEMETRY_ERRORS_KEY}:{model_name}:{interval_timestamp}"
-            cache.hincrby(errors_key, operation, 1)
-            cache.expire(errors_key, TELEMETRY_RETENTION_DAYS * 86400)
-        
-    except Exception as e:
-        logger.exception(f"Error recording cache telemetry: {str(e)}")
+    if operation == 'get':
+        note_cache_lookup(success)
+    if TELEMETRY_ENABLED:
+        _aggregator.record(operation, key, success, latency_ms)
 
 
 def record_cache_consistency(model_name, consistency_ratio):
     """
     Record cache consistency metrics.
-    
+
     Args:
         model_name: Model name
         consistency_ratio: Consistency ratio (0.0 to 1.0)
     """
-    if not TELEMETRY_ENABLED:
-        return
-    
-    try:
-        # Get current timestamp
-        now = timezone.now()
-        timestamp = int(now.timestamp())
-        
-        # Round timestamp to aggregation interval
-        interval_timestamp = timestamp - (timestamp % TELEMETRY_AGGREGATION_INTERVAL)
-        
-        # Record consistency
-        consistency_key = f"{TELEMETRY_CONSISTENCY_KEY}:{model_name}:{interval_timestamp}"
-        cache.lpush(consistency_key, consistency_ratio)
-        cache.ltrim(consistency_key, 0, 99)  # Keep only the last 100 consistency measurements
-        cache.expire(consistency_key, TELEMETRY_RETENTION_DAYS * 86400)
-        
-    except Exception as e:
-        logger.exception(f"Error recording cache consistency: {str(e)}")
+    if TELEMETRY_ENABLED:
+        _aggregator.record_consistency(model_name, consistency_ratio)
+
+
+def flush_cache_telemetry() -> int:
+    """Write this process's pending telemetry to Redis now."""
+    return _aggregator.flush()
+
+
+def _percentile(buckets: List[int], count: int, fraction: float) -> float:
+    """Upper bound of the histogram bucket holding the given fraction of operations."""
+    target = count * fraction
+    seen = 0
+    for bound, bucket_count in zip(LATENCY_BUCKETS_MS + (float('inf'),), buckets):
+        seen += bucket_count
+        if seen >= target:
+            return bound
+    return float('inf')
+
+
+def _summarize(data: Dict[str, str]) -> Dict[str, Any]:
+    count = int(data.get('count', 0))
+    buckets = [int(data.get(field, 0)) for field in _BUCKET_FIELDS]
+    latency_sum = float(data.get('latency_sum_ms', 0))
+    return {
+        'count': count,
+        'errors': int(data.get('errors', 0)),
+        'hits': int(data.get('hits', 0)),
+        'misses': int(data.get('misses', 0)),
+        'avg': latency_sum / count if count else 0,
+        'p50': _percentile(buckets, count, 0.5) if count else 0,
+        'p95': _percentile(buckets, count, 0.95) if count else 0,
+        'p99': _percentile(buckets, count, 0.99) if count else 0,
+        'buckets': dict(zip(_BUCKET_FIELDS, buckets)),
+    }
+
+
+def _intervals(start_time, end_time) -> Iterable[int]:
+    interval = _current_interval(start_time.timestamp())
+    end_interval = _current_interval(end_time.timestamp())
+    while interval <= end_interval:
+        yield interval
+        interval += TELEMETRY_AGGREGATION_INTERVAL
 
 
 def get_cache_telemetry(model_name=None, start_time=None, end_time=None):
     """
     Get cache telemetry metrics.
-    
+
+    Reads the aggregates flushed by every process (this process's pending
+    aggregates are flushed first). Intervals come from a per-interval index
+    set, so no keyspace scan is needed.
+
     Args:
         model_name: Model name (optional)
         start_time: Start time (optional)
         end_time: End time (optional)
-        
+
     Returns:
         Dictionary with telemetry metrics
     """
     if not TELEMETRY_ENABLED:
         return {'enabled': False}
-    
+
     try:
         # Set default time range if not provided
         if end_time is None:
             end_time = timezone.now()
         if start_time is None:
             start_time = end_time - timedelta(hours=24)
-        
-        # Convert to timestamps
-        start_timestamp = int(start_time.timestamp())
-        end_timestamp = int(end_time.timestamp())
-        
-        # Round timestamps to aggregation interval
-        start_interval = start_timestamp - (start_timestamp % TELEMETRY_AGGREGATION_INTERVAL)
-        end_interval = end_timestamp - (end_timestamp % TELEMETRY_AGGREGATION_INTERVAL)
-        
-        # Initialize metrics
+
         metrics = {
             'hit_rate': {},
             'latency': {},
@@ -180,175 +275,85 @@ def get_cache_telemetry(model_name=None, start_time=None, end_time=None):
                 'end': end_time.isoformat(),
             },
         }
-        
-        # Get all keys in the time range
-        interval = start_interval
-        while interval <= end_interval:
-            # Get hit rate
-            if model_name:
-                hit_rate_key = f"{TELEMETRY_HIT_RATE_KEY}:{model_name}:{interval}"
-                hit_rate_data = cache.hgetall(hit_rate_key)
-                if hit_rate_data:
-                    hits = int(hit_rate_data.get('hits', 0))
-                    misses = int(hit_rate_data.get('misses', 0))
-                    total = hits + misses
-                    if total > 0:
-                        metrics['hit_rate'][interval] = {
-                            'hits': hits,
-                            'misses': misses,
-                            'total': total,
-                            'rate': hits / total,
-                        }
-            else:
-                # Get hit rate for all models
-                hit_rate_pattern = f"{TELEMETRY_HIT_RATE_KEY}:*:{interval}"
-                hit_rate_keys = cache.keys(hit_rate_pattern)
-                for key in hit_rate_keys:
-                    model = key.split(':')[2]
-                    hit_rate_data = cache.hgetall(key)
-                    if hit_rate_data:
-                        hits = int(hit_rate_data.get('hits', 0))
-                        misses = int(hit_rate_data.get('misses', 0))
-                        total = hits + misses
-                        if total > 0:
-                            if model not in metrics['hit_rate']:
-                                metrics['hit_rate'][model] = {}
-                            metrics['hit_rate'][model][interval] = {
-                                'hits': hits,
-                                'misses': misses,
-                                'total': total,
-                                'rate': hits / total,
-                            }
-            
-            # Get latency
-            if model_name:
-                for operation in ['get', 'set', 'delete']:
-                    latency_key = f"{TELEMETRY_LATENCY_KEY}:{model_name}:{operation}:{interval}"
-                    latency_data = cache.lrange(latency_key, 0, -1)
-                    if latency_data:
-                        latencies = [float(x) for x in latency_data]
-                        metrics['latency'][interval] = {
-                            'operation': operation,
-                            'min': min(latencies),
-                            'max': max(latencies),
-                            'avg': sum(latencies) / len(latencies),
-                            'count': len(latencies),
-                        }
-            else:
-                # Get latency for all models
-                latency_pattern = f"{TELEMETRY_LATENCY_KEY}:*:{interval}"
-                latency_keys = cache.keys(latency_pattern)
-                for key in latency_keys:
-                    parts = key.split(':')
-                    model = parts[2]
-                    operation = parts[3]
-                    latency_data = cache.lrange(key, 0, -1)
-                    if latency_data:
-                        latencies = [float(x) for x in latency_data]
-                        if model not in metrics['latency']:
-                            metrics['latency'][model] = {}
-                        if operation not in metrics['latency'][model]:
-                            metrics['latency'][model][operation] = {}
-                        metrics['latency'][model][operation][interval] = {
-                            'min': min(latencies),
-                            'max': max(latencies),
-                            'avg': sum(latencies) / len(latencies),
-                            'count': len(latencies),
-                        }
-            
-            # Get errors
-            if model_name:
-                errors_key = f"{TELEMETRY_ERRORS_KEY}:{model_name}:{interval}"
-                errors_data = cache.hgetall(errors_key)
-                if errors_data:
-                    metrics['errors'][interval] = {
-                        'get': int(errors_data.get('get', 0)),
-                        'set': int(errors_data.get('set', 0)),
-                        'delete': int(errors_data.get('delete', 0)),
-                        'total': sum(int(x) for x in errors_data.values()),
-                    }
-            else:
-                # Get errors for all models
-                errors_pattern = f"{TELEMETRY_ERRORS_KEY}:*:{interval}"
-                errors_keys = cache.keys(errors_pattern)
-                for key in errors_keys:
-                    model = key.split(':')[2]
-                    errors_data = cache.hgetall(key)
-                    if errors_data:
-                        if model not in metrics['errors']:
-                            metrics['errors'][model] = {}
-                        metrics['errors'][model][interval] = {
-                            'get': int(errors_data.get('get', 0)),
-                            'set': int(errors_data.get('set', 0)),
-                            'delete': int(errors_data.get('delete', 0)),
-                            'total': sum(int(x) for x in errors_data.values()),
-                        }
-            
-            # Get consistency
-            if model_name:
-                consistency_key = f"{TELEMETRY_CONSISTENCY_KEY}:{model_name}:{interval}"
-                consistency_data = cache.lrange(consistency_key, 0, -1)
-                if consistency_data:
-                    consistency_values = [float(x) for x in consistency_data]
-                    metrics['consistency'][interval] = {
-                        'min': min(consistency_values),
-                        'max': max(consistency_values),
-                        'avg': sum(consistency_values) / len(consistency_values),
-                        'count': len(consistency_values),
-                    }
+
+        client = _default_client()
+        if client is None:
+            return metrics
+        flush_cache_telemetry()
+
+        intervals = list(_intervals(start_time, end_time))
+        pipe = client.pipeline(transaction=False)
+        for interval in intervals:
+            pipe.smembers(f"{TELEMETRY_INDEX_KEY}:{interval}")
+        members_by_interval = pipe.execute()
+
+        entries = []
+        for interval, members in zip(intervals, members_by_interval):
+            for member in members:
+                member = member.decode() if isinstance(member, bytes) else member
+                model, _, operation = member.rpartition(':')
+                if model_name is None or model == model_name:
+                    entries.append((interval, model, operation))
+
+        pipe = client.pipeline(transaction=False)
+        for interval, model, operation in entries:
+            if operation == 'consistency':
+                pipe.hgetall(f"{TELEMETRY_CONSISTENCY_KEY}:{model}:{interval}")
             else:
-                # Get consistency for all models
-                consistency_pattern = f"{TELEMETRY_CONSISTENCY_KEY}:*:{interval}"
-                consistency_keys = cache.keys(consistency_pattern)
-                for key in consistency_keys:
-                    model = key.split(':')[2]
-                    consistency_data = cache.lrange(key, 0, -1)
-                    if consistency_data:
-                        consistency_values = [float(x) for x in consistency_data]
-                        if model not in metrics['consistency']:
-                            metrics['consistency'][model] = {}
-                        metrics['consistency'][model][interval] = {
-                            'min': min(consistency_values),
-                            'max': max(consistency_values),
-                            'avg': sum(consistency_values) / len(consistency_values),
-                            'count': len(consistency_values),
-                        }
-            
-            # Get operations
-            operations_key = f"{TELEMETRY_OPERATIONS_KEY}:{interval}"
-            operations_data = cache.lrange(operations_key, 0, -1)
-            if operations_data:
-                operations = [json.loads(x) for x in operations_data]
-                if model_name:
-                    operations = [op for op in operations if op.get('model') == model_name]
-                
-                # Group operations by model
-                by_model = {}
-                for op in operations:
-                    model = op.get('model', 'unknown')
-                    if model not in by_model:
-                        by_model[model] = []
-                    by_model[model].append(op)
-                
-                # Calculate metrics for each model
-                for model, model_ops in by_model.items():
-                    if model not in metrics['operations']:
-                        metrics['operations'][model] = {}
-                    
-                    metrics['operations'][model][interval] = {
-                        'count': len(model_ops),
-                        'get': len([op for op in model_ops if op.get('operation') == 'get']),
-                        'set': len([op for op in model_ops if op.get('operation') == 'set']),
-                        'delete': len([op for op in model_ops if op.get('operation') == 'delete']),
-                        'success': len([op for op in model_ops if op.get('success')]),
-                        'error': len([op for op in model_ops if not op.get('success')]),
-                    }
-            
-            # Move to next interval
-            interval += TELEMETRY_AGGREGATION_INTERVAL
-        
+                pipe.hgetall(f"{TELEMETRY_STATS_KEY}:{model}:{operation}:{interval}")
+        results = pipe.execute() if entries else []
+
+        for (interval, model, operation), raw in zip(entries, results):
+            data = {
+                (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+                for k, v in raw.items()
+            }
+            if not data:
+                continue
+
+            if operation == 'consistency':
+                count = int(data.get('count', 0))
+                metrics['consistency'].setdefault(model, {})[interval] = {
+                    'min': float(data.get('min', 0)),
+                    'max': float(data.get('max', 0)),
+                    'avg': float(data.get('sum', 0)) / count if count else 0,
+                    'count': count,
+                }
+                continue
+
+            summary = _summarize(data)
+            metrics['latency'].setdefault(model, {}).setdefault(operation, {})[interval] = {
+                key: summary[key] for key in ('avg', 'p50', 'p95', 'p99', 'count', 'buckets')
+            }
+
+            if operation == 'get' and summary['count']:
+                metrics['hit_rate'].setdefault(model, {})[interval] = {
+                    'hits': summary['hits'],
+                    'misses': summary['misses'],
+                    'total': summary['count'],
+                    'rate': summary['hits'] / summary['count'],
+                }
+
+            errors = metrics['errors'].setdefault(model, {}).setdefault(
+                interval, {operation_name: 0 for operation_name in OPERATIONS}
+            )
+            errors[operation] = summary['errors']
+            errors['total'] = sum(errors[operation_name] for operation_name in OPERATIONS)
+
+            operations = metrics['operations'].setdefault(model, {}).setdefault(interval, {
+                'count': 0, 'get': 0, 'set': 0, 'delete': 0, 'success': 0, 'error': 0,
+            })
+            operations['count'] += summary['count']
+            operations[operation] = operations.get(operation, 0) + summary['count']
+            operations['error'] += summary['errors']
+            operations['success'] += summary['count'] - summary['errors']
+
+        # Live per-tier (in-process L1 and Redis) hit rates of this process
+        from core.redis.cache import get_tier_stats
+        metrics['tiers'] = get_tier_stats()
+
         return metrics
-        
+
     except Exception as e:
         logger.exception(f"Error getting cache telemetry: {str(e)}")
         return {'error': str(e)}
@@ -357,71 +362,47 @@ def get_cache_telemetry(model_name=None, start_time=None, end_time=None):
 def telemetry_decorator(func):
     """
     Decorator to add telemetry to cache operations.
-    
+
     This decorator wraps cache operations to record telemetry metrics.
-    
+
     Example:
         @telemetry_decorator
         def get_cached_data(key):
             ...
     """
+    # Get operation type from function name
+    operation = 'unknown'
+    if 'get' in func.__name__:
+        operation = 'get'
+    elif 'set' in func.__name__ or 'cache' in func.__name__:
+        operation = 'set'
+    elif 'delete' in func.__name__ or 'remove' in func.__name__:
+        operation = 'delete'
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Get operation type from function name
-        operation = 'unknown'
-        if 'get' in func.__name__:
-            operation = 'get'
-        elif 'set' in func.__name__ or 'cache' in func.__name__:
-            operation = 'set'
-        elif 'delete' in func.__name__ or 'remove' in func.__name__:
-            operation = 'delete'
-        
         # Get key from args or kwargs
         key = None
         if args and isinstance(args[0], str):
             key = args[0]
         elif 'key' in kwargs:
             key = kwargs['key']
-        
-        # Get data size for set operations
-        data_size = None
-        if operation == 'set' and len(args) > 1:
-            data = args[1]
-            if isinstance(data, (str, bytes)):
-                data_size = len(data)
-            elif isinstance(data, dict):
-                data_size = len(json.dumps(data))
-        
+
         # Record start time
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
         try:
             # Call the original function
             result = func(*args, **kwargs)
-            
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
-            
-            # Determine success
-            success = True
-            if operation == 'get' and result is None:
-                success = False
-            
-            # Record telemetry
-            if key:
-                record_cache_operation(operation, key, success, latency_ms, data_size)
-            
-            return result
-            
-        except Exception as e:
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
-            
-            # Record telemetry
+        except Exception:
             if key:
-                record_cache_operation(operation, key, False, latency_ms, data_size)
-            
-            # Re-raise the exception
+                record_cache_operation(operation, key, False, (time.perf_counter() - start_time) * 1000)
             raise
-    
+
+        if key:
+            # A 'get' that returns None is a miss
+            success = not (operation == 'get' and result is None)
+            record_cache_operation(operation, key, success, (time.perf_counter() - start_time) * 1000)
+        return result
+
     return wrapper
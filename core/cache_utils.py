@@ -14,6 +14,9 @@ from django.conf import settings
 from django.core.cache import cache
 from django.http import JsonResponse
 
+from core.redis.cache_tags import SCAN_COUNT
+from core.single_flight import get_or_compute
+
 logger = logging.getLogger(__name__)
 
 # Cache TTL constants
@@ -153,14 +156,20 @@ def cache_query_result(
 
 def cache_api_response(
     timeout: int = 300,
-    prefix: str = 'api'
+    prefix: str = 'api',
+    stale_timeout: Optional[int] = None
 ):
     """
     Decorator to cache API responses
     
+    Expired responses are re-rendered by one request at a time while the
+    others get the stale response (see core.single_flight).
+    
     Args:
         timeout: Cache timeout in seconds
         prefix: Cache key prefix
+        stale_timeout: Seconds a stale response may be served while it is
+            refreshed (defaults to CACHE_STALE_TIMEOUT)
     
     Example:
         @cache_api_response(timeout=600, prefix='reviews')
@@ -178,20 +187,19 @@ def cache_api_response(
                 request.GET.urlencode() if request.GET else ''
             )
             
-            # Try to get from cache
-            cached_response = cache.get(cache_key)
-            if cached_response is not None:
-                CacheStats.record_hit()
-                logger.debug(f"Cache hit: {cache_key}")
-                return cached_response
+            computed = []
             
-            # Cache miss - execute function
-            CacheStats.record_miss()
-            response = func(request, *args, **kwargs)
+            def compute():
+                computed.append(True)
+                return func(request, *args, **kwargs)
             
-            # Cache the response
-            cache.set(cache_key, response, timeout)
-            logger.debug(f"Cache miss: {cache_key} (cached for {timeout}s)")
+            response = get_or_compute(cache_key, compute, timeout, stale_timeout=stale_timeout)
+            if computed:
+                CacheStats.record_miss()
+                logger.debug(f"Cache miss: {cache_key} (cached for {timeout}s)")
+            else:
+                CacheStats.record_hit()
+                logger.debug(f"Cache hit: {cache_key}")
             
             return response
         
@@ -221,15 +229,11 @@ def invalidate_cache(pattern: str = None, keys: list = None):
     
     if pattern:
         try:
-            # This requires Redis backend
-            from django_redis import get_redis_connection
-            redis_conn = get_redis_connection('default')
-            
-            # Find keys matching pattern
-            matching_keys = redis_conn.keys(pattern)
-            if matching_keys:
-                redis_conn.delete(*matching_keys)
-                logger.debug(f"Invalidated {len(matching_keys)} cache entries matching: {pattern}")
+            # This requires the django-redis backend, whose delete_pattern
+            # applies the cache key prefix and walks the keyspace with SCAN
+            deleted = cache.delete_pattern(pattern, itersize=SCAN_COUNT)
+            if deleted:
+                logger.debug(f"Invalidated {deleted} cache entries matching: {pattern}")
         except Exception as e:
             logger.warning(f"Failed to invalidate cache pattern {pattern}: {str(e)}")
 
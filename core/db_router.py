@@ -0,0 +1,82 @@
+"""
+Database router that sends reads from read-only endpoints to a replica.
+
+Reads go to the ``replica`` alias only inside ``read_replica()`` (or a view
+wrapped in ``use_read_replica``) and only when that alias is configured, so
+the default single-database setup behaves exactly as before. Writes always
+go to ``default``: a model instance loaded from the replica is still saved
+to the primary.
+
+Replicas lag behind the primary, so only list endpoints that tolerate
+slightly stale data should opt in. Reads made while the request holds a
+transaction open on ``default`` stay on the primary to keep
+read-your-writes.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+REPLICA_DB_ALIAS = "replica"
+
+_use_replica: ContextVar[bool] = ContextVar("use_read_replica", default=False)
+
+
+def replica_configured() -> bool:
+    """Whether a read replica is defined in settings.DATABASES."""
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def read_replica():
+    """Route ORM reads in this block to the read replica, if there is one."""
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def use_read_replica(func):
+    """
+    Decorator for read-only views whose queries may be served by the replica.
+
+    Place it directly above the view function (below the router decorator)
+    so it wraps the function that is actually registered.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with read_replica():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class ReadReplicaRouter:
+    """Route opted-in reads to the replica; everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get() or not replica_configured():
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica mirrors the primary, so rows from either may be related
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives schema changes through replication
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,36 @@
+"""
+Per-connection database tuning.
+
+Django 4.2 has no init_command option for SQLite, so the PRAGMAs in
+settings.SQLITE_PRAGMAS are applied from the connection_created signal
+whenever a new SQLite connection is opened. Other backends are untouched.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+}
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Apply settings.SQLITE_PRAGMAS to a freshly opened SQLite connection."""
+    if connection.vendor != "sqlite":
+        return
+
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            try:
+                cursor.execute(f"PRAGMA {name} = {value}")
+            except Exception as e:
+                # In-memory test databases reject some settings (e.g. WAL)
+                logger.debug(f"Could not apply PRAGMA {name}={value}: {str(e)}")
@@ -9,6 +9,7 @@ import logging
 import time
 import uuid
 from contextlib import contextmanager
+from functools import wraps
 from typing import Optional
 
 from django.conf import settings
@@ -31,7 +32,7 @@ class DistributedLock:
     """
     
     def __init__(self, name, timeout=DEFAULT_LOCK_TIMEOUT, retry_count=DEFAULT_RETRY_COUNT, 
-                 retry_delay=DEFAULT_RETRY_DELAY):
+                 retry_delay=DEFAULT_RETRY_DELAY, store=None):
         """
         Initialize the distributed lock.
         
@@ -40,7 +41,10 @@ class DistributedLock:
             timeout: Lock timeout in seconds
             retry_count: Number of times to retry acquiring the lock
             retry_delay: Delay between retries in seconds
+            store: Object with Django's cache add/get/set/delete API to keep
+                the lock in (defaults to the default Django cache)
         """
+        self.store = store if store is not None else cache
         self.name = f"lock:{name}"
         self.timeout = timeout
         self.retry_count = retry_count
@@ -57,7 +61,7 @@ class DistributedLock:
         """
         for attempt in range(self.retry_count + 1):
             # Try to acquire the lock
-            acquired = cache.add(self.name, self.token, self.timeout)
+            acquired = self.store.add(self.name, self.token, self.timeout)
             
             if acquired:
                 self.acquired = True
@@ -68,7 +72,11 @@ class DistributedLock:
             if attempt < self.retry_count:
                 time.sleep(self.retry_delay)
         
-        logger.warning(f"Failed to acquire lock {self.name} after {self.retry_count + 1} attempts")
+        if self.retry_count:
+            logger.warning(f"Failed to acquire lock {self.name} after {self.retry_count + 1} attempts")
+        else:
+            # Callers that do not retry expect contention and handle it themselves
+            logger.debug(f"Lock {self.name} is held elsewhere")
         return False
     
     def release(self) -> bool:
@@ -83,11 +91,11 @@ class DistributedLock:
             return False
         
         # Get the current token
-        current_token = cache.get(self.name)
+        current_token = self.store.get(self.name)
         
         # Only release the lock if the token matches
         if current_token == self.token:
-            cache.delete(self.name)
+            self.store.delete(self.name)
             self.acquired = False
             logger.debug(f"Released lock {self.name} (token: {self.token})")
             return True
@@ -113,12 +121,12 @@ class DistributedLock:
             return False
         
         # Get the current token
-        current_token = cache.get(self.name)
+        current_token = self.store.get(self.name)
         
         # Only extend the lock if the token matches
         if current_token == self.token:
             timeout = additional_timeout if additional_timeout is not None else self.timeout
-            cache.set(self.name, self.token, timeout)
+            self.store.set(self.name, self.token, timeout)
             logger.debug(f"Extended lock {self.name} (token: {self.token}) for {timeout} seconds")
             return True
         else:
@@ -135,7 +143,7 @@ class DistributedLock:
         Returns:
             True if the lock is held, False otherwise
         """
-        return cache.get(self.name) is not None
+        return self.store.get(self.name) is not None
     
     def is_owner(self) -> bool:
         """
@@ -144,7 +152,7 @@ class DistributedLock:
         Returns:
             True if the current instance owns the lock, False otherwise
         """
-        return cache.get(self.name) == self.token
+        return self.store.get(self.name) == self.token
 
 
 @contextmanager
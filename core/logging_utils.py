@@ -217,6 +217,21 @@ class APILogger:
         self.logger.info("Payment event", **context)
 
 
+def _request_breakdown() -> Dict[str, Any]:
+    """DB and Redis work done so far by the current request (see core.metrics)."""
+    from core.metrics import current_stats
+
+    stats = current_stats()
+    if stats is None:
+        return {}
+    return {
+        'db_queries': stats.db_queries,
+        'db_ms': round(stats.db_seconds * 1000, 2),
+        'redis_calls': stats.redis_calls,
+        'redis_ms': round(stats.redis_seconds * 1000, 2),
+    }
+
+
 def log_endpoint(logger: StructuredLogger):
     """
     Decorator to log API endpoint calls with timing and error information.
@@ -254,6 +269,7 @@ def log_endpoint(logger: StructuredLogger):
                     request_id=request_id,
                     status_code=status_code,
                     duration_ms=round(duration_ms, 2),
+                    **_request_breakdown(),
                 )
                 
                 return response
@@ -0,0 +1,125 @@
+"""
+Benchmark tag-indexed and SCAN-based cache invalidation on a large keyspace.
+
+The keyspace is filled with synthetic keys (1M by default) spread over
+``--tags`` tags. The command then times invalidating a few tags, deleting a
+narrow glob pattern with SCAN and, for comparison, a single KEYS call for the
+same pattern. Every Redis command issued is timed individually: Redis is
+single threaded, so the slowest command bounds how long any other client could
+have been stalled. All synthetic keys are deleted afterwards.
+
+Run it against a real Redis server: FakeRedis, used in DEBUG when Redis is
+down, lists the whole keyspace on every SCAN call, so its SCAN timings grow
+with the keyspace where a real server's do not.
+"""
+
+import time
+from contextlib import contextmanager
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.redis.cache import redis_client
+from core.redis.cache_tags import delete_pattern, invalidate_tag, tag_key_name, tag_keys
+
+KEY_PREFIX = "bench_tags:"
+TTL = 3600
+WRITE_BATCH_SIZE = 10000
+
+
+class Command(BaseCommand):
+    help = "Benchmark tag and SCAN based cache invalidation against KEYS"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keys", type=int, default=1000000, help="Synthetic keys to create")
+        parser.add_argument("--tags", type=int, default=1000, help="Tags the keys are spread over")
+        parser.add_argument("--invalidate", type=int, default=10, help="Tags to invalidate")
+        parser.add_argument("--skip-keys", action="store_true", help="Do not run the KEYS comparison")
+
+    def handle(self, *args, **options):
+        if redis_client is None:
+            raise CommandError("Redis is not available")
+        if options["tags"] < options["invalidate"]:
+            raise CommandError("--invalidate cannot exceed --tags")
+        if type(redis_client).__module__.startswith("fakeredis"):
+            self.stdout.write(self.style.WARNING(
+                "Running against FakeRedis: SCAN timings are not representative of a Redis server"
+            ))
+
+        try:
+            started = time.perf_counter()
+            self._populate(options["keys"], options["tags"])
+            self.stdout.write(
+                f"Created {options['keys']} keys over {options['tags']} tags "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+            self._run(options)
+        finally:
+            delete_pattern(f"{KEY_PREFIX}*")
+            delete_pattern(f"{tag_key_name(KEY_PREFIX)}*")
+
+    def _populate(self, count, tags):
+        for start in range(0, count, WRITE_BATCH_SIZE):
+            batch = range(start, min(start + WRITE_BATCH_SIZE, count))
+            pipe = redis_client.pipeline(transaction=False)
+            for i in batch:
+                pipe.set(f"{KEY_PREFIX}{i}", "x", ex=TTL)
+            pipe.execute()
+
+        for tag in range(tags):
+            keys = [f"{KEY_PREFIX}{i}" for i in range(tag, count, tags)]
+            for start in range(0, len(keys), WRITE_BATCH_SIZE):
+                tag_keys([f"{KEY_PREFIX}{tag}"], keys[start:start + WRITE_BATCH_SIZE], timeout=TTL)
+
+    def _run(self, options):
+        with self._timed_commands() as timings:
+            deleted = sum(invalidate_tag(f"{KEY_PREFIX}{tag}") for tag in range(options["invalidate"]))
+        self._report(f"invalidate_tag x{options['invalidate']}", deleted, timings)
+
+        # Matches 1,111 of 1M keys (123, 1230-1239, ...): a narrow pattern in a huge keyspace
+        pattern = f"{KEY_PREFIX}123*"
+        with self._timed_commands() as timings:
+            deleted = delete_pattern(pattern)
+        self._report("delete_pattern (SCAN)", deleted, timings)
+
+        if not options["skip_keys"]:
+            with self._timed_commands() as timings:
+                matched = len(redis_client.keys(f"{KEY_PREFIX}456*"))
+            self._report("KEYS (for comparison)", matched, timings)
+
+    def _report(self, label, count, timings):
+        total = sum(timings)
+        slowest = max(timings) if timings else 0
+        style = self.style.SUCCESS if slowest < 0.002 else self.style.WARNING
+        self.stdout.write(style(
+            f"{label:<26} | keys {count:>7} | commands {len(timings):>5} | "
+            f"total {total * 1000:9.1f} ms | slowest command {slowest * 1000:8.2f} ms"
+        ))
+
+    @contextmanager
+    def _timed_commands(self):
+        """Time every command and pipeline sent through ``redis_client``."""
+        timings = []
+
+        def timed(func):
+            def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    timings.append(time.perf_counter() - started)
+            return wrapper
+
+        original_pipeline = redis_client.pipeline
+
+        def pipeline(*args, **kwargs):
+            pipe = original_pipeline(*args, **kwargs)
+            pipe.execute = timed(pipe.execute)
+            return pipe
+
+        redis_client.execute_command = timed(redis_client.execute_command)
+        redis_client.pipeline = pipeline
+        try:
+            yield timings
+        finally:
+            del redis_client.execute_command
+            del redis_client.pipeline
@@ -0,0 +1,174 @@
+"""
+Benchmark concurrent write throughput of create_job, apply_for_job and
+notification fan-out.
+
+Run it once per database backend to compare them, e.g.::
+
+    python manage.py benchmark_db_writes
+    DB_ENGINE=postgres python manage.py benchmark_db_writes
+    DB_ENGINE=postgres POSTGRES_PORT=6432 DB_PGBOUNCER=True python manage.py benchmark_db_writes
+
+--workers threads call the endpoint functions directly, each with its own
+database connection, the way concurrent requests hit a multi-threaded
+server. Background dispatch (the geocoding task and the websocket
+notification) is replaced with no-ops so only the database writes are timed.
+Rows cannot be rolled back across connections, so everything the benchmark
+creates is deleted at the end instead.
+
+The create_notification scenario goes through core.write_behind: with
+WRITE_BEHIND_ENABLED=True the callers only queue rows, and the time the
+queue then needs to write them out is reported separately.
+"""
+
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import RequestFactory
+
+from core.write_behind import write_behind
+from jobs.api import create_job
+from jobs.applicant import apply_for_job
+from jobs.models import Application, Job, JobIndustry
+from jobs.schemas import ApplyJobSchema, CreateJobSchema
+from notifications.models import Notification
+from notifications.utils import create_notification
+
+User = get_user_model()
+
+
+class _NullChannelLayer:
+    async def group_send(self, group, message):
+        pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark concurrent create_job / apply_for_job write throughput on the configured database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=16, help="Concurrent writer threads")
+        parser.add_argument("--jobs", type=int, default=200, help="Jobs to create")
+        parser.add_argument("--applicants", type=int, default=20, help="Users applying to every job")
+        parser.add_argument("--notifications", type=int, default=2000, help="Notifications to create")
+
+    def handle(self, *args, **options):
+        db = connections[DEFAULT_DB_ALIAS]
+        self.stdout.write(
+            f"Backend: {db.vendor} | CONN_MAX_AGE: {db.settings_dict.get('CONN_MAX_AGE')} | "
+            f"workers: {options['workers']} | write-behind: {write_behind.enabled}"
+        )
+        self.factory = RequestFactory()
+        stamp = int(time.time())
+        self.industry = JobIndustry.objects.create(name=f"Write bench {stamp}")
+        self.client_user = self._create_user(f"write_bench_client_{stamp}")
+        applicants = [self._create_user(f"write_bench_{stamp}_{i}") for i in range(options["applicants"])]
+
+        try:
+            with patch("django_q.tasks.async_task"), \
+                    patch("jobs.applicant.get_channel_layer", return_value=_NullChannelLayer()):
+                job_ids = self._run("create_job", self._create_job, range(options["jobs"]), options["workers"])
+                pairs = [(user, job_id) for job_id in job_ids for user in applicants]
+                self._run("apply_for_job", self._apply, pairs, options["workers"])
+            self._run("create_notification", self._notify, range(options["notifications"]), options["workers"])
+            started = time.perf_counter()
+            drained = write_behind.flush()
+            if drained:
+                self.stdout.write(f"  write-behind drained {drained} rows in {(time.perf_counter() - started) * 1000:.1f} ms")
+        finally:
+            Notification.objects.filter(user=self.client_user).delete()
+            Application.objects.filter(job__client=self.client_user).delete()
+            Job.objects.filter(client=self.client_user).delete()
+            User.objects.filter(id__in=[self.client_user.id] + [user.id for user in applicants]).delete()
+            self.industry.delete()
+            self.stdout.write(self.style.SUCCESS("Benchmark data deleted"))
+
+    def _create_user(self, username):
+        return User.objects.create_user(username=username, email=f"{username}@example.com", password="benchpass123")
+
+    def _request(self, path, user):
+        request = self.factory.post(path)
+        request.user = user
+        return request
+
+    def _create_job(self, index):
+        start = date.today() + timedelta(days=7)
+        payload = CreateJobSchema(
+            user_id=self.client_user.id,
+            title=f"Write bench job {index}",
+            industry=self.industry.id,
+            subcategory="",
+            applicants_needed=5,
+            job_type="single_day",
+            shift_type="morning",
+            start_date=start.isoformat(),
+            end_date=start.isoformat(),
+            start_time="09:00",
+            end_time="17:00",
+            rate=20.0,
+            location="12 Marina Road, Lagos",
+        )
+        response = create_job(self._request("/jobs/create-job", self.client_user), payload)
+        if response.status_code != 201:
+            raise RuntimeError(f"create_job returned {response.status_code}")
+        return Job.objects.filter(client=self.client_user, title=payload.title).values_list("id", flat=True).first()
+
+    def _apply(self, pair):
+        user, job_id = pair
+        payload = ApplyJobSchema(user_id=user.id, job_id=job_id)
+        response = apply_for_job(self._request("/applications/apply-job/", user), payload)
+        if response.application_id is None:
+            raise RuntimeError(response.detail)
+        return response.application_id
+
+    def _notify(self, index):
+        create_notification(
+            user=self.client_user,
+            title="Write bench",
+            message=f"Write bench notification {index}",
+            notification_type="job_posted",
+        )
+        return index
+
+    def _run(self, label, operation, items, workers):
+        items = list(items)
+        chunks = [items[i::workers] for i in range(workers)]
+
+        def worker(chunk):
+            timings, results, errors = [], [], []
+            try:
+                for item in chunk:
+                    started = time.perf_counter()
+                    try:
+                        results.append(operation(item))
+                    except Exception as e:
+                        errors.append(e.__cause__ or e.__context__ or e)
+                    timings.append(time.perf_counter() - started)
+            finally:
+                # Connections are per thread; close this worker's before it exits
+                connections.close_all()
+            return timings, results, errors
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(worker, chunks))
+        elapsed = time.perf_counter() - started
+
+        timings = sorted(t for outcome in outcomes for t in outcome[0])
+        results = [r for outcome in outcomes for r in outcome[1]]
+        errors = [e for outcome in outcomes for e in outcome[2]]
+        if timings:
+            style = self.style.SUCCESS if not errors else self.style.WARNING
+            self.stdout.write(style(
+                f"{label:<19} | ops {len(timings):>5} | errors {len(errors):>4} | "
+                f"{len(results) / elapsed:8.1f} writes/s | "
+                f"p50 {statistics.median(timings) * 1000:7.1f} ms | "
+                f"p95 {timings[max(int(len(timings) * 0.95) - 1, 0)] * 1000:7.1f} ms"
+            ))
+        if errors:
+            self.stdout.write(f"  first error: {errors[0]!r}")
+        return results
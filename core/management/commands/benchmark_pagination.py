@@ -0,0 +1,92 @@
+"""
+Benchmark OFFSET pagination against keyset (cursor) pagination.
+
+Synthetic notifications for one user are created inside a transaction that is
+rolled back at the end, so the command is safe to run against a dev database.
+Each page is timed the way the endpoints fetch it: COUNT(*) plus an OFFSET
+slice for page numbers, and a single keyset query for cursors.
+"""
+
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.pagination import DEFAULT_ORDERING, encode_cursor, paginate_by_cursor
+from notifications.models import Notification, NotificationCategory
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark OFFSET vs keyset pagination at shallow and deep pages"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000, help="Notifications to create")
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--pages", type=str, default="1,100,1000,4000", help="Comma separated page numbers")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per page (best latency is reported)")
+
+    def handle(self, *args, **options):
+        pages = [int(p) for p in options["pages"].split(",") if p.strip()]
+        page_size = options["page_size"]
+        try:
+            with transaction.atomic():
+                user = self._create_notifications(options["rows"])
+                queryset = Notification.objects.filter(user=user)
+                for page in pages:
+                    if (page - 1) * page_size >= options["rows"]:
+                        continue
+                    self._report(queryset, page, page_size, options["repeat"])
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write(self.style.SUCCESS("Benchmark data rolled back"))
+
+    def _create_notifications(self, count):
+        stamp = int(time.time())
+        user = User.objects.create_user(
+            username=f"page_bench_{stamp}", email=f"page_bench_{stamp}@example.com", password="benchpass123"
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(user=user, category=NotificationCategory.NEW_JOB_ALERT, message=f"Bench notification {i}")
+                for i in range(count)
+            ],
+            batch_size=5000,
+        )
+        self.stdout.write(f"Created {count} notifications")
+        return user
+
+    def _best(self, func, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def _report(self, queryset, page, page_size, repeat):
+        offset = (page - 1) * page_size
+        ordered = queryset.order_by(*DEFAULT_ORDERING)
+
+        def offset_page():
+            queryset.count()
+            list(ordered[offset:offset + page_size])
+
+        # The cursor a client holds after reading the previous page
+        cursor = encode_cursor(ordered[offset - 1]) if offset else None
+
+        def cursor_page():
+            paginate_by_cursor(queryset, cursor, page_size)
+
+        offset_time = self._best(offset_page, repeat)
+        cursor_time = self._best(cursor_page, repeat)
+        self.stdout.write(
+            f"page {page:>6} | offset: {offset_time * 1000:8.2f} ms | cursor: {cursor_time * 1000:8.2f} ms"
+        )
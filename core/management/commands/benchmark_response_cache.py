@@ -0,0 +1,134 @@
+"""
+Benchmark cache_api_response hits for a 100-job /alljobs payload.
+
+Synthetic jobs are created inside a transaction that is rolled back at the end,
+so the command is safe to run against a dev database. The same view is cached
+in each mode of cache_api_response: parsed JSON data (raw=False), raw body
+bytes, and gzipped raw bytes. Only cache hits are timed. A conditional request
+answered with a 304 is timed as well.
+"""
+
+import statistics
+import time
+from datetime import time as dtime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.http import JsonResponse
+from django.test import RequestFactory
+from django.utils import timezone
+
+from core.redis.cache import cache_api_response, redis_client
+from core.redis.cache_tags import delete_pattern
+from jobs.models import Job
+from jobs.utils import serialize_jobs
+
+User = get_user_model()
+
+KEY_PREFIX = "bench_response"
+MODES = (
+    ("json (raw=False)", {"raw": False}),
+    ("raw bytes", {"raw": True}),
+    ("raw bytes, gzip", {"raw": True, "compress": True}),
+)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark cache_api_response hit latency for JSON and raw byte modes"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=100, help="Jobs in the cached payload")
+        parser.add_argument("--hits", type=int, default=500, help="Timed cache hits per mode")
+
+    def handle(self, *args, **options):
+        if redis_client is None:
+            raise CommandError("Redis is not available")
+        try:
+            with transaction.atomic():
+                payload = self._build_payload(options["jobs"])
+                self._run(payload, options["hits"])
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write(self.style.SUCCESS("Benchmark data rolled back"))
+        finally:
+            delete_pattern(f"*{KEY_PREFIX}*", client=redis_client)
+
+    def _build_payload(self, count):
+        stamp = int(time.time())
+        client = User.objects.create_user(
+            username=f"response_bench_{stamp}", email=f"response_bench_{stamp}@example.com", password="benchpass123"
+        )
+        start = timezone.now().date() + timedelta(days=1)
+        Job.objects.bulk_create(
+            [
+                Job(
+                    client=client, created_by=client, title=f"Bench job {i}",
+                    description="Warehouse shift covering loading, sorting and dispatch",
+                    location="12 Marina Road, Lagos", latitude=Decimal("6.450000"), longitude=Decimal("3.400000"),
+                    start_date=start, end_date=start, start_time=dtime(9, 0), end_time=dtime(17, 0),
+                    shift_type="day", rate=Decimal("1500.00"),
+                )
+                for i in range(count)
+            ]
+        )
+        jobs = Job.objects.select_related("client__profile", "industry", "subcategory").filter(client=client)
+        # Same shape as the /alljobs response
+        return {
+            "status": "success",
+            "message": "Jobs retrieved successfully",
+            "jobs": serialize_jobs(jobs, include_extra=True),
+            "pagination": {"current_page": 1, "total_pages": 1, "total_items": count, "items_per_page": count},
+        }
+
+    def _request(self, **headers):
+        request = RequestFactory().get("/jobs/alljobs", **headers)
+        request.user = AnonymousUser()
+        return request
+
+    def _run(self, payload, hits):
+        baseline = None
+        for index, (label, mode) in enumerate(MODES):
+            view = cache_api_response(timeout=300, key_prefix=f"{KEY_PREFIX}_{index}", **mode)(
+                lambda request: JsonResponse(payload)
+            )
+            request = self._request(HTTP_ACCEPT_ENCODING="gzip")
+            first = view(request)  # Miss: fills the cache
+
+            timings = []
+            for _ in range(hits):
+                started = time.perf_counter()
+                response = view(request)
+                timings.append(time.perf_counter() - started)
+
+            median = statistics.median(timings)
+            baseline = baseline or median
+            self.stdout.write(
+                f"{label:<18} | body {len(response.content):>7} B | "
+                f"median {median * 1e6:8.1f} us | p95 {self._p95(timings) * 1e6:8.1f} us | "
+                f"{baseline / median:5.1f}x"
+            )
+
+            etag = first.get("ETag")
+            if etag:
+                conditional = self._request(HTTP_IF_NONE_MATCH=etag)
+                timings = []
+                for _ in range(hits):
+                    started = time.perf_counter()
+                    response = view(conditional)
+                    timings.append(time.perf_counter() - started)
+                if response.status_code != 304:
+                    raise CommandError(f"Expected a 304 for a matching ETag, got {response.status_code}")
+                self.stdout.write(
+                    f"{'  304 revalidation':<18} | body {0:>7} B | "
+                    f"median {statistics.median(timings) * 1e6:8.1f} us | p95 {self._p95(timings) * 1e6:8.1f} us"
+                )
+
+    def _p95(self, timings):
+        return sorted(timings)[int(len(timings) * 0.95) - 1]
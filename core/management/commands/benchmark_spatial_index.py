@@ -0,0 +1,85 @@
+"""
+Benchmark radius queries through the geohash spatial index against a full scan.
+
+Synthetic users and UserLocation rows are created inside a transaction that is
+rolled back at the end, so the command is safe to run against a dev database.
+"""
+
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.spatial_index import encode, haversine_km, nearby
+from userlocation.models import UserLocation
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark nearby() radius queries against a full haversine scan"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--locations", type=int, default=100000, help="Number of locations to create")
+        parser.add_argument("--queries", type=int, default=20, help="Radius queries per radius")
+        parser.add_argument("--radii", type=str, default="1,5,25", help="Comma separated radii in km")
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        radii = [float(r) for r in options["radii"].split(",") if r.strip()]
+        try:
+            with transaction.atomic():
+                self._create_locations(options["locations"], rng)
+                centres = [self._random_point(rng) for _ in range(options["queries"])]
+                for radius in radii:
+                    self._report(radius, centres)
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write(self.style.SUCCESS("Benchmark data rolled back"))
+
+    def _random_point(self, rng):
+        # Spread over a Lagos-sized metro area so small radii have neighbours
+        return 6.45 + rng.uniform(-0.5, 0.5), 3.40 + rng.uniform(-0.5, 0.5)
+
+    def _create_locations(self, count, rng):
+        stamp = int(time.time())
+        users = User.objects.bulk_create(
+            [User(username=f"geo_bench_{stamp}_{i}", email=f"geo_bench_{stamp}_{i}@example.com") for i in range(count)],
+            batch_size=2000,
+        )
+        locations = []
+        for user in users:
+            lat, lon = self._random_point(rng)
+            locations.append(
+                UserLocation(user=user, latitude=lat, longitude=lon, address="bench", geohash=encode(lat, lon))
+            )
+        UserLocation.objects.bulk_create(locations, batch_size=2000)
+        self.stdout.write(f"Created {count} locations")
+
+    def _report(self, radius, centres):
+        queryset = UserLocation.objects.all()
+
+        started = time.perf_counter()
+        indexed_hits = sum(len(nearby(queryset, lat, lon, radius)) for lat, lon in centres)
+        indexed = (time.perf_counter() - started) / len(centres)
+
+        started = time.perf_counter()
+        scan_hits = 0
+        for lat, lon in centres:
+            # What the call sites used to do: load every row, haversine each one
+            for location in queryset.iterator(chunk_size=5000):
+                if haversine_km(lat, lon, location.latitude, location.longitude) <= radius:
+                    scan_hits += 1
+        scan = (time.perf_counter() - started) / len(centres)
+
+        self.stdout.write(
+            f"radius {radius:>5.1f} km | index: {indexed * 1000:8.1f} ms/query | "
+            f"full scan: {scan * 1000:8.1f} ms/query | hits {indexed_hits}/{scan_hits}"
+        )
@@ -0,0 +1,119 @@
+"""
+Fire concurrent requests at an expired cache entry and count recomputations.
+
+A view wrapped in cache_api_response stands in for an expensive endpoint:
+each render sleeps for --render-ms to simulate the database work a real
+view would do. --requests threads are released at the same instant against
+the view's cache entry in three states:
+
+- missing (hard expiry): one request renders, the others wait for it;
+- stale (soft expiry): one request renders, the others get the stale body;
+- missing, with single-flight bypassed: every request renders, which is
+  what happened before entries were coalesced.
+
+For each scenario the command reports how many times the view rendered and
+the latency distribution seen by the clients.
+"""
+
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.http import JsonResponse
+from django.test import RequestFactory
+
+from core.redis import cache as redis_cache
+from core.redis.cache import binary_redis_client, cache_api_response, redis_client
+from core.redis.cache_tags import delete_pattern, scan_keys
+
+KEY_PREFIX = "loadtest_stampede:"
+
+
+class Command(BaseCommand):
+    help = "Load-test single-flight and stale-while-revalidate on an expired cache key"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Concurrent requests per scenario")
+        parser.add_argument("--render-ms", type=int, default=200, help="Simulated render time of the view")
+
+    def handle(self, *args, **options):
+        if redis_client is None:
+            raise CommandError("Redis is not available")
+
+        self.renders = 0
+        self.render_lock = threading.Lock()
+        self.render_seconds = options["render_ms"] / 1000
+        view = cache_api_response(timeout=60, key_prefix=KEY_PREFIX, stale_timeout=300)(self._view)
+
+        try:
+            self._warm(view)
+            self._scenario("missing entry", view, options["requests"], self._expire_hard)
+            self._scenario("stale entry", view, options["requests"], self._expire_soft)
+            with patch.object(redis_cache, "get_or_compute", self._uncoalesced):
+                self._scenario("missing, no single-flight", view, options["requests"], self._expire_hard)
+        finally:
+            delete_pattern(f"{KEY_PREFIX}*", client=redis_client)
+            delete_pattern(f"lock:sf:{KEY_PREFIX}*", client=redis_client)
+
+    def _view(self, request):
+        with self.render_lock:
+            self.renders += 1
+        time.sleep(self.render_seconds)
+        return JsonResponse({"jobs": [{"id": i, "title": f"Job {i}"} for i in range(50)]})
+
+    def _request(self, view):
+        request = RequestFactory().get("/jobs/alljobs")
+        request.user = AnonymousUser()
+        started = time.perf_counter()
+        response = view(request)
+        if response.status_code != 200:
+            raise CommandError(f"Unexpected status {response.status_code}")
+        return time.perf_counter() - started
+
+    def _warm(self, view):
+        self._request(view)
+        self.cache_key = next(iter(scan_keys(f"{KEY_PREFIX}*:raw", client=redis_client)))
+
+    def _expire_hard(self):
+        redis_client.delete(self.cache_key)
+
+    def _expire_soft(self):
+        # Keep the body but move its soft expiry into the past
+        binary_redis_client.hset(self.cache_key, "fresh_until", "0")
+
+    def _uncoalesced(self, key, compute, timeout, stale_timeout=None, store=None, **kwargs):
+        """Plain read-through: every miss renders, as before single-flight."""
+        entry = store.get(key)
+        if entry is not None:
+            return entry["value"]
+        value = compute()
+        if value is not None:
+            store.set(key, {"value": value, "fresh_until": time.time() + timeout}, timeout)
+        return value
+
+    def _scenario(self, label, view, count, expire):
+        self._request(view)  # Make sure an entry exists before expiring it
+        expire()
+        self.renders = 0
+        barrier = threading.Barrier(count)
+
+        def fire():
+            barrier.wait()
+            return self._request(view)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            timings = sorted(pool.map(lambda _: fire(), range(count)))
+        elapsed = time.perf_counter() - started
+
+        style = self.style.SUCCESS if self.renders <= 1 else self.style.WARNING
+        self.stdout.write(style(
+            f"{label:<28} | requests {count:>4} | renders {self.renders:>4} | "
+            f"p50 {statistics.median(timings) * 1000:7.1f} ms | "
+            f"p95 {timings[int(count * 0.95) - 1] * 1000:7.1f} ms | "
+            f"max {timings[-1] * 1000:7.1f} ms | wall {elapsed:5.2f}s"
+        ))
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional
 
 from django.core.management.base import BaseCommand
 
+from core.redis.cache_tags import scan_keys
+
 logger = logging.getLogger(__name__)
 
 
@@ -189,7 +191,7 @@ class Command(BaseCommand):
         """
         try:
             # Get all keys
-            keys = redis_client.keys("*")
+            keys = list(scan_keys("*", client=redis_client))
             
             # Sample keys if there are too many
             if len(keys) > 1000:
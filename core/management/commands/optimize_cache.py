@@ -14,6 +14,7 @@ from django.db import models
 
 from core.cache import get_cache_stats, redis_client
 from core.redis_models import cache_model
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +101,7 @@ class Command(BaseCommand):
         }
         
         # Get all keys
-        keys = redis_client.keys("*")
+        keys = list(scan_keys("*", client=redis_client))
         
         # Sample keys if there are too many
         if len(keys) > 1000:
@@ -221,7 +222,7 @@ class Command(BaseCommand):
                 
                 # Get keys without TTL
                 pattern = f"{prefix}:*"
-                keys = redis_client.keys(pattern)
+                keys = list(scan_keys(pattern, client=redis_client))
                 
                 for key in keys:
                     ttl = redis_client.ttl(key)
@@ -274,7 +275,7 @@ class Command(BaseCommand):
                 
                 # Get keys with short TTL
                 pattern = f"{prefix}:*"
-                keys = redis_client.keys(pattern)
+                keys = list(scan_keys(pattern, client=redis_client))
                 
                 for key in keys:
                     ttl = redis_client.ttl(key)
@@ -0,0 +1,367 @@
+"""
+Request and operation metrics exposed in the Prometheus text format.
+
+``MetricsMiddleware`` times every request and breaks it down into database
+queries, Redis calls and cache hits/misses; the ``instrument`` decorator does
+the same for any function (Celery tasks, helpers called from several views).
+Measurements are kept as:
+
+- ``payshift_http_request_duration_seconds`` histogram per route, method and
+  status class, plus ``payshift_http_request_db_queries_total``,
+  ``payshift_http_request_db_seconds_total``,
+  ``payshift_http_request_redis_calls_total``,
+  ``payshift_http_request_redis_seconds_total``,
+  ``payshift_http_request_cache_hits_total`` and
+  ``payshift_http_request_cache_misses_total`` counters with the same labels.
+- The same families under ``payshift_operation_*`` (e.g.
+  ``payshift_operation_duration_seconds``,
+  ``payshift_operation_db_queries_total``) for ``instrument``, labelled by
+  operation name.
+
+Each process adds its counters to one Redis hash every METRICS_FLUSH_INTERVAL
+seconds, so ``metrics_view`` (``/core/metrics/``) reports every gunicorn
+worker no matter which one answers the scrape. Recording is a few in-memory
+additions per request; database queries are counted with
+``connection.execute_wrapper`` and Redis calls by wrapping
+``redis.Redis.execute_command`` once at startup.
+
+Usage:
+    from core.metrics import instrument
+
+    @instrument("payments.verify_batch")
+    def verify_batch(...):
+        ...
+"""
+
+import logging
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+# Constants
+METRICS_ENABLED = getattr(settings, 'METRICS_ENABLED', True)
+METRICS_FLUSH_INTERVAL = getattr(settings, 'METRICS_FLUSH_INTERVAL', 5)  # seconds
+METRICS_TOKEN = getattr(settings, 'METRICS_TOKEN', None)  # Bearer token required by the scrape endpoint
+METRICS_KEY = 'metrics:aggregate'
+METRIC_PREFIX = 'payshift_'
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+_BUCKET_LABELS = [f"{bound:g}" for bound in LATENCY_BUCKETS] + ["+Inf"]
+
+COUNTER_FAMILIES = (
+    ('db_queries_total', 'Database queries executed'),
+    ('db_seconds_total', 'Time spent in database queries'),
+    ('redis_calls_total', 'Redis commands and pipelines sent'),
+    ('redis_seconds_total', 'Time spent waiting for Redis'),
+    ('cache_hits_total', 'Cache lookups that hit'),
+    ('cache_misses_total', 'Cache lookups that missed'),
+)
+
+
+class RequestStats:
+    """Database, Redis and cache work done while handling one request or operation."""
+
+    __slots__ = ('db_queries', 'db_seconds', 'redis_calls', 'redis_seconds', 'cache_hits', 'cache_misses')
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.redis_calls = 0
+        self.redis_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def merge(self, other: "RequestStats") -> None:
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar('request_metrics', default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """Stats of the request or instrumented operation running in this context, if any."""
+    return _current.get()
+
+
+def note_cache_lookup(hit: bool) -> None:
+    """Count a cache hit or miss against the current request."""
+    stats = _current.get()
+    if stats is not None:
+        if hit:
+            stats.cache_hits += 1
+        else:
+            stats.cache_misses += 1
+
+
+def _db_wrapper(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.db_queries += 1
+        stats.db_seconds += time.perf_counter() - start
+
+
+def _timed_redis_call(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        stats = _current.get()
+        if stats is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.redis_calls += 1
+            stats.redis_seconds += time.perf_counter() - start
+    wrapper._metrics_wrapped = True
+    return wrapper
+
+
+def install_redis_instrumentation() -> None:
+    """Count every Redis command and pipeline sent by any client in this process."""
+    import redis
+    from redis.client import Pipeline
+
+    if getattr(redis.Redis.execute_command, '_metrics_wrapped', False):
+        return
+    redis.Redis.execute_command = _timed_redis_call(redis.Redis.execute_command)
+    # Commands queued on a pipeline are sent, and counted, once by execute()
+    Pipeline.execute = _timed_redis_call(Pipeline.execute)
+
+
+def _label_string(labels: Tuple[Tuple[str, str], ...]) -> str:
+    def escape(value):
+        return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+    return ','.join(f'{name}="{escape(value)}"' for name, value in labels)
+
+
+class MetricsRegistry:
+    """
+    Per-process metric values, flushed to a Redis hash shared by all processes.
+
+    Values are keyed by hash field: ``family|labels|suffix``, where the
+    suffix is ``sum``, ``count``, ``bucket:<le>`` (not cumulative) or ``total``.
+    """
+
+    def __init__(self, flush_interval: float = METRICS_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._values: Dict[str, float] = defaultdict(float)
+        self._next_flush = time.monotonic() + flush_interval
+
+    def observe(self, kind: str, labels: Tuple[Tuple[str, str], ...], duration: float, stats: RequestStats) -> None:
+        values = self._values
+        label_string = _label_string(labels)
+        histogram = f"{kind}_duration_seconds|{label_string}|"
+        values[histogram + 'sum'] += duration
+        values[histogram + 'count'] += 1
+        values[histogram + 'bucket:' + _BUCKET_LABELS[bisect_left(LATENCY_BUCKETS, duration)]] += 1
+        for (family, _), value in zip(COUNTER_FAMILIES, (
+            stats.db_queries, stats.db_seconds, stats.redis_calls,
+            stats.redis_seconds, stats.cache_hits, stats.cache_misses,
+        )):
+            if value:
+                values[f"{kind}_{family}|{label_string}|total"] += value
+
+        if time.monotonic() >= self._next_flush:
+            self.flush()
+
+    def flush(self, client=None) -> int:
+        """
+        Add this process's values to the shared Redis hash in one pipeline.
+
+        Returns:
+            The number of fields written
+        """
+        self._next_flush = time.monotonic() + self.flush_interval
+        client = client or _default_client()
+        if client is None or not self._values:
+            return 0
+
+        values, self._values = self._values, defaultdict(float)
+        try:
+            pipe = client.pipeline(transaction=False)
+            for field, value in values.items():
+                pipe.hincrbyfloat(METRICS_KEY, field, value)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error flushing metrics: {str(e)}")
+            # Keep the values for the next flush
+            for field, value in values.items():
+                self._values[field] += value
+            return 0
+        return len(values)
+
+    def snapshot(self, client=None) -> Dict[str, float]:
+        """All values recorded so far, across processes when Redis is available."""
+        client = client or _default_client()
+        if client is None:
+            return dict(self._values)
+        self.flush(client)
+        try:
+            raw = client.hgetall(METRICS_KEY)
+        except Exception as e:
+            logger.warning(f"Error reading metrics: {str(e)}")
+            return dict(self._values)
+        return {
+            (field.decode() if isinstance(field, bytes) else field): float(value)
+            for field, value in raw.items()
+        }
+
+
+def _default_client():
+    from core.redis.cache import redis_client
+
+    return redis_client
+
+
+# Shared by every caller in this process
+registry = MetricsRegistry()
+
+
+def _observe(kind, labels, start, stats):
+    try:
+        registry.observe(kind, labels, time.perf_counter() - start, stats)
+    except Exception as e:
+        logger.warning(f"Error recording metrics: {str(e)}")
+
+
+def instrument(name: Optional[str] = None):
+    """
+    Decorator recording a function's latency and its DB/Redis/cache breakdown.
+
+    Work done inside an instrumented function also counts towards the
+    request (or outer operation) that called it.
+
+    Args:
+        name: Operation label (defaults to module.qualname of the function)
+    """
+    def decorator(func):
+        operation = name or f"{func.__module__}.{func.__qualname__}"
+        labels = (('operation', operation),)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not METRICS_ENABLED:
+                return func(*args, **kwargs)
+            outer = _current.get()
+            stats = RequestStats()
+            token = _current.set(stats)
+            start = time.perf_counter()
+            try:
+                with ExitStack() as stack:
+                    if outer is None:
+                        # Inside a request the middleware already wraps the connections
+                        for connection in connections.all():
+                            stack.enter_context(connection.execute_wrapper(_db_wrapper))
+                    return func(*args, **kwargs)
+            finally:
+                _current.reset(token)
+                if outer is not None:
+                    outer.merge(stats)
+                _observe('operation', labels, start, stats)
+        return wrapper
+    return decorator
+
+
+def _route(request: HttpRequest) -> str:
+    # The URL pattern, not the path, so the number of series stays bounded
+    match = getattr(request, 'resolver_match', None)
+    return match.route if match is not None and match.route else 'unmatched'
+
+
+class MetricsMiddleware:
+    """
+    Middleware recording per-route request latency and its DB/Redis/cache breakdown.
+
+    Add to MIDDLEWARE in settings.py, as early as possible:
+    'core.metrics.MetricsMiddleware',
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not METRICS_ENABLED:
+            return self.get_response(request)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status = 500
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_db_wrapper))
+                response = self.get_response(request)
+            status = response.status_code
+            return response
+        finally:
+            _current.reset(token)
+            labels = (('route', _route(request)), ('method', request.method), ('status', f"{status // 100}xx"))
+            _observe('http_request', labels, start, stats)
+
+
+def render_metrics(values: Dict[str, float]) -> str:
+    """Render ``family|labels|suffix`` values in the Prometheus text format."""
+    families = defaultdict(lambda: defaultdict(dict))
+    for field, value in values.items():
+        family, label_string, suffix = field.split('|', 2)
+        families[family][label_string][suffix] = value
+
+    lines = []
+    for family in sorted(families):
+        name = f"{METRIC_PREFIX}{family}"
+        if family.endswith('_duration_seconds'):
+            lines.append(f"# HELP {name} Latency in seconds")
+            lines.append(f"# TYPE {name} histogram")
+            for label_string, series in sorted(families[family].items()):
+                separator = ',' if label_string else ''
+                cumulative = 0
+                for le in _BUCKET_LABELS:
+                    cumulative += series.get(f"bucket:{le}", 0)
+                    lines.append(f'{name}_bucket{{{label_string}{separator}le="{le}"}} {cumulative:g}')
+                lines.append(f"{name}_sum{{{label_string}}} {series.get('sum', 0):g}")
+                lines.append(f"{name}_count{{{label_string}}} {series.get('count', 0):g}")
+        else:
+            description = next((text for suffix, text in COUNTER_FAMILIES if family.endswith(suffix)), family)
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for label_string, series in sorted(families[family].items()):
+                lines.append(f"{name}{{{label_string}}} {series.get('total', 0):g}")
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Scrape endpoint in the Prometheus text format.
+
+    Requires ``Authorization: Bearer <METRICS_TOKEN>`` when METRICS_TOKEN is
+    set, and a staff user otherwise.
+    """
+    if METRICS_TOKEN:
+        if request.headers.get('Authorization') != f"Bearer {METRICS_TOKEN}":
+            return HttpResponse(status=401)
+    elif not (request.user.is_authenticated and (request.user.is_staff or request.user.is_superuser)):
+        return HttpResponse(status=403)
+
+    return HttpResponse(
+        render_metrics(registry.snapshot()),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
@@ -5,6 +5,8 @@ This module provides mixins that can be added to models to enhance
 cache consistency through timestamps, versioning, and other features.
 """
 
+import copy
+
 from django.db import models
 from django.utils import timezone
 
@@ -110,3 +112,65 @@ class ComprehensiveCacheableModelMixin(VersionedModelMixin, CacheableModelMixin)
     
     class Meta:
         abstract = True
+
+
+class DirtyFieldsMixin(models.Model):
+    """
+    Mixin that tracks which fields changed since the instance was loaded.
+
+    The values a row was loaded with are kept on the instance (see
+    ``from_db``), so ``get_dirty_fields()`` can tell what a save is about to
+    change without re-reading the row. Fields deferred at load time count as
+    changed once they are assigned.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for name, value in zip(field_names, values)
+        }
+        return instance
+
+    def get_loaded_value(self, attname, default=None):
+        """Value a field had when the instance was loaded, by attname (e.g. "client_id")."""
+        return getattr(self, "_loaded_values", {}).get(attname, default)
+
+    def get_dirty_fields(self):
+        """
+        Names of the fields whose value differs from the loaded state.
+
+        Returns:
+            A set of field names, or None when there is no loaded state to
+            compare with (new or hand-built instances), meaning any field
+            may have changed
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        if loaded is None or self._state.adding:
+            return None
+        dirty = set()
+        for field in self._meta.concrete_fields:
+            if field.attname in loaded:
+                if getattr(self, field.attname) != loaded[field.attname]:
+                    dirty.add(field.name)
+            elif field.attname in self.__dict__:
+                # Deferred when loaded but assigned since: assume it changed
+                dirty.add(field.name)
+        return dirty
+
+    def _snapshot_loaded_values(self, update_fields=None):
+        """Treat the current values as loaded, e.g. after a save."""
+        loaded = getattr(self, "_loaded_values", None)
+        if loaded is None:
+            loaded = self._loaded_values = {}
+        deferred = self.get_deferred_fields()
+        for field in self._meta.concrete_fields:
+            if field.attname in deferred:
+                continue
+            if update_fields is None or field.name in update_fields or field.attname in update_fields:
+                value = getattr(self, field.attname)
+                loaded[field.attname] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
@@ -0,0 +1,179 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+OFFSET pagination makes the database walk and discard every row before the
+requested page, and each request pays for a separate COUNT(*). Keyset
+pagination instead remembers the ordering values of the last row served and
+asks for the rows strictly after it, which an index on the ordering columns
+answers in the same time on page 1 and page 1000.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the last row's
+ordering values. The default ordering is newest first over
+``(created_at, id)``; ``id`` makes the order total so no row is skipped or
+repeated when timestamps collide.
+
+Usage:
+    from core.pagination import paginate_by_cursor
+    page = paginate_by_cursor(Notification.objects.filter(user=user), cursor, page_size=50)
+    return {"results": [...page.items...], **page.metadata()}
+"""
+
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q, QuerySet
+
+DEFAULT_ORDERING = ("-created_at", "-id")
+
+# Counting stops here when an approximate total is requested
+APPROXIMATE_COUNT_CAP = 10000
+
+COUNT_EXACT = "exact"
+COUNT_APPROXIMATE = "approximate"
+
+
+class _CursorEncoder(json.JSONEncoder):
+    """Keeps full precision: DjangoJSONEncoder truncates datetimes to milliseconds."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        if isinstance(o, (decimal.Decimal, uuid.UUID)):
+            return str(o)
+        return super().default(o)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded for the requested ordering."""
+
+
+@dataclass
+class CursorPage:
+    items: List[Any]
+    next_cursor: Optional[str]
+    has_next: bool
+    total_count: Optional[int] = None
+    total_count_is_estimate: bool = False
+
+    def metadata(self) -> dict:
+        """Pagination fields to merge into an endpoint's response."""
+        data = {"next_cursor": self.next_cursor, "has_next": self.has_next}
+        if self.total_count is not None:
+            data["total_count"] = self.total_count
+            data["total_count_is_estimate"] = self.total_count_is_estimate
+        return data
+
+
+def _field_name(field: str) -> str:
+    return field[1:] if field.startswith("-") else field
+
+
+def encode_cursor(obj, ordering: Sequence[str] = DEFAULT_ORDERING) -> str:
+    """Cursor pointing just after ``obj`` in ``ordering``."""
+    values = [getattr(obj, _field_name(field)) for field in ordering]
+    payload = json.dumps(values, cls=_CursorEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model, ordering: Sequence[str] = DEFAULT_ORDERING) -> List[Any]:
+    """
+    Ordering values stored in ``cursor``, converted back to Python types.
+
+    Values of model fields go through the field's ``to_python``; values of
+    annotations are returned as decoded from JSON.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Malformed cursor: {e}") from e
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor("Cursor does not match the ordering")
+
+    converted = []
+    for field, value in zip(ordering, values):
+        try:
+            model_field = model._meta.get_field(_field_name(field))
+        except FieldDoesNotExist:
+            converted.append(value)
+            continue
+        try:
+            converted.append(model_field.to_python(value))
+        except ValidationError as e:
+            raise InvalidCursor(f"Invalid cursor value for {field}") from e
+    return converted
+
+
+def keyset_filter(queryset: QuerySet, values: Sequence[Any], ordering: Sequence[str] = DEFAULT_ORDERING) -> QuerySet:
+    """Rows of ``queryset`` that come strictly after ``values`` in ``ordering``."""
+    condition = Q()
+    equal = {}
+    for field, value in zip(ordering, values):
+        name = _field_name(field)
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= Q(**equal, **{f"{name}__{lookup}": value})
+        equal[name] = value
+
+    # Redundant bound on the leading column: without it the planner filters
+    # the OR row by row instead of seeking the index to the cursor position
+    first = ordering[0]
+    bound = {f"{_field_name(first)}__{'lte' if first.startswith('-') else 'gte'}": values[0]}
+    return queryset.filter(Q(**bound), condition)
+
+
+def count_rows(queryset: QuerySet, mode: str = COUNT_EXACT):
+    """
+    Return ``(count, is_estimate)`` for ``queryset``.
+
+    ``approximate`` counts at most ``APPROXIMATE_COUNT_CAP`` rows, so its cost
+    is bounded on large tables; a capped result is flagged as an estimate.
+    """
+    queryset = queryset.order_by()
+    if mode == COUNT_APPROXIMATE:
+        count = queryset[:APPROXIMATE_COUNT_CAP].count()
+        return count, count >= APPROXIMATE_COUNT_CAP
+    return queryset.count(), False
+
+
+def paginate_by_cursor(
+    queryset: QuerySet,
+    cursor: Optional[str] = None,
+    page_size: int = 20,
+    ordering: Sequence[str] = DEFAULT_ORDERING,
+    count: Optional[str] = None,
+) -> CursorPage:
+    """
+    Return the page of ``queryset`` that follows ``cursor`` (the first page when empty).
+
+    ``count`` is ``None`` (no total), ``"exact"`` or ``"approximate"``. The
+    total is only computed for the first page, where clients need it; later
+    pages reuse what they were told. Raises ``InvalidCursor`` for cursors that
+    do not belong to ``ordering``.
+    """
+    ordering = tuple(ordering)
+    ordered = queryset.order_by(*ordering)
+
+    total_count, is_estimate = None, False
+    if count and not cursor:
+        total_count, is_estimate = count_rows(queryset, count)
+
+    if cursor:
+        ordered = keyset_filter(ordered, decode_cursor(cursor, queryset.model, ordering), ordering)
+
+    rows = list(ordered[:page_size + 1])
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    return CursorPage(
+        items=rows,
+        next_cursor=encode_cursor(rows[-1], ordering) if has_next else None,
+        has_next=has_next,
+        total_count=total_count,
+        total_count_is_estimate=is_estimate,
+    )
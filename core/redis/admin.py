@@ -34,6 +34,7 @@ from core.redis.warming import (
     warm_cache,
     warm_critical_models,
 )
+from core.redis.cache_tags import scan_keys
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -176,7 +177,7 @@ def redis_clear_cache_api(request):
             }, status=500)
 
         # Get keys matching pattern
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
         if not keys:
             return JsonResponse({
                 "success": True,
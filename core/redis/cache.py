@@ -14,6 +14,7 @@ Features:
 - Monitoring and statistics
 """
 
+import gzip
 import hashlib
 import inspect
 import json
@@ -29,14 +30,21 @@ import redis
 from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Model, QuerySet
-from django.http import HttpRequest, JsonResponse
-
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified, JsonResponse
+from django.utils.cache import patch_vary_headers
+
+from core.cache_telemetry import record_cache_operation
+from core.metrics import note_cache_lookup
+from core.redis.cache_tags import delete_pattern, invalidate_tags, scan_keys, set_tagged
+from core.redis.local_cache import local_cache
+from core.single_flight import get_or_compute
 from core.redis_settings import (
     CACHE_DEFAULT_TIMEOUT,
     CACHE_ENABLED,
     CACHE_STATS_INTERVAL,
     CACHE_TIMEOUTS,
     CACHE_VERSION,
+    L1_CACHE_ENABLED,
     REDIS_DB_CACHE,
     get_redis_connection_params,
 )
@@ -84,6 +92,9 @@ _cache_operations_counter = 0
 _cache_hits = 0
 _cache_misses = 0
 _last_stats_time = time.time()
+# Lifetime Redis tier counters; the ones above are reset every stats interval
+_redis_tier_hits = 0
+_redis_tier_misses = 0
 
 # Initialize Redis connection
 try:
@@ -118,6 +129,28 @@ if redis_client is None and settings.DEBUG:
         # Continue without Redis
 
 
+def _binary_client(client):
+    """
+    Return a client on the same server that leaves replies as bytes.
+
+    Raw response bodies may be compressed, so they cannot go through a client
+    created with decode_responses=True.
+    """
+    if client is None:
+        return None
+    pool = client.connection_pool
+    if not pool.connection_kwargs.get("decode_responses"):
+        return client
+    binary_pool = pool.__class__(
+        connection_class=pool.connection_class,
+        **{**pool.connection_kwargs, "decode_responses": False},
+    )
+    return type(client)(connection_pool=binary_pool)
+
+
+binary_redis_client = _binary_client(redis_client)
+
+
 class CustomJSONEncoder(DjangoJSONEncoder):
     """
     Custom JSON encoder that handles Django models, QuerySets, Decimal objects,
@@ -233,18 +266,28 @@ def log_cache_stats() -> None:
         _cache_misses = 0
 
 
-def get_cached_data(key: str, bypass_cache: bool = False) -> Optional[Any]:
+def _use_local(local_timeout: Optional[int]) -> bool:
+    """Whether to go through the in-process L1 tier, listening for invalidations first."""
+    return bool(local_timeout) and L1_CACHE_ENABLED and local_cache.listen(redis_client)
+
+
+def get_cached_data(
+    key: str, bypass_cache: bool = False, local_timeout: Optional[int] = None
+) -> Optional[Any]:
     """
     Get data from the Redis cache.
 
     Args:
         key: The cache key
         bypass_cache: If True, bypass the cache and return None
+        local_timeout: If set, check the in-process L1 cache first and keep
+            Redis hits there for this many seconds. Only for hot data that
+            rarely changes and is invalidated through this module.
 
     Returns:
         The cached data or None if not found
     """
-    global _cache_hits, _cache_misses
+    global _cache_hits, _cache_misses, _redis_tier_hits, _redis_tier_misses
     start_time = time.time()
     operation_id = hashlib.md5(f"{key}:{time.time()}".encode()).hexdigest()[:8]
 
@@ -252,16 +295,29 @@ def get_cached_data(key: str, bypass_cache: bool = False) -> Optional[Any]:
         logger.debug(f"Cache disabled, Redis client not available, or bypass requested [op_id={operation_id}]")
         return None
 
+    use_local = _use_local(local_timeout)
+    if use_local:
+        # L1 holds the serialized form so callers never share a mutable object
+        local_data = local_cache.get(key)
+        if local_data is not None:
+            note_cache_lookup(True)
+            return json.loads(local_data)
+
     try:
         # Get data from Redis
+        redis_start = time.perf_counter()
         cached_data = redis_client.get(key)
+        record_cache_operation(CacheOp.GET, key, bool(cached_data), (time.perf_counter() - redis_start) * 1000)
 
         if cached_data:
             # Parse the JSON data
             result = json.loads(cached_data)
+            if use_local:
+                local_cache.set(key, cached_data, local_timeout)
 
             # Update hit counter
             _cache_hits += 1
+            _redis_tier_hits += 1
 
             # Log cache stats periodically
             log_cache_stats()
@@ -274,6 +330,7 @@ def get_cached_data(key: str, bypass_cache: bool = False) -> Optional[Any]:
 
         # Update miss counter
         _cache_misses += 1
+        _redis_tier_misses += 1
 
         # Log cache stats periodically
         log_cache_stats()
@@ -310,7 +367,13 @@ def get_cached_data(key: str, bypass_cache: bool = False) -> Optional[Any]:
         return None
 
 
-def set_cached_data(key: str, data: Any, timeout: Optional[int] = None) -> bool:
+def set_cached_data(
+    key: str,
+    data: Any,
+    timeout: Optional[int] = None,
+    tags: Optional[List[str]] = None,
+    local_timeout: Optional[int] = None,
+) -> bool:
     """
     Store data in the Redis cache.
 
@@ -318,6 +381,9 @@ def set_cached_data(key: str, data: Any, timeout: Optional[int] = None) -> bool:
         key: The cache key
         data: The data to cache
         timeout: Optional timeout in seconds
+        tags: Optional tags to index the key under for invalidate_cache_tag
+        local_timeout: If set, also keep the data in the in-process L1 cache
+            for this many seconds (see get_cached_data)
 
     Returns:
         True if successful, False otherwise
@@ -337,8 +403,18 @@ def set_cached_data(key: str, data: Any, timeout: Optional[int] = None) -> bool:
         serialized_data = json.dumps(data, cls=CustomJSONEncoder)
         data_size_bytes = len(serialized_data.encode('utf-8'))
 
-        # Store in Redis with expiration
-        redis_client.setex(key, timeout, serialized_data)
+        # Store in Redis with expiration, recording the key under its tags
+        redis_start = time.perf_counter()
+        if tags:
+            set_tagged(key, serialized_data, timeout, tags, client=redis_client)
+        else:
+            redis_client.setex(key, timeout, serialized_data)
+        record_cache_operation(CacheOp.SET, key, True, (time.perf_counter() - redis_start) * 1000)
+
+        if _use_local(local_timeout):
+            # Other processes may still hold the previous value in L1
+            local_cache.invalidate(keys=[key], client=redis_client)
+            local_cache.set(key, serialized_data, min(local_timeout, timeout), tags or ())
 
         # Log cache stats periodically
         log_cache_stats()
@@ -403,6 +479,8 @@ def delete_cached_data(key: str) -> bool:
 
         # Delete from Redis
         result = redis_client.delete(key)
+        if L1_CACHE_ENABLED:
+            local_cache.invalidate(keys=[key], client=redis_client)
 
         duration_ms = round((time.time() - start_time) * 1000, 2)
         if exists:
@@ -449,32 +527,11 @@ def invalidate_cache_pattern(pattern: str) -> int:
         return 0
 
     try:
-        # Find all keys matching the pattern
-        keys = redis_client.keys(pattern)
-
-        if not keys:
-            duration_ms = round((time.time() - start_time) * 1000, 2)
-            logger.debug(
-                f"No keys found matching pattern: {pattern} "
-                f"[op_id={operation_id}, duration_ms={duration_ms}]"
-            )
-            return 0
-
-        # For large key sets, delete in batches to avoid blocking Redis
-        batch_size = 1000
-        total_deleted = 0
-
-        for i in range(0, len(keys), batch_size):
-            batch = keys[i:i+batch_size]
-            deleted = redis_client.delete(*batch)
-            total_deleted += deleted
-
-            # Log progress for large deletions
-            if len(keys) > batch_size and i + batch_size < len(keys):
-                logger.debug(
-                    f"Deleted batch {i//batch_size + 1}/{(len(keys) + batch_size - 1)//batch_size}: "
-                    f"{deleted} keys [op_id={operation_id}]"
-                )
+        # Walk the keyspace with SCAN and delete in small batches; KEYS would
+        # block Redis for the whole keyspace on every call
+        total_deleted = delete_pattern(pattern, client=redis_client)
+        if L1_CACHE_ENABLED:
+            local_cache.invalidate(patterns=[pattern], client=redis_client)
 
         duration_ms = round((time.time() - start_time) * 1000, 2)
         logger.info(
@@ -498,6 +555,179 @@ def invalidate_cache_pattern(pattern: str) -> int:
         return 0
 
 
+def invalidate_cache_tag(*tags: str) -> int:
+    """
+    Invalidate all cache keys written with any of the given tags.
+
+    Unlike invalidate_cache_pattern this only touches the keys recorded under
+    each tag, so its cost does not grow with the size of the keyspace.
+
+    Args:
+        tags: The tags to invalidate (e.g., "job:42")
+
+    Returns:
+        Number of keys invalidated
+    """
+    if not CACHE_ENABLED or not redis_client:
+        return 0
+
+    try:
+        deleted = invalidate_tags(*tags, client=redis_client)
+        if L1_CACHE_ENABLED:
+            local_cache.invalidate(tags=tags, client=redis_client)
+        return deleted
+    except redis.RedisError as e:
+        logger.error(f"Redis error invalidating cache tags {tags}: {str(e)}")
+        return 0
+
+
+def get_hash_all(key: str, local_timeout: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Get every field of a Redis hash written with set_hash_field.
+
+    Args:
+        key: The hash key
+        local_timeout: If set, keep the whole hash in the in-process L1 cache
+            for this many seconds (see get_cached_data)
+
+    Returns:
+        Dictionary of deserialized field values
+    """
+    if not CACHE_ENABLED or not redis_client:
+        return {}
+
+    use_local = _use_local(local_timeout)
+    if use_local:
+        local_data = local_cache.get(key)
+        if local_data is not None:
+            return json.loads(local_data)
+
+    try:
+        fields = {field: json.loads(value) for field, value in redis_client.hgetall(key).items()}
+    except (redis.RedisError, json.JSONDecodeError) as e:
+        logger.error(f"Error reading hash {key}: {str(e)}")
+        return {}
+    if use_local:
+        local_cache.set(key, json.dumps(fields, cls=CustomJSONEncoder), local_timeout)
+    return fields
+
+
+def get_hash_field(key: str, field: str, local_timeout: Optional[int] = None) -> Optional[Any]:
+    """
+    Get one field of a Redis hash written with set_hash_field.
+
+    With local_timeout the whole hash is read once and later fields are
+    served from the in-process L1 cache.
+    """
+    if _use_local(local_timeout):
+        return get_hash_all(key, local_timeout).get(field)
+
+    if not CACHE_ENABLED or not redis_client:
+        return None
+    try:
+        value = redis_client.hget(key, field)
+        return json.loads(value) if value is not None else None
+    except (redis.RedisError, json.JSONDecodeError) as e:
+        logger.error(f"Error reading field {field} of hash {key}: {str(e)}")
+        return None
+
+
+def set_hash_field(key: str, field: str, value: Any, timeout: Optional[int] = None) -> bool:
+    """
+    Set one JSON-serialized field of a Redis hash and refresh its expiry.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not CACHE_ENABLED or not redis_client:
+        return False
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(key, field, json.dumps(value, cls=CustomJSONEncoder))
+        pipe.expire(key, timeout or CACHE_DEFAULT_TIMEOUT)
+        pipe.execute()
+    except (redis.RedisError, TypeError) as e:
+        logger.error(f"Error setting field {field} of hash {key}: {str(e)}")
+        return False
+    if L1_CACHE_ENABLED:
+        local_cache.invalidate(keys=[key], client=redis_client)
+    return True
+
+
+def delete_hash_field(key: str, field: str) -> bool:
+    """
+    Delete one field of a Redis hash.
+
+    Returns:
+        True if the field existed, False otherwise
+    """
+    if not CACHE_ENABLED or not redis_client:
+        return False
+    try:
+        deleted = redis_client.hdel(key, field)
+    except redis.RedisError as e:
+        logger.error(f"Error deleting field {field} of hash {key}: {str(e)}")
+        return False
+    if L1_CACHE_ENABLED:
+        local_cache.invalidate(keys=[key], client=redis_client)
+    return bool(deleted)
+
+
+def publish_notification(channel: str, data: Any) -> bool:
+    """
+    Publish a notification to a Redis channel.
+
+    Args:
+        channel: Channel name
+        data: Data to publish; dicts and lists are sent as JSON
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not CACHE_ENABLED or not redis_client:
+        return False
+    try:
+        message = json.dumps(data, cls=CustomJSONEncoder) if isinstance(data, (dict, list)) else str(data)
+        redis_client.publish(channel, message)
+        return True
+    except redis.RedisError as e:
+        logger.error(f"Error publishing notification to {channel}: {str(e)}")
+        return False
+
+
+class RedisStore:
+    """
+    Django cache-style add/get/set/delete on redis_client.
+
+    Lets core.single_flight and core.distributed_lock keep entries and locks
+    in the same Redis as the rest of this module. Errors are logged and
+    treated as misses, like django-redis with IGNORE_EXCEPTIONS.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        return get_cached_data(key)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return set_cached_data(key, value, timeout)
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        try:
+            return bool(redis_client.set(key, json.dumps(value, cls=CustomJSONEncoder), nx=True, ex=timeout))
+        except redis.RedisError as e:
+            logger.error(f"Redis error adding key={key}: {str(e)}")
+            return False
+
+    def delete(self, key: str) -> bool:
+        try:
+            return bool(redis_client.delete(key))
+        except redis.RedisError as e:
+            logger.error(f"Redis error deleting key={key}: {str(e)}")
+            return False
+
+
+redis_store = RedisStore()
+
+
 def cache_function_result(
     timeout: Optional[int] = None,
     key_prefix: Optional[str] = None,
@@ -505,10 +735,15 @@ def cache_function_result(
     include_args: bool = True,
     include_kwargs: bool = True,
     cache_none: bool = False,
+    stale_timeout: Optional[int] = None,
 ) -> Callable:
     """
     Decorator to cache function results in Redis.
 
+    Expired results are recomputed by one caller at a time; for
+    stale_timeout seconds after expiry the others keep getting the previous
+    result instead of recomputing it too (see core.single_flight).
+
     Args:
         timeout: Cache timeout in seconds
         key_prefix: Optional prefix for the cache key
@@ -516,6 +751,8 @@ def cache_function_result(
         include_args: Whether to include positional args in the cache key
         include_kwargs: Whether to include keyword args in the cache key
         cache_none: Whether to cache None results
+        stale_timeout: Seconds a stale result may be served while it is
+            refreshed (defaults to CACHE_STALE_TIMEOUT)
 
     Returns:
         Decorated function
@@ -558,23 +795,12 @@ def cache_function_result(
             # Generate the final cache key
             cache_key = generate_cache_key(prefix, identifier, namespace)
 
-            # Try to get from cache first
-            cached_result = get_cached_data(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for function {func_name}")
-                return cached_result
-
-            # Cache miss, call the function
-            logger.debug(f"Cache miss for function {func_name}")
-            result = func(*args, **kwargs)
-
-            # Don't cache None results unless explicitly requested
-            if result is not None or cache_none:
-                # Use provided timeout or get from CACHE_TIMEOUTS
-                cache_timeout = timeout or CACHE_TIMEOUTS.get("default")
-                set_cached_data(cache_key, result, cache_timeout)
-
-            return result
+            # Use provided timeout or get from CACHE_TIMEOUTS
+            cache_timeout = timeout or CACHE_TIMEOUTS.get("default")
+            return get_or_compute(
+                cache_key, lambda: func(*args, **kwargs), cache_timeout,
+                stale_timeout=stale_timeout, store=redis_store, cache_none=cache_none,
+            )
 
         return wrapper
 
@@ -588,10 +814,18 @@ def cache_api_response(
     vary_on_headers: Optional[List[str]] = None,
     vary_on_cookies: Optional[List[str]] = None,
     vary_on_query_params: Optional[List[str]] = None,
+    raw: bool = True,
+    compress: bool = False,
+    stale_timeout: Optional[int] = None,
 ) -> Callable:
     """
     Decorator to cache API responses in Redis.
 
+    By default the rendered response body is cached as bytes together with
+    its content type and an ETag, so hits are served without parsing or
+    re-serializing JSON and requests carrying a matching If-None-Match get a
+    304. With raw=False the parsed JSON data is cached instead.
+
     Args:
         timeout: Cache timeout in seconds
         key_prefix: Optional prefix for the cache key
@@ -599,6 +833,10 @@ def cache_api_response(
         vary_on_headers: List of HTTP headers to include in the cache key
         vary_on_cookies: List of cookies to include in the cache key
         vary_on_query_params: List of query parameters to include in the cache key
+        raw: Cache the rendered body bytes rather than the parsed JSON data
+        compress: Gzip raw bodies of RAW_COMPRESS_MIN_BYTES or more
+        stale_timeout: Seconds a stale response may be served while one
+            request re-renders it (defaults to CACHE_STALE_TIMEOUT)
 
     Returns:
         Decorated function
@@ -692,34 +930,224 @@ def cache_api_response(
             # Generate the final cache key
             cache_key = generate_cache_key(prefix, identifier, namespace)
 
-            # Try to get from cache first
-            cached_response = get_cached_data(cache_key)
-            if cached_response is not None:
-                logger.debug(f"Cache hit for API view {view_name}")
-                return JsonResponse(cached_response)
-
-            # Cache miss, call the view function
-            logger.debug(f"Cache miss for API view {view_name}")
-            response = view_func(request, *args, **kwargs)
+            # Use provided timeout or get from CACHE_TIMEOUTS
+            cache_timeout = timeout or CACHE_TIMEOUTS.get("default")
 
-            # Only cache JsonResponse objects
-            if isinstance(response, JsonResponse):
-                # Use provided timeout or get from CACHE_TIMEOUTS
-                cache_timeout = timeout or CACHE_TIMEOUTS.get("default")
+            if raw:
+                return _raw_cached_view(
+                    view_func, request, args, kwargs, f"{cache_key}:raw",
+                    cache_timeout, compress, stale_timeout,
+                )
 
-                # Extract the response data
-                response_data = json.loads(response.content.decode("utf-8"))
+            rendered = {}
 
-                # Cache the response data
-                set_cached_data(cache_key, response_data, cache_timeout)
+            def render():
+                logger.debug(f"Cache miss for API view {view_name}")
+                response = rendered["response"] = view_func(request, *args, **kwargs)
+                # Only cache JsonResponse objects
+                if isinstance(response, JsonResponse):
+                    return json.loads(response.content.decode("utf-8"))
+                return None
 
-            return response
+            response_data = get_or_compute(
+                cache_key, render, cache_timeout, stale_timeout=stale_timeout, store=redis_store
+            )
+            if "response" in rendered:
+                return rendered["response"]
+            return JsonResponse(response_data)
 
         return wrapper
 
     return decorator
 
 
+# Raw bodies smaller than this are not worth gzipping
+RAW_COMPRESS_MIN_BYTES = 1024
+
+
+def _response_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(request: HttpRequest, etag: str) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _not_modified(etag: str) -> HttpResponseNotModified:
+    response = HttpResponseNotModified()
+    response["ETag"] = etag
+    return response
+
+
+def _response_from_entry(request: HttpRequest, entry: Dict[bytes, bytes]) -> HttpResponse:
+    body = entry[b"body"]
+    encoding = entry.get(b"encoding")
+    gzipped = encoding == b"gzip"
+    if gzipped and "gzip" not in request.headers.get("Accept-Encoding", ""):
+        body = gzip.decompress(body)
+        gzipped = False
+
+    response = HttpResponse(
+        body, content_type=entry[b"content_type"].decode(), status=int(entry[b"status"])
+    )
+    response["ETag"] = entry[b"etag"].decode()
+    if encoding:
+        patch_vary_headers(response, ("Accept-Encoding",))
+    if gzipped:
+        response["Content-Encoding"] = "gzip"
+    return response
+
+
+def _render_entry(response: HttpResponse, compress: bool = False) -> Dict[bytes, bytes]:
+    """Build the raw cache entry for a rendered response, keyed and valued as Redis returns them."""
+    body = response.content
+    entry = {
+        b"body": body,
+        b"content_type": response.get("Content-Type", "application/json").encode(),
+        b"status": str(response.status_code).encode(),
+        b"etag": _response_etag(body).encode(),
+    }
+    if compress and len(body) >= RAW_COMPRESS_MIN_BYTES:
+        entry[b"body"] = gzip.compress(body, compresslevel=6, mtime=0)
+        entry[b"encoding"] = b"gzip"
+    return entry
+
+
+class RawResponseStore:
+    """
+    Store for raw response entries, kept as Redis hashes.
+
+    Presents each hash to core.single_flight as a {"value", "fresh_until"}
+    envelope, with the soft expiry kept in a "fresh_until" field.
+    """
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not binary_redis_client:
+            return None
+        try:
+            entry = binary_redis_client.hgetall(key)
+        except redis.RedisError as e:
+            logger.error(f"Redis error reading cached response {key}: {str(e)}")
+            return None
+        if not entry:
+            return None
+        # Entries cached without a soft expiry are fresh until they expire
+        fresh_until = float(entry.pop(b"fresh_until", "inf"))
+        return {"value": entry, "fresh_until": fresh_until}
+
+    def set(self, key: str, envelope: Dict[str, Any], timeout: Optional[int] = None) -> bool:
+        if not binary_redis_client:
+            return False
+        try:
+            pipe = binary_redis_client.pipeline()
+            pipe.delete(key)
+            pipe.hset(key, mapping={**envelope["value"], b"fresh_until": repr(envelope["fresh_until"])})
+            pipe.expire(key, timeout or CACHE_DEFAULT_TIMEOUT)
+            pipe.execute()
+            return True
+        except redis.RedisError as e:
+            logger.error(f"Redis error caching response {key}: {str(e)}")
+            return False
+
+
+raw_response_store = RawResponseStore()
+
+
+def _cached_etag(cache_key: str) -> Optional[str]:
+    try:
+        etag = binary_redis_client.hget(cache_key, "etag")
+    except redis.RedisError as e:
+        logger.error(f"Redis error reading cached response {cache_key}: {str(e)}")
+        return None
+    return etag.decode() if etag is not None else None
+
+
+def get_cached_response(request: HttpRequest, cache_key: str) -> Optional[HttpResponse]:
+    """
+    Build a response from a raw cache entry stored by cache_response.
+
+    The cached bytes are handed to HttpResponse as they come back from Redis;
+    gzipped bodies are only decompressed for clients that do not accept gzip.
+    Stale entries are returned too. Returns None on a miss.
+    """
+    if not CACHE_ENABLED or not binary_redis_client:
+        return None
+
+    if request.headers.get("If-None-Match"):
+        # Conditional requests only need the ETag to answer with a 304
+        etag = _cached_etag(cache_key)
+        if etag is not None and _etag_matches(request, etag):
+            return _not_modified(etag)
+
+    envelope = raw_response_store.get(cache_key)
+    if envelope is None:
+        return None
+    return _response_from_entry(request, envelope["value"])
+
+
+def cache_response(
+    cache_key: str,
+    response: HttpResponse,
+    timeout: Optional[int] = None,
+    compress: bool = False,
+    stale_timeout: int = 0,
+) -> Optional[str]:
+    """
+    Store a rendered response body as bytes with its content type and ETag.
+
+    The entry is fresh for timeout seconds and kept stale_timeout seconds longer.
+    Returns the ETag, or None if the response could not be cached.
+    """
+    if not CACHE_ENABLED or not binary_redis_client:
+        return None
+
+    timeout = timeout or CACHE_DEFAULT_TIMEOUT
+    entry = _render_entry(response, compress)
+    envelope = {"value": entry, "fresh_until": time.time() + timeout}
+    if not raw_response_store.set(cache_key, envelope, timeout + stale_timeout):
+        return None
+    return entry[b"etag"].decode()
+
+
+def _raw_cached_view(view_func, request, args, kwargs, cache_key, timeout, compress, stale_timeout):
+    if request.headers.get("If-None-Match"):
+        # Answer revalidations from the ETag alone, stale or not
+        etag = _cached_etag(cache_key)
+        if etag is not None and _etag_matches(request, etag):
+            return _not_modified(etag)
+
+    rendered = {}
+
+    def render():
+        logger.debug(f"Cache miss for API view {view_func.__name__}")
+        response = rendered["response"] = view_func(request, *args, **kwargs)
+        if isinstance(response, JsonResponse):
+            return _render_entry(response, compress)
+        return None
+
+    entry = get_or_compute(
+        cache_key, render, timeout, stale_timeout=stale_timeout,
+        store=raw_response_store, lock_store=redis_store,
+    )
+    if "response" not in rendered:
+        logger.debug(f"Cache hit for API view {view_func.__name__}")
+        return _response_from_entry(request, entry)
+
+    response = rendered["response"]
+    if entry is None:
+        return response
+    etag = entry[b"etag"].decode()
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response["ETag"] = etag
+    return response
+
+
 def cache_model_instance(
     model_type: str,
     instance_id: Any,
@@ -858,6 +1286,27 @@ def invalidate_whoami(user_id: int) -> bool:
     return invalidate_model_instance("whoami", user_id)
 
 
+def get_tier_stats() -> Dict[str, Any]:
+    """
+    Get hit rates of this process's cache tiers.
+
+    The L1 tier only sees lookups made with local_timeout; the Redis tier
+    sees every lookup that reached Redis, including L1 misses.
+
+    Returns:
+        Dictionary with "l1" and "redis" statistics
+    """
+    lookups = _redis_tier_hits + _redis_tier_misses
+    return {
+        "l1": local_cache.stats(),
+        "redis": {
+            "hits": _redis_tier_hits,
+            "misses": _redis_tier_misses,
+            "hit_rate": round(_redis_tier_hits / lookups * 100, 2) if lookups else 0,
+        },
+    }
+
+
 def get_cache_stats() -> Dict[str, Any]:
     """
     Get statistics about the Redis cache.
@@ -880,7 +1329,7 @@ def get_cache_stats() -> Dict[str, Any]:
         key_counts = {}
         for prefix_name, prefix in CACHE_PREFIXES.items():
             pattern = f"{prefix}*"
-            count = len(redis_client.keys(pattern))
+            count = sum(1 for _ in scan_keys(pattern, client=redis_client))
             key_counts[prefix_name] = count
 
         # Calculate total keys
@@ -905,6 +1354,7 @@ def get_cache_stats() -> Dict[str, Any]:
             "uptime_seconds": info.get("uptime_in_seconds", 0),
             "connected_clients": info.get("connected_clients", 0),
             "version": info.get("redis_version", "unknown"),
+            "tiers": get_tier_stats(),
         }
     except Exception as e:
         logger.error(f"Error getting cache stats: {str(e)}")
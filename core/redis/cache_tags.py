@@ -0,0 +1,237 @@
+"""
+Tag-indexed cache invalidation.
+
+Every cached key can be recorded under one or more tags as it is written.
+A tag is a plain Redis set (``tag:<name>``) holding the keys written under
+it, so invalidating a tag touches only the keys in that set instead of
+walking the whole keyspace with ``KEYS``.
+
+For callers that still need glob patterns, ``scan_keys`` and
+``delete_pattern`` walk the keyspace incrementally with ``SCAN`` so no single
+command blocks Redis for longer than one small batch.
+"""
+
+import logging
+import uuid
+from typing import Iterable, Iterator, List, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+TAG_KEY_PREFIX = "tag:"
+
+# Keys fetched per SCAN/SSCAN call and deleted per UNLINK call
+SCAN_COUNT = 1000
+DELETE_BATCH_SIZE = 500
+
+GLOB_CHARACTERS = ("*", "?", "[")
+
+
+def _default_client():
+    from core.redis.cache import redis_client
+
+    return redis_client
+
+
+def tag_key_name(tag: str) -> str:
+    """Return the Redis key of the set that indexes ``tag``."""
+    return f"{TAG_KEY_PREFIX}{tag}"
+
+
+def is_pattern(pattern: str) -> bool:
+    """Return True if ``pattern`` contains glob characters."""
+    return any(char in pattern for char in GLOB_CHARACTERS)
+
+
+def _queue_tag_commands(pipe, tag_names: List[str], keys: List[str]) -> None:
+    # EXISTS before SADD tells a new set (TTL -1) from one kept forever
+    for tag_name in tag_names:
+        pipe.exists(tag_name)
+        pipe.sadd(tag_name, *keys)
+        pipe.ttl(tag_name)
+
+
+def _extend_tag_ttls(client, tag_names: List[str], results: List, timeout: Optional[int]) -> None:
+    """
+    Make sure no tag set expires before the keys it indexes.
+
+    ``results`` holds the EXISTS/SADD/TTL replies queued by
+    ``_queue_tag_commands``. Sets indexing untimed keys are kept forever.
+    """
+    pipe = client.pipeline(transaction=False)
+    pending = False
+    for index, tag_name in enumerate(tag_names):
+        existed, _, ttl = results[3 * index:3 * index + 3]
+        if not timeout:
+            if ttl >= 0:
+                pipe.persist(tag_name)
+                pending = True
+        elif not existed or 0 <= ttl < timeout:
+            pipe.expire(tag_name, timeout)
+            pending = True
+    if pending:
+        pipe.execute()
+
+
+def set_tagged(key: str, value, timeout: Optional[int] = None, tags: Iterable[str] = (), client=None) -> bool:
+    """
+    Store an already serialized ``value`` under ``key`` and index it by ``tags``.
+
+    The value and the tag memberships are written in one round trip; a
+    second one is only needed when a tag set's TTL has to be extended.
+    """
+    client = client or _default_client()
+    if client is None:
+        return False
+
+    tag_names = [tag_key_name(tag) for tag in tags]
+    pipe = client.pipeline(transaction=False)
+    if timeout:
+        pipe.setex(key, timeout, value)
+    else:
+        pipe.set(key, value)
+    _queue_tag_commands(pipe, tag_names, [key])
+    results = pipe.execute()
+    if tag_names:
+        _extend_tag_ttls(client, tag_names, results[1:], timeout)
+    return bool(results[0])
+
+
+def tag_keys(tags: Iterable[str], keys: Iterable[str], timeout: Optional[int] = None, client=None) -> None:
+    """Record ``keys`` that were written elsewhere under each of ``tags``."""
+    client = client or _default_client()
+    keys = list(keys)
+    tag_names = [tag_key_name(tag) for tag in tags]
+    if client is None or not keys or not tag_names:
+        return
+
+    pipe = client.pipeline(transaction=False)
+    _queue_tag_commands(pipe, tag_names, keys)
+    _extend_tag_ttls(client, tag_names, pipe.execute(), timeout)
+
+
+def tag_members(tag: str, client=None) -> Iterator[str]:
+    """Iterate over the keys recorded under ``tag``."""
+    client = client or _default_client()
+    if client is None:
+        return iter(())
+    return client.sscan_iter(tag_key_name(tag), count=SCAN_COUNT)
+
+
+def _unlink(client, keys: List[str]) -> int:
+    try:
+        return client.unlink(*keys)
+    except redis.ResponseError:
+        # UNLINK needs Redis 4; DEL is the blocking equivalent
+        return client.delete(*keys)
+
+
+def _delete_in_batches(client, keys: Iterable[str]) -> int:
+    deleted = 0
+    batch = []
+    for key in keys:
+        batch.append(key)
+        if len(batch) >= DELETE_BATCH_SIZE:
+            deleted += _unlink(client, batch)
+            batch = []
+    if batch:
+        deleted += _unlink(client, batch)
+    return deleted
+
+
+def invalidate_tag(tag: str, client=None) -> int:
+    """
+    Delete every key recorded under ``tag`` and drop the tag.
+
+    The tag set is renamed before it is read, so keys tagged while the purge
+    is running land in a fresh set and survive for the next invalidation
+    instead of being silently untracked. Cost is O(keys in the tag).
+    """
+    client = client or _default_client()
+    if client is None:
+        return 0
+
+    purge_name = f"{tag_key_name(tag)}:purge:{uuid.uuid4().hex}"
+    try:
+        client.rename(tag_key_name(tag), purge_name)
+    except redis.ResponseError:
+        # No such key: nothing was ever cached under this tag
+        return 0
+
+    try:
+        deleted = _delete_in_batches(client, client.sscan_iter(purge_name, count=SCAN_COUNT))
+    finally:
+        _unlink(client, [purge_name])
+    logger.debug(f"Invalidated {deleted} keys tagged {tag}")
+    return deleted
+
+
+def invalidate_tags(*tags: str, client=None) -> int:
+    """Invalidate several tags; returns the total number of keys deleted."""
+    return sum(invalidate_tag(tag, client=client) for tag in tags)
+
+
+def invalidate_keys_and_tags(keys: Iterable[str] = (), tags: Iterable[str] = (), client=None) -> int:
+    """
+    Delete exact ``keys`` and every key recorded under ``tags`` together.
+
+    The keys are unlinked and all tag sets renamed in one pipelined round
+    trip, so invalidating an object's entries and its list tags costs one
+    round trip plus one per non-empty tag, instead of one per key and tag.
+    """
+    client = client or _default_client()
+    keys = list(keys)
+    tags = list(tags)
+    if client is None or not (keys or tags):
+        return 0
+
+    purge_names = [f"{tag_key_name(tag)}:purge:{uuid.uuid4().hex}" for tag in tags]
+    pipe = client.pipeline(transaction=False)
+    for tag, purge_name in zip(tags, purge_names):
+        pipe.rename(tag_key_name(tag), purge_name)
+    if keys:
+        pipe.delete(*keys)
+    results = pipe.execute(raise_on_error=False)
+
+    deleted = results[-1] if keys and isinstance(results[-1], int) else 0
+    for purge_name, renamed in zip(purge_names, results):
+        if isinstance(renamed, Exception):
+            # No such key: nothing was ever cached under this tag
+            continue
+        try:
+            deleted += _delete_in_batches(client, client.sscan_iter(purge_name, count=SCAN_COUNT))
+        finally:
+            _unlink(client, [purge_name])
+    logger.debug(f"Invalidated {deleted} keys ({len(keys)} exact, tags {', '.join(tags) or 'none'})")
+    return deleted
+
+
+def scan_keys(pattern: str, count: int = SCAN_COUNT, client=None) -> Iterator[str]:
+    """
+    Iterate over keys matching ``pattern`` without blocking Redis.
+
+    A pattern without glob characters is looked up directly instead of
+    scanning the keyspace.
+    """
+    client = client or _default_client()
+    if client is None:
+        return iter(())
+    if not is_pattern(pattern):
+        return iter([pattern] if client.exists(pattern) else [])
+    return client.scan_iter(match=pattern, count=count)
+
+
+def delete_pattern(pattern: str, count: int = SCAN_COUNT, client=None) -> int:
+    """
+    Delete keys matching ``pattern`` in small batches.
+
+    Exact keys are deleted directly; glob patterns are walked with ``SCAN``
+    and deleted with ``UNLINK`` ``DELETE_BATCH_SIZE`` keys at a time.
+    """
+    client = client or _default_client()
+    if client is None:
+        return 0
+    if not is_pattern(pattern):
+        return client.delete(pattern)
+    return _delete_in_batches(client, client.scan_iter(match=pattern, count=count))
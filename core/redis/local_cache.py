@@ -0,0 +1,207 @@
+"""
+Per-process in-memory (L1) cache in front of Redis.
+
+Hot, rarely changing data such as job industries, subcategories, feature
+flags and achievement/badge definitions is read on almost every request.
+Keeping a small copy in process memory saves a Redis round trip per read.
+
+The L1 tier is bounded (least recently used entries are evicted first) and
+every entry expires after a short TTL, so a missed invalidation can only
+leave a process stale for that long. Invalidations are applied locally and
+broadcast on a Redis pub/sub channel so that every other process drops the
+same entries.
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from core.redis.redis_pubsub import RedisPubSub
+from core.redis_settings import (
+    L1_CACHE_DEFAULT_TIMEOUT,
+    L1_CACHE_ENABLED,
+    L1_CACHE_MAX_ENTRIES,
+    L1_INVALIDATION_CHANNEL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _default_client():
+    from core.redis.cache import redis_client
+
+    return redis_client
+
+
+class LocalCache:
+    """
+    Thread-safe LRU cache with per-entry TTL and tags.
+
+    Values are returned as stored, so callers should cache immutable or
+    serialized data. ``None`` cannot be cached: it is what ``get`` returns on
+    a miss.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = L1_CACHE_MAX_ENTRIES,
+        default_timeout: int = L1_CACHE_DEFAULT_TIMEOUT,
+        channel: str = L1_INVALIDATION_CHANNEL,
+    ):
+        self.max_entries = max_entries
+        self.default_timeout = default_timeout
+        self.channel = channel
+        # Identifies this cache's own broadcasts so they are not applied twice
+        self.origin = f"{os.getpid()}:{uuid.uuid4().hex}"
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pubsub: Optional[RedisPubSub] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value cached under ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        """Cache ``value`` for ``timeout`` seconds, evicting the least recently used entries."""
+        if value is None:
+            return
+        expires_at = time.monotonic() + (timeout or self.default_timeout)
+        with self._lock:
+            self._entries[key] = (expires_at, value, frozenset(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str) -> int:
+        """Drop ``keys`` from this process only."""
+        with self._lock:
+            return sum(1 for key in keys if self._entries.pop(key, None) is not None)
+
+    def delete_pattern(self, *patterns: str) -> int:
+        """Drop keys matching any of the Redis-style glob ``patterns`` from this process only."""
+        with self._lock:
+            matched = [
+                key for key in self._entries
+                if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns)
+            ]
+            for key in matched:
+                del self._entries[key]
+            return len(matched)
+
+    def delete_tags(self, *tags: str) -> int:
+        """Drop entries cached under any of ``tags`` from this process only."""
+        tags = set(tags)
+        with self._lock:
+            matched = [key for key, (_, _, entry_tags) in self._entries.items() if entry_tags & tags]
+            for key in matched:
+                del self._entries[key]
+            return len(matched)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(
+        self,
+        keys: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        tags: Iterable[str] = (),
+        broadcast: bool = True,
+        client=None,
+    ) -> int:
+        """
+        Drop entries locally and tell every other process to do the same.
+
+        Returns:
+            Number of entries dropped in this process
+        """
+        keys, patterns, tags = list(keys), list(patterns), list(tags)
+        dropped = self.delete(*keys) + self.delete_pattern(*patterns) + self.delete_tags(*tags)
+        if broadcast and (keys or patterns or tags):
+            self.publish({"keys": keys, "patterns": patterns, "tags": tags}, client=client)
+        return dropped
+
+    def publish(self, invalidation: Dict[str, list], client=None) -> bool:
+        """Broadcast an invalidation on the L1 channel."""
+        client = client or (self._pubsub.redis_client if self._pubsub else _default_client())
+        if client is None:
+            return False
+        pubsub = self._pubsub or RedisPubSub(client)
+        return pubsub.publish(self.channel, {"origin": self.origin, **invalidation})
+
+    def listen(self, client=None) -> bool:
+        """
+        Start applying invalidations broadcast by other processes.
+
+        Safe to call repeatedly; only the first call subscribes. Call it
+        before caching anything, so no invalidation can be missed.
+        """
+        if self._pubsub is not None:
+            return True
+        client = client or _default_client()
+        if client is None:
+            return False
+        with self._lock:
+            if self._pubsub is None:
+                pubsub = RedisPubSub(client)
+                if not pubsub.subscribe(self.channel, self._on_message):
+                    return False
+                self._pubsub = pubsub
+        return True
+
+    def stop(self) -> None:
+        """Stop listening for invalidations and drop every entry."""
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+        self.clear()
+
+    def _on_message(self, channel: str, message: Any) -> None:
+        if not isinstance(message, dict) or message.get("origin") == self.origin:
+            return
+        self.invalidate(
+            keys=message.get("keys") or (),
+            patterns=message.get("patterns") or (),
+            tags=message.get("tags") or (),
+            broadcast=False,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": L1_CACHE_ENABLED,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+# Shared by every caller in this process
+local_cache = LocalCache()
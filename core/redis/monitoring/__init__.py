@@ -15,6 +15,7 @@ from django.utils import timezone
 from core.redis.client import redis_client
 from core.redis.settings import CACHE_ENABLED
 from core.redis.utils import get_cache_stats
+from core.redis.cache_tags import scan_keys
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -246,7 +247,7 @@ def analyze_key_size(pattern: str = "*", sample_size: int = 100) -> Dict:
 
     try:
         # Get keys matching pattern
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
         if not keys:
             return {"keys": 0, "message": f"No keys found matching pattern {pattern}"}
 
@@ -25,6 +25,7 @@ from core.redis_monitoring import (
 )
 from core.redis_settings import CACHE_ENABLED
 from core.redis_telemetry import get_telemetry_stats
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -119,7 +120,7 @@ def analyze_key_size_distribution() -> Dict:
         redis_client = get_redis_connection("default")
         
         # Get all keys
-        keys = redis_client.keys("*")
+        keys = list(scan_keys("*", client=redis_client))
         
         if not keys:
             return {
@@ -205,7 +206,7 @@ def analyze_ttl_distribution() -> Dict:
         redis_client = get_redis_connection("default")
         
         # Get all keys
-        keys = redis_client.keys("*")
+        keys = list(scan_keys("*", client=redis_client))
         
         if not keys:
             return {
@@ -10,7 +10,7 @@ import json
 import logging
 from typing import Any, Dict, List, Optional, Set, Union
 
-from core.cache import (
+from core.redis.cache import (
     delete_cached_data,
     delete_hash_field,
     get_cached_data,
@@ -20,12 +20,16 @@ from core.cache import (
     set_cached_data,
     set_hash_field,
 )
+from core.redis_settings import L1_CACHE_DEFAULT_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
 # Constants
 CONFIG_EXPIRATION = 60 * 60 * 24 * 30  # 30 days
 CONFIG_PREFIX = "config:"
+# Configuration is read on every request but rarely written, so reads are
+# served from the in-process L1 cache
+CONFIG_LOCAL_TIMEOUT = L1_CACHE_DEFAULT_TIMEOUT
 
 
 class RedisConfig:
@@ -93,7 +97,7 @@ class RedisConfig:
         """
         try:
             # Get field from hash
-            value = get_hash_field(self.key, key)
+            value = get_hash_field(self.key, key, local_timeout=CONFIG_LOCAL_TIMEOUT)
             
             if value is None:
                 return default
@@ -112,7 +116,7 @@ class RedisConfig:
         """
         try:
             # Get all fields from hash
-            return get_hash_all(self.key)
+            return get_hash_all(self.key, local_timeout=CONFIG_LOCAL_TIMEOUT)
         except Exception as e:
             logger.error(f"Error getting all config for {self.namespace}: {str(e)}")
             return {}
@@ -23,6 +23,7 @@ from core.redis_settings import (
     REDIS_DB_CACHE,
     get_redis_connection_params,
 )
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -115,17 +116,17 @@ def get_key_count_by_prefix() -> Dict:
         # Count keys by prefix
         for prefix_name, prefix in CACHE_PREFIXES.items():
             pattern = f"{prefix}*"
-            count = len(redis_client.keys(pattern))
+            count = sum(1 for _ in scan_keys(pattern, client=redis_client))
             key_counts[prefix_name] = count
             total_keys += count
         # Add permanent cache keys
         permanent_pattern = "permanent:*"
-        permanent_count = len(redis_client.keys(permanent_pattern))
+        permanent_count = sum(1 for _ in scan_keys(permanent_pattern, client=redis_client))
         key_counts["permanent"] = permanent_count
         total_keys += permanent_count
         # Add hibernate cache keys
         hibernate_pattern = "hibernate:*"
-        hibernate_count = len(redis_client.keys(hibernate_pattern))
+        hibernate_count = sum(1 for _ in scan_keys(hibernate_pattern, client=redis_client))
         key_counts["hibernate"] = hibernate_count
         total_keys += hibernate_count
         return {
@@ -293,7 +294,7 @@ def get_historical_stats(period: str = "hourly", days: int = 1) -> List[Dict]:
             return [{"error": f"Invalid period: {period}"}]
 
         # Get keys for the specified period and days
-        keys = redis_client.keys(f"{key_prefix}*")
+        keys = list(scan_keys(f"{key_prefix}*", client=redis_client))
 
         # Sort keys by timestamp (newest first)
         keys.sort(reverse=True)
@@ -448,7 +449,7 @@ def analyze_key_size(pattern: str = "*", sample_size: int = 100) -> Dict:
 
     try:
         # Get keys matching the pattern
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
 
         # If there are too many keys, sample them
         if len(keys) > sample_size:
@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Set
 
 from core.cache import get_user_presence, publish_notification, update_user_presence
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -108,14 +109,13 @@ def get_online_users(redis_client=None) -> List[Dict[str, any]]:
             logger.error("Redis client not available")
             return []
             
-        # Get all presence keys
-        presence_keys = client.keys("presence:*")
+        # Get all presence keys incrementally and their values in one MGET
+        presence_keys = list(scan_keys("presence:*", client=client))
+        presence_values = client.mget(presence_keys) if presence_keys else []
         
         online_users = []
-        for key in presence_keys:
+        for presence_data in presence_values:
             try:
-                # Get presence data
-                presence_data = client.get(key)
                 if presence_data:
                     data = json.loads(presence_data)
                     if data.get("status") in [STATUS_ONLINE, STATUS_AWAY]:
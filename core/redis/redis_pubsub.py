@@ -15,8 +15,6 @@ from typing import Any, Callable, Dict, List, Optional, Set, Union
 import redis
 from django.conf import settings
 
-from core.cache import publish_notification
-
 logger = logging.getLogger(__name__)
 
 # Redis connection settings
@@ -33,15 +31,22 @@ class RedisPubSub:
     using Redis pub/sub.
     """
     
-    def __init__(self):
-        """Initialize Redis pub/sub."""
-        self.redis_client = redis.Redis(
+    def __init__(self, client: Optional[redis.Redis] = None):
+        """
+        Initialize Redis pub/sub.
+
+        Args:
+            client: Optional Redis client to share; a dedicated connection
+                is created from settings if omitted
+        """
+        self.owns_client = client is None
+        self.redis_client = client or redis.Redis(
             host=REDIS_HOST,
             port=REDIS_PORT,
             password=REDIS_PASSWORD,
             decode_responses=True,
         )
-        self.pubsub = self.redis_client.pubsub()
+        self.pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
         self.subscribers: Dict[str, List[Callable]] = {}
         self.listener_thread = None
         self.running = False
@@ -164,6 +169,9 @@ class RedisPubSub:
                     # Get channel and data
                     channel = message["channel"]
                     data = message["data"]
+                    if isinstance(channel, bytes):
+                        # Shared clients may not decode responses
+                        channel = channel.decode()
                     
                     # Parse data
                     try:
@@ -186,7 +194,8 @@ class RedisPubSub:
         """Close the pub/sub connection."""
         self._stop_listener()
         self.pubsub.close()
-        self.redis_client.close()
+        if self.owns_client:
+            self.redis_client.close()
 
 
 # Singleton instance
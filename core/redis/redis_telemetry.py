@@ -16,6 +16,7 @@ from django.utils import timezone
 
 from core.redis.client import redis_client
 from core.redis.settings import CACHE_ENABLED
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -120,7 +121,7 @@ def trim_telemetry_entries() -> None:
 
     try:
         # Get all telemetry keys
-        keys = redis_client.keys(f"{TELEMETRY_KEY_PREFIX}*")
+        keys = list(scan_keys(f"{TELEMETRY_KEY_PREFIX}*", client=redis_client))
 
         # If there are too many, delete the oldest ones
         if len(keys) > TELEMETRY_MAX_ENTRIES:
@@ -162,7 +163,7 @@ def get_slow_operations(
             pattern = f"{TELEMETRY_KEY_PREFIX}slow:*:{operation_type}"
 
         # Get matching keys
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
 
         # Sort by timestamp (newest first)
         keys.sort(reverse=True)
@@ -279,7 +280,7 @@ def get_telemetry_stats() -> Dict:
 
     try:
         # Get all telemetry keys
-        keys = redis_client.keys(f"{TELEMETRY_KEY_PREFIX}*")
+        keys = list(scan_keys(f"{TELEMETRY_KEY_PREFIX}*", client=redis_client))
 
         # Count by operation type
         operation_counts = {}
@@ -9,6 +9,7 @@ import logging
 import hashlib
 from typing import Any, Dict, List, Optional, Union
 
+from core.redis.cache_tags import delete_pattern
 from core.redis.client import redis_client
 from core.redis.settings import CACHE_ENABLED
 
@@ -168,13 +169,10 @@ def invalidate_cache_pattern(pattern: str) -> bool:
         return False
     
     try:
-        # Get keys matching pattern
-        keys = redis_client.keys(pattern)
-        
-        # Delete keys
-        if keys:
-            redis_client.delete(*keys)
-            logger.debug(f"Invalidated {len(keys)} cache entries matching pattern {pattern}")
+        # Delete matching keys incrementally with SCAN rather than KEYS
+        deleted = delete_pattern(pattern, client=redis_client)
+        if deleted:
+            logger.debug(f"Invalidated {deleted} cache entries matching pattern {pattern}")
         
         return True
     except Exception as e:
@@ -19,6 +19,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Model, QuerySet
 from django.utils import timezone
 
+from core.redis.cache_tags import delete_pattern, invalidate_keys_and_tags, invalidate_tags, set_tagged
 from core.redis.client import redis_client, with_redis_retry
 from core.redis.settings import (
     CACHE_DEFAULT_TIMEOUT,
@@ -167,7 +168,9 @@ def get_cached_data(key: str, bypass_cache: bool = False) -> Optional[Any]:
 
 
 @with_redis_retry()
-def set_cached_data(key: str, data: Any, timeout: Optional[int] = None) -> bool:
+def set_cached_data(
+    key: str, data: Any, timeout: Optional[int] = None, tags: Optional[List[str]] = None
+) -> bool:
     """
     Store data in the Redis cache.
 
@@ -175,6 +178,7 @@ def set_cached_data(key: str, data: Any, timeout: Optional[int] = None) -> bool:
         key: The cache key
         data: The data to cache
         timeout: Optional timeout in seconds
+        tags: Optional tags to index the key under for invalidate_cache_tag
 
     Returns:
         True if successful, False otherwise
@@ -194,8 +198,11 @@ def set_cached_data(key: str, data: Any, timeout: Optional[int] = None) -> bool:
         serialized_data = json.dumps(data, cls=CustomJSONEncoder)
         data_size_bytes = len(serialized_data.encode('utf-8'))
 
-        # Store in Redis with expiration
-        redis_client.setex(key, timeout, serialized_data)
+        # Store in Redis with expiration, recording the key under its tags
+        if tags:
+            set_tagged(key, serialized_data, timeout, tags, client=redis_client)
+        else:
+            redis_client.setex(key, timeout, serialized_data)
 
         # Log cache stats periodically
         log_cache_stats()
@@ -283,15 +290,8 @@ def invalidate_cache_pattern(pattern: str) -> int:
         return 0
 
     try:
-        # Get keys matching pattern
-        keys = redis_client.keys(pattern)
-
-        if not keys:
-            logger.debug(f"No keys found matching pattern {pattern} [op_id={operation_id}]")
-            return 0
-
-        # Delete keys
-        result = redis_client.delete(*keys)
+        # Delete matching keys incrementally with SCAN rather than KEYS
+        result = delete_pattern(pattern, client=redis_client)
 
         duration_ms = round((time.time() - start_time) * 1000, 2)
         logger.info(
@@ -309,6 +309,50 @@ def invalidate_cache_pattern(pattern: str) -> int:
         return 0
 
 
+@with_redis_retry()
+def invalidate_cache_tag(*tags: str) -> int:
+    """
+    Invalidate all cache keys written with any of the given tags.
+
+    Args:
+        tags: The tags to invalidate (e.g., "job:42")
+
+    Returns:
+        Number of keys invalidated
+    """
+    if not CACHE_ENABLED or not redis_client:
+        return 0
+
+    try:
+        result = invalidate_tags(*tags, client=redis_client)
+        logger.debug(f"Invalidated {result} keys tagged {', '.join(tags)}")
+        return result
+    except Exception as e:
+        logger.error(f"Unexpected error invalidating cache tags {tags}: {str(e)}")
+        return 0
+
+
+def invalidate_cache_entries(keys: List[str] = (), tags: List[str] = ()) -> int:
+    """
+    Invalidate exact cache keys and tagged keys in a single batch.
+
+    Args:
+        keys: Exact cache keys to delete (e.g., "job:42")
+        tags: Tags whose keys should be deleted (e.g., "clientjobs:u:7")
+
+    Returns:
+        Number of keys invalidated
+    """
+    if not CACHE_ENABLED or not redis_client:
+        return 0
+
+    try:
+        return invalidate_keys_and_tags(keys, tags, client=redis_client)
+    except Exception as e:
+        logger.error(f"Unexpected error invalidating cache keys {list(keys)} and tags {list(tags)}: {str(e)}")
+        return 0
+
+
 def log_cache_stats():
     """
     Log cache statistics periodically.
@@ -65,9 +65,11 @@ except ImportError:
     # Create a compatible time_view decorator
     def time_view(name: Optional[str] = None) -> Callable:
         """
-        Decorator to measure and log the execution time of a view function.
+        Decorator to measure the execution time of a view function.
 
-        This is a compatibility version of the time_view decorator.
+        This is a compatibility version of the time_view decorator. Timings,
+        with their DB/Redis breakdown, are exported by core.metrics as
+        ``payshift_operation_*`` series labelled with the view name.
 
         Args:
             name: Optional name for the view (defaults to function name)
@@ -75,18 +77,10 @@ except ImportError:
         Returns:
             Decorated function
         """
+        from core.metrics import instrument
+
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            def wrapper(*args, **kwargs) -> Any:
-                import time
-                start_time = time.time()
-                result = func(*args, **kwargs)
-                end_time = time.time()
-                view_name = name or func.__name__
-                execution_time = end_time - start_time
-                logging.info(f"View {view_name} executed in {execution_time:.4f} seconds")
-                return result
-            return wrapper
+            return instrument(name or func.__name__)(func)
         return decorator
 
 # Add track_user_activity decorator
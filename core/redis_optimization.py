@@ -18,6 +18,7 @@ from django.utils import timezone
 from core.cache import redis_client, CACHE_PREFIXES
 from core.redis_monitoring import get_memory_usage, get_key_count_by_prefix, analyze_key_size
 from core.redis_settings import CACHE_ENABLED
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -162,7 +163,7 @@ def compress_large_values(
         
     try:
         # Get keys matching the pattern
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
         
         # If there are too many keys, sample them
         if len(keys) > sample_size:
@@ -258,7 +259,7 @@ def identify_unused_keys(
         
     try:
         # Get keys matching the pattern
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
         
         # If there are too many keys, sample them
         if len(keys) > sample_size:
@@ -353,7 +354,7 @@ def extend_ttl_for_popular_keys(
         
     try:
         # Get keys matching the pattern
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
         
         # If there are too many keys, sample them
         if len(keys) > sample_size:
@@ -80,6 +80,12 @@ CACHE_TIMEOUTS = {
     "default": 3600,  # 1 hour
 }
 
+# Per-process in-memory (L1) tier in front of Redis for hot, rarely changing data
+L1_CACHE_ENABLED = getattr(settings, "L1_CACHE_ENABLED", True)
+L1_CACHE_MAX_ENTRIES = getattr(settings, "L1_CACHE_MAX_ENTRIES", 2048)
+L1_CACHE_DEFAULT_TIMEOUT = getattr(settings, "L1_CACHE_DEFAULT_TIMEOUT", 60)  # 1 minute
+L1_INVALIDATION_CHANNEL = "cache:l1:invalidate"
+
 # Model cache settings
 MODEL_CACHE_ENABLED = True
 MODEL_CACHE_PREFIX = "model"
@@ -0,0 +1,124 @@
+"""
+Single-flight recomputation with stale-while-revalidate for hot cache keys.
+
+When a popular entry expires, every request that misses would otherwise
+recompute it at the same time and pile onto the database. Here each entry
+carries two lifetimes:
+
+- a soft TTL (``timeout``): after it the value is stale, and one caller
+  refreshes it while everyone else keeps getting the stale value;
+- a hard TTL (``timeout + stale_timeout``): after it the entry is gone, and
+  one caller recomputes it while the others wait briefly for the result.
+
+"One caller" is whoever wins a short distributed lock on the key
+(core.distributed_lock). Entries are stored as ``{"value", "fresh_until"}``
+envelopes in any store with Django's cache API (add/get/set/delete).
+"""
+
+import logging
+import time
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.distributed_lock import DistributedLock
+
+logger = logging.getLogger(__name__)
+
+# Constants
+CACHE_STALE_TIMEOUT = getattr(settings, 'CACHE_STALE_TIMEOUT', 300)  # Serve stale for up to 5 minutes
+SINGLE_FLIGHT_LOCK_TIMEOUT = getattr(settings, 'SINGLE_FLIGHT_LOCK_TIMEOUT', 10)  # 10 seconds
+SINGLE_FLIGHT_WAIT_TIMEOUT = getattr(settings, 'SINGLE_FLIGHT_WAIT_TIMEOUT', 5)  # 5 seconds
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05  # 50ms
+
+LOCK_PREFIX = "sf:"
+
+
+def _read(store, key: str) -> Optional[dict]:
+    entry = store.get(key)
+    # Entries written before envelopes were introduced count as misses
+    if isinstance(entry, dict) and "fresh_until" in entry:
+        return entry
+    return None
+
+
+def _is_fresh(entry: Optional[dict]) -> bool:
+    return entry is not None and entry["fresh_until"] > time.time()
+
+
+def _compute_and_store(store, key, compute, timeout, stale_timeout, cache_none):
+    value = compute()
+    if value is not None or cache_none:
+        envelope = {"value": value, "fresh_until": time.time() + timeout}
+        store.set(key, envelope, timeout + stale_timeout)
+    return value
+
+
+def get_or_compute(
+    key: str,
+    compute: Callable[[], Any],
+    timeout: int,
+    stale_timeout: Optional[int] = None,
+    store=None,
+    lock_store=None,
+    cache_none: bool = False,
+) -> Any:
+    """
+    Return the cached value for ``key``, recomputing it at most once at a time.
+
+    Args:
+        key: The cache key
+        compute: Called without arguments to produce the value
+        timeout: Seconds the value stays fresh (soft TTL)
+        stale_timeout: Seconds a stale value may still be served while it is
+            refreshed; 0 disables stale serving but keeps single-flight
+        store: Cache to keep the entry in (defaults to the default Django cache)
+        lock_store: Cache to keep the refresh lock in (defaults to ``store``)
+        cache_none: Whether to cache None results
+
+    Returns:
+        The cached, refreshed or freshly computed value
+    """
+    store = store if store is not None else cache
+    lock_store = lock_store if lock_store is not None else store
+    if stale_timeout is None:
+        stale_timeout = CACHE_STALE_TIMEOUT
+
+    entry = _read(store, key)
+    if _is_fresh(entry):
+        return entry["value"]
+
+    lock = DistributedLock(
+        f"{LOCK_PREFIX}{key}", SINGLE_FLIGHT_LOCK_TIMEOUT, retry_count=0, store=lock_store
+    )
+    if lock.acquire():
+        try:
+            # Another caller may have refreshed the entry before we got the lock
+            entry = _read(store, key)
+            if _is_fresh(entry):
+                return entry["value"]
+            return _compute_and_store(store, key, compute, timeout, stale_timeout, cache_none)
+        finally:
+            lock.release()
+
+    if entry is not None:
+        logger.debug(f"Serving stale value for {key} while it is refreshed")
+        return entry["value"]
+
+    # Someone else is computing the missing entry: wait for their result
+    deadline = time.monotonic() + SINGLE_FLIGHT_WAIT_TIMEOUT
+    while True:
+        if time.monotonic() >= deadline:
+            logger.warning(f"Timed out waiting for {key} to be computed elsewhere; computing it here")
+            break
+        time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        # Check the lock first: the holder stores the entry before releasing it
+        holder_done = not lock.is_locked()
+        entry = _read(store, key)
+        if entry is not None:
+            return entry["value"]
+        if holder_done:
+            # The result was not cacheable (or computing it failed)
+            break
+    return _compute_and_store(store, key, compute, timeout, stale_timeout, cache_none)
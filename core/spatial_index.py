@@ -0,0 +1,228 @@
+"""
+Geohash-based spatial index shared by the nearby-job and nearby-applicant queries.
+
+Models that take part store a ``geohash`` column next to their latitude and
+longitude (see ``Job`` and ``UserLocation``). A radius query then works in
+two steps:
+
+1. Prefilter: the circle's bounding box is covered with a handful of geohash
+   cells, and only rows whose geohash falls inside one of those cells are
+   loaded. Each cell is a contiguous range of the indexed column, so this is
+   a set of index range scans rather than a full table scan.
+2. Exact filter: the haversine distance is computed for the survivors only.
+
+Usage:
+    from core.spatial_index import nearby
+    for job, distance_km in nearby(Job.objects.filter(status="upcoming"), lat, lng, 5):
+        ...
+"""
+
+import math
+from typing import Iterable, List, Optional, Tuple
+
+from django.db.models import Q
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.32
+
+# Precision stored on rows: 9 characters is a cell of roughly 5m x 5m
+GEOHASH_PRECISION = 9
+GEOHASH_MAX_LENGTH = 12
+
+# Upper bound on cells used for the prefilter of a single query
+MAX_COVER_CELLS = 16
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# Sorts after every geohash character, so [cell, cell + _RANGE_END) spans the cell
+_RANGE_END = "{"
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (float(lat1), float(lon1), float(lat2), float(lon2)))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def encode(latitude, longitude, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate pair as a geohash string."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    lat, lon = float(latitude), float(longitude)
+
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # geohash interleaves bits starting with longitude
+    while len(chars) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                value = (value << 1) | 1
+                lon_lo = mid
+            else:
+                value <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                value = (value << 1) | 1
+                lat_lo = mid
+            else:
+                value <<= 1
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def geohash_or_blank(latitude, longitude) -> str:
+    """Geohash for a row, or "" when either coordinate is missing."""
+    if latitude is None or longitude is None:
+        return ""
+    return encode(latitude, longitude)
+
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """Return (lat_degrees, lon_degrees) covered by one cell at ``precision``."""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def bounding_box(latitude, longitude, radius_km: float) -> Tuple[float, float, float, float]:
+    """Return (min_lat, max_lat, min_lon, max_lon) enclosing the circle."""
+    lat, lon = float(latitude), float(longitude)
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    min_lat, max_lat = max(-90.0, lat - dlat), min(90.0, lat + dlat)
+
+    widest = max(abs(min_lat), abs(max_lat))
+    cos_lat = math.cos(math.radians(widest))
+    if widest >= 89.0 or radius_km >= cos_lat * KM_PER_DEGREE_LAT * 180:
+        return min_lat, max_lat, -180.0, 180.0
+    dlon = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    return min_lat, max_lat, lon - dlon, lon + dlon
+
+
+def _lon_spans(min_lon: float, max_lon: float) -> List[Tuple[float, float]]:
+    """Split a longitude range that crosses the antimeridian into two spans."""
+    if min_lon < -180.0:
+        return [(min_lon + 360.0, 180.0), (-180.0, max_lon)]
+    if max_lon > 180.0:
+        return [(min_lon, 180.0), (-180.0, max_lon - 360.0)]
+    return [(min_lon, max_lon)]
+
+
+def _cells_for_box(min_lat, max_lat, spans, precision) -> Optional[List[str]]:
+    lat_step, lon_step = cell_size_degrees(precision)
+    lat_cells = math.floor((max_lat + 90.0) / lat_step) - math.floor((min_lat + 90.0) / lat_step) + 1
+    lon_cells = sum(
+        math.floor((hi + 180.0) / lon_step) - math.floor((lo + 180.0) / lon_step) + 1
+        for lo, hi in spans
+    )
+    if lat_cells * lon_cells > MAX_COVER_CELLS:
+        return None
+
+    cells = set()
+    lat_start = math.floor((min_lat + 90.0) / lat_step)
+    for i in range(lat_cells):
+        # Sample the centre of each grid cell so rounding never skips one
+        cell_lat = min(89.999999, -90.0 + (lat_start + i + 0.5) * lat_step)
+        for lo, hi in spans:
+            lon_start = math.floor((lo + 180.0) / lon_step)
+            lon_end = math.floor((hi + 180.0) / lon_step)
+            for j in range(lon_end - lon_start + 1):
+                cell_lon = min(179.999999, -180.0 + (lon_start + j + 0.5) * lon_step)
+                cells.add(encode(cell_lat, cell_lon, precision))
+    return sorted(cells)
+
+
+def covering_cells(latitude, longitude, radius_km: float) -> List[str]:
+    """
+    Geohash cells that together cover the circle's bounding box.
+
+    Picks the finest precision that needs at most ``MAX_COVER_CELLS`` cells.
+    An empty list means the circle is too large to prefilter usefully.
+    """
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    spans = _lon_spans(min_lon, max_lon)
+
+    best = []
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        cells = _cells_for_box(min_lat, max_lat, spans, precision)
+        if cells is None:
+            break
+        best = cells
+    return best
+
+
+def _cell_ranges(cells: Iterable[str]) -> List[Tuple[str, str]]:
+    """
+    Merge cells into ``[start, end)`` column ranges.
+
+    Cells that are neighbours in geohash order (same parent, consecutive last
+    character) collapse into a single range.
+    """
+    ranges = []
+    previous = None
+    for cell in sorted(cells):
+        if (
+            previous is not None
+            and len(cell) == len(previous)
+            and cell[:-1] == previous[:-1]
+            and _BASE32.index(cell[-1]) == _BASE32.index(previous[-1]) + 1
+        ):
+            ranges[-1] = (ranges[-1][0], cell + _RANGE_END)
+        else:
+            ranges.append((cell, cell + _RANGE_END))
+        previous = cell
+    return ranges
+
+
+def cells_filter(cells: Iterable[str], field: str = "geohash") -> Q:
+    """Q object matching rows whose ``field`` lies inside any of ``cells``."""
+    condition = Q()
+    for start, end in _cell_ranges(cells):
+        condition |= Q(**{f"{field}__gte": start, f"{field}__lt": end})
+    return condition
+
+
+def nearby(
+    queryset,
+    latitude,
+    longitude,
+    radius_km: float,
+    lat_field: str = "latitude",
+    lon_field: str = "longitude",
+    geohash_field: str = "geohash",
+) -> List[Tuple[object, float]]:
+    """
+    Return ``[(obj, distance_km), ...]`` for rows within ``radius_km``, nearest first.
+
+    Rows without coordinates are skipped.
+    """
+    cells = covering_cells(latitude, longitude, radius_km)
+    queryset = queryset.exclude(**{f"{lat_field}__isnull": True}).exclude(
+        **{f"{lon_field}__isnull": True}
+    )
+    if cells:
+        # Drop the model's default ordering: results are sorted by distance
+        # below, and an ORDER BY index would otherwise win over the geohash one
+        queryset = queryset.filter(cells_filter(cells, geohash_field)).order_by()
+
+    results = []
+    for obj in queryset:
+        obj_lat, obj_lon = getattr(obj, lat_field), getattr(obj, lon_field)
+        distance = haversine_km(latitude, longitude, obj_lat, obj_lon)
+        if distance <= radius_km:
+            results.append((obj, distance))
+    results.sort(key=lambda item: item[1])
+    return results
@@ -0,0 +1,75 @@
+"""
+Tests for tag-indexed and SCAN-based invalidation in core.redis.cache_tags.
+"""
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from fakeredis import FakeStrictRedis
+
+from core.redis import cache as redis_cache
+from core.redis.cache_tags import (
+    delete_pattern,
+    invalidate_tag,
+    set_tagged,
+    tag_key_name,
+    tag_keys,
+    tag_members,
+)
+
+
+class CacheTagTests(SimpleTestCase):
+
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        patcher = patch.object(redis_cache, "redis_client", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalidate_tag_only_touches_tagged_keys(self):
+        set_tagged("clientjobs:u:1:page:1", "a", 60, tags=["clientjobs:u:1"])
+        set_tagged("clientjobs:u:1:page:2", "b", 60, tags=["clientjobs:u:1", "jobs"])
+        set_tagged("clientjobs:u:2:page:1", "c", 60, tags=["clientjobs:u:2", "jobs"])
+
+        self.assertEqual(invalidate_tag("clientjobs:u:1"), 2)
+
+        self.assertIsNone(self.redis.get("clientjobs:u:1:page:1"))
+        self.assertEqual(self.redis.get("clientjobs:u:2:page:1"), "c")
+        self.assertFalse(self.redis.exists(tag_key_name("clientjobs:u:1")))
+        # Purged keys stay listed under their other tags until those are invalidated
+        self.assertEqual(set(tag_members("jobs")), {"clientjobs:u:1:page:2", "clientjobs:u:2:page:1"})
+        self.assertEqual(invalidate_tag("clientjobs:u:1"), 0)
+
+    def test_tag_sets_outlive_the_keys_they_index(self):
+        set_tagged("short", "x", 30, tags=["t"])
+        self.assertEqual(self.redis.ttl(tag_key_name("t")), 30)
+
+        set_tagged("long", "x", 300, tags=["t"])
+        self.assertEqual(self.redis.ttl(tag_key_name("t")), 300)
+
+        # A shorter write never shortens the tag
+        tag_keys(["t"], ["other"], timeout=10)
+        self.assertEqual(self.redis.ttl(tag_key_name("t")), 300)
+
+        # Untimed keys keep the tag forever
+        set_tagged("forever", "x", None, tags=["t"])
+        self.assertEqual(self.redis.ttl(tag_key_name("t")), -1)
+
+    def test_delete_pattern_scans_globs_and_deletes_exact_keys(self):
+        for i in range(1200):
+            self.redis.set(f"job:{i}", i)
+        self.redis.set("model:job:7", 7)
+
+        with patch.object(self.redis, "keys", side_effect=AssertionError("KEYS must not be used")):
+            self.assertEqual(delete_pattern("job:1*"), 311)
+            self.assertEqual(delete_pattern("model:job:7"), 1)
+            self.assertEqual(redis_cache.invalidate_cache_pattern("job:2*"), 111)
+
+        self.assertEqual(self.redis.get("job:999"), "999")
+        self.assertIsNone(self.redis.get("job:1000"))
+
+    def test_set_cached_data_records_tags(self):
+        self.assertTrue(redis_cache.set_cached_data("job:detail:5", {"id": 5}, 60, tags=["job:5"]))
+        self.assertEqual(set(tag_members("job:5")), {"job:detail:5"})
+
+        self.assertEqual(redis_cache.invalidate_cache_tag("job:5"), 1)
+        self.assertIsNone(redis_cache.get_cached_data("job:detail:5"))
@@ -0,0 +1,62 @@
+"""
+Tests for in-process aggregated cache telemetry in core.cache_telemetry.
+"""
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from fakeredis import FakeStrictRedis
+
+from core import cache_telemetry
+from core.cache_telemetry import TelemetryAggregator, get_cache_telemetry, record_cache_operation
+
+
+class CacheTelemetryTests(SimpleTestCase):
+
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        self.aggregator = TelemetryAggregator(flush_interval=3600)
+        patches = [
+            patch.object(cache_telemetry, "_aggregator", self.aggregator),
+            patch("core.redis.cache.redis_client", self.redis),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_recording_does_not_touch_redis(self):
+        with patch.object(self.redis, "pipeline") as pipeline:
+            for _ in range(100):
+                record_cache_operation("get", "job:1", True, 0.4)
+
+        pipeline.assert_not_called()
+
+    def test_flush_writes_aggregates_in_one_pipeline(self):
+        for latency_ms in (0.05, 0.3, 0.3, 7):
+            record_cache_operation("get", "job:1", latency_ms < 5, latency_ms)
+        record_cache_operation("set", "job:1", False, 2)
+
+        with patch.object(self.redis, "pipeline", wraps=self.redis.pipeline) as pipeline:
+            self.assertEqual(self.aggregator.flush(), 2)
+        pipeline.assert_called_once()
+
+        telemetry = get_cache_telemetry("job")
+        (hit_rate,) = telemetry["hit_rate"]["job"].values()
+        self.assertEqual((hit_rate["hits"], hit_rate["misses"]), (3, 1))
+        (get_latency,) = telemetry["latency"]["job"]["get"].values()
+        self.assertEqual(get_latency["count"], 4)
+        self.assertEqual(get_latency["p50"], 0.5)
+        self.assertEqual(get_latency["p99"], 10)
+        (operations,) = telemetry["operations"]["job"].values()
+        self.assertEqual((operations["count"], operations["set"], operations["error"]), (5, 1, 1))
+
+    def test_flushes_from_several_processes_add_up(self):
+        other = TelemetryAggregator(flush_interval=3600)
+        record_cache_operation("get", "user:1", True, 1)
+        other.record("get", "user:2", False, 1)
+        other.flush()
+
+        telemetry = get_cache_telemetry("user")  # Flushes this process first
+
+        (hit_rate,) = telemetry["hit_rate"]["user"].values()
+        self.assertEqual(hit_rate["total"], 2)
+        self.assertEqual(hit_rate["rate"], 0.5)
@@ -0,0 +1,40 @@
+"""
+Tests for read-replica routing in core.db_router.
+"""
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import connections
+from django.test import SimpleTestCase, override_settings
+
+from core.db_router import ReadReplicaRouter, read_replica, use_read_replica
+from jobs.models import Job
+
+WITH_REPLICA = {**settings.DATABASES, "replica": {**settings.DATABASES["default"]}}
+
+
+class ReadReplicaRouterTests(SimpleTestCase):
+
+    def setUp(self):
+        self.router = ReadReplicaRouter()
+
+    def test_reads_stay_on_the_primary_without_a_replica(self):
+        with read_replica():
+            self.assertIsNone(self.router.db_for_read(Job))
+
+    @override_settings(DATABASES=WITH_REPLICA)
+    def test_only_opted_in_reads_go_to_the_replica(self):
+        self.assertIsNone(self.router.db_for_read(Job))
+
+        @use_read_replica
+        def list_jobs(request):
+            return self.router.db_for_read(Job), self.router.db_for_write(Job)
+
+        self.assertEqual(list_jobs(None), ("replica", "default"))
+        self.assertIsNone(self.router.db_for_read(Job))
+        self.assertFalse(self.router.allow_migrate("replica", "jobs"))
+
+    @override_settings(DATABASES=WITH_REPLICA)
+    def test_reads_inside_a_primary_transaction_stay_on_the_primary(self):
+        with read_replica(), patch.object(connections["default"], "in_atomic_block", True):
+            self.assertEqual(self.router.db_for_read(Job), "default")
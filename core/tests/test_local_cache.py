@@ -0,0 +1,109 @@
+"""
+Tests for the in-process L1 tier in core.redis.local_cache and its use in
+core.redis.cache.
+"""
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from fakeredis import FakeServer, FakeStrictRedis
+
+from core.redis import cache as redis_cache
+from core.redis.local_cache import LocalCache
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+class LocalCacheTests(SimpleTestCase):
+
+    def test_lru_eviction_and_ttl(self):
+        local = LocalCache(max_entries=2, default_timeout=60)
+        local.set("a", "1")
+        local.set("b", "2")
+        self.assertEqual(local.get("a"), "1")  # "b" is now least recently used
+        local.set("c", "3")
+
+        self.assertIsNone(local.get("b"))
+        self.assertEqual(local.get("a"), "1")
+        self.assertEqual(local.stats()["evictions"], 1)
+
+        local.set("short", "x", timeout=0.05)
+        time.sleep(0.06)
+        self.assertIsNone(local.get("short"))
+        self.assertEqual(local.stats()["expirations"], 1)
+
+    def test_invalidation_by_key_pattern_and_tag(self):
+        local = LocalCache()
+        local.set("industry:all", "[]")
+        local.set("badge:1", "{}", tags=["badges"])
+        local.set("badge:2", "{}")
+        local.set("config:flags", "{}")
+
+        self.assertEqual(local.invalidate(patterns=["badge:*"], broadcast=False), 2)
+        local.set("badge:1", "{}", tags=["badges"])
+        self.assertEqual(local.invalidate(keys=["industry:all"], tags=["badges"], broadcast=False), 2)
+        self.assertEqual(local.get("config:flags"), "{}")
+
+    def test_invalidations_reach_other_processes(self):
+        server = FakeServer()
+        first, second = LocalCache(), LocalCache()
+        for local in (first, second):
+            self.assertTrue(local.listen(FakeStrictRedis(server=server, decode_responses=True)))
+            self.addCleanup(local.stop)
+            local.set("industry:all", "[]")
+            local.set("subcat:1", "{}")
+
+        first.invalidate(keys=["industry:all"], patterns=["subcat:*"])
+
+        self.assertIsNone(first.get("industry:all"))
+        self.assertTrue(wait_for(lambda: second.get("industry:all") is None and second.get("subcat:1") is None))
+        # A process ignores its own broadcasts rather than applying them twice
+        first.set("industry:all", "[1]")
+        time.sleep(0.2)
+        self.assertEqual(first.get("industry:all"), "[1]")
+
+
+class TieredCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        self.local = LocalCache()
+        for target, value in (("redis_client", self.redis), ("local_cache", self.local)):
+            patcher = patch.object(redis_cache, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.local.stop)
+
+    def test_hits_are_served_locally_until_invalidated(self):
+        redis_cache.set_cached_data("industry:all", [{"id": 1, "name": "Tech"}], 300, local_timeout=60)
+
+        with patch.object(self.redis, "get", side_effect=AssertionError("L1 hit expected")):
+            self.assertEqual(redis_cache.get_cached_data("industry:all", local_timeout=60)[0]["name"], "Tech")
+
+        # Callers get their own copy, never the cached object
+        redis_cache.get_cached_data("industry:all", local_timeout=60)[0]["name"] = "Changed"
+        self.assertEqual(redis_cache.get_cached_data("industry:all", local_timeout=60)[0]["name"], "Tech")
+
+        redis_cache.delete_cached_data("industry:all")
+        self.assertIsNone(redis_cache.get_cached_data("industry:all", local_timeout=60))
+
+        stats = redis_cache.get_tier_stats()
+        self.assertEqual(stats["l1"]["hits"], 3)
+        self.assertEqual(stats["l1"]["misses"], 1)
+
+    def test_hash_fields_are_read_through_l1(self):
+        self.assertTrue(redis_cache.set_hash_field("config:feature_flags", "chat", True, 60))
+        self.assertTrue(redis_cache.get_hash_field("config:feature_flags", "chat", local_timeout=60))
+
+        with patch.object(self.redis, "hgetall", side_effect=AssertionError("L1 hit expected")):
+            self.assertEqual(redis_cache.get_hash_all("config:feature_flags", local_timeout=60), {"chat": True})
+
+        redis_cache.set_hash_field("config:feature_flags", "chat", False, 60)
+        self.assertFalse(redis_cache.get_hash_field("config:feature_flags", "chat", local_timeout=60))
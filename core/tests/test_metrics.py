@@ -0,0 +1,98 @@
+"""
+Tests for request metrics and the Prometheus exposition in core.metrics.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.urls import ResolverMatch
+from fakeredis import FakeStrictRedis
+
+from core import metrics
+from core.metrics import (MetricsMiddleware, MetricsRegistry, instrument, metrics_view, note_cache_lookup,
+                          render_metrics)
+
+
+class MetricsTests(TestCase):
+
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        self.registry = MetricsRegistry(flush_interval=3600)
+        patches = [
+            patch.object(metrics, "registry", self.registry),
+            patch("core.redis.cache.redis_client", self.redis),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        metrics.install_redis_instrumentation()
+        self.factory = RequestFactory()
+
+    def _view(self, request):
+        request.resolver_match = ResolverMatch(lambda r: None, (), {}, route="jobs/<int:job_id>/")
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.execute("SELECT 2")
+        self.redis.get("job:1")
+        note_cache_lookup(False)
+        return HttpResponse(status=201)
+
+    def test_middleware_records_route_latency_and_breakdown(self):
+        MetricsMiddleware(self._view)(self.factory.get("/jobs/42/"))
+
+        values = self.registry.snapshot(self.redis)
+        labels = 'route="jobs/<int:job_id>/",method="GET",status="2xx"'
+        self.assertEqual(values[f"http_request_duration_seconds|{labels}|count"], 1)
+        self.assertEqual(values[f"http_request_db_queries_total|{labels}|total"], 2)
+        self.assertEqual(values[f"http_request_redis_calls_total|{labels}|total"], 1)
+        self.assertEqual(values[f"http_request_cache_misses_total|{labels}|total"], 1)
+
+    def test_recording_does_not_touch_redis(self):
+        with patch.object(self.redis, "pipeline") as pipeline:
+            for _ in range(50):
+                MetricsMiddleware(lambda request: HttpResponse())(self.factory.get("/"))
+
+        pipeline.assert_not_called()
+
+    def test_instrumented_work_counts_towards_the_request(self):
+        @instrument("lookup")
+        def lookup():
+            self.redis.get("job:1")
+
+        def view(request):
+            lookup()
+            return HttpResponse()
+
+        MetricsMiddleware(view)(self.factory.get("/"))
+
+        values = self.registry.snapshot(self.redis)
+        self.assertEqual(values['operation_redis_calls_total|operation="lookup"|total'], 1)
+        self.assertEqual(values['http_request_redis_calls_total|route="unmatched",method="GET",status="2xx"|total'], 1)
+
+    def test_histogram_buckets_are_cumulative(self):
+        labels = (("route", "r"),)
+        stats = metrics.RequestStats()
+        for duration in (0.003, 0.02, 30):
+            self.registry.observe("http_request", labels, duration, stats)
+
+        text = render_metrics(self.registry.snapshot(self.redis))
+
+        self.assertIn('payshift_http_request_duration_seconds_bucket{route="r",le="0.005"} 1', text)
+        self.assertIn('payshift_http_request_duration_seconds_bucket{route="r",le="0.025"} 2', text)
+        self.assertIn('payshift_http_request_duration_seconds_bucket{route="r",le="10"} 2', text)
+        self.assertIn('payshift_http_request_duration_seconds_bucket{route="r",le="+Inf"} 3', text)
+        self.assertIn('payshift_http_request_duration_seconds_count{route="r"} 3', text)
+
+    def test_scrape_requires_token_or_staff(self):
+        request = self.factory.get("/core/metrics/")
+        request.user = get_user_model()(username="worker")
+        self.assertEqual(metrics_view(request).status_code, 403)
+
+        with patch.object(metrics, "METRICS_TOKEN", "secret"):
+            request = self.factory.get("/core/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+            response = metrics_view(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
@@ -0,0 +1,86 @@
+"""
+Tests for keyset (cursor) pagination.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from core import pagination
+from core.pagination import (
+    COUNT_APPROXIMATE,
+    COUNT_EXACT,
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
+)
+from notifications.models import Notification, NotificationCategory
+
+User = get_user_model()
+
+
+class CursorPaginationTests(TestCase):
+    """Test paging through notifications with cursors."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cursoruser", email="cursoruser@example.com", password="testpass123"
+        )
+        # Drop the welcome notification created for new users
+        Notification.objects.filter(user=self.user).delete()
+        Notification.objects.bulk_create(
+            [
+                Notification(user=self.user, category=NotificationCategory.NEW_JOB_ALERT, message=f"n{i}")
+                for i in range(23)
+            ]
+        )
+        # Give groups of rows the same timestamp so the id tie-breaker matters
+        base = timezone.now()
+        for i, notification in enumerate(Notification.objects.filter(user=self.user).order_by("id")):
+            Notification.objects.filter(pk=notification.pk).update(created_at=base - timedelta(seconds=i // 4))
+        self.queryset = Notification.objects.filter(user=self.user)
+
+    def walk(self, page_size, **kwargs):
+        pages, cursor = [], None
+        while True:
+            page = paginate_by_cursor(self.queryset, cursor, page_size, **kwargs)
+            pages.append(page)
+            if not page.has_next:
+                return pages
+            cursor = page.next_cursor
+
+    def test_walk_visits_every_row_once_in_order(self):
+        pages = self.walk(5)
+        walked = [n.id for page in pages for n in page.items]
+        expected = list(self.queryset.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(walked, expected)
+        self.assertEqual([len(page.items) for page in pages], [5, 5, 5, 5, 3])
+        self.assertIsNone(pages[-1].next_cursor)
+
+    def test_total_is_only_counted_on_first_page(self):
+        pages = self.walk(10, count=COUNT_EXACT)
+        self.assertEqual(pages[0].total_count, 23)
+        self.assertFalse(pages[0].total_count_is_estimate)
+        self.assertIsNone(pages[1].total_count)
+        self.assertNotIn("total_count", pages[1].metadata())
+
+    def test_approximate_count_is_capped(self):
+        with mock.patch.object(pagination, "APPROXIMATE_COUNT_CAP", 10):
+            page = paginate_by_cursor(self.queryset, None, 5, count=COUNT_APPROXIMATE)
+        self.assertEqual(page.total_count, 10)
+        self.assertTrue(page.total_count_is_estimate)
+
+    def test_cursor_round_trip_keeps_microseconds(self):
+        notification = self.queryset.first()
+        notification.created_at = notification.created_at.replace(microsecond=123456)
+        values = decode_cursor(encode_cursor(notification), Notification)
+        self.assertEqual(values, [notification.created_at, notification.id])
+
+    def test_invalid_cursors_are_rejected(self):
+        for cursor in ("not-base64!", encode_cursor(self.queryset.first(), ordering=("-id",))):
+            with self.assertRaises(InvalidCursor):
+                paginate_by_cursor(self.queryset, cursor, 5)
@@ -0,0 +1,81 @@
+"""
+Tests for the raw-bytes response mode of core.redis.cache.cache_api_response.
+"""
+import gzip
+import json
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import JsonResponse
+from django.test import RequestFactory, SimpleTestCase
+from fakeredis import FakeStrictRedis
+
+from core.redis import cache as redis_cache
+from core.redis.cache import RAW_COMPRESS_MIN_BYTES, cache_api_response
+
+PAYLOAD = {"jobs": [{"id": i, "title": f"Job {i}", "rate": "1500.00"} for i in range(100)]}
+
+
+class RawResponseCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        text_client = FakeStrictRedis(decode_responses=True)
+        for name, client in (
+            ("redis_client", text_client),
+            ("binary_redis_client", redis_cache._binary_client(text_client)),
+        ):
+            patcher = patch.object(redis_cache, name, client)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.calls = 0
+
+    def view(self, request):
+        self.calls += 1
+        return JsonResponse(PAYLOAD)
+
+    def get(self, view, **headers):
+        request = RequestFactory().get("/jobs/alljobs", **headers)
+        request.user = AnonymousUser()
+        return view(request)
+
+    def test_hits_return_the_cached_bytes_without_reparsing(self):
+        view = cache_api_response(timeout=60)(self.view)
+        miss = self.get(view)
+
+        with patch("core.redis.cache.json.loads") as loads, patch("core.redis.cache.json.dumps") as dumps:
+            hit = self.get(view)
+
+        loads.assert_not_called()
+        dumps.assert_not_called()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(hit["Content-Type"], "application/json")
+        self.assertEqual(hit["ETag"], miss["ETag"])
+
+    def test_matching_etag_gets_a_304(self):
+        view = cache_api_response(timeout=60)(self.view)
+        etag = self.get(view)["ETag"]
+
+        not_modified = self.get(view, HTTP_IF_NONE_MATCH=f'"stale", {etag}')
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], etag)
+        self.assertEqual(not_modified.content, b"")
+
+        changed = self.get(view, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(json.loads(changed.content), PAYLOAD)
+
+    def test_compressed_bodies_follow_accept_encoding(self):
+        view = cache_api_response(timeout=60, compress=True)(self.view)
+        self.get(view)
+        self.assertGreater(len(json.dumps(PAYLOAD)), RAW_COMPRESS_MIN_BYTES)
+
+        gzipped = self.get(view, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(gzipped["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", gzipped["Vary"])
+        self.assertEqual(json.loads(gzip.decompress(gzipped.content)), PAYLOAD)
+
+        plain = self.get(view)
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertEqual(json.loads(plain.content), PAYLOAD)
+        self.assertEqual(self.calls, 1)
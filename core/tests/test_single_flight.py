@@ -0,0 +1,103 @@
+"""
+Tests for single-flight recomputation and stale-while-revalidate in
+core.single_flight and the cache decorators built on it.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from fakeredis import FakeStrictRedis
+
+from core.redis import cache as redis_cache
+from core.single_flight import get_or_compute
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SingleFlightTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.computes = 0
+        self.lock = threading.Lock()
+
+    def slow_compute(self, value="fresh", delay=0.2):
+        def compute():
+            with self.lock:
+                self.computes += 1
+            time.sleep(delay)
+            return value
+        return compute
+
+    def fire(self, count, compute, **kwargs):
+        barrier = threading.Barrier(count)
+
+        def call():
+            barrier.wait()
+            return get_or_compute("job:detail:1", compute, 60, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            return list(pool.map(lambda _: call(), range(count)))
+
+    def test_concurrent_misses_compute_once(self):
+        results = self.fire(20, self.slow_compute())
+
+        self.assertEqual(self.computes, 1)
+        self.assertEqual(results, ["fresh"] * 20)
+
+    def test_stale_value_is_served_while_one_caller_refreshes(self):
+        cache.set("job:detail:1", {"value": "stale", "fresh_until": time.time() - 1}, 300)
+
+        results = self.fire(20, self.slow_compute())
+
+        self.assertEqual(self.computes, 1)
+        self.assertEqual(results.count("fresh"), 1)
+        self.assertEqual(results.count("stale"), 19)
+        self.assertEqual(get_or_compute("job:detail:1", self.slow_compute("unused"), 60), "fresh")
+
+    def test_uncacheable_results_do_not_keep_waiters_waiting(self):
+        started = time.perf_counter()
+        results = self.fire(5, self.slow_compute(value=None, delay=0.1))
+
+        self.assertEqual(results, [None] * 5)
+        # Waiters compute themselves once the holder is done instead of
+        # sitting out SINGLE_FLIGHT_WAIT_TIMEOUT
+        self.assertLess(time.perf_counter() - started, 2)
+
+    def test_hard_expiry_follows_the_stale_window(self):
+        with patch.object(cache, "set", wraps=cache.set) as cache_set:
+            get_or_compute("job:detail:1", lambda: "fresh", 60, stale_timeout=30)
+        self.assertEqual(cache_set.call_args.args[2], 90)
+
+
+class CachedFunctionSingleFlightTests(SimpleTestCase):
+
+    def setUp(self):
+        patcher = patch.object(redis_cache, "redis_client", FakeStrictRedis(decode_responses=True))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_function_result_coalesces_recomputation(self):
+        calls = []
+
+        @redis_cache.cache_function_result(timeout=60, key_prefix="sf_test:")
+        def expensive(job_id):
+            calls.append(job_id)
+            time.sleep(0.2)
+            return {"id": job_id}
+
+        barrier = threading.Barrier(10)
+
+        def call():
+            barrier.wait()
+            return expensive(7)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            results = list(pool.map(lambda _: call(), range(10)))
+
+        self.assertEqual(calls, [7])
+        self.assertEqual(results, [{"id": 7}] * 10)
@@ -0,0 +1,92 @@
+"""
+Tests for the geohash spatial index.
+"""
+
+import random
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from core.spatial_index import (
+    cell_size_degrees,
+    covering_cells,
+    encode,
+    haversine_km,
+    nearby,
+)
+from userlocation.models import UserLocation
+
+User = get_user_model()
+
+
+class GeohashTests(SimpleTestCase):
+    """Test geohash encoding and cell covering."""
+
+    def test_encode_known_values(self):
+        self.assertEqual(encode(57.64911, 10.40744, 11), "u4pruydqqvj")
+        self.assertEqual(encode(42.6, -5.6, 5), "ezs42")
+
+    def test_cell_size(self):
+        lat_deg, lon_deg = cell_size_degrees(1)
+        self.assertEqual((lat_deg, lon_deg), (45.0, 45.0))
+
+    def test_cover_contains_every_point_in_radius(self):
+        rng = random.Random(42)
+        for _ in range(200):
+            lat = rng.uniform(-80, 80)
+            lon = rng.uniform(-180, 180)
+            radius = rng.choice([0.5, 2, 5, 25, 50, 300])
+            cells = covering_cells(lat, lon, radius)
+            self.assertTrue(cells)
+            for _ in range(20):
+                # Random point inside the circle (approximate, then verified)
+                p_lat = lat + rng.uniform(-1, 1) * radius / 111.32
+                p_lon = lon + rng.uniform(-1, 1) * radius / 60.0
+                p_lon = (p_lon + 180.0) % 360.0 - 180.0
+                if not -90 <= p_lat <= 90 or haversine_km(lat, lon, p_lat, p_lon) > radius:
+                    continue
+                point_hash = encode(p_lat, p_lon)
+                self.assertTrue(
+                    any(point_hash.startswith(cell) for cell in cells),
+                    f"{p_lat},{p_lon} ({point_hash}) not covered by {cells}",
+                )
+
+    def test_cover_wraps_antimeridian(self):
+        cells = covering_cells(0.0, 179.99, 20)
+        self.assertTrue(any(encode(0.0, -179.99).startswith(cell) for cell in cells))
+
+
+class NearbyQueryTests(TestCase):
+    """Test radius queries against UserLocation rows."""
+
+    def test_nearby_matches_full_scan(self):
+        rng = random.Random(7)
+        for i in range(60):
+            user = User.objects.create(username=f"geo{i}", email=f"geo{i}@example.com")
+            UserLocation.objects.create(
+                user=user,
+                latitude=6.5 + rng.uniform(-0.3, 0.3),
+                longitude=3.4 + rng.uniform(-0.3, 0.3),
+                address="Lagos",
+            )
+
+        for radius in (1, 5, 15, 60):
+            expected = sorted(
+                loc.id
+                for loc in UserLocation.objects.all()
+                if haversine_km(6.5, 3.4, loc.latitude, loc.longitude) <= radius
+            )
+            found = nearby(UserLocation.objects.all(), 6.5, 3.4, radius)
+            self.assertEqual(sorted(loc.id for loc, _ in found), expected)
+            distances = [distance for _, distance in found]
+            self.assertEqual(distances, sorted(distances))
+
+    def test_geohash_follows_coordinate_updates(self):
+        user = User.objects.create(username="mover", email="mover@example.com")
+        location = UserLocation.objects.create(user=user, latitude=6.5, longitude=3.4, address="Lagos")
+        self.assertEqual(location.geohash, encode(6.5, 3.4))
+
+        location.latitude, location.longitude = 9.07, 7.49
+        location.save(update_fields=["latitude", "longitude"])
+        location.refresh_from_db()
+        self.assertEqual(location.geohash, encode(9.07, 7.49))
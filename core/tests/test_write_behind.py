@@ -0,0 +1,87 @@
+"""
+Tests for the write-behind queue in core.write_behind and the SQLite
+connection tuning in core.db_tuning.
+"""
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.write_behind import WriteBehindQueue
+from notifications.models import Notification
+
+User = get_user_model()
+
+
+class WriteBehindQueueTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="wb_user", email="wb@example.com", password="pass12345")
+        Notification.objects.filter(user=self.user).delete()  # Drop the welcome notification
+        # A long interval keeps the background thread out of the way; tests flush by hand
+        self.queue = WriteBehindQueue(enabled=True, flush_interval=3600)
+        self.addCleanup(self.queue.stop, flush=False)
+
+    def notification(self, message="Job posted"):
+        return Notification(user=self.user, category="general", message=message)
+
+    def test_rows_are_written_in_one_batch_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                self.queue.add(self.notification(f"Job {i}"))
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.queue.flush(), 5)
+
+        inserts = [q for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 5)
+        self.assertEqual(self.queue.stats()["batches"], 1)
+
+    def test_rows_from_rolled_back_transactions_are_never_queued(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.queue.add(self.notification())
+                    raise ValueError("rollback")
+            except ValueError:
+                pass
+
+        self.assertEqual(self.queue.stats()["pending"], 0)
+
+    def test_a_bad_row_only_drops_itself(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queue.add(self.notification("first"))
+            self.queue.add(self.notification(message=None))  # NOT NULL violation
+            self.queue.add(self.notification("third"))
+
+        self.assertEqual(self.queue.flush(), 2)
+        self.assertEqual(self.queue.stats()["dropped"], 1)
+        self.assertEqual(
+            sorted(Notification.objects.filter(user=self.user).values_list("message", flat=True)),
+            ["first", "third"],
+        )
+
+    def test_disabled_queue_saves_immediately(self):
+        instance = WriteBehindQueue(enabled=False).add(self.notification())
+        self.assertIsNotNone(instance.pk)
+
+
+class SQLitePragmaTests(TestCase):
+
+    def test_new_connections_use_wal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            wrapper = DatabaseWrapper({**connection.settings_dict, "NAME": str(Path(tmp) / "tuned.sqlite3")})
+            try:
+                with wrapper.cursor() as cursor:
+                    cursor.execute("PRAGMA journal_mode")
+                    self.assertEqual(cursor.fetchone()[0], "wal")
+                    cursor.execute("PRAGMA synchronous")
+                    self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            finally:
+                wrapper.close()
@@ -5,6 +5,7 @@ Core URLs for monitoring and system health.
 from django.urls import path, include
 from ninja import NinjaAPI
 
+from .metrics import metrics_view
 from .monitoring import cache_stats_view, clear_cache_view, system_health_view
 from .redis_api import redis_router
 from .views import redis_dashboard_view
@@ -26,6 +27,9 @@ urlpatterns = [
     path("monitoring/clear-cache/", clear_cache_view, name="clear_cache"),
     path("monitoring/system-health/", system_health_view, name="system_health"),
 
+    # Prometheus scrape endpoint
+    path("metrics/", metrics_view, name="metrics"),
+
     # Redis monitoring API
     path("redis/", redis_api.urls),
 
@@ -0,0 +1,223 @@
+"""
+Write-behind queue for high-frequency inserts.
+
+On SQLite every INSERT takes the database-wide write lock, so many small
+writes from concurrent requests (location pings, activity logs,
+notifications) queue up behind each other and eventually fail with
+"database is locked". Instead of saving such rows immediately, callers hand
+unsaved instances to ``write_behind.add()``. A background thread per process
+inserts everything pending every WRITE_BEHIND_FLUSH_INTERVAL seconds with one
+``bulk_create`` transaction per model, so the lock is taken once per batch
+instead of once per row.
+
+Trade-offs: rows become visible up to one flush interval later, and
+``bulk_create`` does not send ``pre_save``/``post_save`` signals, so only use
+it for models nothing listens to. Rows added inside a transaction are only
+queued once it commits. If a batch fails, its rows are retried one by one
+and only the bad ones are dropped. When WRITE_BEHIND_ENABLED is False (the
+default), ``add()`` simply saves the instance.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+
+from django.conf import settings
+from django.db import close_old_connections, connections, router, transaction
+
+logger = logging.getLogger(__name__)
+
+# Constants
+WRITE_BEHIND_ENABLED = getattr(settings, 'WRITE_BEHIND_ENABLED', False)
+WRITE_BEHIND_FLUSH_INTERVAL = getattr(settings, 'WRITE_BEHIND_FLUSH_INTERVAL', 1.0)  # 1 second
+WRITE_BEHIND_BATCH_SIZE = getattr(settings, 'WRITE_BEHIND_BATCH_SIZE', 500)
+WRITE_BEHIND_MAX_PENDING = getattr(settings, 'WRITE_BEHIND_MAX_PENDING', 10000)
+
+
+class WriteBehindQueue:
+    """Buffer unsaved model instances and bulk insert them periodically."""
+
+    def __init__(
+        self,
+        enabled: bool = WRITE_BEHIND_ENABLED,
+        flush_interval: float = WRITE_BEHIND_FLUSH_INTERVAL,
+        batch_size: int = WRITE_BEHIND_BATCH_SIZE,
+        max_pending: int = WRITE_BEHIND_MAX_PENDING,
+    ):
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._pid = None
+
+        self._added = 0
+        self._written = 0
+        self._batches = 0
+        self._overflowed = 0
+        self._dropped = 0
+
+    def add(self, instance):
+        """
+        Queue an unsaved model instance for insertion.
+
+        Args:
+            instance: The model instance to insert
+
+        Returns:
+            The instance (its primary key is only set once it is written)
+        """
+        if not self.enabled:
+            instance.save()
+            return instance
+
+        using = router.db_for_write(type(instance), instance=instance)
+        if connections[using].in_atomic_block:
+            # Never write rows from a transaction that may still roll back
+            transaction.on_commit(lambda: self._enqueue(instance), using=using)
+        else:
+            self._enqueue(instance)
+        return instance
+
+    def _enqueue(self, instance):
+        with self._lock:
+            overflow = len(self._pending) >= self.max_pending
+            if not overflow:
+                self._pending.append(instance)
+                self._added += 1
+                pending = len(self._pending)
+            else:
+                self._overflowed += 1
+
+        if overflow:
+            # The flusher is falling behind: apply back-pressure to the caller
+            instance.save()
+            return
+
+        self._ensure_worker()
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            # Threads do not survive a fork, so each worker process starts its own
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._pid = pid
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush failed: {str(e)}", exc_info=True)
+            finally:
+                close_old_connections()
+
+    def flush(self) -> int:
+        """
+        Insert everything pending now.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending)
+                self._pending.clear()
+            if not batch:
+                return 0
+
+            by_model = OrderedDict()
+            for instance in batch:
+                by_model.setdefault(type(instance), []).append(instance)
+
+            written = 0
+            for model, instances in by_model.items():
+                for start in range(0, len(instances), self.batch_size):
+                    written += self._write(model, instances[start:start + self.batch_size])
+            return written
+
+    def _write(self, model, instances) -> int:
+        using = router.db_for_write(model)
+        try:
+            with transaction.atomic(using=using):
+                model._default_manager.db_manager(using).bulk_create(instances)
+            with self._lock:
+                self._written += len(instances)
+                self._batches += 1
+            return len(instances)
+        except Exception as e:
+            logger.warning(
+                f"Bulk insert of {len(instances)} {model.__name__} rows failed ({str(e)}); "
+                f"retrying them one by one"
+            )
+
+        written = 0
+        for instance in instances:
+            if model._meta.auto_field is not None:
+                # A rolled back bulk insert may already have assigned an id
+                instance.pk = None
+            instance._state.adding = True
+            try:
+                with transaction.atomic(using=using):
+                    instance.save(using=using)
+                written += 1
+            except Exception as e:
+                with self._lock:
+                    self._dropped += 1
+                logger.error(f"Dropping queued {model.__name__} row: {str(e)}")
+        with self._lock:
+            self._written += written
+        return written
+
+    def stop(self, flush: bool = True):
+        """Stop the background thread, optionally flushing what is pending."""
+        self._stopping.set()
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval + 5)
+        self._thread = None
+        if flush:
+            self.flush()
+
+    def stats(self) -> dict:
+        """Return queue counters for this process."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "pending": len(self._pending),
+                "added": self._added,
+                "written": self._written,
+                "batches": self._batches,
+                "overflowed": self._overflowed,
+                "dropped": self._dropped,
+            }
+
+
+write_behind = WriteBehindQueue()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        write_behind.flush()
+    except Exception as e:
+        logger.error(f"Write-behind flush at exit failed: {str(e)}")
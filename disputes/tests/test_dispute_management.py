@@ -454,7 +454,7 @@ class TestJobMatchingWithDisputes:
             cache_key = f"job_matches:{test_job.id}"
             assert any(call[0][0] == cache_key for call in mock_cache.call_args_list)
 
-    @patch("jobs.signals.send_job_match_notification")
+    @patch("notifications.fanout.fan_out")
     def test_notifications_sent_for_matches(
         self, mock_notify, test_job, applicant_user
     ):
@@ -475,5 +475,5 @@ class TestJobMatchingWithDisputes:
 
         # Check that notification was sent
         mock_notify.assert_called_once()
-        assert mock_notify.call_args[0][0] == applicant_user
-        assert mock_notify.call_args[0][1] == test_job
+        assert list(mock_notify.call_args[0][0]) == [applicant_user]
+        assert "85%" in mock_notify.call_args[0][1](applicant_user)
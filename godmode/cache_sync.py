@@ -22,6 +22,7 @@ from django.core.cache import cache
 from core.cache import redis_client, get_cached_data, set_cached_data, delete_cached_data
 from core.redis_settings import CACHE_ENABLED
 from core.redis_lock import redis_lock
+from core.redis.cache_tags import scan_keys
 
 # Configure logging with more detailed format
 logger = logging.getLogger(__name__)
@@ -243,11 +244,11 @@ class CacheSyncManager:
         try:
             # Get keys for the model
             pattern = f"{model_name}:*"
-            keys = redis_client.keys(pattern)
+            keys = list(scan_keys(pattern, client=redis_client))
 
             # Also check for permanent cache
             permanent_pattern = f"permanent:{model_name}:*"
-            permanent_keys = redis_client.keys(permanent_pattern)
+            permanent_keys = list(scan_keys(permanent_pattern, client=redis_client))
 
             # Combine and return
             return [k.decode('utf-8') for k in keys + permanent_keys]
@@ -679,7 +680,7 @@ class CacheSyncManager:
 
         try:
             # Get all keys (excluding system keys)
-            all_keys = redis_client.keys("*")
+            all_keys = list(scan_keys("*", client=redis_client))
             filtered_keys = []
 
             for key in all_keys:
@@ -13,6 +13,7 @@ from django.utils import timezone
 
 from core.cache import redis_client
 from core.redis_settings import CACHE_ENABLED
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -113,11 +114,11 @@ def get_model_cache_keys(model_name: str) -> List[str]:
     try:
         # Get keys for the model
         pattern = f"{model_name}:*"
-        keys = redis_client.keys(pattern)
+        keys = list(scan_keys(pattern, client=redis_client))
         
         # Also check for permanent cache
         permanent_pattern = f"permanent:{model_name}:*"
-        permanent_keys = redis_client.keys(permanent_pattern)
+        permanent_keys = list(scan_keys(permanent_pattern, client=redis_client))
         
         # Combine and return
         return [k.decode('utf-8') for k in keys + permanent_keys]
@@ -160,7 +161,7 @@ def get_cache_stats() -> Dict:
         
         # Get key patterns
         key_patterns = {}
-        all_keys = redis_client.keys("*")
+        all_keys = list(scan_keys("*", client=redis_client))
         
         for key in all_keys:
             key_str = key.decode('utf-8')
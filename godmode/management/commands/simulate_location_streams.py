@@ -6,24 +6,36 @@ This command simulates the creation and updating of location data for users, inc
 - Job locations (locations associated with jobs)
 - Live location history (dynamic location updates as users move)
 
+It can also benchmark the live ingestion pipeline used by
+JobLocationConsumer (jobchat.location_pipeline): temporary devices send
+pings through it, and the throughput of this worker process is reported.
+
 Usage:
     python manage.py simulate_location_streams --user-count=10 --updates-per-user=5
+    python manage.py simulate_location_streams --benchmark-ingestion --devices=1000 --updates-per-user=20
 """
 
+import asyncio
 import json
 import logging
 import random
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+from asgiref.sync import sync_to_async
+from channels.layers import get_channel_layer
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
 from accounts.models import Profile
+from core.write_behind import write_behind
+from jobchat.location_pipeline import ingest_location, latest_key
 from jobchat.models import LocationHistory
 from jobs.models import Job
 
@@ -126,6 +138,17 @@ class Command(BaseCommand):
             action="store_true",
             help="Update job locations",
         )
+        parser.add_argument(
+            "--benchmark-ingestion",
+            action="store_true",
+            help="Benchmark the live location ingestion pipeline instead",
+        )
+        parser.add_argument(
+            "--devices",
+            type=int,
+            default=1000,
+            help="Simulated devices for --benchmark-ingestion",
+        )
 
     def handle(self, *args, **options):
         user_count = options["user_count"]
@@ -134,6 +157,9 @@ class Command(BaseCommand):
         create_location_history = options["create_location_history"]
         update_job_locations = options["update_job_locations"]
 
+        if options["benchmark_ingestion"]:
+            return self.benchmark_ingestion(options["devices"], updates_per_user)
+
         # If no specific options are selected, do all updates
         if not any(
             [update_home_address, create_location_history, update_job_locations]
@@ -341,6 +367,91 @@ class Command(BaseCommand):
 
         return results
 
+    def benchmark_ingestion(self, devices: int, pings_per_device: int) -> str:
+        """
+        Drive the location ingestion pipeline with simulated devices.
+
+        Every device gets a temporary user and sends its pings in rounds, the
+        way JobLocationConsumer hands them over: through a thread-sensitive
+        sync_to_async call followed by a group broadcast. Half the devices
+        move and half only jitter in place, so down-sampling has something
+        to drop. The temporary users (and their history) are deleted at the end.
+
+        Args:
+            devices: Number of simulated devices
+            pings_per_device: Number of pings each device sends
+
+        Returns:
+            Summary of the benchmark
+        """
+        job = Job.objects.first()
+        if not job:
+            self.stdout.write(self.style.WARNING("No jobs available for the benchmark"))
+            return "No jobs available for the benchmark"
+        if devices < 1 or pings_per_device < 1:
+            return "Nothing to benchmark"
+
+        prefix = f"loc_bench_{int(time.time())}_"
+        User.objects.bulk_create(
+            [User(username=f"{prefix}{i}", email=f"{prefix}{i}@example.com") for i in range(devices)]
+        )
+        user_ids = list(User.objects.filter(username__startswith=prefix).values_list("id", flat=True))
+        channel_layer = get_channel_layer()
+        self.stdout.write(
+            f"Devices: {len(user_ids)} | pings per device: {pings_per_device} | "
+            f"write-behind: {write_behind.enabled} | channel layer: {type(channel_layer).__name__}"
+        )
+
+        positions = []
+        for _ in user_ids:
+            area = random.choice(random.choice(NIGERIA_LOCATIONS)["areas"])
+            positions.append([area["lat"] + random.uniform(-0.01, 0.01), area["lng"] + random.uniform(-0.01, 0.01)])
+
+        async def drive():
+            ingest = sync_to_async(ingest_location)
+            persisted = 0
+            for _ in range(pings_per_device):
+                for i, user_id in enumerate(user_ids):
+                    # ~0.0003 degrees is ~30m; ~0.00002 is ~2m of GPS jitter
+                    step = 0.0003 if i % 2 else 0.00002
+                    positions[i][0] += random.uniform(-step, step)
+                    positions[i][1] += random.uniform(-step, step)
+                    latitude, longitude = positions[i]
+                    if await ingest(user_id, job.id, latitude, longitude):
+                        persisted += 1
+                    if channel_layer is not None:
+                        await channel_layer.group_send(
+                            f"job_{job.id}",
+                            {
+                                "type": "location_update",
+                                "latitude": latitude,
+                                "longitude": longitude,
+                                "user_id": user_id,
+                                "timestamp": timezone.now().isoformat(),
+                            },
+                        )
+            return persisted
+
+        try:
+            started = time.perf_counter()
+            persisted = asyncio.run(drive())
+            elapsed = time.perf_counter() - started
+            started = time.perf_counter()
+            drained = write_behind.flush()
+            drain_ms = (time.perf_counter() - started) * 1000
+        finally:
+            cache.delete_many([latest_key(user_id, job.id) for user_id in user_ids])
+            User.objects.filter(id__in=user_ids).delete()
+
+        messages = len(user_ids) * pings_per_device
+        summary = (
+            f"{messages} pings in {elapsed:.2f}s ({messages / elapsed:.1f} msg/s per process), "
+            f"{persisted} persisted ({persisted / messages:.0%}), "
+            f"write-behind drained {drained} rows in {drain_ms:.1f} ms"
+        )
+        self.stdout.write(self.style.SUCCESS(summary))
+        return summary
+
     def update_job_locations(self) -> List[Dict]:
         """
         Update job locations.
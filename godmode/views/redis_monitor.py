@@ -17,6 +17,7 @@ from django.views.decorators.http import require_POST
 from core.cache import get_cache_stats, redis_client
 from core.management.commands.warm_model_cache import Command as WarmCacheCommand
 from core.redis_settings import REDIS_DB_CACHE, get_redis_connection_params
+from core.redis.cache_tags import scan_keys
 
 logger = logging.getLogger(__name__)
 
@@ -144,7 +145,7 @@ def _get_largest_keys(limit=10):
     """
     try:
         # Get all keys
-        keys = redis_client.keys("*")
+        keys = list(scan_keys("*", client=redis_client))
 
         # Sample keys if there are too many
         if len(keys) > 1000:
@@ -16,6 +16,8 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 
 # Import models using string references to avoid circular import issues
+from core.spatial_index import nearby
+from jobchat.location_pipeline import ingest_location
 from jobchat.models import LocationHistory, Message
 from jobs.models import Job
 
@@ -111,18 +113,10 @@ class JobLocationConsumer(AsyncWebsocketConsumer):
             await self.process_location(user, latitude, longitude)
 
     async def process_location(self, user, latitude, longitude):
-        """Saves or updates the user's location and broadcasts to all connected users"""
+        """Records the user's location and broadcasts it to all connected users"""
         current_time = datetime.utcnow()
-        last_location = await self.get_last_location(user)
-
-        if (
-            last_location
-            and last_location.latitude == latitude
-            and last_location.longitude == longitude
-        ):
-            await self.update_last_location_time(last_location, current_time)
-        else:
-            await self.save_location(user, latitude, longitude, current_time)
+        # Latest position goes to Redis; history is down-sampled and batched
+        await self.ingest_location(user, latitude, longitude)
 
         # Broadcast location update to all users in the job group
         # Include user identification so frontend can distinguish applicant from job owner
@@ -144,23 +138,9 @@ class JobLocationConsumer(AsyncWebsocketConsumer):
         await self.send(text_data=json.dumps(event))
 
     @database_sync_to_async
-    def get_last_location(self, user):
-        """Gets the last recorded location of the user"""
-        return LocationHistory.objects.filter(user=user).order_by("-timestamp").first()
-
-    @database_sync_to_async
-    def save_location(self, user, lat, lon, timestamp):
-        """Saves user location to the database"""
-        job = Job.objects.get(id=self.job_id)
-        return LocationHistory.objects.create(
-            job=job, user=user, latitude=lat, longitude=lon, timestamp=timestamp
-        )
-
-    @database_sync_to_async
-    def update_last_location_time(self, last_location, new_timestamp):
-        """Updates the timestamp of the last saved location"""
-        last_location.timestamp = new_timestamp
-        last_location.save()
+    def ingest_location(self, user, lat, lon):
+        """Hands the ping to the location ingestion pipeline"""
+        return ingest_location(user.id, self.job_id, lat, lon)
 
 
 class JobMatchingConsumer(AsyncWebsocketConsumer):
@@ -231,27 +211,21 @@ class JobMatchingConsumer(AsyncWebsocketConsumer):
         if not user_location:
             return []
 
-        jobs = Job.objects.filter(status="upcoming")
-        job_list = []
-        for job in jobs:
-            distance = self.calculate_distance(
+        return [
+            {
+                "id": job.id,
+                "title": job.title,
+                "shift_type": job.shift_type,
+                "rate": job.rate,
+                "distance": round(distance, 2),
+            }
+            for job, distance in nearby(
+                Job.objects.filter(status="upcoming"),
                 user_location.latitude,
                 user_location.longitude,
-                job.latitude,
-                job.longitude,
+                50,  # 50km radius
             )
-            if distance <= 50:  # 50km radius
-                job_list.append(
-                    {
-                        "id": job.id,
-                        "title": job.title,
-                        "shift_type": job.shift_type,
-                        "rate": job.rate,
-                        "distance": round(distance, 2),
-                    }
-                )
-
-        return sorted(job_list, key=lambda x: x["distance"])
+        ]
 
     @database_sync_to_async
     def update_user_location(self, user, latitude, longitude):
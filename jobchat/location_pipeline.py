@@ -0,0 +1,135 @@
+"""
+Ingestion pipeline for live GPS pings from JobLocationConsumer.
+
+Each ping used to cost two or three database round trips (look up the last
+row, re-fetch the Job, then insert or update). The pipeline keeps that state
+in the cache instead:
+
+- the user's latest position for the job lives under ``location:latest:``,
+  so reading it back is one Redis GET and needs no database query;
+- a ping is only written to LocationHistory when the user has moved at least
+  LOCATION_MIN_DISTANCE_M from the last persisted point, or
+  LOCATION_MIN_INTERVAL seconds have passed since it (down-sampling);
+- rows that are written go through core.write_behind, so they are bulk
+  inserted in batches when WRITE_BEHIND_ENABLED is set.
+
+Broadcasting is left to the caller and happens for every ping, so clients
+still see each position immediately.
+
+When the cache is unavailable (DummyCache or Redis down) there is no
+previous state, so every ping is persisted, as before.
+"""
+
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.spatial_index import haversine_km
+from core.write_behind import write_behind
+from jobchat.models import LocationHistory
+
+logger = logging.getLogger(__name__)
+
+# Constants
+LOCATION_MIN_DISTANCE_M = getattr(settings, 'LOCATION_MIN_DISTANCE_M', 25)  # 25 metres
+LOCATION_MIN_INTERVAL = getattr(settings, 'LOCATION_MIN_INTERVAL', 30)  # 30 seconds
+LOCATION_LATEST_TTL = getattr(settings, 'LOCATION_LATEST_TTL', 60 * 60)  # 1 hour
+
+LATEST_KEY_PREFIX = "location:latest:"
+
+
+def latest_key(user_id: int, job_id: int) -> str:
+    """Cache key holding a user's latest position for a job."""
+    return f"{LATEST_KEY_PREFIX}{job_id}:{user_id}"
+
+
+def get_latest_location(user_id: int, job_id: int) -> Optional[dict]:
+    """
+    Return the latest cached position of a user on a job.
+
+    Returns:
+        Dict with latitude, longitude, timestamp and the last persisted
+        point, or None if nothing is cached
+    """
+    try:
+        return cache.get(latest_key(user_id, job_id))
+    except Exception as e:
+        logger.warning(f"Could not read latest location for user {user_id}: {str(e)}")
+        return None
+
+
+def should_persist(
+    previous: Optional[dict],
+    latitude: float,
+    longitude: float,
+    now: float,
+    min_distance_m: float = LOCATION_MIN_DISTANCE_M,
+    min_interval: float = LOCATION_MIN_INTERVAL,
+) -> bool:
+    """
+    Decide whether a ping is worth a LocationHistory row.
+
+    Args:
+        previous: Cached state for the user, or None
+        latitude: New latitude
+        longitude: New longitude
+        now: Ping time as a UNIX timestamp
+        min_distance_m: Movement (from the last persisted point) that forces a write
+        min_interval: Seconds after the last persisted point that force a write
+
+    Returns:
+        True if the ping should be written
+    """
+    if not previous or previous.get("persisted_at") is None:
+        return True
+    if now - previous["persisted_at"] >= min_interval:
+        return True
+    moved_m = haversine_km(
+        previous["persisted_latitude"], previous["persisted_longitude"], latitude, longitude
+    ) * 1000
+    return moved_m >= min_distance_m
+
+
+def ingest_location(user_id: int, job_id: int, latitude, longitude, now=None) -> bool:
+    """
+    Record a GPS ping: update the cached latest position and queue a history
+    row if the ping passes down-sampling.
+
+    Args:
+        user_id: ID of the user sending the ping
+        job_id: ID of the job being tracked
+        latitude: Reported latitude
+        longitude: Reported longitude
+        now: Ping time (defaults to timezone.now())
+
+    Returns:
+        True if a LocationHistory row was queued
+    """
+    now = now or timezone.now()
+    latitude, longitude = float(latitude), float(longitude)
+    ts = now.timestamp()
+
+    previous = get_latest_location(user_id, job_id)
+    persist = should_persist(previous, latitude, longitude, ts)
+
+    state = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "timestamp": ts,
+        "persisted_latitude": latitude if persist else previous["persisted_latitude"],
+        "persisted_longitude": longitude if persist else previous["persisted_longitude"],
+        "persisted_at": ts if persist else previous["persisted_at"],
+    }
+    try:
+        cache.set(latest_key(user_id, job_id), state, LOCATION_LATEST_TTL)
+    except Exception as e:
+        logger.warning(f"Could not cache latest location for user {user_id}: {str(e)}")
+
+    if persist:
+        write_behind.add(LocationHistory(
+            job_id=job_id, user_id=user_id, latitude=latitude, longitude=longitude, timestamp=now
+        ))
+    return persist
@@ -1 +1,59 @@
-from django.test import TestCase
+"""
+Tests for the live location ingestion pipeline in jobchat.location_pipeline.
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from jobchat.location_pipeline import get_latest_location, ingest_location, should_persist
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class ShouldPersistTests(SimpleTestCase):
+
+    def setUp(self):
+        self.previous = {"persisted_latitude": 6.5244, "persisted_longitude": 3.3792, "persisted_at": 1000.0}
+
+    def test_first_ping_is_persisted(self):
+        self.assertTrue(should_persist(None, 6.5244, 3.3792, 1000.0))
+
+    def test_jitter_within_interval_is_dropped(self):
+        # ~1m away, 5 seconds later
+        self.assertFalse(should_persist(self.previous, 6.52441, 3.3792, 1005.0, 25, 30))
+
+    def test_movement_is_persisted(self):
+        # ~110m north
+        self.assertTrue(should_persist(self.previous, 6.5254, 3.3792, 1005.0, 25, 30))
+
+    def test_stationary_user_is_persisted_after_interval(self):
+        self.assertTrue(should_persist(self.previous, 6.5244, 3.3792, 1030.0, 25, 30))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class IngestLocationTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        patcher = patch("jobchat.location_pipeline.write_behind")
+        self.write_behind = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_latest_position_is_cached_and_jitter_is_not_written(self):
+        now = timezone.now()
+        self.assertTrue(ingest_location(1, 7, 6.5244, 3.3792, now))
+        self.assertFalse(ingest_location(1, 7, 6.52441, 3.3792, now + timedelta(seconds=2)))
+
+        self.assertEqual(self.write_behind.add.call_count, 1)
+        latest = get_latest_location(1, 7)
+        self.assertEqual(latest["latitude"], 6.52441)
+        # Down-sampling still measures from the point that was written
+        self.assertEqual(latest["persisted_latitude"], 6.5244)
+
+    def test_queued_row_carries_ids_without_fetching_job(self):
+        ingest_location(3, 9, "6.5", "3.4")
+        row = self.write_behind.add.call_args[0][0]
+        self.assertEqual((row.user_id, row.job_id, row.latitude, row.longitude), (3, 9, 6.5, 3.4))
@@ -17,7 +17,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Case, F, IntegerField, Q, Value, When
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -31,14 +31,17 @@ from userlocation.models import UserLocation
 
 from .applicant import applicant_router
 from .client import client_router
-from .models import Job, JobIndustry, JobSubCategory, User, SavedJob, Application
+from .models import (
+    JOB_INDUSTRIES_CACHE_KEY, JOB_SUBCATEGORIES_CACHE_KEY, Job, JobIndustry, JobSubCategory, User, SavedJob,
+    Application, client_jobs_cache_tag,
+)
 from .schemas import (
     JobDetailSchema, JobCancellationSuccessSchema, ErrorResponseSchema, IndustrySchema, SubCategorySchema,
     SaveJobRequestSchema, UnsaveJobRequestSchema, LocationUpdateSchema, GeocodeResponse, GeocodeRequest,
     CreateJobSchema, EditJobSchema, MarkArrivedSchema, JobPaymentDetailSchema, GetJobsRequestSchema
 )
 from .tasks import *
-from .utils import fetch_all_users, serialize_job, resolve_industry, resolve_subcategory
+from .utils import fetch_all_users, serialize_job, serialize_jobs, resolve_industry, resolve_subcategory
 
 # Import error handling and logging utilities
 from core.exceptions import (
@@ -55,12 +58,15 @@ from core.cache_utils import (
     invalidate_cache,
     CACHE_TTL_JOBS,
 )
+from core.redis_settings import CACHE_TIMEOUTS, L1_CACHE_DEFAULT_TIMEOUT
 from core.logging_utils import log_endpoint, logger as core_logger, api_logger
+from core.db_router import use_read_replica
+from core.pagination import COUNT_APPROXIMATE, InvalidCursor, paginate_by_cursor
 
 logger = logging.getLogger(__name__)
 core_router = Router(tags=["Core"])
 
-from core.cache import invalidate_cache_pattern
+from core.cache import invalidate_cache_tag
 
 # ==
 # 📌 Custom Classes
@@ -160,10 +166,14 @@ def get_all_users_view(request):
 
 @log_endpoint(core_logger)
 @core_router.get("/alljobs", tags=["Jobs"], response={200: dict})
-def get_jobs(request, page: int = Query(1, gt=0), page_size: int = Query(20, gt=0, le=100)):
+@use_read_replica
+def get_jobs(request, page: int = Query(1, gt=0), page_size: int = Query(20, gt=0, le=100), cursor: str = None):
     """
     Get all jobs with their details.
     Fetches directly from the database without Redis caching.
+
+    Pass ``cursor`` (empty for the first page, then ``next_cursor``) to page
+    newest-first with keyset pagination instead of page numbers.
     """
     try:
         from jobs.models import Job  # Make sure you import your Job model
@@ -175,10 +185,22 @@ def get_jobs(request, page: int = Query(1, gt=0), page_size: int = Query(20, gt=
             "client__profile",
             "industry",
             "subcategory"
-        ).prefetch_related("applications").all().order_by("-date")
+        ).all().order_by("-start_date")
 
         user_id = request.user.id if hasattr(request, "user") and request.user and request.user.is_authenticated else None
 
+        if cursor is not None:
+            try:
+                cursor_page = paginate_by_cursor(jobs, cursor, page_size, count=COUNT_APPROXIMATE)
+            except InvalidCursor:
+                return {"status": "error", "message": "Invalid cursor"}
+            return {
+                "status": "success",
+                "message": "Jobs retrieved successfully",
+                "jobs": serialize_jobs(cursor_page.items, include_extra=True, user_id=user_id),
+                "pagination": {"items_per_page": page_size, **cursor_page.metadata()},
+            }
+
         # Apply pagination
         paginator = Paginator(jobs, page_size)
         try:
@@ -198,7 +220,7 @@ def get_jobs(request, page: int = Query(1, gt=0), page_size: int = Query(20, gt=
         )
 
         # Serialize results
-        serialized = [serialize_job(job, include_extra=True, user_id=user_id) for job in jobs_page]
+        serialized = serialize_jobs(jobs_page, include_extra=True, user_id=user_id)
 
         return {
             "status": "success",
@@ -222,116 +244,64 @@ def get_jobs(request, page: int = Query(1, gt=0), page_size: int = Query(20, gt=
             "status": "error",
             "message": f"Error fetching jobs: {str(e)}"
         }
-        
 
 
+# Same order as matched jobs first, then sort_jobs_recent_first, with id as tie-breaker
+MATCHED_JOBS_ORDERING = ("match_rank", "recency_bucket", "start_date", "-created_at", "-id")
 
-@core_router.get("/alljobsmatched", tags=["Jobs"], response={200: dict})
-def get_jobs_filtered_for_user(request, query: Query[GetJobsRequestSchema], page: int = Query(1, gt=0), page_size: int = Query(20, gt=0, le=100)):
+
+def paid_jobs_matched_first(matched_job_ids):
+    """
+    Paid jobs ordered in the database: matched jobs first, then by recency.
+
+    Within each group jobs follow ``sort_jobs_recent_first`` (starting today,
+    then starting within the last two days or later, then the rest, each by
+    start date), so pages can be sliced without loading the whole table.
+    """
+    today = date.today()
+    return (
+        Job.objects.filter(payment_status="paid")
+        .select_related("client__profile", "industry", "subcategory")
+        .annotate(
+            match_rank=Case(
+                When(id__in=list(matched_job_ids), then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField(),
+            ),
+            recency_bucket=Case(
+                When(start_date=today, then=Value(0)),
+                When(start_date__gte=today - timedelta(days=2), then=Value(1)),
+                default=Value(2),
+                output_field=IntegerField(),
+            ),
+        )
+        .order_by(*MATCHED_JOBS_ORDERING)
+    )
+
+
+def paid_matched_job_ids(user_id):
+    """Ids of the user's matched jobs that are paid, in one query."""
     from jobs.matching import get_applicant_matches
-    from jobs.models import Job
 
+    matched_ids = [m["job_id"] for m in get_applicant_matches(user_id, limit=50)]
+    if not matched_ids:
+        return set()
+    return set(
+        Job.objects.filter(id__in=matched_ids, payment_status="paid").values_list("id", flat=True)
+    )
+
+
+@core_router.get("/alljobsmatched", tags=["Jobs"], response={200: dict})
+def get_jobs_filtered_for_user(request, query: Query[GetJobsRequestSchema], page: int = Query(1, gt=0), page_size: int = Query(20, gt=0, le=100)):
     user_id = query.user_id
 
     try:
+        matched_job_ids = set()
         if user_id:
             user_id = int(user_id)
+            matched_job_ids = paid_matched_job_ids(user_id)
 
-            # Get matched jobs
-            matches = get_applicant_matches(user_id, limit=50)
-
-            # Only keep matched jobs with payment_status="paid"
-            filtered = [
-                m for m in matches
-                if Job.objects.filter(id=m["job_id"], payment_status="paid").exists()
-            ]
-
-            matched_job_ids = {m["job_id"] for m in filtered}
-
-            if not filtered:
-                # No matched jobs → return ALL paid jobs with pagination
-                from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-
-                jobs = Job.objects.filter(payment_status="paid")
-                jobs = sort_jobs_recent_first(jobs)
-
-                paginator = Paginator(jobs, page_size)
-                try:
-                    jobs_page = paginator.page(page)
-                except PageNotAnInteger:
-                    jobs_page = paginator.page(1)
-                except EmptyPage:
-                    jobs_page = paginator.page(paginator.num_pages)
-
-                jobs_list = [serialize_job(job, user_id=user_id) for job in jobs_page]
-
-                return {
-                    "status": "success",
-                    "message": f"No matched jobs for user {user_id}. Showing all PAID jobs.",
-                    "jobs": jobs_list,
-                    "other_jobs_list": [],
-                    "pagination": {
-                        "current_page": page,
-                        "total_pages": paginator.num_pages,
-                        "total_items": paginator.count,
-                        "items_per_page": page_size,
-                        "has_next": jobs_page.has_next(),
-                        "has_previous": jobs_page.has_previous()
-                    }
-                }
-
-            else:
-                # Return matched + other paid jobs with pagination
-                from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-
-                matched_jobs = Job.objects.filter(id__in=matched_job_ids, payment_status="paid")
-                matched_jobs = sort_jobs_recent_first(matched_jobs)
-
-                # Exclude matched IDs to get other paid jobs
-                other_jobs = Job.objects.filter(payment_status="paid").exclude(id__in=matched_job_ids)
-                other_jobs = sort_jobs_recent_first(other_jobs)
-
-                # Combine matched jobs first, then other jobs
-                all_jobs = list(matched_jobs) + list(other_jobs)
-
-                paginator = Paginator(all_jobs, page_size)
-                try:
-                    jobs_page = paginator.page(page)
-                except PageNotAnInteger:
-                    jobs_page = paginator.page(1)
-                except EmptyPage:
-                    jobs_page = paginator.page(paginator.num_pages)
-
-                jobs_list = [serialize_job(job, user_id=user_id) for job in jobs_page]
-
-                # Sort so jobs with has_applied=True appear first within the page
-                jobs_list.sort(key=lambda x: not x.get("has_applied", False))
-
-                return {
-                    "status": "success",
-                    "message": f"{len(filtered)} matched PAID jobs fetched for user {user_id}, "
-                               f"plus {len(other_jobs)} other PAID jobs.",
-                    "jobs": jobs_list,
-                    "other_jobs_list": [],  # No longer needed as we combine them
-                    "pagination": {
-                        "current_page": page,
-                        "total_pages": paginator.num_pages,
-                        "total_items": paginator.count,
-                        "items_per_page": page_size,
-                        "has_next": jobs_page.has_next(),
-                        "has_previous": jobs_page.has_previous(),
-                        "matched_jobs_count": len(matched_jobs),
-                        "other_jobs_count": len(other_jobs)
-                    }
-                }
-
-        # No user_id provided → return ALL paid jobs with pagination
-        from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-
-        jobs = Job.objects.filter(payment_status="paid")
-        jobs = sort_jobs_recent_first(jobs)
-
-        paginator = Paginator(jobs, page_size)
+        paginator = Paginator(paid_jobs_matched_first(matched_job_ids), page_size)
         try:
             jobs_page = paginator.page(page)
         except PageNotAnInteger:
@@ -339,20 +309,49 @@ def get_jobs_filtered_for_user(request, query: Query[GetJobsRequestSchema], page
         except EmptyPage:
             jobs_page = paginator.page(paginator.num_pages)
 
-        jobs_list = [serialize_job(job) for job in jobs_page]
+        pagination = {
+            "current_page": page,
+            "total_pages": paginator.num_pages,
+            "total_items": paginator.count,
+            "items_per_page": page_size,
+            "has_next": jobs_page.has_next(),
+            "has_previous": jobs_page.has_previous()
+        }
+
+        if not user_id:
+            return {
+                "status": "success",
+                "message": f"{paginator.count} PAID jobs available (no user_id provided).",
+                "jobs": serialize_jobs(jobs_page),
+                "other_jobs_list": [],
+                "pagination": pagination,
+            }
+
+        jobs_list = serialize_jobs(jobs_page, user_id=user_id)
+
+        if not matched_job_ids:
+            return {
+                "status": "success",
+                "message": f"No matched jobs for user {user_id}. Showing all PAID jobs.",
+                "jobs": jobs_list,
+                "other_jobs_list": [],
+                "pagination": pagination,
+            }
+
+        # Sort so jobs with has_applied=True appear first within the page
+        jobs_list.sort(key=lambda x: not x.get("has_applied", False))
+        other_jobs_count = paginator.count - len(matched_job_ids)
 
         return {
             "status": "success",
-            "message": f"{paginator.count} PAID jobs available (no user_id provided).",
+            "message": f"{len(matched_job_ids)} matched PAID jobs fetched for user {user_id}, "
+                       f"plus {other_jobs_count} other PAID jobs.",
             "jobs": jobs_list,
-            "other_jobs_list": [],
+            "other_jobs_list": [],  # No longer needed as we combine them
             "pagination": {
-                "current_page": page,
-                "total_pages": paginator.num_pages,
-                "total_items": paginator.count,
-                "items_per_page": page_size,
-                "has_next": jobs_page.has_next(),
-                "has_previous": jobs_page.has_previous()
+                **pagination,
+                "matched_jobs_count": len(matched_job_ids),
+                "other_jobs_count": other_jobs_count,
             }
         }
 
@@ -363,7 +362,43 @@ def get_jobs_filtered_for_user(request, query: Query[GetJobsRequestSchema], page
             "status": "error",
             "message": f"Error fetching matched jobs: {str(e)}"
         }
-   
+
+
+@core_router.get("/alljobsmatched/cursor", tags=["Jobs"], response={200: dict})
+def get_jobs_filtered_for_user_cursor(request, query: Query[GetJobsRequestSchema], cursor: str = None, page_size: int = Query(20, gt=0, le=100)):
+    """
+    Infinite-scroll variant of /alljobsmatched.
+
+    Same ordering, but pages with an opaque keyset cursor instead of a page
+    number, so every request reads ``page_size`` rows however deep it is.
+    Pass ``next_cursor`` from the previous response to get the next page.
+    """
+    user_id = int(query.user_id) if query.user_id else None
+
+    try:
+        matched_job_ids = paid_matched_job_ids(user_id) if user_id else set()
+        try:
+            jobs_page = paginate_by_cursor(
+                paid_jobs_matched_first(matched_job_ids), cursor, page_size, ordering=MATCHED_JOBS_ORDERING
+            )
+        except InvalidCursor:
+            return {"status": "error", "message": "Invalid cursor"}
+
+        return {
+            "status": "success",
+            "jobs": serialize_jobs(jobs_page.items, user_id=user_id),
+            **jobs_page.metadata(),
+            "matched_jobs_count": len(matched_job_ids),
+        }
+
+    except Exception as e:
+        logger = logging.getLogger("ninja")
+        logger.error(f"Failed to fetch matched jobs: {str(e)}", exc_info=True)
+        return {
+            "status": "error",
+            "message": f"Error fetching matched jobs: {str(e)}"
+        }
+
 
 # Import Redis decorators
 from core.redis_decorators import time_view, track_user_activity
@@ -525,7 +560,7 @@ def delete_job(request, job_id: int):
 
         # Invalidate client jobs cache if needed
         if client_id:
-            invalidate_cache_pattern(f"clientjobs:u:{client_id}:*")
+            invalidate_cache_tag(client_jobs_cache_tag(client_id))
             core_logger.info(f"Invalidated client jobs cache for client {client_id} after job deletion")
 
         # Log successful deletion
@@ -582,21 +617,19 @@ def get_job_industries(request):
     """
     Get all job industries.
 
-    This endpoint uses Redis caching to improve performance.
-    The response is automatically cached by the cache_api_response decorator.
+    Industries rarely change, so the list is cached in Redis and in the
+    in-process L1 tier; jobs.signals invalidates it when an industry changes.
     """
-    logger.debug("Cache miss for job industries, fetching from database")
-    industries = JobIndustry.objects.all()
-
-    # Cache each industry individually if the cache method exists
-    for industry in industries:
-        if hasattr(industry, 'cache'):
-            try:
-                industry.cache()
-            except Exception as e:
-                logger.warning(f"Failed to cache industry {industry.id}: {str(e)}")
-
-    return list(industries)
+    from core.redis.cache import get_cached_data, set_cached_data
+
+    industries = get_cached_data(JOB_INDUSTRIES_CACHE_KEY, local_timeout=L1_CACHE_DEFAULT_TIMEOUT)
+    if industries is None:
+        logger.debug("Cache miss for job industries, fetching from database")
+        industries = list(JobIndustry.objects.values("id", "name"))
+        set_cached_data(
+            JOB_INDUSTRIES_CACHE_KEY, industries, CACHE_TIMEOUTS["default"], local_timeout=L1_CACHE_DEFAULT_TIMEOUT
+        )
+    return industries
 
 
 # --- GET: Job Subcategories with Industry ---
@@ -605,21 +638,20 @@ def get_job_subcategories(request):
     """
     Get all job subcategories with their industries.
 
-    This endpoint uses Redis caching to improve performance.
-    The response is automatically cached by the cache_api_response decorator.
+    Cached like get_job_industries.
     """
-    logger.debug("Cache miss for job subcategories, fetching from database")
-    subcategories = JobSubCategory.objects.select_related("industry").all()
+    from core.redis.cache import get_cached_data, set_cached_data
 
-    # Cache each subcategory individually if the cache method exists
-    for subcategory in subcategories:
-        if hasattr(subcategory, 'cache'):
-            try:
-                subcategory.cache()
-            except Exception as e:
-                logger.warning(f"Failed to cache subcategory {subcategory.id}: {str(e)}")
-
-    return list(subcategories)
+    subcategories = get_cached_data(JOB_SUBCATEGORIES_CACHE_KEY, local_timeout=L1_CACHE_DEFAULT_TIMEOUT)
+    if subcategories is None:
+        logger.debug("Cache miss for job subcategories, fetching from database")
+        subcategories = list(
+            JobSubCategory.objects.values("id", "name", "industry_id", industry_name=F("industry__name"))
+        )
+        set_cached_data(
+            JOB_SUBCATEGORIES_CACHE_KEY, subcategories, CACHE_TIMEOUTS["default"], local_timeout=L1_CACHE_DEFAULT_TIMEOUT
+        )
+    return subcategories
 
 
 
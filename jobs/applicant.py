@@ -15,6 +15,8 @@ from django.utils import timezone
 # jobs/applicant.py
 from ninja import Router
 
+from core.pagination import COUNT_EXACT, InvalidCursor, paginate_by_cursor
+from core.spatial_index import nearby
 from rating.schemas import *
 
 from .models import *
@@ -154,7 +156,7 @@ def apply_for_job(request, payload: ApplyJobSchema):
 def get_nearby_jobs(request, user_id: int):
     """
     GET /jobs/get-nearby-jobs?lat=...&lng=...&radius_km=...
-    Returns jobs within the specified radius using the Haversine formula.
+    Returns jobs within the specified radius using the shared spatial index.
     """
     try:
         lat = float(request.GET.get("lat", 0))
@@ -165,46 +167,22 @@ def get_nearby_jobs(request, user_id: int):
             {"error": "Invalid latitude, longitude, or radius"}, status=400
         )
 
-    # Get all active jobs
-    jobs = Job.objects.filter(status="upcoming")
-
-    def haversine(lat1, lon1, lat2, lon2):
-        """
-        Calculate the great-circle distance between two points
-        on the Earth using the Haversine formula.
-        """
-        R = 6371.0  # Radius of Earth in KM
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        return R * c
-
-    nearby_jobs = []
-    for job in jobs:
-        if not job.latitude or not job.longitude:
-            continue
-
-        distance = haversine(lat, lng, job.latitude, job.longitude)
-        if distance <= radius_km:
-            nearby_jobs.append(
-                {
-                    "id": job.id,
-                    "title": job.title,
-                    "distance_km": round(distance, 2),
-                    "rate": str(job.rate),
-                    "location": job.location,
-                    "start_time": (
-                        job.start_time.isoformat() if job.start_time else None
-                    ),
-                    "end_time": job.end_time.isoformat() if job.end_time else None,
-                }
-            )
-
-    # Sort jobs by distance (nearest first)
-    nearby_jobs.sort(key=lambda x: x["distance_km"])
+    # Geohash prefilter on upcoming jobs, exact haversine on the survivors;
+    # results come back nearest first
+    nearby_jobs = [
+        {
+            "id": job.id,
+            "title": job.title,
+            "distance_km": round(distance, 2),
+            "rate": str(job.rate),
+            "location": job.location,
+            "start_time": (
+                job.start_time.isoformat() if job.start_time else None
+            ),
+            "end_time": job.end_time.isoformat() if job.end_time else None,
+        }
+        for job, distance in nearby(Job.objects.filter(status="upcoming"), lat, lng, radius_km)
+    ]
 
     return JsonResponse({"jobs": nearby_jobs}, safe=False)
 
@@ -224,6 +202,10 @@ def list_accepted_applications(request):
         )
     )
 
+    apps_qs = list(apps_qs)
+    unique_jobs = list({app.job_id: app.job for app in apps_qs}.values())
+    job_info = dict(zip((job.id for job in unique_jobs), serialize_jobs(unique_jobs)))
+
     applications = []
     for app in apps_qs:
         applications.append(
@@ -236,7 +218,7 @@ def list_accepted_applications(request):
                         applicant=app.applicant, status="completed"
                     ).count(),
                 },
-                "job_info": serialize_job(app.job),
+                "job_info": job_info[app.job_id],
                 "application_metrics": {
                     "applied_at": app.applied_at.isoformat(),
                     "days_since_posted": (timezone.now() - app.job.created_at).days,
@@ -591,10 +573,14 @@ def get_clients_worked_with(request, applicant_id: int):
 
 @applicant_router.get("/applicantjobs/{user_id}", tags=["Applicant Endpoints"])
 def get_applied_jobs_by_user(
-    request, user_id: int, page: int = Query(1, gt=0), page_size: int = Query(50, gt=0)
+    request, user_id: int, page: int = Query(1, gt=0), page_size: int = Query(50, gt=0),
+    cursor: str = None,
 ):
     """
     Retrieve all jobs that a user (applicant) has applied to.
+
+    With ``cursor`` (empty for the first page, then ``next_cursor``) the
+    applications are paged newest first with keyset pagination.
     """
     from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 
@@ -602,9 +588,26 @@ def get_applied_jobs_by_user(
 
     # Fetch applications made by this user
     qs = Application.objects.filter(applicant=user).select_related(
-        "job", "job__industry", "job__subcategory", "job__client"
+        "job", "job__industry", "job__subcategory", "job__client__profile"
     )
 
+    if cursor is not None:
+        try:
+            cursor_page = paginate_by_cursor(qs, cursor, page_size, count=COUNT_EXACT)
+        except InvalidCursor:
+            return JsonResponse({"error": "Invalid cursor"}, status=400)
+        return JsonResponse(
+            {
+                "applicant_id": user.id,
+                "applicant_username": user.username,
+                "jobs_applied": serialize_jobs(
+                    [application.job for application in cursor_page.items], include_extra=True
+                ),
+                **cursor_page.metadata(),
+            },
+            status=200,
+        )
+
     paginator = Paginator(qs, page_size)
 
     try:
@@ -614,12 +617,9 @@ def get_applied_jobs_by_user(
     except EmptyPage:
         applications_page = []
 
-    jobs_data = []
-    for application in applications_page:
-        job = application.job
-        jobs_data.append(
-            serialize_job(job, include_extra=True)
-        )  # reuse your serialize_job
+    jobs_data = serialize_jobs(
+        [application.job for application in applications_page], include_extra=True
+    )
 
     return JsonResponse(
         {
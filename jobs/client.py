@@ -1,6 +1,7 @@
 # ==
 # 📌 Python Standard Library Imports
 # ==
+import hashlib
 import json
 import logging
 import os
@@ -53,7 +54,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from jobs.utils import serialize_job
+from jobs.models import client_jobs_cache_tag
+from jobs.utils import serialize_job, serialize_jobs
 
 # ==
 # 📌 Local Application Imports
@@ -61,7 +63,10 @@ from jobs.utils import serialize_job
 from .models import *
 from .schemas import *
 from core.cache import cache_api_response
+from core.pagination import COUNT_EXACT, InvalidCursor, paginate_by_cursor
+from core.redis.cache import get_cached_data, set_cached_data
 from core.redis_decorators import time_view, track_user_activity
+from core.spatial_index import nearby
 
 from userlocation.models import UserLocation
 from accounts.models import Profile
@@ -72,6 +77,10 @@ logger = logging.getLogger(__name__)
 # Initialize channel_layer lazily to avoid import errors
 channel_layer = None
 
+# Cached /clientjobs/ pages, tagged with client_jobs_cache_tag and dropped when
+# the client's jobs or their applications change; the TTL bounds date flags
+CLIENT_JOBS_CACHE_TIMEOUT = getattr(settings, 'CLIENT_JOBS_CACHE_TIMEOUT', 60 * 5)  # 5 minutes
+
 WEIGHT_RATING = 3
 WEIGHT_DISTANCE = 2
 WEIGHT_EXPERIENCE = 1.5
@@ -214,20 +223,55 @@ def get_job_detail(request, job_id: int):
 @time_view("client_jobs_by_id")
 @track_user_activity("view_client_jobs")
 def get_client_jobs_by_id(
-    request, user_id: int, page: int = Query(1, gt=0), page_size: int = Query(50, gt=0)
+    request, user_id: int, page: int = Query(1, gt=0), page_size: int = Query(50, gt=0),
+    cursor: str = None,
 ):
     """
     Get all jobs for a specific client.
     Returns paginated list of jobs with basic client information.
+
+    With ``cursor`` (empty for the first page, then ``next_cursor``) jobs are
+    paged newest first with keyset pagination instead of page numbers.
+
+    Pages are cached under the client's jobs tag, which Job saves and deletes
+    and Application changes invalidate.
     """
+    tag = client_jobs_cache_tag(user_id)
+    if cursor is not None:
+        cache_key = f"{tag}:cursor:{hashlib.md5(cursor.encode()).hexdigest()}:size:{page_size}"
+    else:
+        cache_key = f"{tag}:page:{page}:size:{page_size}"
+    cached = get_cached_data(cache_key)
+    if cached is not None:
+        return JsonResponse(cached, status=200)
+
     client = get_object_or_404(User.objects.select_related('profile'), id=user_id)
     # Optimize query with select_related for related objects
     jobs = (
-        Job.objects.select_related("industry", "subcategory")
-        .prefetch_related("applications")
+        Job.objects.select_related("client__profile", "industry", "subcategory")
         .filter(client=client)
         .order_by("-start_date")  # was "-date"
     )
+    client_info = {
+        "client_id": client.id,
+        "client_username": client.username,
+        "client_first_name": client.first_name,
+        "client_last_name": client.last_name,
+        "client_rating": client.profile.rating if hasattr(client, 'profile') else None,
+    }
+
+    if cursor is not None:
+        try:
+            cursor_page = paginate_by_cursor(jobs, cursor, page_size, count=COUNT_EXACT)
+        except InvalidCursor:
+            return JsonResponse({"error": "Invalid cursor"}, status=400)
+        payload = {
+            **client_info,
+            "jobs": serialize_jobs(cursor_page.items, include_extra=True),
+            "pagination": {"items_per_page": page_size, **cursor_page.metadata()},
+        }
+        set_cached_data(cache_key, payload, CLIENT_JOBS_CACHE_TIMEOUT, tags=[tag])
+        return JsonResponse(payload, status=200)
 
     paginator = Paginator(jobs, page_size)
 
@@ -238,14 +282,10 @@ def get_client_jobs_by_id(
     except EmptyPage:
         jobs_page = []
 
-    jobs_data = [serialize_job(job, include_extra=True) for job in jobs_page]
+    jobs_data = serialize_jobs(jobs_page, include_extra=True)
 
-    return JsonResponse({
-        "client_id": client.id,
-        "client_username": client.username,
-        "client_first_name": client.first_name,
-        "client_last_name": client.last_name,
-        "client_rating": client.profile.rating if hasattr(client, 'profile') else None,
+    payload = {
+        **client_info,
         "jobs": jobs_data,
         "pagination": {
             "current_page": page,
@@ -255,14 +295,16 @@ def get_client_jobs_by_id(
             "has_next": jobs_page.has_next() if jobs_page else False,
             "has_previous": jobs_page.has_previous() if jobs_page else False
         }
-    }, status=200)
+    }
+    set_cached_data(cache_key, payload, CLIENT_JOBS_CACHE_TIMEOUT, tags=[tag])
+    return JsonResponse(payload, status=200)
 
 
 
 
 @client_router.get("/jobs/{job_id}/best-applicants/", tags=["Client Endpoints"])
 def get_best_applicants(request, job_id: int):
-    """Fetch and notify the best applicants for a job using Haversine."""
+    """Fetch and notify the best applicants for a job near its location."""
     # Optimize query with select_related for related objects
     job = get_object_or_404(
         Job.objects.select_related(
@@ -274,29 +316,15 @@ def get_best_applicants(request, job_id: int):
     )
     candidates = find_best_applicants(job)
 
-    top_applicants = []
-    for candidate in candidates:
-        # Get user location
-        user_location = UserLocation.objects.filter(user=candidate.user).first()
-        if not user_location or not user_location.last_location:
-            continue
-
-        # Calculate distance
-        distance = haversine(
-            job.latitude,
-            job.longitude,
-            user_location.last_location.y,
-            user_location.last_location.x,
-        )
-
-        top_applicants.append(
-            {
-                "id": candidate.user.id,
-                "name": candidate.user.username,
-                "rating": candidate.avg_rating or 0,
-                "distance_km": round(distance, 2),
-            }
-        )
+    top_applicants = [
+        {
+            "id": candidate.user.id,
+            "name": candidate.user.username,
+            "rating": candidate.avg_rating or 0,
+            "distance_km": round(candidate.distance_km, 2),
+        }
+        for candidate in candidates
+    ]
 
     # Notify candidates via WebSocket
     channel_layer = get_channel_layer()
@@ -416,56 +444,64 @@ def get_industry_or_subcategory(model, value):
 
 
 def find_best_applicants(job, max_distance_km=50):
-    """Find and rank the best applicants for a given job using Haversine"""
+    """
+    Find and rank the best applicants for a given job.
+
+    Candidates come from the spatial index (latest location of each active
+    applicant within ``max_distance_km``); ratings and completed jobs are
+    aggregated for all candidates at once. Returned profiles carry
+    ``avg_rating`` and ``distance_km`` attributes.
+    """
     if not job.latitude or not job.longitude:
         return []
 
-    # Get all potential candidates in the same industry/subcategory
-    candidates = (
-        Profile.objects.filter(
-            industry=job.industry, subcategory=job.subcategory, is_active=True
+    located = nearby(
+        UserLocation.objects.filter(
+            user__is_active=True, user__profile__role="applicant"
+        ).select_related("user__profile"),
+        job.latitude,
+        job.longitude,
+        max_distance_km,
+    )
+    if not located:
+        return []
+
+    user_ids = [location.user_id for location, _ in located]
+    avg_ratings = dict(
+        Review.objects.filter(reviewed_id__in=user_ids)
+        .values("reviewed_id")
+        .annotate(avg=Avg("rating"))
+        .values_list("reviewed_id", "avg")
+    )
+    jobs_completed = dict(
+        Application.objects.filter(
+            applicant_id__in=user_ids, status=Application.Status.ACCEPTED
         )
-        .select_related("user")
-        .prefetch_related("user__ratings_received")
+        .values("applicant_id")
+        .annotate(total=Count("id"))
+        .values_list("applicant_id", "total")
     )
 
     ranked_candidates = []
-    for candidate in candidates:
-        if not candidate.last_location:
-            continue
-
-        # Extract coordinates
-        user_lat = candidate.last_location.y
-        user_lon = candidate.last_location.x
-        job_lat = job.latitude
-        job_lon = job.longitude
-
-        # Calculate distance score
-        distance_score = calculate_distance_score(
-            job_lat, job_lon, user_lat, user_lon, max_distance_km
-        )
+    for location, distance in located:
+        candidate = location.user.profile
+        avg_rating = float(avg_ratings.get(location.user_id) or 0)
+        completed = jobs_completed.get(location.user_id, 0)
 
-        # Calculate other metrics
-        avg_rating = (
-            candidate.user.ratings_received.aggregate(Avg("rating"))["rating__avg"] or 0
-        )
-        jobs_completed = candidate.user.accepted_jobs.count()
+        # Closer distances get higher scores (1 at the job, 0 at max_distance_km)
+        distance_score = max(0.0, 1 - (distance / max_distance_km))
 
         # Calculate composite score
         composite_score = (
             (avg_rating * WEIGHT_RATING)
             + (distance_score * WEIGHT_DISTANCE)
-            + (jobs_completed * WEIGHT_EXPERIENCE)
+            + (completed * WEIGHT_EXPERIENCE)
         )
 
+        candidate.avg_rating = avg_rating
+        candidate.distance_km = distance
         ranked_candidates.append(
-            {
-                "profile": candidate,
-                "composite_score": composite_score,
-                "distance_km": haversine(job_lat, job_lon, user_lat, user_lon),
-                "avg_rating": avg_rating,
-                "jobs_completed": jobs_completed,
-            }
+            {"profile": candidate, "composite_score": composite_score}
         )
 
     # Sort by composite score (descending)
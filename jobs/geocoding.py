@@ -12,6 +12,7 @@ This module provides geocoding functionality with support for:
 import json
 import logging
 import random
+import threading
 import time
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any, Dict, List, Optional, Tuple
@@ -22,6 +23,8 @@ from geopy.exc import (GeocoderServiceError, GeocoderTimedOut,
                        GeocoderUnavailable)
 from geopy.geocoders import Nominatim
 
+from core.redis.cache import redis_client
+
 # Import the Redis cache module
 from .geocoding_cache import (cache_coordinates, get_cache_stats,
                               get_cached_coordinates)
@@ -42,6 +45,166 @@ GEOCODING_PROVIDERS = getattr(settings, "GEOCODING_PROVIDERS", ["google", "nomin
 GEOCODING_RETRY_DELAY = getattr(settings, "GEOCODING_RETRY_DELAY", 1)  # seconds
 GEOCODING_MAX_RETRIES = getattr(settings, "GEOCODING_MAX_RETRIES", 3)
 
+# Per-provider token buckets: (requests per second, burst size)
+GEOCODING_RATE_LIMITS = getattr(settings, "GEOCODING_RATE_LIMITS", {
+    "google": (50, 50),
+    "nominatim": (1, 1),  # Nominatim usage policy: at most 1 request per second
+    "mapbox": (10, 10),
+})
+GEOCODING_RATE_LIMIT_WAIT = getattr(settings, "GEOCODING_RATE_LIMIT_WAIT", 2)  # seconds
+# Circuit breaker: open after this many consecutive failures, for this long
+GEOCODING_BREAKER_THRESHOLD = getattr(settings, "GEOCODING_BREAKER_THRESHOLD", 5)
+GEOCODING_BREAKER_COOLDOWN = getattr(settings, "GEOCODING_BREAKER_COOLDOWN", 60)  # seconds
+
+# Provider errors that say the provider is unhealthy rather than the address bad
+PROVIDER_FAILURE_TYPES = {
+    "timeout",
+    "http_error",
+    "connection_error",
+    "service_unavailable",
+    "service_error",
+    "exception",
+    "api_error_over_query_limit",
+    "api_error_over_daily_limit",
+    "api_error_unknown_error",
+}
+# Errors after which the same address may succeed later
+TRANSIENT_ERROR_TYPES = PROVIDER_FAILURE_TYPES | {"rate_limited", "circuit_open"}
+
+RATE_LIMIT_KEY_PREFIX = "geocoding:bucket:"
+BREAKER_KEY_PREFIX = "geocoding:breaker:"
+
+# Takes a token if one is available; returns the seconds to wait otherwise
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+# In-process state, used when Redis is not available
+_local_lock = threading.Lock()
+_local_buckets = {}  # provider -> [tokens, timestamp]
+_local_failures = {}  # provider -> consecutive failures
+_local_open_until = {}  # provider -> time the breaker closes again
+
+
+def _take_token(provider: str) -> float:
+    """Take a token from the provider's bucket; returns the seconds to wait if empty."""
+    rate, burst = GEOCODING_RATE_LIMITS[provider]
+    now = time.time()
+    if redis_client is not None:
+        try:
+            return float(redis_client.eval(
+                TOKEN_BUCKET_SCRIPT, 1, f"{RATE_LIMIT_KEY_PREFIX}{provider}", rate, burst, now
+            ))
+        except Exception as e:
+            logger.warning(f"Shared rate limiter unavailable for {provider}, limiting locally: {str(e)}")
+
+    with _local_lock:
+        tokens, ts = _local_buckets.get(provider, (burst, now))
+        tokens = min(burst, tokens + max(0.0, now - ts) * rate)
+        if tokens >= 1:
+            _local_buckets[provider] = (tokens - 1, now)
+            return 0.0
+        _local_buckets[provider] = (tokens, now)
+        return (1 - tokens) / rate
+
+
+def acquire_provider_token(provider: str, max_wait: float = None) -> bool:
+    """
+    Wait for the provider's token bucket to allow a request.
+
+    Buckets live in Redis so every worker shares one budget per provider.
+    Providers without a configured limit are never throttled.
+
+    Args:
+        provider: Provider name (google, nominatim, mapbox)
+        max_wait: Longest time to wait in seconds (GEOCODING_RATE_LIMIT_WAIT by default)
+
+    Returns:
+        True if a request may be made now, False if the wait would be too long
+    """
+    if provider not in GEOCODING_RATE_LIMITS:
+        return True
+    max_wait = GEOCODING_RATE_LIMIT_WAIT if max_wait is None else max_wait
+    deadline = time.monotonic() + max_wait
+    while True:
+        wait = _take_token(provider)
+        if wait <= 0:
+            return True
+        if time.monotonic() + wait > deadline:
+            return False
+        time.sleep(wait)
+
+
+def is_circuit_open(provider: str) -> bool:
+    """Return True while the provider is skipped after repeated failures."""
+    if redis_client is not None:
+        try:
+            return bool(redis_client.exists(f"{BREAKER_KEY_PREFIX}{provider}:open"))
+        except Exception as e:
+            logger.warning(f"Circuit breaker state unavailable for {provider}: {str(e)}")
+    return _local_open_until.get(provider, 0) > time.time()
+
+
+def record_provider_result(provider: str, failed: bool) -> None:
+    """
+    Update the provider's circuit breaker after a request.
+
+    GEOCODING_BREAKER_THRESHOLD consecutive failures open the circuit for
+    GEOCODING_BREAKER_COOLDOWN seconds. The first request after the cooldown
+    is a trial: one more failure opens it again, a success closes it.
+    """
+    failures_key = f"{BREAKER_KEY_PREFIX}{provider}:failures"
+    if redis_client is not None:
+        try:
+            if not failed:
+                redis_client.delete(failures_key)
+                return
+            pipe = redis_client.pipeline()
+            pipe.incr(failures_key)
+            pipe.expire(failures_key, GEOCODING_BREAKER_COOLDOWN * 10)
+            failures = pipe.execute()[0]
+            if failures >= GEOCODING_BREAKER_THRESHOLD:
+                redis_client.set(f"{BREAKER_KEY_PREFIX}{provider}:open", 1, ex=GEOCODING_BREAKER_COOLDOWN)
+                redis_client.set(failures_key, GEOCODING_BREAKER_THRESHOLD - 1, ex=GEOCODING_BREAKER_COOLDOWN * 10)
+                logger.warning(f"Opened circuit for geocoding provider {provider} after {failures} failures")
+            return
+        except Exception as e:
+            logger.warning(f"Circuit breaker state unavailable for {provider}: {str(e)}")
+
+    with _local_lock:
+        if not failed:
+            _local_failures.pop(provider, None)
+            return
+        failures = _local_failures.get(provider, 0) + 1
+        _local_failures[provider] = failures
+        if failures >= GEOCODING_BREAKER_THRESHOLD:
+            _local_open_until[provider] = time.time() + GEOCODING_BREAKER_COOLDOWN
+            _local_failures[provider] = GEOCODING_BREAKER_THRESHOLD - 1
+            logger.warning(f"Opened circuit for geocoding provider {provider} after {failures} failures")
+
+
+def is_transient_failure(result: Dict[str, Any]) -> bool:
+    """Return True if a failed geocoding result is worth retrying later."""
+    if result.get("error_type") != "all_providers_failed":
+        return result.get("error_type") in TRANSIENT_ERROR_TYPES
+    details = result.get("error_details") or []
+    return bool(details) and all(e.get("error_type") in TRANSIENT_ERROR_TYPES for e in details)
+
 
 def geocode_address(address: str, provider: str = None) -> Dict[str, Any]:
     """
@@ -152,6 +315,25 @@ def geocode_address(address: str, provider: str = None) -> Dict[str, Any]:
         try:
             logger.info(f"[{request_id}] Trying provider: {provider_name}")
 
+            if is_circuit_open(provider_name):
+                logger.info(f"[{request_id}] Skipping {provider_name}: circuit open")
+                errors.append({
+                    "provider": provider_name,
+                    "error": "Circuit open after repeated failures",
+                    "error_type": "circuit_open",
+                    "time": 0,
+                })
+                continue
+            if not acquire_provider_token(provider_name):
+                logger.info(f"[{request_id}] Skipping {provider_name}: rate limit reached")
+                errors.append({
+                    "provider": provider_name,
+                    "error": "Rate limit reached",
+                    "error_type": "rate_limited",
+                    "time": time.time() - provider_start,
+                })
+                continue
+
             if provider_name == "google":
                 result = _geocode_google(clean_address)
             elif provider_name == "nominatim":
@@ -166,6 +348,10 @@ def geocode_address(address: str, provider: str = None) -> Dict[str, Any]:
 
             provider_elapsed = time.time() - provider_start
             provider_times[provider_name] = provider_elapsed
+            record_provider_result(
+                provider_name,
+                failed=not result or result.get("error_type") in PROVIDER_FAILURE_TYPES,
+            )
 
             if result and result.get("success"):
                 # Add timing information
@@ -220,6 +406,7 @@ def geocode_address(address: str, provider: str = None) -> Dict[str, Any]:
                 )
         except Exception as e:
             provider_elapsed = time.time() - provider_start
+            record_provider_result(provider_name, failed=True)
             logger.error(
                 f"[{request_id}] Unexpected error with {provider_name} geocoding: {str(e)}",
                 exc_info=True,
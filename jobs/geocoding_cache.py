@@ -15,8 +15,9 @@ Features:
 import hashlib
 import json
 import logging
-import random
+import threading
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any, Dict, List, Optional, Tuple
@@ -24,6 +25,9 @@ from typing import Any, Dict, List, Optional, Tuple
 import redis
 from django.conf import settings
 
+from core.redis.cache_tags import DELETE_BATCH_SIZE, delete_pattern
+from core.redis.local_cache import LocalCache
+
 logger = logging.getLogger(__name__)
 
 # Redis connection settings
@@ -37,6 +41,9 @@ GEOCODE_CACHE_TIMEOUT = getattr(
     settings, "GEOCODE_CACHE_TIMEOUT", 60 * 60 * 24 * 30
 )  # 30 days by default
 GEOCODE_CACHE_PREFIX = "geocode:"
+# Sorted set of cached keys scored by last access, kept outside the prefix
+GEOCODE_CACHE_INDEX_KEY = "geocode_index"
+GEOCODE_CACHE_SAMPLE_SIZE = 100  # Entries sampled for memory and age estimates
 GEOCODE_CACHE_MAX_ENTRIES = getattr(
     settings, "GEOCODE_CACHE_MAX_ENTRIES", 100000
 )  # Maximum number of cache entries
@@ -49,11 +56,24 @@ GEOCODE_CACHE_EVICTION_POLICY = getattr(
 GEOCODE_CACHE_STATS_INTERVAL = getattr(
     settings, "GEOCODE_CACHE_STATS_INTERVAL", 100
 )  # Log stats every N operations
+# Hit counts per cache key, kept beside the entries so a hit never rewrites one
+GEOCODE_CACHE_HITS_KEY = "geocode_hits"
+GEOCODE_HIT_FLUSH_INTERVAL = getattr(
+    settings, "GEOCODE_HIT_FLUSH_INTERVAL", 10
+)  # Seconds between writes of buffered hit counts
+# Per-process copy of the hottest entries; geocodes practically never change
+GEOCODE_L1_MAX_ENTRIES = getattr(settings, "GEOCODE_L1_MAX_ENTRIES", 2000)
+GEOCODE_L1_TIMEOUT = getattr(settings, "GEOCODE_L1_TIMEOUT", 300)  # 5 minutes
 
 # Monitoring settings
 _cache_operations_counter = 0  # Counter for cache operations
 _last_eviction_check = 0  # Timestamp of last eviction check
 
+_l1 = LocalCache(max_entries=GEOCODE_L1_MAX_ENTRIES, default_timeout=GEOCODE_L1_TIMEOUT)
+_pending_hits = Counter()  # Hits not yet written to Redis, by cache key
+_hits_lock = threading.Lock()
+_last_hits_flush = time.monotonic()
+
 # Initialize Redis connection
 try:
     redis_client = redis.Redis(
@@ -86,6 +106,11 @@ except Exception as e:
     redis_client = None
 
 
+def normalize_address(address: str) -> str:
+    """Canonical form of an address: lower case with runs of whitespace collapsed."""
+    return " ".join(address.lower().split())
+
+
 def get_cache_key(address: str) -> str:
     """
     Generate a cache key for an address.
@@ -97,13 +122,78 @@ def get_cache_key(address: str) -> str:
         A cache key string
     """
     # Normalize the address to ensure consistent cache keys
-    normalized_address = address.lower().strip()
+    normalized_address = normalize_address(address)
 
     # Use MD5 hash to create a fixed-length key that works well with Redis
     address_hash = hashlib.md5(normalized_address.encode()).hexdigest()
     return f"{GEOCODE_CACHE_PREFIX}{address_hash}"
 
 
+def _prune_index() -> None:
+    """
+    Drop index entries whose cache keys have expired.
+
+    Writes and flushed hits (see ``flush_hit_counts``) refresh both the key
+    TTL and its index score, so any entry scored more than
+    GEOCODE_CACHE_TIMEOUT ago has already expired.
+    """
+    expired = redis_client.zrangebyscore(
+        GEOCODE_CACHE_INDEX_KEY, "-inf", time.time() - GEOCODE_CACHE_TIMEOUT
+    )
+    for i in range(0, len(expired), DELETE_BATCH_SIZE):
+        batch = expired[i:i + DELETE_BATCH_SIZE]
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zrem(GEOCODE_CACHE_INDEX_KEY, *batch)
+        pipe.hdel(GEOCODE_CACHE_HITS_KEY, *batch)
+        pipe.execute()
+
+
+def _touch_index(pipe, cache_key: str) -> None:
+    pipe.zadd(GEOCODE_CACHE_INDEX_KEY, {cache_key: time.time()})
+
+
+def _sample_keys(count: int) -> List[str]:
+    return redis_client.zrandmember(GEOCODE_CACHE_INDEX_KEY, count) or []
+
+
+def _estimate_memory_bytes(total_entries: int) -> int:
+    """Estimate memory used by the cache from a sample of its entries."""
+    sample = _sample_keys(min(GEOCODE_CACHE_SAMPLE_SIZE, total_entries))
+    if not sample:
+        return 0
+    pipe = redis_client.pipeline(transaction=False)
+    for key in sample:
+        pipe.memory_usage(key)
+    sizes = [size or 0 for size in pipe.execute()]
+    return int(sum(sizes) / len(sizes) * total_entries)
+
+
+def _evict(count: int) -> int:
+    """
+    Evict ``count`` entries according to GEOCODE_CACHE_EVICTION_POLICY.
+
+    The index is ordered by last access, which is also the order of the
+    remaining TTLs, so the LRU and TTL policies both take the lowest scores.
+    """
+    if count <= 0:
+        return 0
+    if GEOCODE_CACHE_EVICTION_POLICY == "random":
+        keys_to_remove = _sample_keys(count)
+    else:
+        keys_to_remove = redis_client.zrange(GEOCODE_CACHE_INDEX_KEY, 0, count - 1)
+
+    removed = 0
+    for i in range(0, len(keys_to_remove), DELETE_BATCH_SIZE):
+        batch = keys_to_remove[i:i + DELETE_BATCH_SIZE]
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.delete(*batch)
+        pipe.zrem(GEOCODE_CACHE_INDEX_KEY, *batch)
+        pipe.hdel(GEOCODE_CACHE_HITS_KEY, *batch)
+        removed += pipe.execute()[0]
+    _l1.delete(*keys_to_remove)
+    return removed
+
+
 def check_cache_limits() -> None:
     """
     Check if the cache has exceeded its limits and apply eviction policy if needed.
@@ -112,6 +202,10 @@ def check_cache_limits() -> None:
     - LRU: Evict least recently used entries
     - Random: Evict random entries
     - TTL: Evict entries with the shortest TTL
+
+    Entries are counted and ordered through the GEOCODE_CACHE_INDEX_KEY sorted
+    set, so a check costs O(log N) plus the entries evicted instead of a scan
+    of the whole keyspace.
     """
     global _last_eviction_check
 
@@ -126,10 +220,8 @@ def check_cache_limits() -> None:
         return
 
     try:
-        # Get all cache keys
-        pattern = f"{GEOCODE_CACHE_PREFIX}*"
-        keys = redis_client.keys(pattern)
-        total_entries = len(keys)
+        _prune_index()
+        total_entries = redis_client.zcard(GEOCODE_CACHE_INDEX_KEY)
 
         # Check entry count limit
         if total_entries > GEOCODE_CACHE_MAX_ENTRIES:
@@ -137,55 +229,12 @@ def check_cache_limits() -> None:
             logger.warning(
                 f"Cache entry limit exceeded ({total_entries}/{GEOCODE_CACHE_MAX_ENTRIES}). Removing {entries_to_remove} entries."
             )
-
-            if GEOCODE_CACHE_EVICTION_POLICY == "random":
-                # Random eviction
-                keys_to_remove = random.sample(keys, min(entries_to_remove, len(keys)))
-                if keys_to_remove:
-                    redis_client.delete(*keys_to_remove)
-                    logger.info(f"Randomly evicted {len(keys_to_remove)} cache entries")
-
-            elif GEOCODE_CACHE_EVICTION_POLICY == "ttl":
-                # TTL-based eviction (remove entries with shortest TTL)
-                keys_with_ttl = [(key, redis_client.ttl(key)) for key in keys]
-                keys_with_ttl.sort(key=lambda x: x[1])  # Sort by TTL (ascending)
-                keys_to_remove = [k[0] for k in keys_with_ttl[:entries_to_remove]]
-                if keys_to_remove:
-                    redis_client.delete(*keys_to_remove)
-                    logger.info(
-                        f"Evicted {len(keys_to_remove)} cache entries with shortest TTL"
-                    )
-
-            else:  # Default to LRU
-                # LRU eviction (implemented by checking access time)
-                # This is a simplified LRU implementation
-                keys_with_data = []
-                for key in keys:
-                    data = redis_client.get(key)
-                    if data:
-                        try:
-                            result = json.loads(data)
-                            accessed_at = result.get(
-                                "last_accessed", result.get("cached_at", "")
-                            )
-                            keys_with_data.append((key, accessed_at))
-                        except:
-                            keys_with_data.append((key, ""))
-
-                # Sort by access time (oldest first)
-                keys_with_data.sort(key=lambda x: x[1])
-                keys_to_remove = [k[0] for k in keys_with_data[:entries_to_remove]]
-                if keys_to_remove:
-                    redis_client.delete(*keys_to_remove)
-                    logger.info(
-                        f"Evicted {len(keys_to_remove)} least recently used cache entries"
-                    )
+            removed = _evict(entries_to_remove)
+            logger.info(f"Evicted {removed} cache entries ({GEOCODE_CACHE_EVICTION_POLICY})")
+            total_entries -= removed
 
         # Check memory usage limit
-        memory_used_bytes = sum(
-            redis_client.memory_usage(key) or 0 for key in redis_client.keys(pattern)
-        )
-        memory_used_mb = memory_used_bytes / (1024 * 1024)
+        memory_used_mb = _estimate_memory_bytes(total_entries) / (1024 * 1024)
 
         if memory_used_mb > GEOCODE_CACHE_MAX_MEMORY_MB:
             # Calculate how many entries to remove to get below 80% of the limit
@@ -196,38 +245,8 @@ def check_cache_limits() -> None:
             logger.warning(
                 f"Cache memory limit exceeded ({memory_used_mb:.2f}MB/{GEOCODE_CACHE_MAX_MEMORY_MB}MB). Removing {entries_to_remove} entries."
             )
-
-            # Use the same eviction policy as above
-            if GEOCODE_CACHE_EVICTION_POLICY == "random":
-                keys_to_remove = random.sample(keys, min(entries_to_remove, len(keys)))
-            elif GEOCODE_CACHE_EVICTION_POLICY == "ttl":
-                keys_with_ttl = [(key, redis_client.ttl(key)) for key in keys]
-                keys_with_ttl.sort(key=lambda x: x[1])
-                keys_to_remove = [k[0] for k in keys_with_ttl[:entries_to_remove]]
-            else:  # LRU
-                keys_with_data = []
-                for key in random.sample(
-                    keys, min(100, len(keys))
-                ):  # Sample to avoid checking all keys
-                    data = redis_client.get(key)
-                    if data:
-                        try:
-                            result = json.loads(data)
-                            accessed_at = result.get(
-                                "last_accessed", result.get("cached_at", "")
-                            )
-                            keys_with_data.append((key, accessed_at))
-                        except:
-                            keys_with_data.append((key, ""))
-
-                keys_with_data.sort(key=lambda x: x[1])
-                keys_to_remove = [k[0] for k in keys_with_data[:entries_to_remove]]
-
-            if keys_to_remove:
-                redis_client.delete(*keys_to_remove)
-                logger.info(
-                    f"Evicted {len(keys_to_remove)} cache entries to reduce memory usage"
-                )
+            removed = _evict(entries_to_remove)
+            logger.info(f"Evicted {removed} cache entries to reduce memory usage")
 
     except Exception as e:
         logger.error(f"Error checking cache limits: {str(e)}")
@@ -250,9 +269,67 @@ def log_cache_stats() -> None:
         )
 
 
+def flush_hit_counts(force: bool = False) -> int:
+    """
+    Write buffered hit counts to Redis in one pipelined round trip.
+
+    Each key that was hit gets its counter in GEOCODE_CACHE_HITS_KEY
+    incremented, its index score (last access) refreshed and its TTL
+    extended. Runs at most every GEOCODE_HIT_FLUSH_INTERVAL seconds unless
+    ``force`` is set.
+
+    Returns:
+        The number of keys flushed
+    """
+    global _last_hits_flush
+
+    if not redis_client:
+        return 0
+    with _hits_lock:
+        if not _pending_hits or (
+            not force and time.monotonic() - _last_hits_flush < GEOCODE_HIT_FLUSH_INTERVAL
+        ):
+            return 0
+        hits = dict(_pending_hits)
+        _pending_hits.clear()
+        _last_hits_flush = time.monotonic()
+
+    try:
+        now = time.time()
+        pipe = redis_client.pipeline(transaction=False)
+        for cache_key, count in hits.items():
+            pipe.hincrby(GEOCODE_CACHE_HITS_KEY, cache_key, count)
+            pipe.expire(cache_key, GEOCODE_CACHE_TIMEOUT)
+        pipe.zadd(GEOCODE_CACHE_INDEX_KEY, {cache_key: now for cache_key in hits}, xx=True)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Error flushing geocoding cache hit counts: {str(e)}")
+    return len(hits)
+
+
+def _record_hit(cache_key: str) -> None:
+    with _hits_lock:
+        _pending_hits[cache_key] += 1
+    flush_hit_counts()
+
+
+def _decode_entry(cached_data: str) -> Dict[str, Any]:
+    result = json.loads(cached_data)
+
+    # Convert string coordinates back to Decimal for consistency
+    if result.get("success") and "latitude" in result and "longitude" in result:
+        result["latitude"] = Decimal(result["latitude"])
+        result["longitude"] = Decimal(result["longitude"])
+    return result
+
+
 def get_cached_coordinates(address: str) -> Optional[Dict[str, Any]]:
     """
-    Get cached coordinates for an address from Redis with enhanced monitoring.
+    Get cached coordinates for an address.
+
+    A hit is served from the per-process L1 copy when there is one, or with a
+    single GET otherwise. Entries are never rewritten on a hit: hits are
+    counted in memory and written in batches by ``flush_hit_counts``.
 
     Args:
         address: The address to get coordinates for
@@ -266,55 +343,16 @@ def get_cached_coordinates(address: str) -> Optional[Dict[str, Any]]:
     cache_key = get_cache_key(address)
 
     try:
-        # Check cache limits periodically
-        check_cache_limits()
-
-        # Get data from cache
-        cached_data = redis_client.get(cache_key)
+        cached_data = _l1.get(cache_key)
+        if cached_data is None:
+            cached_data = redis_client.get(cache_key)
+            if cached_data:
+                _l1.set(cache_key, cached_data)
 
         if cached_data:
-            # Parse the cached data
-            result = json.loads(cached_data)
-
-            # Convert string coordinates back to Decimal for consistency
-            if result.get("success") and "latitude" in result and "longitude" in result:
-                result["latitude"] = Decimal(result["latitude"])
-                result["longitude"] = Decimal(result["longitude"])
-
-            # Update last accessed time and increment hit counter
-            if "hit_count" in result:
-                result["hit_count"] += 1
-            else:
-                result["hit_count"] = 1
-
-            result["last_accessed"] = datetime.now().isoformat()
-
-            # Update the cache with the new access time and hit count
-            try:
-                # Convert Decimal objects to strings for JSON serialization
-                serializable_result = {}
-                for key, value in result.items():
-                    if isinstance(value, Decimal):
-                        serializable_result[key] = str(value)
-                    else:
-                        serializable_result[key] = value
-
-                # Update the cache entry with the new data
-                redis_client.setex(
-                    cache_key, GEOCODE_CACHE_TIMEOUT, json.dumps(serializable_result)
-                )
-            except Exception as update_error:
-                logger.warning(f"Error updating cache access time: {str(update_error)}")
-
-            # Log the cache hit
-            logger.info(
-                f"Cache hit for address: {address} (hit #{result.get('hit_count', 1)})"
-            )
-
-            # Log cache stats periodically
-            log_cache_stats()
-
-            return result
+            _record_hit(cache_key)
+            logger.debug(f"Cache hit for address: {address}")
+            return _decode_entry(cached_data)
 
         logger.info(f"Cache miss for address: {address}")
 
@@ -345,10 +383,8 @@ def cache_coordinates(address: str, geocoding_result: Dict[str, Any]) -> None:
 
     cache_key = get_cache_key(address)
 
-    # Add metadata to track cache usage
+    # Add metadata to track cache usage; hits are counted in GEOCODE_CACHE_HITS_KEY
     geocoding_result["cached_at"] = datetime.now().isoformat()
-    geocoding_result["last_accessed"] = datetime.now().isoformat()
-    geocoding_result["hit_count"] = 0
 
     try:
         # Check cache limits periodically
@@ -362,10 +398,14 @@ def cache_coordinates(address: str, geocoding_result: Dict[str, Any]) -> None:
             else:
                 serializable_result[key] = value
 
-        # Store in Redis with expiration
-        redis_client.setex(
-            cache_key, GEOCODE_CACHE_TIMEOUT, json.dumps(serializable_result)
-        )
+        # Store in Redis with expiration and record it in the index
+        cached_data = json.dumps(serializable_result)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.setex(cache_key, GEOCODE_CACHE_TIMEOUT, cached_data)
+        pipe.hdel(GEOCODE_CACHE_HITS_KEY, cache_key)
+        _touch_index(pipe, cache_key)
+        pipe.execute()
+        _l1.set(cache_key, cached_data)
 
         logger.info(f"Cached coordinates for address: {address}")
 
@@ -386,13 +426,15 @@ def clear_geocoding_cache() -> None:
         return
 
     try:
-        # Find all keys with the geocoding prefix
-        pattern = f"{GEOCODE_CACHE_PREFIX}*"
-        keys = redis_client.keys(pattern)
-
-        if keys:
-            redis_client.delete(*keys)
-            logger.info(f"Cleared {len(keys)} geocoding cache entries from Redis")
+        # SCAN rather than the index so entries cached before it existed go too
+        deleted = delete_pattern(f"{GEOCODE_CACHE_PREFIX}*", client=redis_client)
+        redis_client.delete(GEOCODE_CACHE_INDEX_KEY, GEOCODE_CACHE_HITS_KEY)
+        _l1.clear()
+        with _hits_lock:
+            _pending_hits.clear()
+
+        if deleted:
+            logger.info(f"Cleared {deleted} geocoding cache entries from Redis")
         else:
             logger.info("No geocoding cache entries to clear")
 
@@ -416,11 +458,11 @@ def get_cache_stats() -> Dict[str, Any]:
         return {"error": "Redis client not available"}
 
     try:
-        pattern = f"{GEOCODE_CACHE_PREFIX}*"
-        keys = redis_client.keys(pattern)
+        _prune_index()
+        total_entries = redis_client.zcard(GEOCODE_CACHE_INDEX_KEY)
 
-        # Calculate memory usage
-        memory_used_bytes = sum(redis_client.memory_usage(key) or 0 for key in keys)
+        # Estimate memory usage from a sample of entries
+        memory_used_bytes = _estimate_memory_bytes(total_entries)
         memory_used_mb = memory_used_bytes / (1024 * 1024)
 
         # Get server info
@@ -431,10 +473,13 @@ def get_cache_stats() -> Dict[str, Any]:
         hit_count_total = 0
         hit_count_keys = 0
 
-        sample_size = min(100, len(keys))
+        sampled_keys = _sample_keys(min(GEOCODE_CACHE_SAMPLE_SIZE, total_entries))
+        sample_size = len(sampled_keys)
         if sample_size > 0:
-            sampled_keys = random.sample(keys, sample_size)
             now = datetime.now()
+            hit_counts = dict(zip(
+                sampled_keys, redis_client.hmget(GEOCODE_CACHE_HITS_KEY, sampled_keys)
+            ))
 
             for key in sampled_keys:
                 data = redis_client.get(key)
@@ -458,15 +503,15 @@ def get_cache_stats() -> Dict[str, Any]:
                                 age_distribution[">30d"] += 1
 
                         # Track hit counts
-                        hit_count = result.get("hit_count", 0)
+                        hit_count = int(hit_counts.get(key) or result.get("hit_count", 0))
                         hit_count_total += hit_count
                         hit_count_keys += 1
                     except:
                         pass
 
             # Scale up the distribution to represent the full cache
-            if sample_size < len(keys):
-                scale_factor = len(keys) / sample_size
+            if sample_size < total_entries:
+                scale_factor = total_entries / sample_size
                 for key in age_distribution:
                     age_distribution[key] = int(age_distribution[key] * scale_factor)
 
@@ -474,7 +519,7 @@ def get_cache_stats() -> Dict[str, Any]:
         avg_hit_count = hit_count_total / hit_count_keys if hit_count_keys > 0 else 0
 
         return {
-            "total_entries": len(keys),
+            "total_entries": total_entries,
             "memory_used_bytes": memory_used_bytes,
             "memory_used_mb": round(memory_used_mb, 2),
             "memory_limit_mb": GEOCODE_CACHE_MAX_MEMORY_MB,
@@ -485,7 +530,7 @@ def get_cache_stats() -> Dict[str, Any]:
             else 0,
             "entries_limit": GEOCODE_CACHE_MAX_ENTRIES,
             "entries_usage_percent": round(
-                (len(keys) / GEOCODE_CACHE_MAX_ENTRIES) * 100, 2
+                (total_entries / GEOCODE_CACHE_MAX_ENTRIES) * 100, 2
             )
             if GEOCODE_CACHE_MAX_ENTRIES > 0
             else 0,
@@ -501,7 +546,59 @@ def get_cache_stats() -> Dict[str, Any]:
             "age_distribution": age_distribution,
             "average_hit_count": round(avg_hit_count, 2),
             "cache_operations": _cache_operations_counter,
+            "local_cache": _l1.stats(),
         }
     except Exception as e:
         logger.error(f"Error getting cache stats: {str(e)}")
         return {"error": str(e)}
+
+
+# Reverse geocoding shares the cache, keyed by coordinates rounded to
+# REVERSE_GEOCODE_CACHE_PRECISION decimals (4 decimals is a cell of about
+# 11m), so points that are close together resolve to the same entry.
+REVERSE_GEOCODE_CACHE_PRECISION = getattr(settings, "REVERSE_GEOCODE_CACHE_PRECISION", 4)
+
+
+def get_reverse_cache_address(latitude: float, longitude: float) -> str:
+    """
+    Build the pseudo-address a coordinate pair is cached under.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+
+    Returns:
+        A string such as "reverse:6.5244,3.3792"
+    """
+    precision = REVERSE_GEOCODE_CACHE_PRECISION
+    return f"reverse:{float(latitude):.{precision}f},{float(longitude):.{precision}f}"
+
+
+def get_cached_address(latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+    """
+    Get a cached reverse geocoding result for a coordinate pair.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+
+    Returns:
+        A dictionary with "success" and "address", or None if not in cache.
+        Failed lookups are cached too, with success False.
+    """
+    return get_cached_coordinates(get_reverse_cache_address(latitude, longitude))
+
+
+def cache_address(latitude: float, longitude: float, address: Optional[str]) -> None:
+    """
+    Cache the reverse geocoding result for a coordinate pair.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        address: The resolved address, or None if the provider found nothing
+    """
+    cache_coordinates(
+        get_reverse_cache_address(latitude, longitude),
+        {"success": bool(address), "address": address},
+    )
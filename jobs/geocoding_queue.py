@@ -0,0 +1,219 @@
+"""
+Background pipeline that geocodes new and moved jobs.
+
+``Job.save`` used to hand geocoding to django-q, which is not installed, so
+jobs were only geocoded by the synchronous fallback in the request. Now:
+
+1. ``enqueue_job_geocoding`` adds the job id to a Redis set, so repeated
+   saves of the same job collapse into one entry, and schedules a single
+   drain task per coalescing window on the existing Celery workers.
+2. ``drain_job_geocoding_queue`` (see ``jobs.tasks``) pops a batch of ids and
+   calls ``geocode_queued_jobs``.
+3. ``geocode_queued_jobs`` groups the batch by normalized address, geocodes
+   each distinct address once (``jobs.geocoding`` applies the per-provider
+   rate limits and circuit breakers) and writes the coordinates back with a
+   single ``bulk_update``. An address another worker is already geocoding is
+   left to that worker; its jobs are requeued and hit the cache next time.
+
+Usage:
+    from jobs.geocoding_queue import enqueue_job_geocoding
+    enqueue_job_geocoding(job.id)
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, List
+
+from django.conf import settings
+from django.db import transaction
+
+from core.redis.cache import redis_client
+from core.spatial_index import geohash_or_blank
+from jobs.geocoding import geocode_address, is_transient_failure
+from jobs.geocoding_cache import get_cache_key, normalize_address
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "job_geocoding:pending"
+SCHEDULED_KEY = "job_geocoding:scheduled"
+ATTEMPTS_KEY = "job_geocoding:attempts"
+INFLIGHT_PREFIX = "job_geocoding:inflight:"
+
+# Saves within this many seconds of each other are geocoded by the same task
+COALESCE_WINDOW = getattr(settings, "GEOCODING_QUEUE_COALESCE_WINDOW", 2)
+# Jobs handled per drain task
+JOB_BATCH_SIZE = getattr(settings, "GEOCODING_QUEUE_BATCH_SIZE", 50)
+# Transient failures (rate limits, open circuits, timeouts) are retried this often
+MAX_ATTEMPTS = getattr(settings, "GEOCODING_QUEUE_MAX_ATTEMPTS", 5)
+RETRY_DELAY = getattr(settings, "GEOCODING_QUEUE_RETRY_DELAY", 30)  # seconds
+# Longest time one worker may hold an address before others may take it
+INFLIGHT_TIMEOUT = 60
+
+
+def enqueue_job_geocoding(job_id: int) -> None:
+    """
+    Queue a job for geocoding once the current transaction commits.
+
+    Without Redis each job gets its own task instead of being coalesced.
+    """
+    from jobs.tasks import geocode_jobs
+
+    if redis_client is None:
+        transaction.on_commit(lambda: _dispatch(geocode_jobs, [job_id]))
+        return
+
+    try:
+        redis_client.sadd(PENDING_KEY, job_id)
+        schedule_drain()
+    except Exception as e:
+        logger.warning(f"Job geocoding queue unavailable, queuing job {job_id} directly: {e}")
+        transaction.on_commit(lambda: _dispatch(geocode_jobs, [job_id]))
+
+
+def requeue_jobs(job_ids: List[int], countdown: int = RETRY_DELAY) -> List[int]:
+    """
+    Put job ids back on the queue for another attempt.
+
+    Jobs that already used up MAX_ATTEMPTS are dropped. Returns the ids that
+    were requeued.
+    """
+    if redis_client is None or not job_ids:
+        return []
+
+    pipe = redis_client.pipeline()
+    for job_id in job_ids:
+        pipe.hincrby(ATTEMPTS_KEY, job_id, 1)
+    attempts = pipe.execute()
+
+    requeued = [job_id for job_id, count in zip(job_ids, attempts) if count < MAX_ATTEMPTS]
+    dropped = [job_id for job_id in job_ids if job_id not in requeued]
+    if dropped:
+        redis_client.hdel(ATTEMPTS_KEY, *dropped)
+        logger.warning(f"Giving up geocoding jobs {dropped} after {MAX_ATTEMPTS} attempts")
+    if requeued:
+        redis_client.sadd(PENDING_KEY, *requeued)
+        schedule_drain(countdown=countdown)
+    return requeued
+
+
+def schedule_drain(countdown: int = COALESCE_WINDOW) -> None:
+    """
+    Once the current transaction commits, schedule a drain task unless one
+    is already waiting to run.
+
+    The marker is only set on commit, so a rolled back save cannot hold it.
+    """
+    from jobs.tasks import drain_job_geocoding_queue
+
+    def schedule():
+        # The marker expires on its own in case the scheduled task is lost
+        if redis_client.set(SCHEDULED_KEY, 1, nx=True, ex=max(countdown, COALESCE_WINDOW) * 4):
+            _dispatch(drain_job_geocoding_queue, countdown=countdown)
+
+    transaction.on_commit(schedule)
+
+
+def _dispatch(task, *args, countdown=None):
+    try:
+        task.apply_async(args=args, countdown=countdown)
+    except Exception as e:
+        logger.warning(f"Failed to queue {task.name}: {e}")
+
+
+def pop_pending_jobs(batch_size: int = JOB_BATCH_SIZE) -> List[int]:
+    """
+    Take up to ``batch_size`` job ids off the queue.
+
+    The scheduled marker is cleared first, so a job enqueued while this batch
+    is being geocoded schedules a fresh drain instead of being stranded.
+    """
+    if redis_client is None:
+        return []
+    redis_client.delete(SCHEDULED_KEY)
+    return [int(job_id) for job_id in redis_client.spop(PENDING_KEY, batch_size) or []]
+
+
+def pending_count() -> int:
+    """Number of jobs waiting to be geocoded."""
+    if redis_client is None:
+        return 0
+    return redis_client.scard(PENDING_KEY)
+
+
+def _claim_address(address: str) -> bool:
+    """Mark an address as being geocoded by this worker; False if another worker has it."""
+    if redis_client is None:
+        return True
+    key = f"{INFLIGHT_PREFIX}{get_cache_key(address)}"
+    return bool(redis_client.set(key, 1, nx=True, ex=INFLIGHT_TIMEOUT))
+
+
+def _release_address(address: str) -> None:
+    if redis_client is not None:
+        redis_client.delete(f"{INFLIGHT_PREFIX}{get_cache_key(address)}")
+
+
+def geocode_queued_jobs(job_ids: List[int]) -> Dict[str, int]:
+    """
+    Geocode ``job_ids``, one provider lookup per distinct address.
+
+    Returns counts of jobs "geocoded", "failed" (permanently, e.g. no
+    results) and "requeued" (transient failures or addresses another worker
+    is geocoding).
+    """
+    from jobs.matching_queue import enqueue_job_matching
+    from jobs.models import _invalidate_job_caches
+
+    counts = {"geocoded": 0, "failed": 0, "requeued": 0}
+    # Job's default ordering sorts by date; id order keeps batches deterministic
+    jobs = Job.objects.filter(id__in=job_ids).exclude(location="").order_by("pk").only(
+        "id", "client", "location", "latitude", "longitude", "geohash"
+    )
+
+    by_address = defaultdict(list)
+    for job in jobs:
+        if job.location and len(job.location.strip()) >= 3:
+            by_address[normalize_address(job.location)].append(job)
+
+    updated, retry = [], []
+    for address, address_jobs in by_address.items():
+        if not _claim_address(address):
+            retry.extend(job.id for job in address_jobs)
+            continue
+        try:
+            result = geocode_address(address)
+        except Exception as e:
+            logger.error(f"Error geocoding '{address}': {str(e)}")
+            result = {"success": False, "error": str(e), "error_type": "exception"}
+        finally:
+            _release_address(address)
+
+        if result.get("success"):
+            for job in address_jobs:
+                job.latitude = result["latitude"]
+                job.longitude = result["longitude"]
+                job.geohash = geohash_or_blank(job.latitude, job.longitude)
+            updated.extend(address_jobs)
+        elif is_transient_failure(result):
+            retry.extend(job.id for job in address_jobs)
+        else:
+            counts["failed"] += len(address_jobs)
+            logger.warning(f"Geocoding failed for jobs {[job.id for job in address_jobs]}: {result.get('error')}")
+
+    if updated:
+        Job.objects.bulk_update(updated, ["latitude", "longitude", "geohash"])
+        counts["geocoded"] = len(updated)
+        if redis_client is not None:
+            redis_client.hdel(ATTEMPTS_KEY, *(job.id for job in updated))
+        # bulk_update skips post_save, so refresh what the signals would have
+        for job in updated:
+            _invalidate_job_caches(job.id, {job.client_id} - {None})
+            enqueue_job_matching(job.id)
+
+    counts["requeued"] = len(requeue_jobs(retry))
+    logger.info(
+        f"Geocoded {counts['geocoded']} jobs from {len(by_address)} addresses "
+        f"({counts['failed']} failed, {counts['requeued']} requeued)"
+    )
+    return counts
@@ -15,13 +15,14 @@ Usage:
 import logging
 import math
 import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count, Max, Q
 from django.utils import timezone
 
 from accounts.models import Profile, UserActivityLog
@@ -50,6 +51,13 @@ SESSION_DURATION_FACTOR = 0.1  # Points per minute of session time
 # Cache timeout for activity scores (1 hour)
 ACTIVITY_SCORE_CACHE_TIMEOUT = 60 * 60
 
+ACTIVITY_POINTS = {
+    "login": LOGIN_POINTS,
+    "job_view": JOB_VIEW_POINTS,
+    "job_application": APPLICATION_POINTS,
+    "profile_update": PROFILE_UPDATE_POINTS,
+}
+
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -191,38 +199,18 @@ def get_user_activity_score(user) -> float:
         )
 
         # Count different types of activities
-        login_count = activity_logs.filter(activity_type="login").count()
-        job_view_count = activity_logs.filter(activity_type="job_view").count()
-        application_count = activity_logs.filter(
-            activity_type="job_application"
-        ).count()
-        profile_update_count = activity_logs.filter(
-            activity_type="profile_update"
-        ).count()
-
-        # Calculate raw score
-        raw_score = (
-            login_count * LOGIN_POINTS
-            + job_view_count * JOB_VIEW_POINTS
-            + application_count * APPLICATION_POINTS
-            + profile_update_count * PROFILE_UPDATE_POINTS
-        )
+        counts = {
+            activity_type: activity_logs.filter(activity_type=activity_type).count()
+            for activity_type in ACTIVITY_POINTS
+        }
 
-        # Get last login time and calculate recency factor
+        # Get last login time for the recency factor
         last_login = (
             activity_logs.filter(activity_type="login").order_by("-created_at").first()
         )
-        recency_factor = 1.0
-        if last_login:
-            days_since_login = (timezone.now() - last_login.created_at).days
-            recency_factor = max(1.0 - (days_since_login / ACTIVITY_RECENCY_DAYS), 0.1)
-
-        # Apply recency factor
-        raw_score *= recency_factor
-
-        # Normalize score (max expected raw score is around 500)
-        max_expected_score = 500
-        score = min(raw_score / max_expected_score, 1.0)
+        score = activity_score_from_counts(
+            counts, last_login.created_at if last_login else None
+        )
 
         # Cache the score
         cache.set(cache_key, score, ACTIVITY_SCORE_CACHE_TIMEOUT)
@@ -232,6 +220,32 @@ def get_user_activity_score(user) -> float:
     return score
 
 
+def activity_score_from_counts(counts: Dict[str, int], last_login_at=None) -> float:
+    """
+    Normalized activity score (0-1) from per-type activity counts.
+
+    Args:
+        counts: Mapping of activity type to number of occurrences in the window
+        last_login_at: Time of the most recent login in the window, if any
+
+    Returns:
+        Normalized activity score between 0 and 1
+    """
+    raw_score = sum(
+        counts.get(activity_type, 0) * points
+        for activity_type, points in ACTIVITY_POINTS.items()
+    )
+
+    # Apply recency factor
+    if last_login_at:
+        days_since_login = (timezone.now() - last_login_at).days
+        raw_score *= max(1.0 - (days_since_login / ACTIVITY_RECENCY_DAYS), 0.1)
+
+    # Normalize score (max expected raw score is around 500)
+    max_expected_score = 500
+    return min(raw_score / max_expected_score, 1.0)
+
+
 def calculate_rating_score(user) -> float:
     """
     Calculate user rating score based on reviews.
@@ -347,6 +361,166 @@ def match_job_to_users(job, users) -> List[Dict[str, Any]]:
     return sorted(matches, key=lambda x: x["score"], reverse=True)
 
 
+def _batch_activity_scores(user_ids: List[int]) -> Dict[int, float]:
+    """Activity scores for many users, reusing and filling the per-user cache."""
+    keys = {f"activity_score:{user_id}": user_id for user_id in user_ids}
+    scores = {}
+    try:
+        scores = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+    except Exception as e:
+        logger.error(f"Error reading cached activity scores: {str(e)}")
+
+    missing = [user_id for user_id in user_ids if user_id not in scores]
+    if not missing:
+        return scores
+
+    recent_date = timezone.now() - timezone.timedelta(days=ACTIVITY_RECENCY_DAYS)
+    counts = defaultdict(dict)
+    last_login = {}
+    rows = (
+        UserActivityLog.objects.filter(
+            user_id__in=missing,
+            created_at__gte=recent_date,
+            activity_type__in=list(ACTIVITY_POINTS),
+        )
+        .values("user_id", "activity_type")
+        .annotate(total=Count("id"), latest=Max("created_at"))
+        .order_by()
+    )
+    for row in rows:
+        counts[row["user_id"]][row["activity_type"]] = row["total"]
+        if row["activity_type"] == "login":
+            last_login[row["user_id"]] = row["latest"]
+
+    computed = {
+        user_id: activity_score_from_counts(counts.get(user_id, {}), last_login.get(user_id))
+        for user_id in missing
+    }
+    try:
+        cache.set_many(
+            {f"activity_score:{user_id}": score for user_id, score in computed.items()},
+            ACTIVITY_SCORE_CACHE_TIMEOUT,
+        )
+    except Exception as e:
+        logger.error(f"Error caching activity scores: {str(e)}")
+    scores.update(computed)
+    return scores
+
+
+def score_job_for_users(job, users) -> List[Dict[str, Any]]:
+    """
+    Batched equivalent of ``match_job_to_users``.
+
+    Produces the same scores as ``calculate_match_score`` but loads each
+    factor for the whole group of users at once, so the number of queries
+    does not depend on ``len(users)``. Callers are expected to pass users in
+    chunks of a few hundred.
+
+    Args:
+        job: Job instance
+        users: List of User instances
+
+    Returns:
+        List of dictionaries with user IDs and match scores, highest first
+    """
+    from userlocation.models import UserLocation
+
+    users = list(users)
+    if not users:
+        return []
+    user_ids = [user.id for user in users]
+
+    with_profile = set(
+        Profile.objects.filter(user_id__in=user_ids).values_list("user_id", flat=True)
+    )
+    user_ids = [user_id for user_id in user_ids if user_id in with_profile]
+    if not user_ids:
+        return []
+
+    # Latest known location per user
+    locations = {}
+    if job.latitude and job.longitude:
+        rows = (
+            UserLocation.objects.filter(user_id__in=user_ids)
+            .order_by("user_id", "-last_updated")
+            .values_list("user_id", "latitude", "longitude")
+        )
+        for user_id, latitude, longitude in rows:
+            locations.setdefault(user_id, (latitude, longitude))
+
+    # Completed jobs per user, split by industry and subcategory
+    completed = defaultdict(int)
+    same_industry = defaultdict(int)
+    same_subcategory = defaultdict(int)
+    rows = (
+        Job.objects.filter(selected_applicant_id__in=user_ids, status=Job.Status.COMPLETED)
+        .values("selected_applicant_id", "industry_id", "subcategory_id")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    for row in rows:
+        user_id = row["selected_applicant_id"]
+        completed[user_id] += row["total"]
+        if row["industry_id"] == job.industry_id:
+            same_industry[user_id] += row["total"]
+        if row["subcategory_id"] == job.subcategory_id:
+            same_subcategory[user_id] += row["total"]
+
+    ratings = dict(
+        Review.objects.filter(reviewed_id__in=user_ids)
+        .values("reviewed_id")
+        .annotate(avg=Avg("rating"))
+        .order_by()
+        .values_list("reviewed_id", "avg")
+    )
+    activity = _batch_activity_scores(user_ids)
+
+    max_distance = 50.0
+    matches = []
+    for user in users:
+        if user.id not in with_profile:
+            continue
+
+        location_score = 0.0
+        if user.id in locations:
+            distance_km = calculate_distance(
+                float(job.latitude),
+                float(job.longitude),
+                float(locations[user.id][0]),
+                float(locations[user.id][1]),
+            )
+            if distance_km <= max_distance:
+                location_score = 1.0 - (distance_km / max_distance)
+
+        skills_score = (
+            min(same_industry[user.id] / 5.0, 1.0) * 0.6
+            + min(same_subcategory[user.id] / 3.0, 1.0) * 0.4
+        )
+        avg_rating = ratings.get(user.id)
+        rating_score = (float(avg_rating) - 1) / 4.0 if avg_rating else 0.5
+        experience_score = min(completed[user.id] / 20.0, 1.0)
+
+        score = (
+            location_score * WEIGHT_LOCATION
+            + skills_score * WEIGHT_SKILLS
+            + activity.get(user.id, 0.0) * WEIGHT_ACTIVITY
+            + rating_score * WEIGHT_RATING
+            + experience_score * WEIGHT_EXPERIENCE
+        )
+        if score > 0:
+            matches.append(
+                {
+                    "user_id": user.id,
+                    "username": user.username,
+                    "score": score,
+                    "job_id": job.id,
+                    "job_title": job.title,
+                }
+            )
+
+    return sorted(matches, key=lambda x: x["score"], reverse=True)
+
+
 def match_user_to_jobs(user, jobs) -> List[Dict[str, Any]]:
     """
     Match a single user to multiple jobs.
@@ -0,0 +1,193 @@
+"""
+Keyword index over Job.title and Job.description.
+
+Skill matching used to split every job's title and description into words and
+compare each applicant skill against each word on every request. This module
+keeps that tokenisation in the database instead:
+
+- ``SearchToken`` holds the distinct vocabulary of words
+- ``JobToken`` holds one posting per (job, word)
+
+The index is maintained incrementally from the Job post_save signal (see
+``jobs.signals``). Skill lookups become one query against the vocabulary plus
+one query against the postings, with the same "skill in word or word in skill"
+semantics as ``jobs.matching.skills_match_score``.
+
+Usage:
+    from jobs.keyword_index import index_job, match_skill_counts
+    index_job(job)
+    hits = match_skill_counts(["python", "waiter"])  # {job_id: skills_hit}
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.db import transaction
+from django.db.models import Q
+
+from jobs.models import Job, JobToken, SearchToken
+
+logger = logging.getLogger(__name__)
+
+# Keep IN (...) lists well below SQLite's bound parameter limit
+QUERY_CHUNK_SIZE = 500
+
+
+def _chunks(items: List, size: int = QUERY_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def tokenize(title: Optional[str], description: Optional[str]) -> Set[str]:
+    """
+    Split a job's title and description into the keyword set used for matching.
+
+    Words longer than ``SearchToken.MAX_LENGTH`` are not indexed.
+    """
+    tokens = set((title or "").lower().split())
+    if description:
+        tokens |= set(description.lower().split())
+    return {t for t in tokens if len(t) <= SearchToken.MAX_LENGTH}
+
+
+def _token_ids(tokens: Iterable[str]) -> Dict[str, int]:
+    """Return {token: id}, creating missing vocabulary rows."""
+    tokens = list(tokens)
+    if not tokens:
+        return {}
+    SearchToken.objects.bulk_create(
+        [SearchToken(token=t) for t in tokens], ignore_conflicts=True, batch_size=QUERY_CHUNK_SIZE
+    )
+    ids = {}
+    for chunk in _chunks(tokens):
+        ids.update(SearchToken.objects.filter(token__in=chunk).values_list("token", "id"))
+    return ids
+
+
+def index_job(job: Job) -> None:
+    """
+    Bring one job's postings in line with its current title and description.
+
+    Only the difference against the stored postings is written, so re-saving
+    a job whose text did not change costs a single SELECT.
+    """
+    wanted = tokenize(job.title, job.description)
+    existing = dict(
+        JobToken.objects.filter(job_id=job.pk).values_list("token__token", "token_id")
+    )
+    stale = [token_id for token, token_id in existing.items() if token not in wanted]
+    missing = wanted.difference(existing)
+    if not stale and not missing:
+        return
+
+    with transaction.atomic():
+        if stale:
+            JobToken.objects.filter(job_id=job.pk, token_id__in=stale).delete()
+        if missing:
+            ids = _token_ids(missing)
+            JobToken.objects.bulk_create(
+                [JobToken(job_id=job.pk, token_id=ids[t]) for t in missing],
+                ignore_conflicts=True,
+                batch_size=QUERY_CHUNK_SIZE,
+            )
+
+
+def index_jobs(queryset=None, batch_size: int = 1000) -> int:
+    """
+    (Re)build postings for every job in ``queryset`` (all jobs by default).
+
+    Intended for backfills and bulk-created jobs, which bypass post_save.
+    Returns the number of jobs indexed.
+    """
+    queryset = Job.objects.all() if queryset is None else queryset
+    rows = queryset.values_list("id", "title", "description").iterator(chunk_size=batch_size)
+
+    indexed = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            indexed += _index_batch(batch)
+            batch = []
+    if batch:
+        indexed += _index_batch(batch)
+    return indexed
+
+
+def _index_batch(rows) -> int:
+    tokens_by_job = {job_id: tokenize(title, description) for job_id, title, description in rows}
+    ids = _token_ids(set().union(*tokens_by_job.values()))
+    with transaction.atomic():
+        JobToken.objects.filter(job_id__in=list(tokens_by_job)).delete()
+        JobToken.objects.bulk_create(
+            [
+                JobToken(job_id=job_id, token_id=ids[t])
+                for job_id, tokens in tokens_by_job.items()
+                for t in tokens
+            ],
+            batch_size=QUERY_CHUNK_SIZE,
+        )
+    return len(tokens_by_job)
+
+
+def prune_vocabulary() -> int:
+    """Delete vocabulary rows that no job references any more."""
+    deleted, _ = SearchToken.objects.filter(postings__isnull=True).delete()
+    return deleted
+
+
+def _skill_substrings(skill: str) -> Set[str]:
+    """Every string that could be a word contained in ``skill``."""
+    substrings = set()
+    for piece in skill.split():
+        for start in range(len(piece)):
+            for end in range(start + 1, min(len(piece), start + SearchToken.MAX_LENGTH) + 1):
+                substrings.add(piece[start:end])
+    return substrings
+
+
+def match_skill_counts(skills: List[str]) -> Dict[int, int]:
+    """
+    Count, per job, how many of ``skills`` hit a keyword of that job.
+
+    A skill hits a keyword when either is a substring of the other, exactly
+    like the nested scan in ``jobs.matching.skills_match_score``. Skills must
+    already be stripped and lower-cased (see ``jobs.matching.parse_skills``).
+    Jobs with no hits are absent from the result.
+    """
+    if not skills:
+        return {}
+
+    substrings = [_skill_substrings(skill) for skill in skills]
+    condition = Q()
+    for skill in skills:
+        condition |= Q(token__contains=skill)
+    candidates = set()
+    for skill_substrings in substrings:
+        candidates |= skill_substrings
+
+    vocabulary = dict(SearchToken.objects.filter(condition).values_list("id", "token"))
+    for chunk in _chunks(list(candidates.difference(vocabulary.values()))):
+        vocabulary.update(SearchToken.objects.filter(token__in=chunk).values_list("id", "token"))
+
+    # Bit i of a token's mask is set when skill i hits that token
+    token_masks = {}
+    for token_id, token in vocabulary.items():
+        mask = 0
+        for i, skill in enumerate(skills):
+            if skill in token or token in substrings[i]:
+                mask |= 1 << i
+        if mask:
+            token_masks[token_id] = mask
+    if not token_masks:
+        return {}
+
+    job_masks = defaultdict(int)
+    for chunk in _chunks(list(token_masks)):
+        for job_id, token_id in JobToken.objects.filter(token_id__in=chunk).values_list(
+            "job_id", "token_id"
+        ):
+            job_masks[job_id] |= token_masks[token_id]
+
+    return {job_id: mask.bit_count() for job_id, mask in job_masks.items()}
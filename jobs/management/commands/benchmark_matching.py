@@ -0,0 +1,115 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from accounts.models import Profile
+from jobs.keyword_index import index_jobs
+from jobs.matching import calculate_match_score, get_applicant_matches
+from jobs.models import Job
+
+User = get_user_model()
+
+LOCATIONS = ["Lagos", "Ikeja, Lagos", "Abuja", "Lekki Phase 1, Lagos", "Port Harcourt", "Ibadan"]
+TITLES = ["Waiter", "Event Usher", "Python Developer", "Warehouse Packer", "Delivery Rider", "Cleaner"]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class QueryCounter:
+    """Counts executed queries without relying on the capped connection.queries log."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark get_applicant_matches (queries and latency per call) at several job counts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=str, default='1000,10000,100000', help='Comma separated job counts')
+        parser.add_argument('--repeat', type=int, default=3, help='Calls per size (best latency is reported)')
+        parser.add_argument('--legacy', action='store_true', help='Also time the per-job calculate_match_score loop')
+
+    def handle(self, *args, **options):
+        sizes = [int(s) for s in options['sizes'].split(',') if s.strip()]
+        try:
+            with transaction.atomic():
+                applicant, client = self._create_users()
+                created = 0
+                for size in sizes:
+                    self._create_jobs(client, size - created)
+                    created = size
+                    self._report(size, applicant, options['repeat'], options['legacy'])
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write(self.style.SUCCESS('Benchmark data rolled back'))
+
+    def _create_users(self):
+        stamp = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        client = User.objects.create_user(
+            username=f'bench_client_{stamp}', email=f'bench_client_{stamp}@example.com', password='benchpass123'
+        )
+        applicant = User.objects.create_user(
+            username=f'bench_applicant_{stamp}', email=f'bench_applicant_{stamp}@example.com', password='benchpass123'
+        )
+        Profile.objects.update_or_create(
+            user=applicant,
+            defaults={'role': 'applicant', 'location': 'Lagos', 'skills': 'python, waiter, cleaning, delivery'},
+        )
+        return User.objects.select_related('profile').get(pk=applicant.pk), client
+
+    def _create_jobs(self, client, count):
+        today = timezone.now().date()
+        jobs = [
+            Job(
+                client=client,
+                created_by=client,
+                title=f"{TITLES[i % len(TITLES)]} #{i}",
+                description=f"Looking for a reliable {TITLES[(i * 7) % len(TITLES)].lower()} for a busy shift",
+                location=LOCATIONS[i % len(LOCATIONS)],
+                start_date=today + timedelta(days=i % 30),
+                end_date=today + timedelta(days=i % 30),
+                shift_type='day',
+                rate=Decimal('2500.00'),
+                is_active=True,
+            )
+            for i in range(count)
+        ]
+        created = Job.objects.bulk_create(jobs, batch_size=2000)
+        # bulk_create skips post_save, so index the new rows directly
+        index_jobs(Job.objects.filter(id__in=[job.id for job in created]))
+
+    def _report(self, size, applicant, repeat, legacy):
+        best = None
+        for _ in range(repeat):
+            counter = QueryCounter()
+            with connection.execute_wrapper(counter):
+                started = time.perf_counter()
+                get_applicant_matches(applicant.id, limit=50)
+                elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        self.stdout.write(
+            f'{size:>7} jobs | batched: {counter.count:>7} queries, {best * 1000:9.1f} ms'
+        )
+
+        if legacy:
+            counter = QueryCounter()
+            with connection.execute_wrapper(counter):
+                started = time.perf_counter()
+                for job in Job.objects.filter(is_active=True):
+                    calculate_match_score(job, applicant)
+                elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{size:>7} jobs | per-job: {counter.count:>7} queries, {elapsed * 1000:9.1f} ms'
+            )
@@ -0,0 +1,37 @@
+"""
+Management command to rebuild the skill-matching keyword index.
+
+The index is kept current by the Job post_save signal; run this after bulk
+imports (bulk_create / queryset.update bypass signals) or to drop vocabulary
+that no job uses any more.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from jobs.keyword_index import index_jobs, prune_vocabulary
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the job title/description keyword index used for skill matching'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job_id', type=int, help='Only reindex this job')
+        parser.add_argument('--batch_size', type=int, default=1000, help='Jobs indexed per transaction')
+        parser.add_argument('--prune', action='store_true', help='Delete tokens no longer used by any job')
+
+    def handle(self, *args, **options):
+        queryset = Job.objects.all()
+        if options.get('job_id'):
+            queryset = queryset.filter(id=options['job_id'])
+
+        indexed = index_jobs(queryset, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} jobs'))
+
+        if options.get('prune'):
+            pruned = prune_vocabulary()
+            self.stdout.write(self.style.SUCCESS(f'Pruned {pruned} unused tokens'))
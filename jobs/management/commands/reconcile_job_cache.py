@@ -13,6 +13,7 @@ from django.utils import timezone
 
 from jobs.models import Job
 from core.cache import get_cache_stats, invalidate_cache_pattern, redis_client
+from core.redis.cache_tags import scan_keys
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -60,8 +61,8 @@ class Command(BaseCommand):
         # 1. Remove stale cache entries
         if full_reconciliation:
             # Get all job IDs from cache
-            job_keys = redis_client.keys('job:*')
-            model_job_keys = redis_client.keys('model:job:*')
+            job_keys = list(scan_keys('job:*', client=redis_client))
+            model_job_keys = list(scan_keys('model:job:*', client=redis_client))
             
             # Extract job IDs from keys
             job_ids_from_cache = set()
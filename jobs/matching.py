@@ -3,12 +3,17 @@ Job matching module for finding the best applicants for jobs.
 Provides functions for matching applicants to jobs based on location, skills, availability, and rating.
 """
 
+import heapq
 import logging
-from typing import Dict, List
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Set
 
 from django.contrib.auth import get_user_model
 
 from accounts.models import Profile
+from jobs.keyword_index import match_skill_counts
 from jobs.models import Application, Job
 
 User = get_user_model()
@@ -22,6 +27,9 @@ WEIGHT_ACHIEVEMENT = 1
 WEIGHT_BADGE = 1
 WEIGHT_POINT = 1
 
+# Application statuses that occupy the applicant on the job's date
+BOOKED_APPLICATION_STATUSES = ("Accepted", "Pending")
+
 
 def get_job_matches(job_id: int, limit: int = 10) -> List[Dict]:
     """
@@ -59,26 +67,39 @@ def get_applicant_matches(applicant_id: int, limit: int = 10) -> List[Dict]:
     Get the best matching jobs for an applicant.
     Returns a list of jobs with scores, sorted descending.
     Softened: always include jobs with score > 10 (base score), so user always sees some jobs.
+
+    Scoring runs through the batched engine (see ``score_jobs_for_applicant``), so
+    the number of queries is fixed regardless of how many jobs are active. Skill
+    hits come from the keyword index rather than re-tokenising every job.
     """
     try:
-        applicant = User.objects.get(id=applicant_id)
-        jobs = Job.objects.filter(is_active=True)
-        matches = []
-        for job in jobs:
-            score = calculate_match_score(job, applicant)
-            if score > 10:  # Lowered threshold, include partial matches
-                matches.append({
-                    "job_id": job.id,
-                    "title": job.title,
-                    "location": job.location,
-                    "score": score,
-                    "client_id": job.client_id,
-                    "client_name": f"{job.client.first_name} {job.client.last_name}",
-                    "date": job.date.isoformat(),
-                    "rate": float(job.rate),
-                })
-        matches.sort(key=lambda x: x["score"], reverse=True)
-        return matches[:limit]
+        applicant = User.objects.select_related("profile").get(id=applicant_id)
+        context = ApplicantMatchContext.load(applicant)
+        if context is None:
+            return []
+
+        columns = load_job_columns(Job.objects.filter(is_active=True), include_descriptions=False)
+        skill_hits = match_skill_counts(context.skills)
+        scores = score_jobs_for_applicant(columns, context, skill_hits=skill_hits)
+
+        ranked = heapq.nlargest(
+            limit,
+            (i for i, score in enumerate(scores) if score > 10),  # Lowered threshold, include partial matches
+            key=scores.__getitem__,
+        )
+        return [
+            {
+                "job_id": columns.ids[i],
+                "title": columns.titles[i],
+                "location": columns.locations[i],
+                "score": scores[i],
+                "client_id": columns.client_ids[i],
+                "client_name": columns.client_names[i],
+                "date": columns.dates[i].isoformat() if columns.dates[i] else None,
+                "rate": float(columns.rates[i]),
+            }
+            for i in ranked
+        ]
     except User.DoesNotExist:
         logger.error(f"Applicant with ID {applicant_id} not found")
         return []
@@ -86,6 +107,171 @@ def get_applicant_matches(applicant_id: int, limit: int = 10) -> List[Dict]:
         logger.error(f"Error getting applicant matches for applicant_id={applicant_id}: {str(e)}")
         return []
 
+
+# ------------------------------------------------------
+# Batched matching engine
+# ------------------------------------------------------
+
+
+@dataclass
+class ApplicantMatchContext:
+    """
+    Everything about one applicant that the scorers need, loaded up front.
+
+    Loading costs a fixed number of queries (the rating aggregate plus one query
+    over the applicant's own applications), after which scoring any number of
+    jobs touches no database rows.
+    """
+
+    profile_location: str
+    skills: List[str]
+    rating_score: float
+    applied_job_ids: Set[int] = field(default_factory=set)
+    bookings_by_date: Dict[date, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, applicant) -> Optional["ApplicantMatchContext"]:
+        profile = getattr(applicant, "profile", None)
+        if not profile:
+            return None
+
+        applied_job_ids = set()
+        bookings_by_date = defaultdict(int)
+        for job_id, job_date, status in Application.objects.filter(
+            applicant=applicant
+        ).values_list("job_id", "job__start_date", "status"):
+            applied_job_ids.add(job_id)
+            if status in BOOKED_APPLICATION_STATUSES:
+                bookings_by_date[job_date] += 1
+
+        return cls(
+            profile_location=(profile.location or "").lower(),
+            skills=parse_skills(profile.skills),
+            rating_score=calculate_rating_match(profile),
+            applied_job_ids=applied_job_ids,
+            bookings_by_date=dict(bookings_by_date),
+        )
+
+
+@dataclass
+class JobColumns:
+    """Column-oriented snapshot of the job fields used for scoring and output."""
+
+    ids: List[int] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    locations: List[str] = field(default_factory=list)
+    dates: List[Optional[date]] = field(default_factory=list)
+    rates: List = field(default_factory=list)
+    client_ids: List[int] = field(default_factory=list)
+    client_names: List[str] = field(default_factory=list)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+JOB_COLUMN_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "location",
+    "start_date",
+    "rate",
+    "client_id",
+    "client__first_name",
+    "client__last_name",
+)
+
+
+def load_job_columns(queryset, chunk_size: int = 2000, include_descriptions: bool = True) -> JobColumns:
+    """
+    Load the scoring columns for every job in ``queryset`` in a single query.
+
+    Rows are streamed as tuples, so no ``Job`` instances are built. Descriptions
+    are only needed when skills are scored by scanning rather than through the
+    keyword index, so they can be left out to keep the rows small.
+    """
+    fields = JOB_COLUMN_FIELDS
+    if not include_descriptions:
+        fields = tuple(f for f in JOB_COLUMN_FIELDS if f != "description")
+
+    columns = JobColumns()
+    for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        if include_descriptions:
+            (job_id, title, description, location, start_date, rate,
+             client_id, first_name, last_name) = row
+        else:
+            (job_id, title, location, start_date, rate,
+             client_id, first_name, last_name) = row
+            description = ""
+        columns.ids.append(job_id)
+        columns.titles.append(title)
+        columns.descriptions.append(description)
+        columns.locations.append(location)
+        columns.dates.append(start_date)
+        columns.rates.append(rate)
+        columns.client_ids.append(client_id)
+        columns.client_names.append(f"{first_name} {last_name}")
+    return columns
+
+
+def score_jobs_for_applicant(
+    columns: JobColumns,
+    context: ApplicantMatchContext,
+    skill_hits: Optional[Dict[int, int]] = None,
+) -> List[float]:
+    """
+    Score every job in ``columns`` for one applicant in a single pass.
+
+    Uses the same weights and component scores as ``calculate_match_score``.
+    Location and availability components are memoised per distinct value,
+    since many jobs share a location string or a start date.
+
+    ``skill_hits`` is the per-job skill hit count from
+    ``jobs.keyword_index.match_skill_counts``; without it skills are scored
+    by scanning each job's title and description.
+    """
+    location_scores = {}
+    availability_scores = {}
+    weighted_rating = context.rating_score * 0.1
+    applied = context.applied_job_ids
+    scores = []
+
+    for job_id, title, description, location, job_date in zip(
+        columns.ids, columns.titles, columns.descriptions, columns.locations, columns.dates
+    ):
+        location_score = location_scores.get(location)
+        if location_score is None:
+            location_score = location_scores[location] = location_match_score(
+                location, context.profile_location
+            )
+
+        availability_score = availability_scores.get(job_date)
+        if availability_score is None:
+            availability_score = availability_scores[job_date] = availability_match_score(
+                context.bookings_by_date.get(job_date, 0)
+            )
+
+        if skill_hits is None:
+            skills_score = skills_match_score(context.skills, title, description)
+        elif not context.skills or not title:
+            skills_score = 10.0
+        else:
+            skills_score = skills_score_from_hits(skill_hits.get(job_id, 0), len(context.skills))
+
+        score = (
+            location_score * 0.3
+            + skills_score * 0.4
+            + availability_score * 0.2
+            + weighted_rating
+        )
+        if job_id in applied:
+            score = score * 0.8  # Reduce score by 20% for applied jobs
+        scores.append(score)
+
+    return scores
+
+
 def calculate_match_score(job, applicant) -> float:
     """
     Calculate a match score between a job and an applicant (0-100).
@@ -117,10 +303,17 @@ def calculate_location_match(job: Job, profile: Profile) -> float:
     """
     Calculate location match score (softened: partial/fuzzy match allowed).
     """
-    if not profile.location or not job.location:
+    return location_match_score(job.location, (profile.location or "").lower())
+
+
+def location_match_score(job_location: str, profile_loc: str) -> float:
+    """
+    Location match score for a raw job location and an already lower-cased
+    profile location.
+    """
+    if not profile_loc or not job_location:
         return 10.0  # Give a small base score if location is missing
-    job_loc = job.location.lower()
-    profile_loc = profile.location.lower()
+    job_loc = job_location.lower()
     if profile_loc == job_loc:
         return 100.0
     # Partial substring match
@@ -133,16 +326,32 @@ def calculate_location_match(job: Job, profile: Profile) -> float:
         return 40.0
     return 10.0  # Small base score for any non-match
 
+
+def parse_skills(skills: Optional[str]) -> List[str]:
+    """Split a comma separated skills string into lower-cased skills."""
+    if not skills:
+        return []
+    return [s.strip().lower() for s in skills.split(",") if s.strip()]
+
 def calculate_skills_match(job: Job, profile: Profile) -> float:
     """
     Calculate skills match score (softened: partial/fuzzy match allowed).
     """
-    if not profile.skills or not job.title:
+    if not profile.skills:
+        return 10.0  # Small base score if missing
+    return skills_match_score(parse_skills(profile.skills), job.title, job.description)
+
+
+def skills_match_score(applicant_skills: List[str], title: str, description: str) -> float:
+    """
+    Skills match score for pre-parsed applicant skills against a job's title
+    and description.
+    """
+    if not applicant_skills or not title:
         return 10.0  # Small base score if missing
-    applicant_skills = [s.strip().lower() for s in profile.skills.split(",") if s.strip()]
-    job_keywords = set(job.title.lower().split())
-    if job.description:
-        job_keywords |= set(job.description.lower().split())
+    job_keywords = set(title.lower().split())
+    if description:
+        job_keywords |= set(description.lower().split())
     # Fuzzy/substring match: count skills that appear as substrings in any job keyword
     matches = 0
     for skill in applicant_skills:
@@ -150,18 +359,30 @@ def calculate_skills_match(job: Job, profile: Profile) -> float:
             if skill in word or word in skill:
                 matches += 1
                 break
-    if not applicant_skills:
-        return 10.0
+    return skills_score_from_hits(matches, len(applicant_skills))
+
+
+def skills_score_from_hits(matches: int, total_skills: int) -> float:
+    """
+    Skills score for ``matches`` of ``total_skills`` applicant skills hitting the job.
+    """
     # Give a base score, plus proportional match
-    return min(100.0, 10.0 + (matches / len(applicant_skills)) * 90.0)
+    return min(100.0, 10.0 + (matches / total_skills) * 90.0)
 
 def calculate_availability_match(job, applicant) -> float:
     """
     Calculate availability match score.
     """
     other_jobs = Application.objects.filter(
-        applicant=applicant, job__date=job.date, status__in=["Accepted", "Pending"]
+        applicant=applicant, job__start_date=job.start_date, status__in=BOOKED_APPLICATION_STATUSES
     ).count()
+    return availability_match_score(other_jobs)
+
+
+def availability_match_score(other_jobs: int) -> float:
+    """
+    Availability score from the number of booked applications on the job's date.
+    """
     if other_jobs == 0:
         return 100.0
     elif other_jobs == 1:
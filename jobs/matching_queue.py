@@ -0,0 +1,176 @@
+"""
+Background pipeline that matches new and edited jobs to users.
+
+Job saves used to score the job against every active user inside the
+request. Now the post_save signal only records the job id:
+
+1. ``enqueue_job_matching`` adds the id to a Redis set, so repeated saves of
+   the same job collapse into one entry, and schedules a single drain task
+   per coalescing window.
+2. ``drain_job_matching_queue`` (see ``jobs.tasks``) pops a batch of ids and
+   calls ``match_queued_jobs``.
+3. ``match_queued_jobs`` streams active users in chunks, scores every job of
+   the batch against each chunk with ``score_job_for_users`` and writes the
+   results to the ``job_matches:{job_id}`` cache.
+
+Usage:
+    from jobs.matching_queue import enqueue_job_matching
+    enqueue_job_matching(job.id)
+"""
+
+import heapq
+import logging
+from typing import Dict, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from core.redis.cache import redis_client
+from jobs.job_matching_utils import score_job_for_users
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+PENDING_KEY = "job_matching:pending"
+SCHEDULED_KEY = "job_matching:scheduled"
+
+# Saves within this many seconds of each other are matched by the same task
+COALESCE_WINDOW = 5
+# Jobs handled per drain task, and users scored per query batch
+JOB_BATCH_SIZE = 20
+USER_CHUNK_SIZE = 500
+
+MATCH_CACHE_TIMEOUT = 60 * 60  # 1 hour
+# Only the best matches are cached; notifications still see every high match
+MAX_CACHED_MATCHES = 500
+NOTIFY_THRESHOLD = 0.7
+
+
+def enqueue_job_matching(job_id: int) -> None:
+    """
+    Queue a job for matching once the current transaction commits.
+
+    Never runs the matching itself. Without Redis each job gets its own task
+    instead of being coalesced.
+    """
+    from jobs.tasks import match_jobs
+
+    if redis_client is None:
+        transaction.on_commit(lambda: _dispatch(match_jobs, [job_id]))
+        return
+
+    try:
+        redis_client.sadd(PENDING_KEY, job_id)
+        schedule_drain()
+    except Exception as e:
+        logger.warning(f"Job matching queue unavailable, queuing job {job_id} directly: {e}")
+        transaction.on_commit(lambda: _dispatch(match_jobs, [job_id]))
+
+
+def requeue_jobs(job_ids: List[int]) -> None:
+    """Put job ids back on the queue, e.g. after a failed batch."""
+    if redis_client is not None and job_ids:
+        redis_client.sadd(PENDING_KEY, *job_ids)
+
+
+def schedule_drain(countdown: int = COALESCE_WINDOW) -> None:
+    """
+    Once the current transaction commits, schedule a drain task unless one
+    is already waiting to run.
+
+    The marker is only set on commit, so a rolled back save cannot hold it
+    and delay the drain for later ones.
+    """
+    from jobs.tasks import drain_job_matching_queue
+
+    def schedule():
+        # The marker expires on its own in case the scheduled task is lost
+        if redis_client.set(SCHEDULED_KEY, 1, nx=True, ex=COALESCE_WINDOW * 4):
+            _dispatch(drain_job_matching_queue, countdown=countdown)
+
+    transaction.on_commit(schedule)
+
+
+def _dispatch(task, *args, countdown=None):
+    try:
+        task.apply_async(args=args, countdown=countdown)
+    except Exception as e:
+        logger.warning(f"Failed to queue {task.name}: {e}")
+
+
+def pop_pending_jobs(batch_size: int = JOB_BATCH_SIZE) -> List[int]:
+    """
+    Take up to ``batch_size`` job ids off the queue.
+
+    The scheduled marker is cleared first, so a job enqueued while this batch
+    is being matched schedules a fresh drain instead of being stranded.
+    """
+    if redis_client is None:
+        return []
+    redis_client.delete(SCHEDULED_KEY)
+    return [int(job_id) for job_id in redis_client.spop(PENDING_KEY, batch_size) or []]
+
+
+def pending_count() -> int:
+    """Number of jobs waiting to be matched."""
+    if redis_client is None:
+        return 0
+    return redis_client.scard(PENDING_KEY)
+
+
+def match_queued_jobs(job_ids: List[int], chunk_size: Optional[int] = None) -> Dict[int, int]:
+    """
+    Score ``job_ids`` against all active users and cache the results.
+
+    Users are read once per batch in id order, ``chunk_size`` at a time
+    (``USER_CHUNK_SIZE`` by default), and every job is scored against each
+    chunk before the next one is loaded. Returns {job_id: number of matches}.
+    """
+    from jobs.signals import send_notifications_for_matches
+
+    chunk_size = chunk_size or USER_CHUNK_SIZE
+
+    jobs = list(Job.objects.filter(id__in=job_ids))
+    if not jobs:
+        return {}
+
+    best = {job.id: [] for job in jobs}
+    notify = {job.id: [] for job in jobs}
+    counts = {job.id: 0 for job in jobs}
+    sequence = 0  # Tie-breaker so the heap never compares dicts
+
+    last_id = 0
+    while True:
+        users = list(
+            User.objects.filter(is_active=True, id__gt=last_id)
+            .order_by("id")
+            .only("id", "username")[:chunk_size]
+        )
+        if not users:
+            break
+        last_id = users[-1].id
+
+        for job in jobs:
+            for match in score_job_for_users(job, users):
+                counts[job.id] += 1
+                if match["score"] > NOTIFY_THRESHOLD:
+                    notify[job.id].append(match)
+                sequence += 1
+                entry = (match["score"], -sequence, match)
+                if len(best[job.id]) < MAX_CACHED_MATCHES:
+                    heapq.heappush(best[job.id], entry)
+                else:
+                    heapq.heappushpop(best[job.id], entry)
+
+    for job in jobs:
+        job_matches = [entry[2] for entry in sorted(best[job.id], reverse=True)]
+        cache.set(f"job_matches:{job.id}", job_matches, timeout=MATCH_CACHE_TIMEOUT)
+        try:
+            send_notifications_for_matches(job, notify[job.id])
+        except Exception as e:
+            logger.error(f"Error sending match notifications for job {job.id}: {e}")
+        logger.info(f"Cached {len(job_matches)} of {counts[job.id]} matches for job {job.id}")
+
+    return counts
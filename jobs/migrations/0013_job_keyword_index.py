@@ -0,0 +1,60 @@
+# Generated by Django 4.2.16 on 2026-10-16 19:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_keyword_index(apps, schema_editor):
+    # Historical models, so tokenise inline rather than through jobs.keyword_index
+    Job = apps.get_model("jobs", "Job")
+    SearchToken = apps.get_model("jobs", "SearchToken")
+    JobToken = apps.get_model("jobs", "JobToken")
+
+    token_ids = {}
+    postings = []
+    for job_id, title, description in Job.objects.values_list("id", "title", "description").iterator():
+        tokens = set((title or "").lower().split())
+        if description:
+            tokens |= set(description.lower().split())
+        for token in tokens:
+            if len(token) > 255:
+                continue
+            if token not in token_ids:
+                token_ids[token] = SearchToken.objects.create(token=token).id
+            postings.append(JobToken(job_id=job_id, token_id=token_ids[token]))
+    JobToken.objects.bulk_create(postings, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_alter_job_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Search Token',
+                'verbose_name_plural': 'Search Tokens',
+            },
+        ),
+        migrations.CreateModel(
+            name='JobToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='jobs.job')),
+                ('token', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='jobs.searchtoken')),
+            ],
+            options={
+                'verbose_name': 'Job Token',
+                'verbose_name_plural': 'Job Tokens',
+                'unique_together': {('token', 'job')},
+            },
+        ),
+        migrations.RunPython(backfill_keyword_index, reverse_code=migrations.RunPython.noop),
+    ]
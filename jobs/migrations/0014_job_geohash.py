@@ -0,0 +1,30 @@
+# Generated by Django 4.2.16 on 2026-10-16 19:56
+
+from django.db import migrations, models
+
+from core.spatial_index import geohash_or_blank
+
+
+def backfill_geohash(apps, schema_editor):
+    Job = apps.get_model("jobs", "Job")
+    rows = []
+    for row in Job.objects.exclude(latitude__isnull=True).exclude(longitude__isnull=True).iterator():
+        row.geohash = geohash_or_blank(row.latitude, row.longitude)
+        rows.append(row)
+    Job.objects.bulk_update(rows, ["geohash"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0013_job_keyword_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='Spatial index cell derived from latitude/longitude', max_length=12),
+        ),
+        migrations.RunPython(backfill_geohash, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-16 20:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0014_job_geohash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applicant', '-created_at', '-id'], name='jobs_applic_applica_dd6274_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at', '-id'], name='jobs_job_created_f3f2db_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['client', '-created_at', '-id'], name='jobs_job_client__b69aec_idx'),
+        ),
+    ]
@@ -26,6 +26,8 @@ from geopy.exc import GeocoderTimedOut
 from geopy.geocoders import Nominatim
 
 # Local App Imports
+from core.model_mixins import DirtyFieldsMixin
+from core.spatial_index import GEOHASH_MAX_LENGTH, geohash_or_blank
 from rating.models import Review
 ## Removed RedisCachedModelMixin import to eliminate Redis dependency
 
@@ -45,6 +47,41 @@ def user_profile_pic_path(instance, filename):
     )
 
 
+def client_jobs_cache_tag(client_id):
+    """Cache tag for every cached view of a client's jobs (see core.redis.cache_tags)"""
+    return f"clientjobs:u:{client_id}"
+
+
+def _queue_job_geocoding(job_id):
+    """Queue background geocoding for a job (see jobs.geocoding_queue)"""
+    try:
+        from jobs.geocoding_queue import enqueue_job_geocoding
+
+        enqueue_job_geocoding(job_id)
+        logger.info(f"Queued geocoding for job {job_id}")
+    except Exception as e:
+        logger.error(f"Failed to queue geocoding for job {job_id}: {str(e)}")
+
+
+def _invalidate_job_caches(job_id, client_ids):
+    """Drop a job's cached copies and its clients' job lists in one batch"""
+    try:
+        from core.redis.utils import invalidate_cache_entries
+
+        invalidate_cache_entries(
+            keys=[f"job:{job_id}", f"model:job:{job_id}"],
+            tags=[client_jobs_cache_tag(client_id) for client_id in client_ids],
+        )
+        logger.debug(f"Invalidated caches for job {job_id} and clients {sorted(client_ids)}")
+    except Exception as e:
+        logger.error(f"Failed to invalidate cache for job {job_id}: {str(e)}")
+
+
+# Cached /job-industries/ and /job-subcategories/ listings
+JOB_INDUSTRIES_CACHE_KEY = "industry:all"
+JOB_SUBCATEGORIES_CACHE_KEY = "subcat:all"
+
+
 # Your models will follow below these imports
 
 # ------------------------------------------------------
@@ -139,7 +176,7 @@ class JobSubCategory(models.Model):
             raise ValidationError("Subcategory name cannot be just whitespace")
 
 
-class Job(models.Model):
+class Job(DirtyFieldsMixin, models.Model):
     """
     Optimized Job model with all fixes applied.
     Preserves all original fields while adding improvements.
@@ -284,6 +321,10 @@ class Job(models.Model):
     longitude = models.DecimalField(
         max_digits=9, decimal_places=6, null=True, blank=True
     )
+    geohash = models.CharField(
+        max_length=GEOHASH_MAX_LENGTH, blank=True, default="", db_index=True,
+        help_text="Spatial index cell derived from latitude/longitude",
+    )
 
     # --- Status Tracking ---
     status = models.CharField(
@@ -307,6 +348,9 @@ class Job(models.Model):
             models.Index(fields=["start_date", "start_time"]),
             models.Index(fields=["is_active"]),
             models.Index(fields=["job_type", "shift_type"]),
+            # Keyset pagination (see core.pagination)
+            models.Index(fields=["-created_at", "-id"]),
+            models.Index(fields=["client", "-created_at", "-id"]),
         ]
         verbose_name = "Job"
         verbose_name_plural = "Jobs"
@@ -350,8 +394,15 @@ class Job(models.Model):
         """Validate model-level business rules"""
         super().clean()
 
-        if self.pk:
-            old = Job.objects.get(pk=self.pk)
+        if self.pk and not self._state.adding:
+            dirty = self.get_dirty_fields()
+            if dirty is None:
+                # Hand-built instance: the row is the only record of the old status
+                old_status = Job.objects.filter(pk=self.pk).values_list("payment_status", flat=True).first()
+            elif "payment_status" in dirty:
+                old_status = self.get_loaded_value("payment_status")
+            else:
+                return
             allowed_transitions = {
                 self.PaymentStatus.PENDING: [
                     self.PaymentStatus.PAID,  # Explicitly allow this
@@ -366,10 +417,10 @@ class Job(models.Model):
                 ],
                 # ... keep other transitions ...
             }
-            if old.payment_status != self.payment_status:
-                if self.payment_status not in allowed_transitions.get(old.payment_status, []):
+            if old_status is not None and old_status != self.payment_status:
+                if self.payment_status not in allowed_transitions.get(old_status, []):
                     raise ValidationError(
-                        f"Invalid payment status transition: {old.payment_status} → {self.payment_status}"
+                        f"Invalid payment status transition: {old_status} → {self.payment_status}"
                     )
 
 
@@ -498,70 +549,49 @@ class Job(models.Model):
     def save(self, *args, **kwargs):
         # Skip geocoding during initial save to avoid API rate limits
         skip_geocoding = kwargs.pop("skip_geocoding", False)
+        is_new = self._state.adding
+
+        # Keep the spatial index cell in step with the coordinates
+        self.geohash = geohash_or_blank(self.latitude, self.longitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"}.intersection(update_fields):
+            kwargs["update_fields"] = update_fields = {*update_fields, "geohash"}
+
+        # Compare against the values the row was loaded with instead of
+        # re-reading it; None means there is nothing to compare with
+        dirty = self.get_dirty_fields()
+        if dirty is None:
+            needs_geocoding = not (self.latitude and self.longitude)
+        else:
+            # Coordinates saved together with the location come from the caller
+            needs_geocoding = "location" in dirty and not {"latitude", "longitude"}.intersection(dirty)
 
-        needs_geocoding = False
-        if self.pk is None:
-            needs_geocoding = True
-        elif self.pk:
-            try:
-                old_job = Job.objects.get(pk=self.pk)
-                needs_geocoding = self.location != old_job.location
-            except Job.DoesNotExist:
-                needs_geocoding = True
-
-        # Calculate service fee and total amount for new jobs or when rate/times change
-        is_new = self.pk is None
-
-        self.full_clean()  # Ensure validation runs on every save
+        # Only validate what this save can change
+        if dirty is None:
+            self.full_clean()
+        else:
+            changed = set(dirty)
+            if update_fields is not None:
+                changed &= set(update_fields)
+            if changed:
+                self.full_clean(exclude=[f.name for f in self._meta.fields if f.name not in changed])
 
         # For new jobs, calculate service fee and total amount
         if is_new and self.rate and self.start_time and self.end_time:
             self.calculate_service_fee_and_total()
 
-        # Store client ID before save for cache invalidation
-        client_id = None
-        if self.pk and hasattr(self, 'client') and self.client:
-            client_id = self.client.id
-
-        with transaction.atomic():
-            super().save(*args, **kwargs)
-
-            # Only attempt geocoding if not explicitly skipped
-            if not skip_geocoding and needs_geocoding and self.location:
-                try:
-                    from django_q.tasks import async_task
-
-                    # Queue geocoding as a background task instead of doing it synchronously
-                    async_task(
-                        "jobs.tasks.geocode_job",
-                        self.id,
-                        hook="jobs.hooks.handle_geocode_result",
-                    )
-                    logger.info(f"Queued geocoding task for job {self.id}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to queue geocoding task for job {self.id}: {str(e)}"
-                    )
-
-            # Invalidate client jobs cache
-            try:
-                from core.redis.utils import invalidate_cache_pattern
-
-                # Invalidate cache for this specific job
-                invalidate_cache_pattern(f"job:{self.id}")
-                invalidate_cache_pattern(f"model:job:{self.id}")
+        # Client the row belonged to before this save, for cache invalidation
+        previous_client_id = self.get_loaded_value("client_id")
 
-                # Invalidate client jobs cache for this client
-                if hasattr(self, 'client') and self.client:
-                    invalidate_cache_pattern(f"clientjobs:*:u:{self.client.id}")
-                    logger.debug(f"Invalidated client jobs cache for client {self.client.id}")
+        super().save(*args, **kwargs)
+        self._snapshot_loaded_values(update_fields)
 
-                # If client changed, invalidate cache for previous client too
-                if client_id and client_id != self.client.id:
-                    invalidate_cache_pattern(f"clientjobs:*:u:{client_id}")
-                    logger.debug(f"Invalidated client jobs cache for previous client {client_id}")
-            except Exception as e:
-                logger.error(f"Failed to invalidate cache for job {self.id}: {str(e)}")
+        # Side effects only once the row is committed, so a rolled back save
+        # neither geocodes nor evicts caches for data that never existed
+        if not skip_geocoding and needs_geocoding and self.location:
+            transaction.on_commit(lambda job_id=self.id: _queue_job_geocoding(job_id))
+        client_ids = {self.client_id, previous_client_id} - {None}
+        transaction.on_commit(lambda job_id=self.id: _invalidate_job_caches(job_id, client_ids))
 
         # Ensure the job is cached after save
         if hasattr(self, 'cache'):
@@ -571,30 +601,12 @@ class Job(models.Model):
 
     def delete(self, *args, **kwargs):
         """
-        Override delete method to invalidate cache before deletion.
+        Override delete method to invalidate cache once the deletion commits.
         """
-        # Store client ID for cache invalidation
-        client_id = None
-        if hasattr(self, 'client') and self.client:
-            client_id = self.client.id
-
-        # Additional cache invalidation for client jobs
-        try:
-            from core.redis.utils import invalidate_cache_pattern
-
-            # Invalidate cache for this specific job
-            invalidate_cache_pattern(f"job:{self.id}")
-            invalidate_cache_pattern(f"model:job:{self.id}")
-
-            # Invalidate client jobs cache for this client
-            if client_id:
-                invalidate_cache_pattern(f"clientjobs:*:u:{client_id}")
-                logger.debug(f"Invalidated client jobs cache for client {client_id} after job deletion")
-        except Exception as e:
-            logger.error(f"Failed to invalidate cache after job deletion: {str(e)}")
-
-        # Call parent's delete method
-        return super().delete(*args, **kwargs)
+        job_id, client_id = self.id, self.client_id
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(lambda: _invalidate_job_caches(job_id, {client_id} - {None}))
+        return result
 
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
@@ -696,6 +708,7 @@ class Application(models.Model):
             models.Index(fields=["applied_at"]),
             models.Index(fields=["is_shown_up"]),
             models.Index(fields=["job", "applicant", "status"]),  # Composite index
+            models.Index(fields=["applicant", "-created_at", "-id"]),  # Keyset pagination
         ]
         ordering = ["-created_at"]
 
@@ -1021,3 +1034,47 @@ class SavedJob(models.Model):
                 "industry": self.job.industry.name if self.job.industry else None,
             }
         }
+
+
+# ------------------------------------------------------
+# Keyword index used by skill matching
+# ------------------------------------------------------
+
+
+class SearchToken(models.Model):
+    """
+    A distinct lower-cased word seen in some job title or description.
+
+    The vocabulary grows far more slowly than the number of jobs, so substring
+    lookups against it stay cheap as the job table grows.
+    """
+
+    MAX_LENGTH = 255
+
+    token = models.CharField(max_length=MAX_LENGTH, unique=True)
+
+    class Meta:
+        verbose_name = "Search Token"
+        verbose_name_plural = "Search Tokens"
+
+    def __str__(self):
+        return self.token
+
+
+class JobToken(models.Model):
+    """Posting linking a job to one of the tokens in its title or description."""
+
+    job = models.ForeignKey(
+        Job, on_delete=models.CASCADE, related_name="search_tokens", db_index=True
+    )
+    token = models.ForeignKey(
+        SearchToken, on_delete=models.CASCADE, related_name="postings", db_index=True
+    )
+
+    class Meta:
+        unique_together = ("token", "job")
+        verbose_name = "Job Token"
+        verbose_name_plural = "Job Tokens"
+
+    def __str__(self):
+        return f"{self.job_id}:{self.token_id}"
@@ -10,6 +10,8 @@ from typing import Any, Dict, List, Optional
 
 from django.core.cache import cache
 
+from core.redis.cache_tags import SCAN_COUNT
+
 
 class RedisCache:
     """Utility class for Redis caching operations."""
@@ -49,9 +51,8 @@ class RedisCache:
     @staticmethod
     def clear_pattern(pattern: str) -> None:
         """Clear all cache keys matching a pattern."""
-        keys = cache.keys(pattern)
-        if keys:
-            cache.delete_many(keys)
+        # django-redis walks the keyspace with SCAN instead of blocking KEYS
+        cache.delete_pattern(pattern, itersize=SCAN_COUNT)
 
 
 class JobCache(RedisCache):
@@ -181,10 +181,14 @@ class SubCategorySchema(Schema):
 
     @staticmethod
     def resolve_industry_name(obj):
+        if isinstance(obj, dict):  # Cached listing rows
+            return obj.get("industry_name")
         return obj.industry.name if obj.industry else None
 
     @staticmethod
     def resolve_industry_id(obj):
+        if isinstance(obj, dict):
+            return obj.get("industry_id")
         return obj.industry.id if obj.industry else None
 
 
@@ -231,6 +231,7 @@ def end_shift(request, job_id: int):
 
         Notification.objects.create(
             user=job.client,
+            job=job,
             category="shift_ended",
             message=f"Shift for '{job.title}' has been completed by {request.user.first_name} {request.user.last_name}.",
             is_read=False
@@ -314,6 +315,7 @@ def cancel_shift(request, job_id: int, payload: Dict = None):
                 # Create notification
                 Notification.objects.create(
                     user=recipient,
+                    job=job,
                     category="shift_cancelled",
                     message=f"Shift for '{job.title}' has been cancelled. Reason: {reason}",
                     is_read=False
@@ -22,11 +22,21 @@ from django.dispatch import receiver
 
 from accounts.models import Profile
 from jobchat.models import LocationHistory
-from jobs.models import Application, Job
+from core.redis.cache import delete_cached_data, invalidate_cache_tag
+from jobs.models import (
+    JOB_INDUSTRIES_CACHE_KEY,
+    JOB_SUBCATEGORIES_CACHE_KEY,
+    Application,
+    Job,
+    JobIndustry,
+    JobSubCategory,
+    client_jobs_cache_tag,
+)
 from notifications.models import Notification, NotificationCategory
 from payment.models import Payment
 from .job_matching_utils import match_jobs_to_users, match_users_to_jobs
-from .utils import fallback_geocode_and_save
+from .keyword_index import index_job
+from .matching_queue import enqueue_job_matching
 # Temporarily commented out - django_q has pkg_resources issue
 # from django_q.tasks import async_task
 # ==
@@ -156,51 +166,25 @@ def get_nearby_applicants(job):
 #             )
 
 
+# Fields that change a job's match results; other edits are not re-matched
+MATCHING_FIELDS = {"title", "latitude", "longitude", "industry", "subcategory"}
+
+
 @receiver(post_save, sender=Job)
-def match_job_to_users_on_create(sender, instance, created, **kwargs):
+def match_job_to_users_on_create(sender, instance, created, update_fields=None, **kwargs):
     """
-    Match a newly created job to potential users.
+    Queue a new or edited job for matching to potential users.
 
-    This signal handler:
-    1. Triggers an asynchronous job matching task when a job is created
-    2. Caches the matching results for quick access
-    3. Sends notifications to highly matched users
+    Matching runs in the background pipeline (see ``jobs.matching_queue``),
+    which caches the results under ``job_matches:{job_id}`` and notifies
+    highly matched users. Bursts of saves of the same job are coalesced.
     """
-    if created:
-        logger.info(
-            f"Triggering job matching for new job: {instance.id} - {instance.title}"
-        )
-
-        # Use Django Q for asynchronous job matching
-        # Temporarily disabled - django_q has pkg_resources issue
-        # try:
-        #     # Queue the job matching task
-        #     async_task(
-        #         "jobs.job_matching_utils.match_jobs_to_users",
-        #         [instance],
-        #         hook="jobs.signals.handle_job_matching_results",
-        #         task_name=f"match_job_{instance.id}",
-        #         group="job_matching"
-        #     )
-        #     logger.info(f"Queued job matching task for job {instance.id}")
-        # except Exception as e:
-        #     logger.error(f"Error queuing job matching task: {e}")
-
-        # Fallback to synchronous execution if async fails
-        try:
-            # Get all active users
-            active_users = User.objects.filter(is_active=True)
-            matches = match_jobs_to_users([instance], active_users)
-            if matches:
-                for job_id, job_matches in matches.items():
-                    # Cache the matches
-                    cache_key = f"job_matches:{job_id}"
-                    cache.set(cache_key, job_matches, timeout=3600)  # Cache for 1 hour
-
-                    # Send notifications for high-scoring matches
-                    send_notifications_for_matches(instance, job_matches)
-        except Exception as inner_e:
-            logger.error(f"Error in fallback job matching: {inner_e}")
+    if not created and update_fields and not MATCHING_FIELDS.intersection(update_fields):
+        return
+    try:
+        enqueue_job_matching(instance.id)
+    except Exception as e:
+        logger.warning(f"Could not queue job matching for job {instance.id}: {e}")
 
 
 def handle_job_matching_results(task):
@@ -246,17 +230,10 @@ def send_notifications_for_matches(job, matches):
         job: The Job instance
         matches: List of match dictionaries with user_id and score
     """
-    # Only notify for high-scoring matches (above 0.7)
-    high_matches = [m for m in matches if m["score"] > 0.7]
+    from notifications.fanout import notify_job_matches
 
-    for match in high_matches:
-        try:
-            user = User.objects.get(id=match["user_id"])
-            send_job_match_notification(user, job, match["score"])
-        except User.DoesNotExist:
-            logger.warning(
-                f"User {match['user_id']} not found when sending match notification"
-            )
+    # Only high-scoring matches (above 0.7) are notified, in one bulk fan-out
+    notify_job_matches(job, matches)
 
 
 def send_job_match_notification(user, job, score):
@@ -274,6 +251,7 @@ def send_job_match_notification(user, job, score):
     # Create notification
     Notification.objects.create(
         user=user,
+        job=job,
         category=NotificationCategory.NEW_JOB_ALERT,
         message=f"🔍 We found a job that's {score_percent}% match for you: {job.title}",
     )
@@ -297,38 +275,16 @@ def send_job_match_notification(user, job, score):
 
 
 @receiver(post_save, sender=Job)
-def geocode_job_after_save(sender, instance, created, **kwargs):
-    """Geocode the job after it is saved to the database."""
-    if created and instance.location and not (instance.latitude and instance.longitude):
-        # Only geocode if the job was just created and has a location but no coordinates
-        try:
-            # Import here to avoid circular imports
-            from jobs.utils import get_address_coordinates_helper
-
-            # Get coordinates using the helper function
-            coords = get_address_coordinates_helper(instance.location)
-
-            if coords and coords.get("success"):
-                instance.latitude = coords["latitude"]
-                instance.longitude = coords["longitude"]
-                # Use update_fields to avoid triggering this signal again
-                instance.save(update_fields=["latitude", "longitude"])
-                logger.info(
-                    f"Job {instance.id} geocoded successfully: lat={instance.latitude}, lon={instance.longitude}"
-                )
-            else:
-                logger.warning(
-                    f"Geocoding failed for job {instance.id}: {coords.get('error', 'Unknown error')}"
-                )
-                # Fallback to synchronous geocoding
-                fallback_geocode_and_save(instance.id)
-        except Exception as e:
-            logger.error(f"Error geocoding job location: {e}")
-            # Fallback to synchronous geocoding
-            try:
-                fallback_geocode_and_save(instance.id)
-            except Exception as inner_e:
-                logger.error(f"Failed to geocode job: {inner_e}")
+def update_keyword_index_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keep the skill-matching keyword index in step with the job's title and description.
+    """
+    if update_fields and not {"title", "description"}.intersection(update_fields):
+        return
+    try:
+        index_job(instance)
+    except Exception as e:
+        logger.error(f"Error updating keyword index for job {instance.id}: {e}")
 
 
 # =
@@ -341,9 +297,9 @@ def invalidate_clientjobs_cache_on_save(sender, instance, created, **kwargs):
 
     This ensures that the client jobs endpoint always returns the most up-to-date data.
     """
-    if instance.client:
+    if instance.client_id:
         # Invalidate the specific client's jobs cache
-        client_id = instance.client.id
+        client_id = instance.client_id
         cache_pattern = f"clientjobs:u:{client_id}:*"
 
 
@@ -360,9 +316,9 @@ def invalidate_clientjobs_cache_on_delete(sender, instance, **kwargs):
 
     This ensures that the client jobs endpoint always returns the most up-to-date data.
     """
-    if instance.client:
+    if instance.client_id:
         # Invalidate the specific client's jobs cache
-        client_id = instance.client.id
+        client_id = instance.client_id
         cache_pattern = f"clientjobs:u:{client_id}:*"
 
 
@@ -376,6 +332,34 @@ def invalidate_clientjobs_cache_on_delete(sender, instance, **kwargs):
         logger.debug(f"Invalidated client jobs cache for client {client_id} after job deletion")
 
 
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_clientjobs_cache_on_application_change(sender, instance, **kwargs):
+    """
+    Invalidate the client's cached job lists, which carry applicant counts.
+
+    Job saves and deletes invalidate the same tag themselves (see Job.save).
+    """
+    client_id = instance.job.client_id if instance.job_id else None
+    if client_id:
+        transaction.on_commit(lambda: invalidate_cache_tag(client_jobs_cache_tag(client_id)))
+
+
+@receiver(post_save, sender=JobIndustry)
+@receiver(post_delete, sender=JobIndustry)
+@receiver(post_save, sender=JobSubCategory)
+@receiver(post_delete, sender=JobSubCategory)
+def invalidate_job_taxonomy_cache(sender, instance, **kwargs):
+    """
+    Invalidate the cached industry and subcategory listings.
+
+    Subcategory listings carry their industry's name, so both are dropped
+    together. delete_cached_data also evicts them from every process's L1 tier.
+    """
+    delete_cached_data(JOB_INDUSTRIES_CACHE_KEY)
+    delete_cached_data(JOB_SUBCATEGORIES_CACHE_KEY)
+
+
 # # =
 # # ✅ APPLICATION-RELATED SIGNALS
 # # =
@@ -1,10 +1,14 @@
 import logging
 
+from celery import shared_task
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.management import call_command
 from django.utils import timezone
 
 from .geocoding import geocode_address
+from . import geocoding_queue
+from .matching_queue import (match_queued_jobs, pending_count, pop_pending_jobs,
+                             requeue_jobs, schedule_drain)
 from .models import Job
 
 logger = logging.getLogger(__name__)
@@ -166,3 +170,100 @@ def reconcile_job_cache():
     except Exception as e:
         logger.error(f"Error reconciling job cache: {str(e)}")
         return {"success": False, "error": str(e)}
+
+
+@shared_task(
+    name="jobs.tasks.drain_job_matching_queue",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def drain_job_matching_queue(self):
+    """
+    Match the next batch of queued jobs to users.
+
+    Scheduled by ``jobs.matching_queue.enqueue_job_matching``. Reschedules
+    itself while jobs remain queued.
+    """
+    job_ids = pop_pending_jobs()
+    if not job_ids:
+        return {"status": "success", "matched_jobs": 0}
+
+    try:
+        counts = match_queued_jobs(job_ids)
+    except Exception as e:
+        logger.error(f"Error matching queued jobs {job_ids}: {str(e)}")
+        requeue_jobs(job_ids)
+        schedule_drain(countdown=self.default_retry_delay)
+        return {"status": "error", "message": str(e)}
+
+    if pending_count():
+        schedule_drain(countdown=0)
+    return {"status": "success", "matched_jobs": len(counts)}
+
+
+@shared_task(
+    name="jobs.tasks.match_jobs",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def match_jobs(self, job_ids):
+    """Match specific jobs to users without going through the queue."""
+    try:
+        counts = match_queued_jobs(job_ids)
+        return {"status": "success", "matched_jobs": len(counts)}
+    except Exception as e:
+        logger.error(f"Error matching jobs {job_ids}: {str(e)}")
+        self.retry(exc=e)
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task(
+    name="jobs.tasks.drain_job_geocoding_queue",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def drain_job_geocoding_queue(self):
+    """
+    Geocode the next batch of queued jobs.
+
+    Scheduled by ``jobs.geocoding_queue.enqueue_job_geocoding``. Reschedules
+    itself while jobs remain queued.
+    """
+    job_ids = geocoding_queue.pop_pending_jobs()
+    if not job_ids:
+        return {"status": "success", "geocoded_jobs": 0}
+
+    try:
+        counts = geocoding_queue.geocode_queued_jobs(job_ids)
+    except Exception as e:
+        logger.error(f"Error geocoding queued jobs {job_ids}: {str(e)}")
+        geocoding_queue.requeue_jobs(job_ids, countdown=self.default_retry_delay)
+        return {"status": "error", "message": str(e)}
+
+    if geocoding_queue.pending_count():
+        geocoding_queue.schedule_drain(countdown=0)
+    return {"status": "success", "geocoded_jobs": counts["geocoded"]}
+
+
+@shared_task(
+    name="jobs.tasks.geocode_jobs",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def geocode_jobs(self, job_ids):
+    """Geocode specific jobs without going through the queue."""
+    try:
+        counts = geocoding_queue.geocode_queued_jobs(job_ids)
+        return {"status": "success", "geocoded_jobs": counts["geocoded"]}
+    except Exception as e:
+        logger.error(f"Error geocoding jobs {job_ids}: {str(e)}")
+        self.retry(exc=e)
+        return {"status": "error", "message": str(e)}
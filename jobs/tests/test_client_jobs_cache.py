@@ -0,0 +1,68 @@
+"""
+Tests for the tagged cache of the /clientjobs/ listing.
+"""
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from fakeredis import FakeStrictRedis
+
+from core.redis import cache as redis_cache
+from core.redis import utils as redis_utils
+from core.redis.cache_tags import tag_members
+from jobs.client import get_client_jobs_by_id
+from jobs.models import Job, _invalidate_job_caches, client_jobs_cache_tag
+
+User = get_user_model()
+
+
+class ClientJobsCacheTestCase(TestCase):
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        patches = [
+            patch.object(redis_cache, "redis_client", self.redis),
+            patch.object(redis_cache, "CACHE_ENABLED", True),
+            patch.object(redis_utils, "redis_client", self.redis),
+            patch.object(redis_utils, "CACHE_ENABLED", True),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client_user = User.objects.create_user(
+            username="cached_client", email="cached_client@example.com", password="pass12345"
+        )
+        day = timezone.now().date() + timedelta(days=1)
+        with patch("jobs.models._queue_job_geocoding"):
+            self.job = Job.objects.create(
+                client=self.client_user, created_by=self.client_user, title="Cashier", location="Lagos",
+                start_date=day, end_date=day, shift_type="day", rate=Decimal("1500.00"),
+            )
+
+    def get_page(self):
+        request = RequestFactory().get(f"/jobs/clients/clientjobs/{self.client_user.id}")
+        request.user = AnonymousUser()
+        return get_client_jobs_by_id(request, self.client_user.id, page=1, page_size=50)
+
+    def test_pages_are_cached_under_the_client_tag(self):
+        first = json.loads(self.get_page().content)
+
+        with self.assertNumQueries(0):
+            second = json.loads(self.get_page().content)
+
+        self.assertEqual(first, second)
+        self.assertEqual(list(tag_members(client_jobs_cache_tag(self.client_user.id))), [
+            f"{client_jobs_cache_tag(self.client_user.id)}:page:1:size:50"
+        ])
+
+    def test_job_invalidation_drops_the_cached_pages(self):
+        self.get_page()
+
+        _invalidate_job_caches(self.job.id, {self.client_user.id})
+
+        self.assertEqual(self.redis.keys(f"{client_jobs_cache_tag(self.client_user.id)}:page:*"), [])
@@ -0,0 +1,66 @@
+"""
+Tests for the read-only hit path of jobs.geocoding_cache.
+"""
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from fakeredis import FakeStrictRedis
+
+from core.redis.local_cache import LocalCache
+from jobs import geocoding_cache
+from jobs.geocoding_cache import (GEOCODE_CACHE_HITS_KEY, GEOCODE_CACHE_INDEX_KEY, cache_coordinates,
+                                  flush_hit_counts, get_cache_key, get_cached_coordinates)
+
+
+class GeocodingCacheHitTests(SimpleTestCase):
+
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        patches = [
+            patch.object(geocoding_cache, "redis_client", self.redis),
+            patch.object(geocoding_cache, "_l1", LocalCache(max_entries=10, default_timeout=60)),
+            patch.object(geocoding_cache, "_last_eviction_check", float("inf")),
+            patch.object(geocoding_cache, "GEOCODE_HIT_FLUSH_INTERVAL", 3600),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        geocoding_cache._pending_hits.clear()
+        self.key = get_cache_key("12 Allen Avenue, Ikeja")
+        cache_coordinates("12 Allen Avenue, Ikeja", {
+            "success": True, "latitude": Decimal("6.6"), "longitude": Decimal("3.35"), "provider": "google",
+        })
+
+    def test_hits_do_not_rewrite_the_entry(self):
+        stored = self.redis.get(self.key)
+
+        with patch.object(self.redis, "setex") as setex, patch.object(self.redis, "set") as set_:
+            for _ in range(3):
+                result = get_cached_coordinates("12 allen avenue,  IKEJA")
+
+        setex.assert_not_called()
+        set_.assert_not_called()
+        self.assertEqual(result["latitude"], Decimal("6.6"))
+        self.assertEqual(self.redis.get(self.key), stored)
+
+    def test_l1_serves_hits_without_redis(self):
+        with patch.object(self.redis, "get") as get:
+            result = get_cached_coordinates("12 Allen Avenue, Ikeja")
+
+        get.assert_not_called()
+        self.assertEqual(result["provider"], "google")
+        result["latitude"] = None  # Callers get their own copy
+        self.assertEqual(get_cached_coordinates("12 Allen Avenue, Ikeja")["latitude"], Decimal("6.6"))
+
+    def test_hit_counts_are_flushed_in_batches(self):
+        for _ in range(4):
+            get_cached_coordinates("12 Allen Avenue, Ikeja")
+        self.redis.zadd(GEOCODE_CACHE_INDEX_KEY, {self.key: 0})
+        self.assertIsNone(self.redis.hget(GEOCODE_CACHE_HITS_KEY, self.key))
+
+        self.assertEqual(flush_hit_counts(force=True), 1)
+
+        self.assertEqual(self.redis.hget(GEOCODE_CACHE_HITS_KEY, self.key), "4")
+        self.assertGreater(self.redis.zscore(GEOCODE_CACHE_INDEX_KEY, self.key), 0)
+        self.assertEqual(flush_hit_counts(force=True), 0)
@@ -0,0 +1,137 @@
+"""
+Tests for the background job geocoding queue, provider rate limits and circuit breakers.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from fakeredis import FakeStrictRedis
+
+from jobs import geocoding
+from jobs.geocoding_cache import get_cache_key
+from jobs.geocoding_queue import INFLIGHT_PREFIX, PENDING_KEY, geocode_queued_jobs
+from jobs.models import Job
+
+User = get_user_model()
+
+
+def located(latitude, longitude, provider="google"):
+    return {"success": True, "latitude": Decimal(latitude), "longitude": Decimal(longitude), "provider": provider}
+
+
+def failed(error_type):
+    return {"success": False, "error": error_type, "error_type": error_type, "latitude": None, "longitude": None}
+
+
+class GeocodingTestMixin:
+    def setUp(self):
+        super().setUp()
+        for state in (geocoding._local_buckets, geocoding._local_failures, geocoding._local_open_until):
+            state.clear()
+        patches = [
+            patch.object(geocoding, "redis_client", None),  # In-process limiter and breaker
+            patch.object(geocoding, "GEOCODING_PROVIDERS", ["google", "nominatim"]),
+            patch.object(geocoding, "GEOCODING_RATE_LIMITS", {}),
+            patch("jobs.geocoding.get_cached_coordinates", return_value=None),
+            patch("jobs.geocoding.cache_coordinates"),
+            patch("jobs.geocoding.GeocodingMetrics"),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class ProviderLimitTests(GeocodingTestMixin, TestCase):
+
+    def test_token_bucket_limits_requests(self):
+        with patch.object(geocoding, "GEOCODING_RATE_LIMITS", {"nominatim": (1, 1)}):
+            self.assertTrue(geocoding.acquire_provider_token("nominatim", max_wait=0))
+            self.assertFalse(geocoding.acquire_provider_token("nominatim", max_wait=0))
+            self.assertTrue(geocoding.acquire_provider_token("google", max_wait=0))  # Unlimited
+
+    def test_circuit_opens_after_repeated_failures(self):
+        with patch("jobs.geocoding._geocode_google", return_value=failed("timeout")) as google, \
+                patch("jobs.geocoding._geocode_nominatim", return_value=located("6.5", "3.3", "nominatim")):
+            for _ in range(geocoding.GEOCODING_BREAKER_THRESHOLD):
+                self.assertTrue(geocoding.geocode_address("12 Allen Avenue, Ikeja")["success"])
+            self.assertTrue(geocoding.is_circuit_open("google"))
+
+            result = geocoding.geocode_address("3 Broad Street, Lagos")
+
+        self.assertEqual(google.call_count, geocoding.GEOCODING_BREAKER_THRESHOLD)
+        self.assertEqual(result["provider"], "nominatim")
+
+    def test_no_results_do_not_trip_the_breaker(self):
+        with patch("jobs.geocoding._geocode_google", return_value=failed("no_results")), \
+                patch("jobs.geocoding._geocode_nominatim", return_value=failed("no_results")):
+            for _ in range(geocoding.GEOCODING_BREAKER_THRESHOLD):
+                result = geocoding.geocode_address("Nowhere in particular")
+
+        self.assertFalse(geocoding.is_circuit_open("google"))
+        self.assertFalse(geocoding.is_transient_failure(result))
+
+
+@patch("jobs.matching_queue.enqueue_job_matching")
+@patch("jobs.models._invalidate_job_caches")
+class GeocodeQueuedJobsTests(GeocodingTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.redis = FakeStrictRedis(decode_responses=True)
+        patcher = patch("jobs.geocoding_queue.redis_client", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client_user = User.objects.create_user(
+            username="geo_client", email="geo_client@example.com", password="pass12345"
+        )
+
+    def make_job(self, location):
+        day = timezone.now().date() + timedelta(days=1)
+        return Job.objects.create(
+            client=self.client_user, created_by=self.client_user, title="Usher", location=location,
+            start_date=day, end_date=day, shift_type="day", rate=Decimal("1500.00"),
+        )
+
+    def test_identical_addresses_are_geocoded_once(self, invalidate, enqueue_matching):
+        jobs = [
+            self.make_job("12 Allen Avenue, Ikeja"),
+            self.make_job("  12 allen avenue,  IKEJA "),
+            self.make_job("3 Broad Street, Lagos"),
+        ]
+
+        results = {"allen": located("6.6", "3.35"), "broad": located("6.45", "3.39")}
+
+        def google_result(address):
+            return next(result for word, result in results.items() if word in address.lower())
+
+        with patch("jobs.geocoding._geocode_google", side_effect=google_result) as google:
+            counts = geocode_queued_jobs([job.id for job in jobs])
+
+        self.assertEqual(google.call_count, 2)
+        self.assertEqual(counts, {"geocoded": 3, "failed": 0, "requeued": 0})
+        first, second, third = Job.objects.filter(id__in=[job.id for job in jobs]).order_by("id")
+        self.assertEqual((first.latitude, second.latitude, third.latitude), (Decimal("6.6"), Decimal("6.6"), Decimal("6.45")))
+        self.assertTrue(first.geohash)
+        self.assertEqual(enqueue_matching.call_count, 3)
+
+    def test_transient_failures_are_requeued(self, invalidate, enqueue_matching):
+        job = self.make_job("12 Allen Avenue, Ikeja")
+        with patch("jobs.geocoding._geocode_google", return_value=failed("timeout")), \
+                patch("jobs.geocoding._geocode_nominatim", return_value=failed("service_unavailable")):
+            counts = geocode_queued_jobs([job.id])
+
+        self.assertEqual(counts["requeued"], 1)
+        self.assertEqual(self.redis.smembers(PENDING_KEY), {str(job.id)})
+
+    def test_addresses_in_flight_elsewhere_are_left_alone(self, invalidate, enqueue_matching):
+        job = self.make_job("12 Allen Avenue, Ikeja")
+        self.redis.set(f"{INFLIGHT_PREFIX}{get_cache_key(job.location)}", 1)
+
+        with patch("jobs.geocoding._geocode_google") as google:
+            counts = geocode_queued_jobs([job.id])
+
+        google.assert_not_called()
+        self.assertEqual(counts["requeued"], 1)
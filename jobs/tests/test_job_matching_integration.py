@@ -187,21 +187,21 @@ class TestJobMatchingIntegration:
             },
         ]
 
-        # Mock the notification creation
-        with patch("jobs.signals.Notification.objects.create") as mock_notify:
-            # Call the function directly
-            from jobs.signals import send_notifications_for_matches
+        from jobs.signals import send_notifications_for_matches
+        from notifications.models import Notification
 
-            send_notifications_for_matches(test_job, matches)
+        send_notifications_for_matches(test_job, matches)
 
-            # Check that notification was created only for the high-scoring match
-            assert mock_notify.call_count == 1
+        # Check that a notification was created only for the high-scoring match
+        alerts = Notification.objects.filter(
+            user__in=applicant_users, category="new_job_alert"
+        )
+        assert alerts.count() == 1
 
-            # Check the notification details
-            call_kwargs = mock_notify.call_args[1]
-            assert call_kwargs["user"] == applicant_users[0]
-            assert "85%" in call_kwargs["message"]
-            assert call_kwargs["category"] == "new_job_alert"
+        # Check the notification details
+        alert = alerts.get()
+        assert alert.user == applicant_users[0]
+        assert "85%" in alert.message
 
     def test_user_activity_affects_matching(self, test_job, applicant_users):
         """Test that user activity affects match scores"""
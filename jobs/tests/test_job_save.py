@@ -0,0 +1,92 @@
+"""
+Tests for the Job.save path: dirty-field tracking and side effects deferred to commit.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from jobs.models import Job, client_jobs_cache_tag
+
+User = get_user_model()
+
+
+@patch("jobs.models._queue_job_geocoding")
+class JobSaveTestCase(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            username="save_client", email="save_client@example.com", password="pass12345"
+        )
+        day = timezone.now().date() + timedelta(days=1)
+        with patch("jobs.models._queue_job_geocoding"):
+            job = Job.objects.create(
+                client=self.client_user, created_by=self.client_user, title="Cashier", location="Lagos",
+                start_date=day, end_date=day, shift_type="day", rate=Decimal("1500.00"),
+            )
+        self.job = Job.objects.get(pk=job.pk)
+
+    def test_loaded_job_tracks_dirty_fields(self, queue_geocoding):
+        self.assertEqual(self.job.get_dirty_fields(), set())
+        self.job.status = Job.Status.UPCOMING
+        self.assertEqual(self.job.get_dirty_fields(), {"status"})
+        self.assertIsNone(Job(title="Unsaved").get_dirty_fields())
+
+    def test_status_update_does_not_reread_the_row(self, queue_geocoding):
+        self.job.status = Job.Status.UPCOMING
+        with self.captureOnCommitCallbacks() as callbacks, CaptureQueriesContext(connection) as queries:
+            self.job.save(update_fields=["status"])
+
+        # Signal receivers do their own queries; the job row itself is only written
+        job_reads = [q["sql"] for q in queries if q["sql"].startswith("SELECT") and 'FROM "jobs_job"' in q["sql"]]
+        self.assertEqual(job_reads, [])
+        self.assertEqual(sum(q["sql"].startswith('UPDATE "jobs_job"') for q in queries), 1)
+
+        self.assertEqual(self.job.get_dirty_fields(), set())
+        with patch("jobs.models._invalidate_job_caches") as invalidate:
+            for callback in callbacks:
+                callback()
+        queue_geocoding.assert_not_called()
+        invalidate.assert_called_once_with(self.job.id, {self.client_user.id})
+
+    def test_payment_status_transition_is_checked_against_loaded_value(self, queue_geocoding):
+        self.job.payment_status = Job.PaymentStatus.REFUNDED
+        with self.assertNumQueries(0), self.assertRaises(ValidationError):
+            self.job.clean()
+
+        self.job.payment_status = Job.PaymentStatus.HELD
+        with self.assertNumQueries(0):
+            self.job.clean()
+
+    def test_location_change_queues_geocoding_on_commit(self, queue_geocoding):
+        self.job.location = "Abuja"
+        with patch("jobs.models._invalidate_job_caches"):
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.job.save()
+            queue_geocoding.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+        queue_geocoding.assert_called_once_with(self.job.id)
+
+    @patch("core.redis.utils.invalidate_cache_entries")
+    def test_client_change_invalidates_both_clients(self, invalidate, queue_geocoding):
+        other = User.objects.create_user(
+            username="save_other", email="save_other@example.com", password="pass12345"
+        )
+        self.job.client = other
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+
+        invalidate.assert_called_once()
+        kwargs = invalidate.call_args.kwargs
+        self.assertEqual(kwargs["keys"], [f"job:{self.job.id}", f"model:job:{self.job.id}"])
+        self.assertEqual(
+            set(kwargs["tags"]),
+            {client_jobs_cache_tag(self.client_user.id), client_jobs_cache_tag(other.id)},
+        )
@@ -0,0 +1,93 @@
+"""
+Tests for the page-level job serializer in jobs.utils.
+"""
+from datetime import time, timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import Profile, ProfilePicture
+from jobs.models import Application, Job
+from jobs.utils import serialize_job, serialize_jobs
+from rating.models import Review
+
+User = get_user_model()
+
+
+def make_user(username, role):
+    user = User.objects.create_user(
+        username=username, email=f"{username}@example.com", password="testpass123",
+        first_name=username.title(), last_name="Tester",
+    )
+    Profile.objects.update_or_create(user=user, defaults={"role": role})
+    return user
+
+
+def make_jobs(client, count):
+    today = timezone.now().date()
+    return [
+        Job.objects.create(
+            client=client,
+            created_by=client,
+            title=f"Serializer job {i}",
+            description="Evening shift",
+            location="Lagos",
+            latitude=Decimal("6.450000"),
+            longitude=Decimal("3.400000"),
+            start_date=today + timedelta(days=i),
+            end_date=today + timedelta(days=i),
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            shift_type="day",
+            rate=Decimal("1500.00"),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def serializer_data(db):
+    clients = [make_user("serclient1", "client"), make_user("serclient2", "client")]
+    applicants = [make_user(f"serapplicant{i}", "applicant") for i in range(3)]
+
+    ProfilePicture.objects.create(profile=clients[0].profile, image="profile_pics/old.png", is_active=True)
+    ProfilePicture.objects.create(profile=clients[0].profile, image="profile_pics/new.png", is_active=True)
+    ProfilePicture.objects.create(profile=clients[1].profile, image="profile_pics/off.png", is_active=False)
+
+    jobs = make_jobs(clients[0], 3) + make_jobs(clients[1], 2)
+    Review.objects.create(reviewer=applicants[0], reviewed=clients[0], job=jobs[0], rating=4)
+    Review.objects.create(reviewer=applicants[1], reviewed=clients[0], job=jobs[1], rating=5)
+
+    Application.objects.create(job=jobs[0], applicant=applicants[0], status=Application.Status.ACCEPTED)
+    Application.objects.create(job=jobs[0], applicant=applicants[1], status=Application.Status.PENDING)
+    Application.objects.create(job=jobs[1], applicant=applicants[0], status=Application.Status.WITHDRAWN)
+    Application.objects.create(job=jobs[3], applicant=applicants[2], status=Application.Status.PENDING)
+    return jobs, applicants
+
+
+@pytest.mark.django_db
+class TestSerializeJobs:
+
+    @pytest.mark.parametrize("include_extra", [True, False])
+    def test_matches_serialize_job(self, serializer_data, include_extra):
+        jobs, applicants = serializer_data
+        for user_id in (None, applicants[0].id, applicants[2].id):
+            queryset = Job.objects.filter(id__in=[job.id for job in jobs]).order_by("id")
+            expected = [
+                serialize_job(job, include_extra=include_extra, user_id=user_id) for job in queryset
+            ]
+            assert serialize_jobs(queryset, include_extra=include_extra, user_id=user_id) == expected
+
+    def test_query_count_is_independent_of_page_size(self, serializer_data):
+        jobs, applicants = serializer_data
+
+        with CaptureQueriesContext(connection) as small:
+            serialize_jobs(Job.objects.filter(id__in=[jobs[0].id]), user_id=applicants[0].id)
+        with CaptureQueriesContext(connection) as large:
+            serialize_jobs(Job.objects.all(), user_id=applicants[0].id)
+
+        assert len(large.captured_queries) == len(small.captured_queries)
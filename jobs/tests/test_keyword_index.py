@@ -0,0 +1,86 @@
+"""
+Tests for the job keyword index used by skill matching.
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from jobs.keyword_index import index_job, match_skill_counts, tokenize
+from jobs.matching import skills_match_score
+from jobs.models import Job, JobToken
+
+User = get_user_model()
+
+
+@pytest.fixture
+def index_client(db):
+    return User.objects.create_user(
+        username="indexclient", email="indexclient@example.com", password="testpass123"
+    )
+
+
+def make_job(client, title, description=""):
+    today = timezone.now().date()
+    job = Job.objects.bulk_create([Job(
+        client=client, created_by=client, title=title, description=description, location="Lagos",
+        start_date=today, end_date=today, shift_type="day", rate=Decimal("1000.00"),
+    )])[0]
+    index_job(job)
+    return job
+
+
+def indexed_tokens(job):
+    return set(JobToken.objects.filter(job=job).values_list("token__token", flat=True))
+
+
+def test_tokenize_lowercases_and_merges_fields():
+    assert tokenize("Senior PYTHON dev", "Django and python") == {"senior", "python", "dev", "django", "and"}
+    assert tokenize("Cleaner", None) == {"cleaner"}
+
+
+@pytest.mark.django_db
+class TestKeywordIndex:
+
+    def test_index_job_applies_only_the_difference(self, index_client):
+        job = make_job(index_client, "Event Waiter", "weekend shift")
+        assert indexed_tokens(job) == {"event", "waiter", "weekend", "shift"}
+
+        job.description = "night shift"
+        index_job(job)
+        assert indexed_tokens(job) == {"event", "waiter", "night", "shift"}
+
+    @pytest.mark.parametrize("skills", [
+        ["python"],            # exact word
+        ["pyth"],              # prefix of a word
+        ["thon"],              # substring of a word
+        ["waiters", "x"],      # word contained in the skill
+        ["event planning"],    # multi-word skill
+        ["python", "cleaner", "delivery"],
+    ])
+    def test_counts_match_nested_scan(self, index_client, skills):
+        jobs = [
+            make_job(index_client, "Python Developer", "backend python work"),
+            make_job(index_client, "Event Waiter", "catering for an event"),
+            make_job(index_client, "Office Cleaner", ""),
+            make_job(index_client, "Delivery Rider", "bike required"),
+        ]
+
+        hits = match_skill_counts(skills)
+
+        for job in jobs:
+            expected = skills_match_score(skills, job.title, job.description)
+            actual = 10.0 + (hits.get(job.id, 0) / len(skills)) * 90.0
+            assert actual == pytest.approx(min(100.0, expected))
+
+    def test_post_save_signal_reindexes_changed_text(self, index_client):
+        job = make_job(index_client, "Office Cleaner", "daily")
+
+        Job.objects.filter(pk=job.pk).update(title="Warehouse Packer")
+        job.refresh_from_db()
+        job.save(update_fields=["title"])
+
+        assert indexed_tokens(job) == {"warehouse", "packer", "daily"}
+        assert job.id in match_skill_counts(["pack"])
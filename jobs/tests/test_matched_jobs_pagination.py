@@ -0,0 +1,105 @@
+"""
+Tests for database-side pagination of /alljobsmatched.
+"""
+from datetime import time, timedelta
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.utils import timezone
+
+from accounts.models import Profile
+from jobs.api import (get_jobs_filtered_for_user, get_jobs_filtered_for_user_cursor,
+                      paid_jobs_matched_first, sort_jobs_recent_first)
+from jobs.models import Job
+from jobs.schemas import GetJobsRequestSchema
+
+User = get_user_model()
+
+
+@pytest.fixture
+def paid_jobs(db):
+    client = User.objects.create_user(
+        username="pageclient", email="pageclient@example.com", password="testpass123",
+    )
+    Profile.objects.update_or_create(user=client, defaults={"role": "client"})
+    today = timezone.now().date()
+    jobs = []
+    for i, offset in enumerate([0, -1, 3, -10, 0, 5, -3, 1, -1, 2, 0, -20]):
+        jobs.append(Job.objects.create(
+            client=client,
+            created_by=client,
+            title=f"Paged job {i}",
+            description="Shift",
+            location="Lagos",
+            latitude=Decimal("6.450000"),
+            longitude=Decimal("3.400000"),
+            start_date=today + timedelta(days=offset),
+            end_date=today + timedelta(days=offset),
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            shift_type="day",
+            rate=Decimal("1500.00"),
+        ))
+    Job.objects.filter(id__in=[job.id for job in jobs]).update(payment_status="paid")
+    return jobs
+
+
+def legacy_order(matched_ids):
+    """The ordering the endpoint used to build in Python."""
+    matched = sort_jobs_recent_first(Job.objects.filter(id__in=matched_ids, payment_status="paid"))
+    others = sort_jobs_recent_first(Job.objects.filter(payment_status="paid").exclude(id__in=matched_ids))
+    return [job.id for job in list(matched) + list(others)]
+
+
+@pytest.mark.django_db
+class TestMatchedJobsPagination:
+
+    def test_database_order_matches_legacy_order(self, paid_jobs):
+        matched = {paid_jobs[3].id, paid_jobs[7].id, paid_jobs[10].id}
+        for matched_ids in (set(), matched):
+            ordered = [job.id for job in paid_jobs_matched_first(matched_ids)]
+            assert ordered == legacy_order(matched_ids)
+
+    def test_page_and_cursor_walks_agree(self, paid_jobs):
+        request = RequestFactory().get("/alljobsmatched")
+        query = GetJobsRequestSchema(user_id=None)
+
+        paged = []
+        for page in range(1, 4):
+            response = get_jobs_filtered_for_user(request, query, page=page, page_size=5)
+            paged += [job["id"] for job in response["jobs"]]
+
+        walked = []
+        cursor = None
+        while True:
+            response = get_jobs_filtered_for_user_cursor(request, query, cursor=cursor, page_size=5)
+            walked += [job["id"] for job in response["jobs"]]
+            cursor = response["next_cursor"]
+            if not response["has_next"]:
+                break
+
+        assert paged == walked == legacy_order(set())
+
+    def test_matched_jobs_come_first(self, paid_jobs):
+        request = RequestFactory().get("/alljobsmatched")
+        user = User.objects.create_user(username="pageapplicant", email="pageapplicant@example.com", password="x")
+        matches = [{"job_id": paid_jobs[11].id}, {"job_id": paid_jobs[5].id}]
+
+        with mock.patch("jobs.matching.get_applicant_matches", return_value=matches):
+            response = get_jobs_filtered_for_user(
+                request, GetJobsRequestSchema(user_id=user.id), page=1, page_size=5
+            )
+
+        assert {job["id"] for job in response["jobs"][:2]} == {paid_jobs[11].id, paid_jobs[5].id}
+        assert response["pagination"]["matched_jobs_count"] == 2
+        assert response["pagination"]["other_jobs_count"] == len(paid_jobs) - 2
+
+    def test_invalid_cursor_is_rejected(self, paid_jobs):
+        request = RequestFactory().get("/alljobsmatched/cursor")
+        response = get_jobs_filtered_for_user_cursor(
+            request, GetJobsRequestSchema(user_id=None), cursor="not-a-cursor", page_size=5
+        )
+        assert response == {"status": "error", "message": "Invalid cursor"}
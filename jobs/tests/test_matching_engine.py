@@ -0,0 +1,98 @@
+"""
+Tests for the batched applicant matching engine in jobs.matching.
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import Profile
+from jobs.keyword_index import index_jobs
+from jobs.matching import (ApplicantMatchContext, calculate_match_score,
+                           get_applicant_matches, load_job_columns,
+                           score_jobs_for_applicant)
+from jobs.models import Application, Job
+
+User = get_user_model()
+
+
+def make_jobs(client, count, offset=0):
+    today = timezone.now().date()
+    titles = ["Python Developer", "Event Waiter", "Cleaner", "Delivery Rider"]
+    locations = ["Lagos", "Ikeja, Lagos", "Abuja", ""]
+    created = Job.objects.bulk_create([
+        Job(
+            client=client,
+            title=titles[i % len(titles)],
+            description="Busy weekend shift for a python and catering team" if i % 3 else "",
+            location=locations[i % len(locations)],
+            start_date=today + timedelta(days=i % 3),
+            end_date=today + timedelta(days=i % 3),
+            shift_type="day",
+            rate=Decimal("1500.00"),
+        )
+        for i in range(offset, offset + count)
+    ])
+    index_jobs(Job.objects.filter(id__in=[job.id for job in created]))
+
+
+@pytest.fixture
+def matching_users(db):
+    client = User.objects.create_user(
+        username="matchclient", email="matchclient@example.com", password="testpass123",
+        first_name="Ada", last_name="Client",
+    )
+    applicant = User.objects.create_user(
+        username="matchapplicant", email="matchapplicant@example.com", password="testpass123",
+    )
+    Profile.objects.update_or_create(
+        user=applicant,
+        defaults={"role": "applicant", "location": "Lagos", "skills": "python, waiter"},
+    )
+    return client, User.objects.select_related("profile").get(pk=applicant.pk)
+
+
+@pytest.mark.django_db
+class TestBatchedMatching:
+
+    def test_batched_scores_match_per_job_scores(self, matching_users):
+        client, applicant = matching_users
+        make_jobs(client, 12)
+        jobs = list(Job.objects.filter(is_active=True))
+        Application.objects.create(job=jobs[0], applicant=applicant, status="Pending")
+        Application.objects.create(job=jobs[5], applicant=applicant, status="Rejected")
+
+        context = ApplicantMatchContext.load(applicant)
+        columns = load_job_columns(Job.objects.filter(is_active=True))
+        batched = dict(zip(columns.ids, score_jobs_for_applicant(columns, context)))
+
+        for job in jobs:
+            assert batched[job.id] == pytest.approx(calculate_match_score(job, applicant))
+
+    def test_query_count_is_independent_of_job_count(self, matching_users):
+        client, applicant = matching_users
+        make_jobs(client, 5)
+        with CaptureQueriesContext(connection) as small:
+            get_applicant_matches(applicant.id, limit=50)
+
+        make_jobs(client, 50, offset=5)
+        with CaptureQueriesContext(connection) as large:
+            matches = get_applicant_matches(applicant.id, limit=50)
+
+        assert len(large.captured_queries) == len(small.captured_queries)
+        assert len(matches) == 50
+
+    def test_matches_are_sorted_and_shaped(self, matching_users):
+        client, applicant = matching_users
+        make_jobs(client, 8)
+
+        matches = get_applicant_matches(applicant.id, limit=3)
+
+        assert len(matches) == 3
+        assert [m["score"] for m in matches] == sorted((m["score"] for m in matches), reverse=True)
+        assert matches[0]["client_name"] == "Ada Client"
+        assert matches[0]["date"] == Job.objects.get(id=matches[0]["job_id"]).start_date.isoformat()
@@ -0,0 +1,156 @@
+"""
+Tests for the background job matching pipeline in jobs.matching_queue.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import Profile, UserActivityLog
+from jobs import matching_queue
+from jobs.job_matching_utils import calculate_match_score, score_job_for_users
+from jobs.models import Job
+from jobs.tasks import drain_job_matching_queue
+from rating.models import Review
+from userlocation.models import UserLocation
+
+fakeredis = pytest.importorskip("fakeredis")
+
+User = get_user_model()
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@pytest.fixture
+def queue_redis():
+    client = fakeredis.FakeStrictRedis(decode_responses=True)
+    with mock.patch.object(matching_queue, "redis_client", client):
+        yield client
+
+
+@pytest.fixture
+def local_cache(settings):
+    settings.CACHES = LOCMEM_CACHE
+    cache.clear()
+    yield cache
+
+
+def make_job(client, **kwargs):
+    today = timezone.now().date()
+    defaults = dict(
+        client=client,
+        created_by=client,
+        title="Event Waiter",
+        description="Serve guests at a busy evening event",
+        location="Lagos",
+        latitude=Decimal("6.450000"),
+        longitude=Decimal("3.400000"),
+        start_date=today + timedelta(days=1),
+        end_date=today + timedelta(days=1),
+        shift_type="day",
+        rate=Decimal("1500.00"),
+    )
+    defaults.update(kwargs)
+    return Job.objects.create(**defaults)
+
+
+def make_applicants(count, client):
+    reviewed_job = make_job(client, title="Reviewed shift")
+    applicants = []
+    locations = []
+    for i in range(count):
+        user = User.objects.create_user(
+            username=f"pipeline_applicant_{i}", email=f"pipeline_applicant_{i}@example.com",
+            password="testpass123",
+        )
+        Profile.objects.update_or_create(user=user, defaults={"role": "applicant"})
+        # bulk_create skips the reverse geocoding done in UserLocation.save
+        locations.append(UserLocation(user=user, latitude=6.45 + i * 0.05, longitude=3.40))
+        if i % 2:
+            UserActivityLog.objects.create(user=user, activity_type="login")
+            UserActivityLog.objects.create(user=user, activity_type="job_application")
+        if i % 3 == 0:
+            Review.objects.create(reviewer=client, reviewed=user, job=reviewed_job, rating=4)
+        applicants.append(user)
+    UserLocation.objects.bulk_create(locations)
+    return applicants
+
+
+@pytest.fixture
+def pipeline_client(db):
+    client = User.objects.create_user(
+        username="pipelineclient", email="pipelineclient@example.com", password="testpass123",
+    )
+    Profile.objects.update_or_create(user=client, defaults={"role": "client"})
+    return client
+
+
+@pytest.mark.django_db
+class TestMatchingPipeline:
+
+    def test_batched_scores_match_per_user_scores(self, pipeline_client, queue_redis, local_cache):
+        applicants = make_applicants(6, pipeline_client)
+        job = make_job(pipeline_client)
+        completed = make_job(pipeline_client, title="Old shift")
+        Job.objects.filter(pk=completed.pk).update(
+            status=Job.Status.COMPLETED, selected_applicant=applicants[1]
+        )
+        job.refresh_from_db()
+
+        batched = {m["user_id"]: m["score"] for m in score_job_for_users(job, applicants)}
+        for user in applicants:
+            assert batched[user.id] == pytest.approx(calculate_match_score(job, user))
+
+    def test_batched_query_count_is_independent_of_user_count(self, pipeline_client, queue_redis, local_cache):
+        applicants = make_applicants(8, pipeline_client)
+        job = make_job(pipeline_client)
+
+        with CaptureQueriesContext(connection) as small:
+            score_job_for_users(job, applicants[:2])
+        cache.clear()
+        with CaptureQueriesContext(connection) as large:
+            score_job_for_users(job, applicants)
+
+        assert len(large.captured_queries) == len(small.captured_queries)
+
+    def test_saving_a_job_only_enqueues_it(self, pipeline_client, queue_redis, django_capture_on_commit_callbacks):
+        with mock.patch.object(matching_queue, "score_job_for_users") as scorer:
+            with django_capture_on_commit_callbacks() as callbacks:
+                job = make_job(pipeline_client)
+                job.title = "Senior Event Waiter"
+                job.save()
+                job.save(update_fields=["description"])
+
+        scorer.assert_not_called()
+        assert queue_redis.smembers(matching_queue.PENDING_KEY) == {str(job.id)}
+        # Nothing is marked until the commit
+        assert queue_redis.get(matching_queue.SCHEDULED_KEY) is None
+
+        # Three saves, a single drain task (other apps hook the commit too)
+        drains = [callback for callback in callbacks if "schedule_drain" in callback.__qualname__]
+        with mock.patch.object(drain_job_matching_queue, "apply_async") as apply_async:
+            for callback in drains:
+                callback()
+        apply_async.assert_called_once()
+        assert queue_redis.get(matching_queue.SCHEDULED_KEY) == "1"
+
+    def test_drain_caches_matches(self, pipeline_client, queue_redis, local_cache):
+        applicants = make_applicants(5, pipeline_client)
+        jobs = [make_job(pipeline_client), make_job(pipeline_client, title="Usher")]
+
+        with mock.patch.object(matching_queue, "USER_CHUNK_SIZE", 2):
+            result = drain_job_matching_queue.apply().get()
+
+        assert result["matched_jobs"] == 3
+        assert matching_queue.pending_count() == 0
+        for job in jobs:
+            matches = cache.get(f"job_matches:{job.id}")
+            user_ids = {m["user_id"] for m in matches}
+            assert {user.id for user in applicants} <= user_ids
+            assert [m["score"] for m in matches] == sorted((m["score"] for m in matches), reverse=True)
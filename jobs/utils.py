@@ -6,7 +6,7 @@ import logging
 import os
 import uuid
 from datetime import date, datetime, time, timedelta
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from math import atan2, cos, radians, sin, sqrt
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -34,7 +34,7 @@ from django.contrib.sessions.models import Session
 from django.core.mail import send_mail
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db import IntegrityError
-from django.db.models import Avg, Count, F, Max, Q, Sum
+from django.db.models import Avg, Count, F, Max, Q, Sum, prefetch_related_objects
 from django.http import HttpRequest, JsonResponse
 from django.middleware.csrf import CsrfViewMiddleware
 from django.shortcuts import get_object_or_404, redirect, render
@@ -155,7 +155,107 @@ def get_related_object(model, field, value):
             status=400,
         )
 
-def serialize_job(job, include_extra: bool = True, user_id: int = None) -> dict:
+
+class JobListContext:
+    """
+    Per-page data ``serialize_job`` would otherwise query job by job.
+
+    Built once for a page of jobs by ``serialize_jobs``: application
+    aggregates, the viewing user's application status, client ratings and
+    active profile pictures, each gathered with a single query.
+    """
+
+    def __init__(self, applications, user_applications, client_ratings, profile_pic_urls):
+        self.applications = applications  # {job_id: [(applicant_id, status), ...]}
+        self.user_applications = user_applications  # {job_id: status}
+        self.client_ratings = client_ratings  # {client_id: rating}
+        self.profile_pic_urls = profile_pic_urls  # {profile_id: url}
+
+    @classmethod
+    def load(cls, jobs, user_id: int = None) -> "JobListContext":
+        from accounts.models import ProfilePicture
+        from jobs.models import Application
+
+        job_ids = [job.id for job in jobs]
+
+        applications = {job_id: [] for job_id in job_ids}
+        user_applications = {}
+        # Same ordering as job.applications (Application.Meta.ordering)
+        rows = (
+            Application.objects.filter(job_id__in=job_ids)
+            .order_by("-created_at")
+            .values_list("job_id", "applicant_id", "status")
+        )
+        for job_id, applicant_id, status in rows:
+            applications[job_id].append((applicant_id, status))
+            if (
+                user_id is not None
+                and applicant_id == user_id
+                and status != Application.Status.WITHDRAWN
+                and job_id not in user_applications
+            ):
+                user_applications[job_id] = status
+
+        profiles = {}
+        for job in jobs:
+            if job.client and hasattr(job.client, "profile"):
+                profiles[job.client.id] = job.client.profile
+
+        client_ratings = {}
+        if profiles:
+            averages = dict(
+                Review.objects.filter(reviewed_id__in=list(profiles))
+                .values("reviewed_id")
+                .annotate(avg=Avg("rating"))
+                .order_by()
+                .values_list("reviewed_id", "avg")
+            )
+            for client_id, profile in profiles.items():
+                client_ratings[client_id] = _profile_rating(profile, averages.get(client_id))
+
+        profile_pic_urls = {}
+        pictures = (
+            ProfilePicture.objects.filter(
+                profile_id__in=[profile.id for profile in profiles.values()], is_active=True
+            )
+            .order_by("-uploaded_at")
+        )
+        for picture in pictures:
+            profile_pic_urls.setdefault(picture.profile_id, picture.url)
+
+        return cls(applications, user_applications, client_ratings, profile_pic_urls)
+
+
+def _profile_rating(profile, average) -> float:
+    """``Profile.rating`` computed from an already aggregated review average."""
+    if average is not None:
+        avg_rating = Decimal(str(average)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        if avg_rating > 0:
+            return float(avg_rating)
+    return float(profile.manual_rating) if profile.manual_rating else 0.0
+
+
+def serialize_jobs(jobs, include_extra: bool = True, user_id: int = None) -> List[dict]:
+    """
+    Serialize a page of jobs with a constant number of queries.
+
+    Produces exactly what ``serialize_job`` returns for each job, but loads the
+    per-job lookups for the whole page at once via ``JobListContext``.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    prefetch_related_objects(jobs, "client__profile", "industry", "subcategory")
+    context = JobListContext.load(jobs, user_id=user_id)
+    return [
+        serialize_job(job, include_extra=include_extra, user_id=user_id, context=context)
+        for job in jobs
+    ]
+
+
+def serialize_job(
+    job, include_extra: bool = True, user_id: int = None, context: JobListContext = None
+) -> dict:
     from jobs.models import Application
     now = date.today()
     job_start_date = job.start_date
@@ -179,8 +279,19 @@ def serialize_job(job, include_extra: bool = True, user_id: int = None) -> dict:
     has_applied = False
     application_status = None
 
+    if context is not None:
+        job_applications = context.applications.get(job.id, [])
+        applicants_count = len(job_applications)
+        applicants_user_ids = [applicant_id for applicant_id, _ in job_applications]
+        accepted_applicants_count = sum(
+            1 for _, status in job_applications if status == Application.Status.ACCEPTED
+        )
+        if job.id in context.user_applications:
+            has_applied = True
+            application_status = context.user_applications[job.id]
+
     try:
-        if hasattr(job, "applications"):
+        if context is None and hasattr(job, "applications"):
             applicants_count = job.applications.count()
             applicants_user_ids = list(job.applications.values_list("applicant_id", flat=True))
             accepted_applicants_count = job.applications.filter(status=Application.Status.ACCEPTED).count()
@@ -191,7 +302,7 @@ def serialize_job(job, include_extra: bool = True, user_id: int = None) -> dict:
 
     # Determine if the user has applied and get application status
     try:
-        if user_id is not None:
+        if context is None and user_id is not None:
             application = Application.objects.filter(job=job, applicant_id=user_id).exclude(status=Application.Status.WITHDRAWN).first()
             if application:
                 has_applied = True
@@ -203,7 +314,9 @@ def serialize_job(job, include_extra: bool = True, user_id: int = None) -> dict:
 
     # Get client rating safely
     client_rating = None
-    if job.client and hasattr(job.client, "profile"):
+    if context is not None and job.client and job.client.id in context.client_ratings:
+        client_rating = context.client_ratings[job.client.id]
+    elif job.client and hasattr(job.client, "profile"):
         try:
             client_rating = job.client.profile.rating
         except Exception as e:
@@ -258,7 +371,9 @@ def serialize_job(job, include_extra: bool = True, user_id: int = None) -> dict:
         "application_status": application_status,
     }
 
-    if job.client and hasattr(job.client, "profile"):
+    if context is not None and job.client and hasattr(job.client, "profile"):
+        data["client_profile_pic_url"] = context.profile_pic_urls.get(job.client.profile.id)
+    elif job.client and hasattr(job.client, "profile"):
         try:
             profile = job.client.profile
             active_pic = profile.pictures.filter(is_active=True).first()
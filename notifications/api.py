@@ -1,3 +1,5 @@
+import logging
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
@@ -8,6 +10,10 @@ from django.shortcuts import get_object_or_404
 from ninja import Router
 from ninja.errors import HttpError
 
+from core.db_router import use_read_replica
+from core.pagination import COUNT_EXACT, InvalidCursor, paginate_by_cursor
+from core.redis.cache_tags import SCAN_COUNT
+from core.single_flight import get_or_compute
 from jobs.models import *
 from .models import *
 from .schemas import (
@@ -18,6 +24,7 @@ from .schemas import (
     SinglePreferenceUpdateSchema
 )
 
+logger = logging.getLogger(__name__)
 User = get_user_model()
 notifications_router = Router(tags=["Notifications"])
 
@@ -72,8 +79,27 @@ def get_authenticated_user(request):
     return get_object_or_404(User, id=user_id)
 
 
+def serialize_notification(n):
+    """Response item for one notification, with the job it is about (load with select_related("job"))."""
+    notification_item = {
+        "id": n.id,
+        "message": n.message,
+        "category": n.category,
+        "is_read": n.is_read,
+        "created_at": n.created_at.isoformat(),
+        "payload": n.metadata or {},
+    }
+
+    if n.job is not None:
+        notification_item["job_id"] = n.job_id
+        notification_item["job_title"] = n.job.title
+
+    return notification_item
+
+
 # ✅ Get All Notifications
 @notifications_router.get("/{user_id}/")
+@use_read_replica
 def get_notifications(request, user_id: int):
     """
     Retrieve notifications for a specific user with optional filtering.
@@ -86,8 +112,9 @@ def get_notifications(request, user_id: int):
         category: Filter by notification category
         limit: Maximum number of results to return (default: 50)
         page: Page number for pagination (default: 1)
+        cursor: Keyset cursor; pass it empty for the first page and then the
+            returned next_cursor. Takes precedence over page.
     """
-    from django.core.cache import cache
     import logging
     logger = logging.getLogger(__name__)
 
@@ -104,102 +131,78 @@ def get_notifications(request, user_id: int):
     category = request.GET.get('category')
     limit = int(request.GET.get('limit', 50))
     page = int(request.GET.get('page', 1))
+    cursor = request.GET.get('cursor')
 
     # Calculate offset for pagination
     offset = (page - 1) * limit
 
     # Build cache key
     cache_key = f"notifications:list:{user.id}:{is_read_param or 'all'}:{category or 'all'}:{page}:{limit}"
+    if cursor is not None:
+        cache_key = f"notifications:list:{user.id}:{is_read_param or 'all'}:{category or 'all'}:cursor:{cursor}:{limit}"
+
+    def build_response_data():
+        # Build query
+        query = Q(user=user)
+
+        if is_read_param is not None:
+            is_read = is_read_param.lower() == 'true'
+            query &= Q(is_read=is_read)
+
+        if category:
+            query &= Q(category=category)
+
+        if cursor is not None:
+            cursor_page = paginate_by_cursor(
+                Notification.objects.filter(query).select_related("job"), cursor, limit, count=COUNT_EXACT
+            )
+            return {
+                "status": "success",
+                "message": "Notifications retrieved successfully",
+                "data": {
+                    **cursor_page.metadata(),
+                    "notifications": [serialize_notification(n) for n in cursor_page.items],
+                }
+            }
+
+        # Get total count for pagination
+        total_count = Notification.objects.filter(query).count()
+
+        # Calculate pagination info
+        total_pages = (total_count + limit - 1) // limit  # Ceiling division
+        has_next = page < total_pages
+        has_previous = page > 1
+
+        # Execute query with pagination
+        notifications = (
+            Notification.objects.filter(query).select_related("job").order_by("-created_at")[offset:offset + limit]
+        )
 
-    # Try to get from cache
-    cached_data = cache.get(cache_key)
-    if cached_data:
-        return JsonResponse(cached_data)
-
-    # Build query
-    query = Q(user=user)
-
-    if is_read_param is not None:
-        is_read = is_read_param.lower() == 'true'
-        query &= Q(is_read=is_read)
-
-    if category:
-        query &= Q(category=category)
-
-    # Get total count for pagination
-    total_count = Notification.objects.filter(query).count()
-
-    # Calculate pagination info
-    total_pages = (total_count + limit - 1) // limit  # Ceiling division
-    has_next = page < total_pages
-    has_previous = page > 1
-
-    # Execute query with pagination
-    notifications = Notification.objects.filter(query).order_by("-created_at")[offset:offset + limit]
-
-    # Format response
-    notification_data = []
-    for n in notifications:
-        notification_item = {
-            "id": n.id,
-            "message": n.message,
-            "category": n.category,
-            "is_read": n.is_read,
-            "created_at": n.created_at.isoformat(),
-        }
-
-        # Check if this notification is related to a job
-        if n.category in [NotificationCategory.NEW_JOB_ALERT,
-                         NotificationCategory.JOB_REMINDER,
-                         NotificationCategory.JOB_ACCEPTANCE]:
-
-            # First, try to extract job information from the message using regex
-            import re
-            job_title_match = re.search(r"'([^']*)'", n.message)
-
-            if job_title_match:
-                # Try to find the job by title
-                job_title = job_title_match.group(1)
-                try:
-                    # Find the job that matches this title
-                    job = Job.objects.filter(title=job_title).first()
-                    if job:
-                        notification_item["job_id"] = job.id
-                        notification_item["job_title"] = job.title
-                except Exception as e:
-                    logger.error(f"Error finding job for notification {n.id}: {str(e)}")
-
-            # If we couldn't find a job by title, try to find the most recent job for this user
-            # This is a fallback mechanism
-            if "job_id" not in notification_item:
-                try:
-                    # Find the most recent job for this user
-                    recent_job = Job.objects.filter(client=n.user).order_by('-created_at').first()
-                    if recent_job:
-                        notification_item["job_id"] = recent_job.id
-                        notification_item["job_title"] = recent_job.title
-                except Exception as e:
-                    logger.error(f"Error finding recent job for notification {n.id}: {str(e)}")
-
-        notification_data.append(notification_item)
-
-    response_data = {
-        "status": "success",
-        "message": "Notifications retrieved successfully",
-        "data": {
-            "total_count": total_count,
-            "total_pages": total_pages,
-            "current_page": page,
-            "has_next": has_next,
-            "has_previous": has_previous,
-            "next_page": page + 1 if has_next else None,
-            "previous_page": page - 1 if has_previous else None,
-            "notifications": notification_data,
+        # Format response
+        notification_data = [serialize_notification(n) for n in notifications]
+
+        response_data = {
+            "status": "success",
+            "message": "Notifications retrieved successfully",
+            "data": {
+                "total_count": total_count,
+                "total_pages": total_pages,
+                "current_page": page,
+                "has_next": has_next,
+                "has_previous": has_previous,
+                "next_page": page + 1 if has_next else None,
+                "previous_page": page - 1 if has_previous else None,
+                "notifications": notification_data,
+            }
         }
-    }
+        return response_data
 
-    # Cache the response for 5 minutes
-    cache.set(cache_key, response_data, timeout=60 * 5)
+    # Cached for 5 minutes; when the entry expires one request rebuilds it
+    # while concurrent ones get the previous page
+    try:
+        response_data = get_or_compute(cache_key, build_response_data, 60 * 5)
+    except InvalidCursor:
+        return JsonResponse({"error": "Invalid cursor"}, status=400)
 
     return JsonResponse(response_data)
 
@@ -312,9 +315,8 @@ def mark_notification_as_read(request, user_id: int, notification_id: int):
     # Also invalidate the notifications list cache
     try:
         list_cache_key = f"notifications:list:{user.id}:*"
-        for key in cache.keys(list_cache_key):
-            cache.delete(key)
-            logger.debug(f"Invalidated cache key: {key}")
+        deleted = cache.delete_pattern(list_cache_key, itersize=SCAN_COUNT)
+        logger.debug(f"Invalidated {deleted} cache keys matching {list_cache_key}")
     except Exception as e:
         logger.error(f"Error invalidating list cache: {str(e)}")
 
@@ -0,0 +1,229 @@
+"""
+Bulk notification fan-out.
+
+Sending one notification to many users used to cost a user lookup, an
+INSERT and a blocking ``group_send`` per recipient. ``fan_out`` does the
+same work in batches:
+
+1. Recipients are loaded with a single query (or passed in already loaded).
+2. Notifications are inserted with ``bulk_create``, FANOUT_BATCH_SIZE rows
+   per statement.
+3. The websocket events of a batch are sent from one event loop, with up to
+   FANOUT_SEND_CONCURRENCY ``group_send`` calls in flight at a time, instead
+   of one ``async_to_sync`` round trip per user.
+
+Fan-outs are started from signals, so they run in Celery tasks
+(``notifications.tasks``) rather than on the request thread.
+
+Usage:
+    from notifications.fanout import fan_out
+    fan_out(users, lambda user: f"Hi {user.get_full_name()}!", category="job_nearby")
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+from core.spatial_index import nearby
+from notifications.models import Notification, NotificationCategory
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# Constants
+FANOUT_BATCH_SIZE = getattr(settings, 'FANOUT_BATCH_SIZE', 1000)
+FANOUT_SEND_CONCURRENCY = getattr(settings, 'FANOUT_SEND_CONCURRENCY', 100)
+NEARBY_JOB_ALERT_RADIUS_KM = getattr(settings, 'NEARBY_JOB_ALERT_RADIUS_KM', 10)  # 10 km
+MATCH_NOTIFY_THRESHOLD = 0.7
+
+RECIPIENT_FIELDS = ("id", "username", "first_name", "last_name")
+
+
+def _send_events(events: List[Tuple[str, dict]]) -> int:
+    """Send (group, event) pairs over the channel layer from one event loop."""
+    channel_layer = get_channel_layer()
+    if channel_layer is None or not events:
+        return 0
+
+    async def send_all():
+        semaphore = asyncio.Semaphore(FANOUT_SEND_CONCURRENCY)
+
+        async def send(group, event):
+            async with semaphore:
+                try:
+                    await channel_layer.group_send(group, event)
+                    return True
+                except Exception as e:
+                    logger.error(f"Error sending websocket event to {group}: {str(e)}")
+                    return False
+
+        results = await asyncio.gather(*(send(group, event) for group, event in events))
+        return sum(results)
+
+    return async_to_sync(send_all)()
+
+
+def fan_out(
+    recipients: Iterable,
+    build_message: Callable[[object], str],
+    category: str,
+    title: Optional[str] = None,
+    importance: Optional[str] = None,
+    job=None,
+    group_prefix: str = "user_job_notifications_",
+    build_event: Optional[Callable[[object, Notification], dict]] = None,
+    batch_size: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Create a notification for every recipient and push it over websockets.
+
+    Args:
+        recipients: Users (only RECIPIENT_FIELDS need to be loaded)
+        build_message: Returns the message text for a recipient
+        category: Notification category
+        title: Notification title
+        importance: Stored as metadata["importance"] when given
+        job: Job (or job id) the notifications are about. Users who already
+            have a notification of this category for the job are skipped, so
+            a retried fan-out does not notify anyone twice
+        group_prefix: Websocket group is group_prefix + user id
+        build_event: Returns the websocket event for (recipient, notification);
+            defaults to the "job_notification" event of
+            send_job_websocket_notification
+        batch_size: Rows per bulk insert (FANOUT_BATCH_SIZE by default)
+
+    Returns:
+        Counts of notifications "created" and websocket events "sent"
+    """
+    batch_size = batch_size or FANOUT_BATCH_SIZE
+    metadata = {"importance": importance} if importance else None
+    job_id = getattr(job, "pk", job)
+    build_event = build_event or _job_notification_event
+    counts = {"created": 0, "sent": 0}
+
+    batch = []
+    for recipient in recipients:
+        batch.append(recipient)
+        if len(batch) >= batch_size:
+            _fan_out_batch(batch, build_message, category, title, metadata, job_id, group_prefix, build_event, counts)
+            batch = []
+    if batch:
+        _fan_out_batch(batch, build_message, category, title, metadata, job_id, group_prefix, build_event, counts)
+
+    logger.info(f"Fanned out {counts['created']} {category} notifications ({counts['sent']} websocket events)")
+    return counts
+
+
+def _fan_out_batch(recipients, build_message, category, title, metadata, job_id, group_prefix, build_event, counts):
+    if job_id is not None:
+        # A retried fan-out skips the recipients an earlier attempt already notified
+        notified = set(
+            Notification.objects.filter(
+                job_id=job_id, category=category, user_id__in=[recipient.id for recipient in recipients]
+            ).values_list("user_id", flat=True)
+        )
+        if notified:
+            recipients = [recipient for recipient in recipients if recipient.id not in notified]
+            if not recipients:
+                return
+    notifications = Notification.objects.bulk_create([
+        Notification(
+            user_id=recipient.id,
+            message=build_message(recipient),
+            title=title,
+            category=category,
+            metadata=metadata,
+            job_id=job_id,
+        )
+        for recipient in recipients
+    ])
+    counts["created"] += len(notifications)
+    counts["sent"] += _send_events([
+        (f"{group_prefix}{recipient.id}", build_event(recipient, notification))
+        for recipient, notification in zip(recipients, notifications)
+    ])
+
+
+def _job_notification_event(recipient, notification: Notification) -> dict:
+    return {
+        "type": "job_notification",
+        "id": notification.id,
+        "title": notification.title or "",
+        "message": notification.message,
+        "category": notification.category,
+        "created_at": str(notification.created_at),
+        "metadata": notification.metadata,
+    }
+
+
+def notify_nearby_applicants(job) -> Dict[str, int]:
+    """
+    Alert applicants whose latest location is near a newly posted job.
+
+    Recipients come from one spatial index query on UserLocation.
+    """
+    from userlocation.models import UserLocation
+
+    coordinates = job.location_coordinates
+    if not coordinates:
+        return {"created": 0, "sent": 0}
+
+    locations = (
+        UserLocation.objects.filter(user__is_active=True, user__profile__role="applicant")
+        .exclude(user_id=job.client_id)
+        .select_related("user")
+        .only("latitude", "longitude", "geohash", "user", *(f"user__{field}" for field in RECIPIENT_FIELDS))
+    )
+    recipients = [location.user for location, _ in nearby(locations, *coordinates, NEARBY_JOB_ALERT_RADIUS_KM)]
+
+    return fan_out(
+        recipients,
+        lambda user: f"Check out '{job.title}', a new job in your area, {user.get_full_name()}!",
+        category="job_nearby",
+        title="[LOCATION] New Job Opportunity Nearby!",
+        importance="medium",
+        job=job,
+    )
+
+
+def notify_job_matches(job, matches: List[dict]) -> Dict[str, int]:
+    """
+    Alert users who are a high match (score above MATCH_NOTIFY_THRESHOLD) for a job.
+
+    Args:
+        job: The Job instance
+        matches: Match dictionaries with user_id and score
+    """
+    scores = {m["user_id"]: m["score"] for m in matches if m["score"] > MATCH_NOTIFY_THRESHOLD}
+    if not scores:
+        return {"created": 0, "sent": 0}
+
+    recipients = User.objects.filter(id__in=list(scores)).only(*RECIPIENT_FIELDS)
+    missing = len(scores) - len(recipients)
+    if missing:
+        logger.warning(f"{missing} matched users not found when notifying matches for job {job.id}")
+
+    def message(user):
+        return f"🔍 We found a job that's {int(scores[user.id] * 100)}% match for you: {job.title}"
+
+    def event(user, notification):
+        return {
+            "type": "job_match_notification",
+            "message": f"We found a job that's {int(scores[user.id] * 100)}% match for you: {job.title}",
+            "job_id": job.id,
+            "match_score": scores[user.id],
+        }
+
+    return fan_out(
+        recipients,
+        message,
+        category=NotificationCategory.NEW_JOB_ALERT,
+        job=job,
+        group_prefix="user_",
+        build_event=event,
+    )
@@ -0,0 +1,95 @@
+"""
+Management command to link existing notifications to the job they are about.
+
+Notifications now carry a job reference set when they are created. Older
+rows only mention the job title in quotes inside the message, so this
+command recovers the reference from it:
+
+1. Jobs the recipient posted or applied to are checked first; the
+   notification is linked when exactly one of their titles appears quoted
+   in the message.
+2. Otherwise every quoted string is looked up as a job title, and the
+   notification is linked when exactly one job has such a title.
+
+Ambiguous notifications are left unlinked rather than guessed.
+"""
+
+import logging
+import re
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from jobs.models import Application, Job
+from notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+QUOTED = re.compile(r"'([^']+)'")
+
+
+class Command(BaseCommand):
+    help = 'Link notifications without a job reference to the job named in their message'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch_size', type=int, default=500, help='Notifications processed per batch')
+        parser.add_argument('--dry_run', action='store_true', help='Report what would be linked without saving')
+
+    def handle(self, *args, **options):
+        linked = 0
+        seen = 0
+        last_id = 0
+
+        while True:
+            batch = list(
+                Notification.objects.filter(job__isnull=True, id__gt=last_id)
+                .order_by('id')
+                .only('id', 'user_id', 'message')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+            seen += len(batch)
+
+            resolved = self.resolve(batch)
+            if resolved and not options['dry_run']:
+                Notification.objects.bulk_update(resolved, ['job'])
+            linked += len(resolved)
+
+        verb = 'Would link' if options['dry_run'] else 'Linked'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {linked} of {seen} notifications to a job'))
+
+    def resolve(self, notifications):
+        """Set job_id on the notifications that can be linked and return them."""
+        user_ids = {n.user_id for n in notifications}
+        user_jobs = defaultdict(set)
+        for job_id, title, client_id in Job.objects.filter(client_id__in=user_ids).values_list('id', 'title', 'client_id'):
+            user_jobs[client_id].add((job_id, title))
+        for job_id, title, applicant_id in (
+            Application.objects.filter(applicant_id__in=user_ids).values_list('job_id', 'job__title', 'applicant_id')
+        ):
+            user_jobs[applicant_id].add((job_id, title))
+
+        resolved = []
+        unmatched = []
+        for n in notifications:
+            matches = {job_id for job_id, title in user_jobs[n.user_id] if title and f"'{title}'" in n.message}
+            if len(matches) == 1:
+                n.job_id = matches.pop()
+                resolved.append(n)
+            elif not matches:
+                unmatched.append(n)
+
+        titles = {title for n in unmatched for title in QUOTED.findall(n.message)}
+        jobs_by_title = defaultdict(set)
+        for job_id, title in Job.objects.filter(title__in=titles).values_list('id', 'title'):
+            jobs_by_title[title].add(job_id)
+
+        for n in unmatched:
+            candidates = set()
+            for title in QUOTED.findall(n.message):
+                candidates |= jobs_by_title.get(title, set())
+            if len(candidates) == 1:
+                n.job_id = candidates.pop()
+                resolved.append(n)
+        return resolved
@@ -0,0 +1,97 @@
+"""
+Benchmark a job alert fanned out to many recipients.
+
+Temporary users are created, then the same alert is sent with the old
+per-recipient path (user lookup, INSERT and blocking group_send per user)
+on a sample of them, and with notifications.fanout.fan_out to all of them.
+The per-recipient timing is extrapolated to the full recipient count.
+
+If no CHANNEL_LAYERS are configured an in-memory layer is used, so the
+websocket sends are still part of the timing. Everything the benchmark
+creates is deleted at the end.
+"""
+
+import time
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from channels.layers import InMemoryChannelLayer, get_channel_layer
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from notifications.fanout import RECIPIENT_FIELDS, fan_out
+from notifications.models import Notification
+
+User = get_user_model()
+
+TITLE = "[LOCATION] New Job Opportunity Nearby!"
+
+
+class Command(BaseCommand):
+    help = "Benchmark bulk notification fan-out against per-recipient notifications"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--recipients", type=int, default=10000, help="Users receiving the alert")
+        parser.add_argument("--legacy-sample", type=int, default=500, help="Recipients timed on the per-recipient path")
+
+    def handle(self, *args, **options):
+        prefix = f"fanout_bench_{int(time.time())}_"
+        User.objects.bulk_create(
+            [User(username=f"{prefix}{i}", email=f"{prefix}{i}@example.com", first_name="Bench", last_name=str(i))
+             for i in range(options["recipients"])],
+            batch_size=1000,
+        )
+        user_ids = list(User.objects.filter(username__startswith=prefix).values_list("id", flat=True))
+        channel_layer = get_channel_layer() or InMemoryChannelLayer()
+        self.stdout.write(f"Recipients: {len(user_ids)} | channel layer: {type(channel_layer).__name__}")
+
+        try:
+            with patch("notifications.fanout.get_channel_layer", return_value=channel_layer):
+                sample = user_ids[:options["legacy_sample"]]
+                if sample:
+                    self._report("per-recipient", len(user_ids), *self._measure(self._legacy, sample, channel_layer))
+                recipients = User.objects.filter(id__in=user_ids).only(*RECIPIENT_FIELDS)
+                self._report("fan_out", len(user_ids), *self._measure(self._fan_out, recipients))
+        finally:
+            Notification.objects.filter(user_id__in=user_ids).delete()
+            User.objects.filter(id__in=user_ids).delete()
+            self.stdout.write(self.style.SUCCESS("Benchmark data deleted"))
+
+    def _measure(self, operation, *args):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            count = operation(*args)
+            elapsed = time.perf_counter() - started
+        return count, elapsed, len(queries.captured_queries)
+
+    def _report(self, label, total, count, elapsed, queries):
+        self.stdout.write(self.style.SUCCESS(
+            f"{label:<14} | {count:>6} recipients in {elapsed * 1000:9.1f} ms ({queries} queries) | "
+            f"est. {elapsed / count * total:7.2f} s for {total}"
+        ))
+
+    def _legacy(self, user_ids, channel_layer):
+        send = async_to_sync(channel_layer.group_send)
+        for user_id in user_ids:
+            user = User.objects.get(id=user_id)
+            notification = Notification.objects.create(
+                user=user,
+                title=TITLE,
+                message=f"Check out 'Benchmark job', a new job in your area, {user.get_full_name()}!",
+                category="job_nearby",
+                metadata={"importance": "medium"},
+            )
+            send(f"user_job_notifications_{user.id}", {"type": "job_notification", "id": notification.id})
+        return len(user_ids)
+
+    def _fan_out(self, recipients):
+        counts = fan_out(
+            recipients,
+            lambda user: f"Check out 'Benchmark job', a new job in your area, {user.get_full_name()}!",
+            category="job_nearby",
+            title=TITLE,
+            importance="medium",
+        )
+        return counts["created"]
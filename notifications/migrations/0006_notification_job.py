@@ -0,0 +1,20 @@
+# Generated by Django 4.2.16 on 2026-10-16 21:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0015_keyset_pagination_indexes'),
+        ('notifications', '0005_keyset_pagination_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='job',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='notifications', to='jobs.job'),
+        ),
+    ]
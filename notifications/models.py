@@ -30,9 +30,16 @@ class Notification(models.Model):
     metadata = models.JSONField(null=True, blank=True, help_text="Additional data for the notification")
     title = models.CharField(max_length=50, blank=True, null=True)
     navigate_url = models.CharField(max_length=300, default="/", blank=True, null=True)
+    # Job the notification is about, set when it is created
+    job = models.ForeignKey(
+        "jobs.Job", on_delete=models.SET_NULL, null=True, blank=True, related_name="notifications"
+    )
 
     class Meta:
         ordering = ["-created_at"]  # Sort notifications by newest first
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-id"]),  # Keyset pagination
+        ]
 
     def __str__(self):
         return f"Notification for {self.user.username}: {self.category} - {self.message[:50]}"
@@ -1,7 +1,7 @@
 # signals.py
 import logging
 from django.db import transaction
-from django.db.models.signals import post_save, pre_save, post_delete
+from django.db.models.signals import post_save, pre_save, post_delete, pre_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
@@ -26,7 +26,6 @@ from accounts.models import CustomUser, Profile
 from payment.models import Payment, EscrowPayment, Transaction
 from notifications.utils import create_notification
 from .utils import (
-    get_nearby_applicants, 
     send_websocket_notification,
     send_job_websocket_notification,
     send_review_websocket_notification,
@@ -41,10 +40,31 @@ def _safe_update_fields(kwargs):
     """Return iterable update_fields (coerce None -> [])"""
     return kwargs.get('update_fields') or []
 
+
+# Jobs whose delete is in progress. A job's row is removed after the rows that
+# cascade from it, so their post_delete handlers must not link notifications
+# to it; pre_delete runs for every collected job before anything is deleted.
+_deleting_job_ids = set()
+
+
+def _job_link(job_id):
+    """The job id to store on a notification, or None if that job is being deleted."""
+    return None if job_id in _deleting_job_ids else job_id
+
+
 # ====
 # Helper Functions
 # ====
 
+def _dispatch_nearby_alert(job_id):
+    from .tasks import notify_nearby_applicants_task
+
+    try:
+        notify_nearby_applicants_task.delay(job_id)
+    except Exception as e:
+        logger.warning(f"Failed to queue nearby job alert for job {job_id}: {str(e)}")
+
+
 def create_status_notification(user, entity_type, entity_title, old_status, new_status):
     """Helper to create standardized, human-friendly status change notifications"""
     status_messages = {
@@ -210,21 +230,16 @@ def handle_job_notifications(sender, instance, created, **kwargs):
         if created:
             create_notification(
                 user=instance.client,
+                job=instance,
                 title="[INFO] Job Posted!",
                 message=f"Your job '{instance.title}' is live, {instance.client.get_full_name()}! Applicants will start applying soon.",
                 notification_type="job_posted",
                 importance="high"
             )
             if instance.location_coordinates:
-                nearby_users = get_nearby_applicants(instance)
-                for user in nearby_users:
-                    create_notification(
-                        user=user,
-                        title="[LOCATION] New Job Opportunity Nearby!",
-                        message=f"Check out '{instance.title}', a new job in your area, {user.get_full_name()}!",
-                        notification_type="job_nearby",
-                        importance="medium"
-                    )
+                # Fanned out in bulk by a Celery task (see notifications.fanout)
+                job_id = instance.id
+                transaction.on_commit(lambda: _dispatch_nearby_alert(job_id))
         elif update_fields:
             if 'status' in update_fields:
                 create_status_notification(
@@ -253,6 +268,17 @@ def handle_job_notifications(sender, instance, created, **kwargs):
     except Exception as e:
         logger.error(f"Error handling job notification: {str(e)}")
 
+
+@receiver(pre_delete, sender=Job)
+def track_job_deletion_start(sender, instance, **kwargs):
+    _deleting_job_ids.add(instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+def track_job_deletion_end(sender, instance, **kwargs):
+    _deleting_job_ids.discard(instance.pk)
+
+
 @receiver(post_delete, sender=Job)
 def handle_job_deletion(sender, instance, **kwargs):
     """
@@ -316,6 +342,7 @@ def handle_application_notifications(sender, instance, created, **kwargs):
         if created:
             create_notification(
                 user=instance.job.client,
+                job=instance.job,
                 title="[INFO] New Application Received",
                 message=f"{instance.applicant.get_full_name()} applied to your job '{instance.job.title}'. Review their application now!",
                 notification_type="new_application",
@@ -323,6 +350,7 @@ def handle_application_notifications(sender, instance, created, **kwargs):
             )
             create_notification(
                 user=instance.applicant,
+                job=instance.job,
                 title="[INFO] Application Sent",
                 message=f"Your application for '{instance.job.title}' is in, {instance.applicant.get_full_name()}! We'll keep you posted.",
                 notification_type="application_submitted",
@@ -339,6 +367,7 @@ def handle_application_notifications(sender, instance, created, **kwargs):
             if instance.status == 'Rejected':
                 create_notification(
                     user=instance.applicant,
+                    job=instance.job,
                     title="[ERROR] Application Rejected",
                     message=f"Sorry, {instance.applicant.get_full_name()}, your application for '{instance.job.title}' was rejected.",
                     notification_type="application_rejected",
@@ -347,6 +376,7 @@ def handle_application_notifications(sender, instance, created, **kwargs):
             if instance.status == 'Accepted':
                 create_notification(
                     user=instance.applicant,
+                    job=instance.job,
                     title="[SUCCESS] Application Accepted",
                     message=f"Congratulations! Your application for '{instance.job.title}' was accepted.",
                     notification_type="application_accepted",
@@ -365,6 +395,7 @@ def log_application_status_change(sender, instance, created, **kwargs):
         try:
             create_notification(
                 user=instance.application.applicant,
+                job=instance.application.job,
                 title="[INFO] Application Status Update",
                 message=f"Hi {instance.application.applicant.get_full_name()}, your application for '{instance.application.job.title}' changed from {instance.old_status} to {instance.new_status}.",
                 notification_type="application_status_change",
@@ -453,6 +484,7 @@ def handle_escrow_updates(sender, instance, created, **kwargs):
         if created:
             create_notification(
                 user=instance.client,
+                job=instance.job,
                 title="[ACCOUNT] Funds Secured in Escrow",
                 message=f"Your payment of {instance.total_amount} for '{instance.job.title}' is safely held, {instance.client.get_full_name()}!",
                 notification_type="escrow_created",
@@ -462,6 +494,7 @@ def handle_escrow_updates(sender, instance, created, **kwargs):
             if instance.status == 'released':
                 create_notification(
                     user=instance.client,
+                    job=instance.job,
                     title="[PAYMENT] Funds Released",
                     message=f"Your payment of {instance.escrow_amount} for '{instance.job.title}' was sent to {instance.applicant.get_full_name()}, {instance.client.get_full_name()}!",
                     notification_type="escrow_released_client",
@@ -470,6 +503,7 @@ def handle_escrow_updates(sender, instance, created, **kwargs):
 
                 create_notification(
                     user=instance.applicant,
+                    job=instance.job,
                     title="[PAYMENT] Payment Received",
                     message=f"You've received {instance.escrow_amount} for '{instance.job.title}', {instance.applicant.get_full_name()}! Check your account.",
                     notification_type="escrow_released_applicant",
@@ -479,6 +513,7 @@ def handle_escrow_updates(sender, instance, created, **kwargs):
             elif instance.status == 'refunded':
                 create_notification(
                     user=instance.client,
+                    job=instance.job,
                     title="[PAYMENT] Refund Issued",
                     message=f"Your payment of {instance.total_amount} for '{instance.job.title}' was refunded, {instance.client.get_full_name()}.",
                     notification_type="escrow_refunded",
@@ -514,6 +549,7 @@ def handle_dispute_updates(sender, instance, created, **kwargs):
             # Notify dispute creator
             create_notification(
                 user=instance.created_by,
+                job=instance.job,
                 title="[DISPUTE] Dispute Filed",
                 message=f"Hi {instance.created_by.get_full_name()}, your dispute '{title}' for job '{instance.job.title}' has been submitted. We'll keep you updated!",
                 notification_type="dispute_created",
@@ -524,6 +560,7 @@ def handle_dispute_updates(sender, instance, created, **kwargs):
             if instance.job.client != instance.created_by:
                 create_notification(
                     user=instance.job.client,
+                    job=instance.job,
                     title="[DISPUTE] New Dispute Filed",
                     message=f"A dispute '{title}' was filed for your job '{instance.job.title}' by {instance.created_by.get_full_name()}. Review the details.",
                     notification_type="dispute_filed_client",
@@ -535,6 +572,7 @@ def handle_dispute_updates(sender, instance, created, **kwargs):
             for admin_id in admins:
                 create_notification(
                     user_id=admin_id,
+                    job=instance.job,
                     title="[DISPUTE] New Dispute Filed",
                     message=f"A new dispute '{title}' was filed for job '{instance.job.title}' by {instance.created_by.get_full_name()}.",
                     notification_type="admin_dispute_filed",
@@ -565,6 +603,7 @@ def handle_dispute_updates(sender, instance, created, **kwargs):
             if instance.assigned_admin and instance.status == 'assigned':
                 create_notification(
                     user=instance.assigned_admin,
+                    job=instance.job,
                     title="[DISPUTE] Dispute Assigned to You",
                     message=f"Hi {instance.assigned_admin.get_full_name()}, you've been assigned to handle dispute '{title}' for job '{instance.job.title}'. Please review it.",
                     notification_type="dispute_assigned_admin",
@@ -577,6 +616,7 @@ def handle_dispute_updates(sender, instance, created, **kwargs):
                     if user != instance.created_by or instance.job.client != instance.created_by:
                         create_notification(
                             user=user,
+                            job=instance.job,
                             title="[DISPUTE] Dispute Resolution Details",
                             message=f"The dispute '{title}' for job '{instance.job.title}' was resolved. Notes: {instance.resolution_notes}",
                             notification_type="dispute_resolution_notes",
@@ -589,11 +629,15 @@ def handle_dispute_updates(sender, instance, created, **kwargs):
 def handle_dispute_deletion(sender, instance, **kwargs):
     """
     Notify when a dispute is deleted.
+
+    The notification is linked to the job unless the job itself is being
+    deleted (see _job_link).
     """
     try:
         title = instance.title or f"Dispute #{instance.id}"
         create_notification(
             user=instance.created_by,
+            job=_job_link(instance.job_id),
             title="[DISPUTE] Dispute Deleted",
             message=f"Your dispute '{title}' for job '{instance.job.title}' was deleted, {instance.created_by.get_full_name()}. Contact support if this was unexpected.",
             notification_type="dispute_deleted",
@@ -603,6 +647,7 @@ def handle_dispute_deletion(sender, instance, **kwargs):
         if instance.job.client != instance.created_by:
             create_notification(
                 user=instance.job.client,
+                job=_job_link(instance.job_id),
                 title="[DISPUTE] Dispute Removed",
                 message=f"The dispute '{title}' for your job '{instance.job.title}' was deleted, {instance.job.client.get_full_name()}.",
                 notification_type="dispute_deleted_client",
@@ -625,6 +670,7 @@ def handle_review_updates(sender, instance, created, **kwargs):
             # Notify reviewed user
             create_notification(
                 user=instance.reviewed,
+                job=instance.job,
                 title="[REVIEW] New Review Received",
                 message=f"Hi {instance.reviewed.get_full_name()}, {instance.reviewer.get_full_name()} left you a {instance.rating}-star review for job '{instance.job.title}'. Check it out!",
                 notification_type="review_received",
@@ -634,6 +680,7 @@ def handle_review_updates(sender, instance, created, **kwargs):
             # Notify reviewer
             create_notification(
                 user=instance.reviewer,
+                job=instance.job,
                 title="[REVIEW] Review Submitted",
                 message=f"Your {instance.rating}-star review for {instance.reviewed.get_full_name()} on job '{instance.job.title}' was submitted, {instance.reviewer.get_full_name()}!",
                 notification_type="review_submitted",
@@ -644,6 +691,7 @@ def handle_review_updates(sender, instance, created, **kwargs):
             # Notify reviewer when review is verified
             create_notification(
                 user=instance.reviewer,
+                job=instance.job,
                 title="[SUCCESS] Review Verified",
                 message=f"Your review for {instance.reviewed.get_full_name()} on job '{instance.job.title}' is now verified, {instance.reviewer.get_full_name()}!",
                 notification_type="review_verified",
@@ -654,6 +702,7 @@ def handle_review_updates(sender, instance, created, **kwargs):
             # Notify reviewer when reviewed user responds
             create_notification(
                 user=instance.reviewer,
+                job=instance.job,
                 title="[REVIEW] Review Response",
                 message=f"{instance.reviewed.get_full_name()} responded to your review for job '{instance.job.title}', {instance.reviewer.get_full_name()}: '{instance.response}'",
                 notification_type="review_response",
@@ -675,6 +724,7 @@ def handle_saved_job_actions(sender, instance, created, **kwargs):
         if created:
             create_notification(
                 user=instance.user,
+                job=instance.job,
                 title="[BOOKMARK] Job Saved",
                 message=f"You saved '{instance.job.title}', {instance.user.get_full_name()}! Apply when you're ready.",
                 notification_type="job_saved",
@@ -687,10 +737,13 @@ def handle_saved_job_actions(sender, instance, created, **kwargs):
 def handle_unsaved_job(sender, instance, **kwargs):
     """
     Notification when a job is unsaved.
+
+    Linked to the job unless the job itself is being deleted (see _job_link).
     """
     try:
         create_notification(
             user=instance.user,
+            job=_job_link(instance.job_id),
             title="[DELETE] Job Removed",
             message=f"You removed '{instance.job.title}' from your saved jobs, {instance.user.get_full_name()}. Browse more jobs!",
             notification_type="job_unsaved",
@@ -875,7 +928,7 @@ def handle_notification_preference_update(sender, instance, created, **kwargs):
 # Connect all signals
 def connect_signals():
     """Explicitly connect all signals"""
-    from django.db.models.signals import post_save, pre_save, post_delete
+    from django.db.models.signals import post_save, pre_save, post_delete, pre_delete
     
     # User signals
     post_save.connect(handle_user_creation, sender=CustomUser)
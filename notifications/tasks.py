@@ -13,3 +13,25 @@ def send_notification_task(user_id, message):
     user = User.objects.get(id=user_id)
     Notification.objects.create(user=user, message=message)
     print(f"✅ Notification sent to {user.username}: {message}")
+
+
+@shared_task(
+    name="notifications.tasks.notify_nearby_applicants",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def notify_nearby_applicants_task(self, job_id):
+    """Fan out the "new job nearby" alert for a newly posted job."""
+    from jobs.models import Job
+
+    from .fanout import notify_nearby_applicants
+
+    job = Job.objects.filter(id=job_id).first()
+    if job is None:
+        return {"status": "skipped", "message": f"Job {job_id} not found"}
+    try:
+        return {"status": "success", **notify_nearby_applicants(job)}
+    except Exception as e:
+        self.retry(exc=e)
@@ -0,0 +1,91 @@
+"""
+Tests for bulk notification fan-out.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from jobs.models import Job
+
+from notifications.fanout import RECIPIENT_FIELDS, fan_out, notify_job_matches
+from notifications.models import Notification
+
+User = get_user_model()
+
+
+class FanOutTestCase(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username=f"fanout_{i}", email=f"fanout_{i}@example.com", password="pass12345",
+                first_name="Fan", last_name=str(i),
+            )
+            for i in range(5)
+        ]
+        Notification.objects.filter(user__in=self.users).delete()  # Drop the welcome notifications
+
+    def test_fan_out_batches_inserts_and_sends(self):
+        recipients = User.objects.filter(id__in=[u.id for u in self.users]).only(*RECIPIENT_FIELDS)
+        layer = MagicMock()
+
+        async def group_send(group, event):
+            return None
+        layer.group_send.side_effect = group_send
+
+        with patch("notifications.fanout.get_channel_layer", return_value=layer):
+            with self.assertNumQueries(3):  # Recipients, then two bulk inserts of at most 3 rows
+                counts = fan_out(
+                    recipients,
+                    lambda user: f"Hi {user.get_full_name()}",
+                    category="job_nearby",
+                    importance="medium",
+                    batch_size=3,
+                )
+
+        self.assertEqual(counts, {"created": 5, "sent": 5})
+        self.assertEqual(Notification.objects.filter(user__in=self.users, category="job_nearby").count(), 5)
+        self.assertEqual(
+            Notification.objects.get(user=self.users[2], category="job_nearby").message, "Hi Fan 2"
+        )
+        groups = {call.args[0] for call in layer.group_send.call_args_list}
+        self.assertEqual(groups, {f"user_job_notifications_{u.id}" for u in self.users})
+
+    def test_only_high_matches_are_notified(self):
+        day = timezone.now().date() + timedelta(days=1)
+        job = Job.objects.create(
+            client=self.users[4], created_by=self.users[4], title="Barista", location="Lagos",
+            start_date=day, end_date=day, shift_type="day", rate=Decimal("1500.00"),
+        )
+        matches = [
+            {"user_id": self.users[0].id, "score": 0.9},
+            {"user_id": self.users[1].id, "score": 0.5},
+            {"user_id": 999999, "score": 0.95},  # Deleted user
+        ]
+
+        with patch("notifications.fanout.get_channel_layer", return_value=None):
+            counts = notify_job_matches(job, matches)
+
+        self.assertEqual(counts["created"], 1)
+        alert = Notification.objects.get(user=self.users[0], category="new_job_alert")
+        self.assertIn("90%", alert.message)
+        self.assertEqual(alert.job_id, job.id)
+        self.assertFalse(Notification.objects.filter(user=self.users[1], category="new_job_alert").exists())
+
+    def test_retried_fan_out_skips_already_notified_users(self):
+        day = timezone.now().date() + timedelta(days=1)
+        job = Job.objects.create(
+            client=self.users[4], created_by=self.users[4], title="Porter", location="Lagos",
+            start_date=day, end_date=day, shift_type="day", rate=Decimal("1500.00"),
+        )
+        recipients = list(User.objects.filter(id__in=[u.id for u in self.users[:4]]).order_by("id").only(*RECIPIENT_FIELDS))
+
+        with patch("notifications.fanout.get_channel_layer", return_value=None):
+            fan_out(recipients[:2], lambda user: "Nearby", category="job_nearby", job=job)  # First attempt
+            counts = fan_out(recipients, lambda user: "Nearby", category="job_nearby", job=job, batch_size=2)
+
+        self.assertEqual(counts["created"], 2)
+        self.assertEqual(Notification.objects.filter(job=job, category="job_nearby").count(), 4)
@@ -0,0 +1,93 @@
+"""
+Tests for the job reference stored on notifications.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from jobs.models import Job, SavedJob
+from notifications.api import serialize_notification
+from notifications.models import Notification
+
+User = get_user_model()
+
+
+class NotificationJobTestCase(TestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user(
+            username="notif_client", email="notif_client@example.com", password="pass12345"
+        )
+        self.other = User.objects.create_user(
+            username="notif_other", email="notif_other@example.com", password="pass12345"
+        )
+        self.job = self.make_job(self.client_user, "Event Waiter")
+        Notification.objects.filter(user__in=[self.client_user, self.other]).delete()
+
+    def make_job(self, client, title):
+        day = timezone.now().date() + timedelta(days=1)
+        return Job.objects.create(
+            client=client, created_by=client, title=title, location="Lagos",
+            start_date=day, end_date=day, shift_type="day", rate=Decimal("1500.00"),
+        )
+
+    def test_list_serialization_does_not_query_per_notification(self):
+        for i in range(5):
+            Notification.objects.create(
+                user=self.client_user, job=self.job, category="new_job_alert", message=f"Alert {i}"
+            )
+
+        with self.assertNumQueries(1):
+            items = [
+                serialize_notification(n)
+                for n in Notification.objects.filter(user=self.client_user).select_related("job")
+            ]
+
+        self.assertEqual({(item["job_id"], item["job_title"]) for item in items}, {(self.job.id, "Event Waiter")})
+
+    def test_deleting_a_saved_job_keeps_foreign_keys_valid(self):
+        SavedJob.objects.create(user=self.other, job=self.job)
+        job_id = self.job.id
+
+        self.job.delete()
+        connection.check_constraints()  # What the commit would enforce
+
+        unsaved = Notification.objects.get(user=self.other, category="job_unsaved")
+        self.assertIsNone(unsaved.job_id)
+        self.assertFalse(Notification.objects.filter(job_id=job_id).exists())
+
+    def test_unsaving_a_job_links_the_notification(self):
+        SavedJob.objects.create(user=self.other, job=self.job).delete()
+
+        unsaved = Notification.objects.get(user=self.other, category="job_unsaved")
+        self.assertEqual(unsaved.job_id, self.job.id)
+
+    def test_backfill_links_jobs_named_in_messages(self):
+        self.make_job(self.other, "Event Waiter")  # Same title, different client
+        own = Notification.objects.create(
+            user=self.client_user, category="job_posted",
+            message="Your job 'Event Waiter' is live, Client! Applicants will start applying soon.",
+        )
+        unique = self.make_job(self.other, "Night Porter")
+        alert = Notification.objects.create(
+            user=self.client_user, category="new_job_alert", message="We found a 'Night Porter' job for you",
+        )
+        ambiguous = Notification.objects.create(
+            user=self.other, category="new_job_alert", message="Apply to 'Barista' now",
+        )
+        self.make_job(self.client_user, "Barista")
+        self.make_job(self.client_user, "Barista")
+
+        call_command("backfill_notification_jobs", stdout=StringIO())
+
+        own.refresh_from_db()
+        alert.refresh_from_db()
+        ambiguous.refresh_from_db()
+        self.assertEqual(own.job_id, self.job.id)
+        self.assertEqual(alert.job_id, unique.id)
+        self.assertIsNone(ambiguous.job_id)
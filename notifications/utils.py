@@ -7,16 +7,20 @@ from jobchat.models import LocationHistory
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 
+from core.write_behind import write_behind
+
 logger = logging.getLogger(__name__)
-def create_notification(user, message, title=None, notification_type=None, importance=None, **kwargs):
+def create_notification(user, message, title=None, notification_type=None, importance=None, job=None, **kwargs):
     from .models import Notification  # Import locally to avoid circular imports
-    Notification.objects.create(
+    # Queued for a batched insert when write-behind is enabled (see core.write_behind)
+    write_behind.add(Notification(
         user=user,
         message=message,
         title=title,
         category=notification_type or "general",
-        metadata={"importance": importance} if importance else None
-    )
+        metadata={"importance": importance} if importance else None,
+        job_id=getattr(job, "pk", job),
+    ))
     
     
 def get_nearby_applicants(job):
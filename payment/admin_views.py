@@ -11,7 +11,6 @@ This module provides admin views for:
 
 import json
 import logging
-from datetime import datetime
 
 from django.contrib.admin.views.decorators import staff_member_required
 from django.http import JsonResponse
@@ -20,9 +19,16 @@ from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
+from core.redis.cache import redis_client
+
 from .batch_processor import process_webhook_batch
 from .webhook_queue import (
+    PRIORITY_HIGH,
+    WEBHOOK_COMPLETED_KEY,
+    WEBHOOK_DATA_PREFIX,
+    WEBHOOK_FAILED_KEY,
     cleanup_stale_processing,
+    enqueue_webhook,
     get_queue_stats,
     retry_failed_webhooks,
 )
@@ -71,8 +77,7 @@ def webhook_stats(request):
         # Get failed webhooks
         failed_webhooks = []
         try:
-            from django.core.cache import cache
-            failed_data = cache.lrange("payment:webhook_failed", 0, 9)  # Get last 10
+            failed_data = redis_client.lrange(WEBHOOK_FAILED_KEY, 0, 9)  # Get last 10
             
             if failed_data:
                 for item in failed_data:
@@ -87,8 +92,7 @@ def webhook_stats(request):
         # Get completed webhooks
         completed_webhooks = []
         try:
-            from django.core.cache import cache
-            completed_data = cache.lrange("payment:webhook_completed", 0, 9)  # Get last 10
+            completed_data = redis_client.lrange(WEBHOOK_COMPLETED_KEY, 0, 9)  # Get last 10
             
             if completed_data:
                 for item in completed_data:
@@ -219,9 +223,8 @@ def retry_webhook(request, webhook_id):
     """
     try:
         # Get webhook data
-        from django.core.cache import cache
-        data_key = f"payment:webhook_data:{webhook_id}"
-        webhook_data_json = cache.get(data_key)
+        data_key = f"{WEBHOOK_DATA_PREFIX}{webhook_id}"
+        webhook_data_json = redis_client.get(data_key)
         
         if not webhook_data_json:
             return JsonResponse({
@@ -231,27 +234,22 @@ def retry_webhook(request, webhook_id):
         
         webhook_data = json.loads(webhook_data_json)
         
-        # Reset attempt count and error
-        webhook_data["attempts"] = 0
-        webhook_data["error"] = None
-        webhook_data["status"] = "retrying"
-        
-        # Store updated data
-        cache.set(data_key, json.dumps(webhook_data), 60 * 60 * 24 * 7)  # 7 days
-        
-        # Requeue with high priority
-        from .webhook_queue import PRIORITY_HIGH
-        score = PRIORITY_HIGH * 1000 + int(datetime.now().timestamp())
-        cache.zadd("payment:webhook_queue", {webhook_id: score})
-        
-        # Remove from failed list
-        failed_webhooks = cache.lrange("payment:webhook_failed", 0, -1)
+        # Requeue the payload with high priority and a fresh attempt count
+        new_webhook_id = enqueue_webhook(
+            webhook_data["payment_method"],
+            webhook_data["reference"],
+            webhook_data.get("gateway_status", webhook_data["status"]),
+            webhook_data["raw_data"],
+            priority=PRIORITY_HIGH,
+        )
         
-        for webhook_json in failed_webhooks:
+        # Drop the old entry and remove it from the failed list
+        redis_client.delete(data_key)
+        for webhook_json in redis_client.lrange(WEBHOOK_FAILED_KEY, 0, -1):
             try:
                 webhook = json.loads(webhook_json)
                 if webhook.get("webhook_id") == webhook_id:
-                    cache.lrem("payment:webhook_failed", 1, webhook_json)
+                    redis_client.lrem(WEBHOOK_FAILED_KEY, 1, webhook_json)
                     break
             except json.JSONDecodeError:
                 pass
@@ -259,6 +257,7 @@ def retry_webhook(request, webhook_id):
         return JsonResponse({
             "status": "success",
             "message": f"Webhook {webhook_id} requeued",
+            "webhook_id": new_webhook_id,
             "timestamp": timezone.now().isoformat(),
         })
     except Exception as e:
@@ -45,6 +45,7 @@ from core.exceptions import (
     InsufficientFundsError,
 )
 from core.logging_utils import log_endpoint, logger as core_logger, api_logger
+from core.pagination import COUNT_APPROXIMATE, InvalidCursor, paginate_by_cursor
 
 # Import caching utilities for Phase 2.2c
 from core.cache_utils import (
@@ -114,6 +115,14 @@ def _get_time_range(filter: str) -> tuple[datetime, Optional[datetime]]:
 # 📌 Payment Endpoints
 # ==
 
+def _cursor_page(queryset, cursor, limit):
+    """Keyset page for the list endpoints; the total is counted on the first page only."""
+    try:
+        return paginate_by_cursor(queryset, cursor, limit, count=COUNT_APPROXIMATE)
+    except InvalidCursor:
+        raise PaeshiftValidationError("Invalid cursor")
+
+
 # ==
 # 📌 Wallet Transaction Endpoints
 # ==
@@ -125,7 +134,7 @@ def _get_time_range(filter: str) -> tuple[datetime, Optional[datetime]]:
     description="Retrieve wallet transactions with optional time filtering",
 )
 def list_wallet_transactions(
-    request, user_id: int, filter: str = "all", limit: int = 100, offset: int = 0
+    request, user_id: int, filter: str = "all", limit: int = 100, offset: int = 0, cursor: str = None
 ):
     """
     Get paginated wallet transactions with optional time filter.
@@ -135,6 +144,8 @@ def list_wallet_transactions(
         filter: Time filter (all, today, yesterday, this_week, last_week, this_month)
         limit: Maximum number of results to return
         offset: Offset for pagination
+        cursor: Keyset cursor (empty for the first page, then next_cursor);
+            replaces offset when given
 
     Returns:
         List of wallet transactions
@@ -170,11 +181,16 @@ def list_wallet_transactions(
             # Log the filter being applied
             core_logger.debug(f"Applied filter '{filter}' with date range: {start} to {end}")
 
-        # Get total count before pagination
-        total_count = transactions.count()
-
-        # Apply pagination
-        paginated = transactions[offset:offset + limit]
+        # Keyset pagination when a cursor is passed, offset otherwise
+        page_info = {}
+        if cursor is not None:
+            cursor_page = _cursor_page(transactions, cursor, limit)
+            paginated = cursor_page.items
+            total_count = cursor_page.total_count
+            page_info = cursor_page.metadata()
+        else:
+            total_count = transactions.count()
+            paginated = transactions[offset:offset + limit]
 
         # Create response
         response = {
@@ -196,6 +212,7 @@ def list_wallet_transactions(
                     }
                     for t in paginated
                 ],
+                **page_info,
             }
         }
 
@@ -209,7 +226,7 @@ def list_wallet_transactions(
 
         return response
 
-    except ResourceNotFoundError:
+    except (ResourceNotFoundError, PaeshiftValidationError):
         raise
     except Exception as e:
         core_logger.error(f"Error retrieving wallet transactions: {str(e)}", exc_info=True)
@@ -335,7 +352,7 @@ def withdraw_funds(request, payload: WalletWithdrawSchema):
     description="Retrieve payments with optional time filtering",
 )
 def list_payments(
-    request, user_id: int, filter: str = "all", limit: int = 100, offset: int = 0
+    request, user_id: int, filter: str = "all", limit: int = 100, offset: int = 0, cursor: str = None
 ):
     """
     Get paginated payments with optional time filter.
@@ -369,8 +386,15 @@ def list_payments(
 
             core_logger.debug(f"Applied filter '{filter}' with date range: {start} to {end}")
 
-        total_count = payments.count()
-        paginated = payments[offset : offset + limit]
+        page_info = {}
+        if cursor is not None:
+            cursor_page = _cursor_page(payments, cursor, limit)
+            paginated = cursor_page.items
+            total_count = cursor_page.total_count
+            page_info = cursor_page.metadata()
+        else:
+            total_count = payments.count()
+            paginated = payments[offset : offset + limit]
 
         response = {
             "status": "success",
@@ -388,6 +412,7 @@ def list_payments(
                     }
                     for p in paginated
                 ],
+                **page_info,
             }
         }
 
@@ -401,7 +426,7 @@ def list_payments(
 
         return response
 
-    except ResourceNotFoundError:
+    except (ResourceNotFoundError, PaeshiftValidationError):
         raise
     except Exception as e:
         core_logger.error(f"Error retrieving payment history: {str(e)}", exc_info=True)
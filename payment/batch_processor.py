@@ -14,8 +14,10 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from django.db import transaction
 from django.utils import timezone
 
+from jobs.models import Job
+
 from .models import Payment
-from .services import FlutterwaveService, PaystackService
+from .services import FlutterwaveService, PaystackService, verify_payments
 from .tasks import process_payment_webhook_q
 from .webhook_queue import (
     get_webhook_batch,
@@ -30,6 +32,12 @@ DEFAULT_BATCH_SIZE = 20
 MAX_BATCH_SIZE = 100
 MIN_BATCH_SIZE = 5
 
+# Webhooks for payments in these states are acknowledged without changes
+FINAL_PAYMENT_STATUSES = ("Completed", "Failed", "Refunded")
+
+# Job payment statuses that may move to paid (mirrors Job.clean)
+PAYABLE_JOB_STATUSES = (Job.PaymentStatus.PENDING, Job.PaymentStatus.HELD)
+
 
 def process_webhook_batch(batch_size: int = DEFAULT_BATCH_SIZE) -> Tuple[int, int]:
     """
@@ -106,114 +114,7 @@ def process_paystack_batch(webhooks: List[Dict[str, Any]]) -> Tuple[int, int]:
     Returns:
         Tuple of (success_count, failure_count)
     """
-    if not webhooks:
-        return 0, 0
-    
-    logger.info(f"Processing batch of {len(webhooks)} Paystack webhooks")
-    
-    # Extract references for batch verification
-    references = [webhook.get("reference") for webhook in webhooks if webhook.get("reference")]
-    
-    # Create service
-    service = PaystackService()
-    
-    # Batch verify payments
-    verification_results = {}
-    for reference in references:
-        try:
-            result = service.verify_payment(reference)
-            verification_results[reference] = result
-        except Exception as e:
-            logger.exception(f"Error verifying Paystack payment {reference}: {str(e)}")
-            verification_results[reference] = {"status": "error", "message": str(e)}
-    
-    # Get payment records in a single query
-    payment_map = {}
-    try:
-        payments = Payment.objects.filter(pay_code__in=references)
-        for payment in payments:
-            payment_map[payment.pay_code] = payment
-    except Exception as e:
-        logger.exception(f"Error fetching payment records: {str(e)}")
-    
-    # Process each webhook
-    success_count = 0
-    failure_count = 0
-    
-    for webhook in webhooks:
-        webhook_id = webhook.get("id")
-        reference = webhook.get("reference")
-        
-        try:
-            # Skip if no reference
-            if not reference:
-                mark_webhook_failed(webhook_id, "Missing reference", retry=False)
-                failure_count += 1
-                continue
-            
-            # Get verification result
-            verification_result = verification_results.get(reference, {"status": "error", "message": "Verification failed"})
-            
-            # Get payment record
-            payment = payment_map.get(reference)
-            
-            if not payment:
-                mark_webhook_failed(webhook_id, f"Payment with reference {reference} not found", retry=False)
-                failure_count += 1
-                continue
-            
-            # Skip if payment is already in a final state
-            if payment.status in ["Completed", "Failed", "Refunded"]:
-                mark_webhook_completed(webhook_id, {
-                    "status": "skipped",
-                    "message": f"Payment {reference} already in state {payment.status}",
-                })
-                success_count += 1
-                continue
-            
-            # Update payment status based on verification
-            if verification_result.get("status") == "success":
-                # Update payment in database
-                with transaction.atomic():
-                    payment.status = "Completed"
-                    payment.save()
-                    
-                    # Update job payment status if this payment is for a job
-                    if payment.job:
-                        job = payment.job
-                        job.payment_status = "paid"
-                        job.save()
-                
-                # Mark webhook as completed
-                mark_webhook_completed(webhook_id, {
-                    "status": "success",
-                    "message": "Payment completed",
-                    "payment_id": payment.id,
-                    "amount": str(payment.original_amount),
-                })
-                
-                success_count += 1
-            else:
-                # Mark payment as failed
-                with transaction.atomic():
-                    payment.status = "Failed"
-                    payment.save()
-                
-                # Mark webhook as completed
-                mark_webhook_completed(webhook_id, {
-                    "status": "failed",
-                    "message": "Payment failed",
-                    "payment_id": payment.id,
-                    "amount": str(payment.original_amount),
-                })
-                
-                success_count += 1
-        except Exception as e:
-            logger.exception(f"Error processing Paystack webhook {webhook_id}: {str(e)}")
-            mark_webhook_failed(webhook_id, str(e))
-            failure_count += 1
-    
-    return success_count, failure_count
+    return process_gateway_batch(webhooks, PaystackService())
 
 
 def process_flutterwave_batch(webhooks: List[Dict[str, Any]]) -> Tuple[int, int]:
@@ -223,116 +124,133 @@ def process_flutterwave_batch(webhooks: List[Dict[str, Any]]) -> Tuple[int, int]
     Args:
         webhooks: List of webhook data dictionaries
         
+    Returns:
+        Tuple of (success_count, failure_count)
+    """
+    return process_gateway_batch(webhooks, FlutterwaveService())
+
+
+def process_gateway_batch(webhooks: List[Dict[str, Any]], service) -> Tuple[int, int]:
+    """
+    Process a batch of webhooks for one payment gateway.
+
+    1. All references are verified concurrently, bounded by the gateway's
+       concurrency limit (see ``payment.services.verify_payments``).
+    2. Payment and Job rows are loaded in one query and the new statuses are
+       decided in memory.
+    3. The changed rows are saved in a single transaction, so their
+       ``post_save`` handlers (payment cache, status audit log, job status,
+       user stats, cache invalidation) run as for any other save, and the
+       webhooks are marked once it has committed.
+
+    Args:
+        webhooks: List of webhook data dictionaries
+        service: PaystackService or FlutterwaveService instance
+
     Returns:
         Tuple of (success_count, failure_count)
     """
     if not webhooks:
         return 0, 0
-    
-    logger.info(f"Processing batch of {len(webhooks)} Flutterwave webhooks")
-    
+
+    gateway = service.gateway.title()
+    logger.info(f"Processing batch of {len(webhooks)} {gateway} webhooks")
+
     # Extract references for batch verification
     references = [webhook.get("reference") for webhook in webhooks if webhook.get("reference")]
-    
-    # Create service
-    service = FlutterwaveService()
-    
-    # Batch verify payments
-    verification_results = {}
-    for reference in references:
-        try:
-            result = service.verify_payment(reference)
-            verification_results[reference] = result
-        except Exception as e:
-            logger.exception(f"Error verifying Flutterwave payment {reference}: {str(e)}")
-            verification_results[reference] = {"status": "error", "message": str(e)}
-    
-    # Get payment records in a single query
+
+    verification_results = verify_payments(service, references)
+
+    # Get payment records (and their jobs) in a single query
     payment_map = {}
     try:
-        payments = Payment.objects.filter(pay_code__in=references)
+        payments = Payment.objects.filter(pay_code__in=references).select_related("job")
         for payment in payments:
             payment_map[payment.pay_code] = payment
     except Exception as e:
         logger.exception(f"Error fetching payment records: {str(e)}")
-    
-    # Process each webhook
+
     success_count = 0
     failure_count = 0
-    
+
+    # Decide every outcome before touching the database
+    completed = []  # (webhook_id, result) to mark once the updates commit
+    updated_payments = {}
+    updated_jobs = {}
+
     for webhook in webhooks:
         webhook_id = webhook.get("id")
         reference = webhook.get("reference")
-        
-        try:
-            # Skip if no reference
-            if not reference:
-                mark_webhook_failed(webhook_id, "Missing reference", retry=False)
-                failure_count += 1
-                continue
-            
-            # Get verification result
-            verification_result = verification_results.get(reference, {"status": "error", "message": "Verification failed"})
-            
-            # Get payment record
-            payment = payment_map.get(reference)
-            
-            if not payment:
-                mark_webhook_failed(webhook_id, f"Payment with reference {reference} not found", retry=False)
-                failure_count += 1
-                continue
-            
-            # Skip if payment is already in a final state
-            if payment.status in ["Completed", "Failed", "Refunded"]:
-                mark_webhook_completed(webhook_id, {
-                    "status": "skipped",
-                    "message": f"Payment {reference} already in state {payment.status}",
-                })
-                success_count += 1
-                continue
-            
-            # Update payment status based on verification
-            if verification_result.get("status") == "success":
-                # Update payment in database
-                with transaction.atomic():
-                    payment.status = "Completed"
-                    payment.save()
-                    
-                    # Update job payment status if this payment is for a job
-                    if payment.job:
-                        job = payment.job
-                        job.payment_status = "paid"
-                        job.save()
-                
-                # Mark webhook as completed
-                mark_webhook_completed(webhook_id, {
-                    "status": "success",
-                    "message": "Payment completed",
-                    "payment_id": payment.id,
-                    "amount": str(payment.original_amount),
-                })
-                
-                success_count += 1
-            else:
-                # Mark payment as failed
-                with transaction.atomic():
-                    payment.status = "Failed"
-                    payment.save()
-                
-                # Mark webhook as completed
-                mark_webhook_completed(webhook_id, {
-                    "status": "failed",
-                    "message": "Payment failed",
-                    "payment_id": payment.id,
-                    "amount": str(payment.original_amount),
-                })
-                
-                success_count += 1
-        except Exception as e:
-            logger.exception(f"Error processing Flutterwave webhook {webhook_id}: {str(e)}")
-            mark_webhook_failed(webhook_id, str(e))
+
+        # Skip if no reference
+        if not reference:
+            mark_webhook_failed(webhook_id, "Missing reference", retry=False)
             failure_count += 1
-    
+            continue
+
+        payment = payment_map.get(reference)
+        if not payment:
+            mark_webhook_failed(webhook_id, f"Payment with reference {reference} not found", retry=False)
+            failure_count += 1
+            continue
+
+        # Skip if payment is already in a final state (including earlier in this batch)
+        if payment.status in FINAL_PAYMENT_STATUSES:
+            mark_webhook_completed(webhook_id, {
+                "status": "skipped",
+                "message": f"Payment {reference} already in state {payment.status}",
+            })
+            success_count += 1
+            continue
+
+        verification_result = verification_results.get(reference, {"status": "error", "message": "Verification failed"})
+        result = {
+            "payment_id": payment.id,
+            "amount": str(payment.original_amount),
+        }
+
+        if verification_result.get("status") == "success":
+            job = payment.job
+            if job and job.payment_status != Job.PaymentStatus.PAID:
+                # Same rule as Job.clean, checked here so one bad job fails only its webhook
+                if job.payment_status not in PAYABLE_JOB_STATUSES:
+                    mark_webhook_failed(
+                        webhook_id,
+                        f"Invalid payment status transition: {job.payment_status} → {Job.PaymentStatus.PAID}",
+                    )
+                    failure_count += 1
+                    continue
+                job.payment_status = Job.PaymentStatus.PAID
+                updated_jobs[job.pk] = job
+
+            payment.status = "Completed"
+            result.update(status="success", message="Payment completed")
+        else:
+            payment.status = "Failed"
+            result.update(status="failed", message="Payment failed")
+
+        updated_payments[payment.pk] = payment
+        completed.append((webhook_id, result))
+
+    if not completed:
+        return success_count, failure_count
+
+    try:
+        with transaction.atomic():
+            for payment in updated_payments.values():
+                payment.save(update_fields=["status", "updated_at"])
+            for job in updated_jobs.values():
+                job.save(update_fields=["payment_status", "updated_at"])
+    except Exception as e:
+        logger.exception(f"Error saving {gateway} webhook batch: {str(e)}")
+        for webhook_id, _ in completed:
+            mark_webhook_failed(webhook_id, str(e))
+        return success_count, failure_count + len(completed)
+
+    for webhook_id, result in completed:
+        mark_webhook_completed(webhook_id, result)
+    success_count += len(completed)
+
     return success_count, failure_count
 
 
@@ -349,7 +267,7 @@ def process_single_webhook(webhook: Dict[str, Any]) -> Dict[str, Any]:
     webhook_id = webhook.get("id")
     reference = webhook.get("reference")
     payment_method = webhook.get("payment_method")
-    status = webhook.get("status")
+    status = webhook.get("gateway_status", webhook.get("status"))
     raw_data = webhook.get("raw_data")
     
     try:
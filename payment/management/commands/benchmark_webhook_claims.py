@@ -0,0 +1,107 @@
+"""
+Benchmark concurrent webhook batch claims.
+
+Synthetic webhooks are enqueued with ``enqueue_webhook`` and then drained by
+1, 4 and 16 worker threads calling ``get_webhook_batch``. Every run reports
+claims per second and checks that no webhook was handed out twice. All
+synthetic keys are deleted and the queue totals restored afterwards; the
+command refuses to run while real webhooks are queued.
+"""
+
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.redis.cache import redis_client
+from payment import webhook_queue
+from payment.webhook_queue import (
+    WEBHOOK_DATA_PREFIX,
+    WEBHOOK_PROCESSING_KEY,
+    WEBHOOK_QUEUE_KEY,
+    WEBHOOK_STATS_KEY,
+    enqueue_webhook,
+    get_webhook_batch,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark webhook batch claims with several concurrent workers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--webhooks", type=int, default=5000, help="Webhooks to enqueue per run")
+        parser.add_argument("--workers", type=str, default="1,4,16", help="Comma separated worker counts")
+        parser.add_argument("--batch-size", type=int, default=webhook_queue.DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        if redis_client is None:
+            raise CommandError("Redis is not available")
+        if redis_client.zcard(WEBHOOK_QUEUE_KEY):
+            raise CommandError("The webhook queue is not empty; run the benchmark against an idle Redis")
+
+        workers = [int(w) for w in options["workers"].split(",") if w.strip()]
+        saved_stats = redis_client.hgetall(WEBHOOK_STATS_KEY)
+        try:
+            self._run(workers, options)
+        finally:
+            redis_client.delete(WEBHOOK_STATS_KEY)
+            if saved_stats:
+                redis_client.hset(WEBHOOK_STATS_KEY, mapping=saved_stats)
+
+    def _run(self, workers, options):
+        claim_mode = None
+        for worker_count in workers:
+            webhook_ids = self._enqueue(options["webhooks"])
+            try:
+                elapsed, claimed = self._drain(worker_count, options["batch_size"])
+            finally:
+                self._cleanup(webhook_ids)
+
+            if claim_mode is None:
+                claim_mode = "script" if webhook_queue._scripting_available else "ZPOPMIN + pipeline"
+                self.stdout.write(f"Claim mode: {claim_mode}")
+
+            duplicates = len(claimed) - len(set(claimed))
+            rate = len(claimed) / elapsed if elapsed else 0
+            self.stdout.write(
+                f"workers {worker_count:>3} | claimed {len(claimed):>6} | "
+                f"{rate:10.0f} claims/s | duplicates {duplicates}"
+            )
+            if duplicates or set(claimed) != set(webhook_ids):
+                self.stdout.write(self.style.ERROR("Claims did not match the enqueued webhooks"))
+
+    def _enqueue(self, count):
+        return [
+            enqueue_webhook("paystack", f"bench-{i}", "success", {"reference": f"bench-{i}"})
+            for i in range(count)
+        ]
+
+    def _drain(self, worker_count, batch_size):
+        claimed = []
+        claimed_lock = threading.Lock()
+        start = threading.Barrier(worker_count + 1)
+
+        def worker():
+            start.wait()
+            while True:
+                batch = get_webhook_batch(batch_size)
+                if not batch:
+                    return
+                with claimed_lock:
+                    claimed.extend(webhook["id"] for webhook in batch)
+
+        threads = [threading.Thread(target=worker) for _ in range(worker_count)]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        started = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - started, claimed
+
+    def _cleanup(self, webhook_ids):
+        pipe = redis_client.pipeline(transaction=False)
+        for webhook_id in webhook_ids:
+            pipe.delete(f"{WEBHOOK_DATA_PREFIX}{webhook_id}", f"{WEBHOOK_PROCESSING_KEY}:{webhook_id}")
+        pipe.zrem(WEBHOOK_QUEUE_KEY, *webhook_ids)
+        pipe.execute()
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-16 20:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment', '0015_payment_payment_pay_status_124d3d_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['payer', '-created_at', '-id'], name='payment_pay_payer_i_3eeced_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['wallet', '-created_at', '-id'], name='payment_tra_wallet__fb7e04_idx'),
+        ),
+    ]
@@ -95,6 +95,7 @@ class Payment(models.Model):
             models.Index(fields=['job_id']),
             models.Index(fields=['created_at']),
             models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['payer', '-created_at', '-id']),  # Keyset pagination
         ]
 
     def __str__(self):
@@ -249,6 +250,9 @@ class Transaction(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Transaction"
         verbose_name_plural = "Transactions"
+        indexes = [
+            models.Index(fields=["wallet", "-created_at", "-id"]),  # Keyset pagination
+        ]
 
     def __str__(self):
         return f"{self.wallet.user.email} - {self.transaction_type} - {self.amount}"
@@ -1,19 +1,89 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 import requests
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Seconds allowed to open a connection; read timeouts are per gateway
+CONNECT_TIMEOUT = 3.05
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_gateway_session(gateway):
+    """
+    Shared keep-alive session for ``gateway`` ("paystack" or "flutterwave").
+
+    Reusing one session keeps TLS connections to the gateway open between
+    calls instead of handshaking for every request. The pool is sized to the
+    gateway's concurrency limit so concurrent verifications never queue for
+    a connection.
+    """
+    session = _sessions.get(gateway)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(gateway)
+            if session is None:
+                pool_size = gateway_concurrency(gateway)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _sessions[gateway] = session
+    return session
+
+
+def gateway_concurrency(gateway):
+    """Maximum concurrent requests to ``gateway`` from one batch."""
+    return max(1, int(getattr(settings, f"{gateway.upper()}_CONCURRENCY", 5)))
+
+
+def gateway_timeout(gateway):
+    """``(connect, read)`` timeout for requests to ``gateway``."""
+    return (CONNECT_TIMEOUT, float(getattr(settings, f"{gateway.upper()}_TIMEOUT", 10)))
+
+
+def verify_payments(service, references):
+    """
+    Verify ``references`` with ``service`` concurrently.
+
+    At most the gateway's concurrency limit of requests are in flight at
+    once. Returns {reference: result}; a reference whose verification raised
+    maps to ``{"status": "error", "message": ...}``.
+    """
+    references = list(dict.fromkeys(references))
+    if not references:
+        return {}
+
+    def verify(reference):
+        try:
+            return service.verify_payment(reference)
+        except Exception as e:
+            logger.warning(f"Error verifying {service.gateway} payment {reference}: {str(e)}")
+            return {"status": "error", "message": str(e)}
+
+    workers = min(gateway_concurrency(service.gateway), len(references))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{service.gateway}-verify") as executor:
+        return dict(zip(references, executor.map(verify, references)))
+
 
 class PaystackService:
     """Service for handling Paystack payment operations"""
 
+    gateway = "paystack"
+
     def __init__(self):
-        self.base_url = "https://api.paystack.co"
+        self.base_url = getattr(settings, "PAYSTACK_BASE_URL", "https://api.paystack.co")
         self.secret_key = settings.PAYSTACK_SECRET_KEY
+        self.session = get_gateway_session(self.gateway)
+        self.timeout = gateway_timeout(self.gateway)
         self.headers = {
             "Authorization": f"Bearer {self.secret_key}",
             "Content-Type": "application/json",
@@ -30,7 +100,7 @@ class PaystackService:
             "metadata": metadata or {},
         }
 
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.session.post(url, headers=self.headers, json=data, timeout=self.timeout)
         response_data = response.json()
 
         if not response_data.get("status"):
@@ -45,7 +115,7 @@ class PaystackService:
         from .models import Payment  # Lazy import
 
         url = f"{self.base_url}/transaction/verify/{reference}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers, timeout=self.timeout)
         response_data = response.json()
 
         if not response_data.get("status"):
@@ -65,7 +135,7 @@ class PaystackService:
             "bank_code": bank_code,
         }
 
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.session.post(url, headers=self.headers, json=data, timeout=self.timeout)
         response_data = response.json()
 
         if not response_data.get("status"):
@@ -85,7 +155,7 @@ class PaystackService:
             "recipient": recipient_code,
         }
 
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self.session.post(url, headers=self.headers, json=data, timeout=self.timeout)
         response_data = response.json()
 
         if not response_data.get("status"):
@@ -98,7 +168,7 @@ class PaystackService:
     def verify_transfer(self, transfer_code):
         """Verify a transfer status."""
         url = f"{self.base_url}/transfer/{transfer_code}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers, timeout=self.timeout)
         response_data = response.json()
 
         if not response_data.get("status"):
@@ -112,9 +182,13 @@ class PaystackService:
 class FlutterwaveService:
     """Service for handling Flutterwave payment operations"""
 
+    gateway = "flutterwave"
+
     def __init__(self):
-        self.base_url = "https://api.flutterwave.com/v3"
+        self.base_url = getattr(settings, "FLUTTERWAVE_BASE_URL", "https://api.flutterwave.com/v3")
         self.secret_key = settings.FLUTTERWAVE_SECRET_KEY
+        self.session = get_gateway_session(self.gateway)
+        self.timeout = gateway_timeout(self.gateway)
         self.headers = {
             "Authorization": f"Bearer {self.secret_key}",
             "Content-Type": "application/json",
@@ -137,7 +211,7 @@ class FlutterwaveService:
         logger.info(f"Initializing Flutterwave payment for {email}: {amount}")
 
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.session.post(url, headers=self.headers, json=data, timeout=self.timeout)
             response.raise_for_status()
             response_data = response.json()
 
@@ -165,7 +239,7 @@ class FlutterwaveService:
         logger.info(f"Verifying Flutterwave payment: {reference}")
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             response_data = response.json()
 
@@ -203,7 +277,7 @@ class FlutterwaveService:
         logger.info(f"Processing Flutterwave refund for transaction {transaction_id}")
 
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self.session.post(url, headers=self.headers, json=data, timeout=self.timeout)
             response.raise_for_status()
             response_data = response.json()
 
@@ -224,7 +298,7 @@ class FlutterwaveService:
         url = f"{self.base_url}/transactions/{transaction_id}"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             response_data = response.json()
 
@@ -0,0 +1,153 @@
+"""
+Tests for concurrent gateway verification in payment.batch_processor,
+run against a local stub of the Paystack API.
+"""
+import json
+import threading
+import time
+from datetime import time as dtime, timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from payment import services
+from payment.batch_processor import process_paystack_batch
+from payment.models import Payment
+from payment.services import PaystackService, verify_payments
+
+User = get_user_model()
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class StubPaystack(BaseHTTPRequestHandler):
+    """Answers /transaction/verify/<reference> after ``delay`` seconds."""
+
+    delay = 0.1
+    failed = set()
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    connections = set()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            cls.connections.add(self.client_address)
+        try:
+            time.sleep(cls.delay)
+            reference = self.path.rsplit("/", 1)[-1]
+            outcome = "failed" if reference in cls.failed else "success"
+            body = json.dumps({"status": True, "data": {"reference": reference, "status": outcome}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(CACHES=LOCMEM_CACHE, PAYSTACK_CONCURRENCY=4, PAYSTACK_TIMEOUT=5)
+class BatchVerificationTests(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        StubPaystack.protocol_version = "HTTP/1.1"  # Keep-alive
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubPaystack)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        StubPaystack.in_flight = StubPaystack.max_in_flight = 0
+        StubPaystack.failed = set()
+        StubPaystack.connections = set()
+        services._sessions.clear()
+        settings_patch = override_settings(PAYSTACK_BASE_URL=f"http://127.0.0.1:{self.server.server_port}")
+        settings_patch.enable()
+        self.addCleanup(settings_patch.disable)
+        self.addCleanup(services._sessions.clear)
+
+    def test_verification_is_concurrent_and_bounded(self):
+        references = [f"REF{i}" for i in range(12)]
+
+        started = time.perf_counter()
+        results = verify_payments(PaystackService(), references)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(set(results), set(references))
+        self.assertTrue(all(result["status"] == "success" for result in results.values()))
+        self.assertEqual(StubPaystack.max_in_flight, 4)
+        # 12 calls of 0.1s, four at a time: about 0.3s instead of 1.2s serially
+        self.assertLess(elapsed, 0.8)
+        # Connections are reused from the pool rather than opened per call
+        self.assertLessEqual(len(StubPaystack.connections), 4)
+
+    def test_errors_are_reported_per_reference(self):
+        StubPaystack.delay = 0
+        self.addCleanup(setattr, StubPaystack, "delay", 0.1)
+        with override_settings(PAYSTACK_BASE_URL="http://127.0.0.1:9"):
+            services._sessions.clear()
+            results = verify_payments(PaystackService(), ["REFX"])
+        self.assertEqual(results["REFX"]["status"], "error")
+
+    def test_batch_saves_changed_rows_with_their_signals(self):
+        client = User.objects.create_user(username="batchclient", email="batchclient@example.com", password="x")
+        today = timezone.now().date()
+        jobs = [
+            Job.objects.create(
+                client=client, created_by=client, title=f"Paid job {i}", description="Shift",
+                location="Lagos", latitude=Decimal("6.450000"), longitude=Decimal("3.400000"),
+                start_date=today + timedelta(days=1), end_date=today + timedelta(days=1),
+                start_time=dtime(9, 0), end_time=dtime(17, 0), shift_type="day", rate=Decimal("1500.00"),
+            )
+            for i in range(3)
+        ]
+        payments = [
+            Payment.objects.create(
+                pay_code=f"PAY_BATCH{i}", payer=client, job=jobs[i],
+                original_amount=Decimal("1500.00"), final_amount=Decimal("1500.00"),
+            )
+            for i in range(3)
+        ]
+        Payment.objects.filter(pk=payments[2].pk).update(status="Completed")
+        StubPaystack.failed = {"PAY_BATCH1"}
+
+        webhooks = [{"id": f"wh{i}", "reference": f"PAY_BATCH{i}"} for i in range(3)]
+        webhooks.append({"id": "wh-missing", "reference": "PAY_UNKNOWN"})
+
+        with patch("payment.batch_processor.mark_webhook_completed") as completed, \
+                patch("payment.batch_processor.mark_webhook_failed") as failed, \
+                patch("payment.redis_cache.log_payment_status_change") as audit, \
+                self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_paystack_batch(webhooks), (3, 1))
+
+        statuses = dict(Payment.objects.filter(pk__in=[p.pk for p in payments]).values_list("pay_code", "status"))
+        self.assertEqual(statuses, {"PAY_BATCH0": "Completed", "PAY_BATCH1": "Failed", "PAY_BATCH2": "Completed"})
+        self.assertEqual(Job.objects.get(pk=jobs[0].pk).payment_status, Job.PaymentStatus.PAID)
+        self.assertEqual(Job.objects.get(pk=jobs[1].pk).payment_status, Job.PaymentStatus.PENDING)
+
+        results = {call.args[0]: call.args[1]["status"] for call in completed.call_args_list}
+        self.assertEqual(results, {"wh0": "success", "wh1": "failed", "wh2": "skipped"})
+        failed.assert_called_once_with("wh-missing", "Payment with reference PAY_UNKNOWN not found", retry=False)
+        # Status changes go through post_save, which writes the audit log
+        changes = {call.args[0]: call.args[2] for call in audit.call_args_list}
+        self.assertEqual(changes, {payments[0].pk: "Completed", payments[1].pk: "Failed"})
@@ -0,0 +1,134 @@
+"""
+Tests for lock-free webhook batch claims in payment.webhook_queue.
+"""
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import RequestFactory, SimpleTestCase
+from fakeredis import FakeStrictRedis
+
+from payment import admin_views, webhook_queue
+from payment.webhook_queue import (
+    WEBHOOK_DATA_PREFIX,
+    WEBHOOK_FAILED_KEY,
+    WEBHOOK_PROCESSING_KEY,
+    WEBHOOK_QUEUE_KEY,
+    enqueue_webhook,
+    get_queue_stats,
+    get_webhook_batch,
+    mark_webhook_completed,
+    mark_webhook_failed,
+)
+
+
+class WebhookBatchClaimTests(SimpleTestCase):
+
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        patcher = patch.object(webhook_queue, "redis_client", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def enqueue(self, count, priority=webhook_queue.PRIORITY_NORMAL):
+        return [
+            enqueue_webhook("paystack", f"ref-{i}", "success", {"reference": f"ref-{i}"}, priority=priority)
+            for i in range(count)
+        ]
+
+    def test_batch_is_moved_to_processing(self):
+        normal = self.enqueue(6)
+        urgent = self.enqueue(1, priority=webhook_queue.PRIORITY_HIGH)
+
+        batch = get_webhook_batch(5)
+
+        self.assertEqual([webhook["id"] for webhook in batch][0], urgent[0])
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(self.redis.zcard(WEBHOOK_QUEUE_KEY), 2)
+        for webhook in batch:
+            marker = json.loads(self.redis.get(f"{WEBHOOK_PROCESSING_KEY}:{webhook['id']}"))
+            self.assertEqual(marker["webhook_id"], webhook["id"])
+        self.assertTrue(set(normal) - {webhook["id"] for webhook in batch})
+
+        stats = get_queue_stats()
+        self.assertEqual(stats["queued"], 2)
+        self.assertEqual(stats["processing"], 5)
+        self.assertEqual(stats["processing_total"], 5)
+        self.assertEqual(stats["enqueued_total"], 7)
+
+    def test_concurrent_workers_never_share_a_webhook(self):
+        webhook_ids = self.enqueue(300)
+        claimed = []
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                batch = get_webhook_batch(7)
+                if not batch:
+                    return
+                with lock:
+                    claimed.extend(webhook["id"] for webhook in batch)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(claimed), len(webhook_ids))
+        self.assertEqual(set(claimed), set(webhook_ids))
+
+    def test_missing_payloads_are_skipped(self):
+        webhook_ids = self.enqueue(5)
+        self.redis.delete(f"{webhook_queue.WEBHOOK_DATA_PREFIX}{webhook_ids[0]}")
+
+        batch = get_webhook_batch(5)
+
+        self.assertEqual({webhook["id"] for webhook in batch}, set(webhook_ids[1:]))
+        self.assertTrue(mark_webhook_completed(batch[0]["id"], {"ok": True}))
+        self.assertIsNone(self.redis.get(f"{WEBHOOK_PROCESSING_KEY}:{batch[0]['id']}"))
+
+    def test_queue_functions_fall_back_without_redis(self):
+        with patch.object(webhook_queue, "redis_client", None):
+            self.assertIsNone(enqueue_webhook("paystack", "ref-1", "success", {"reference": "ref-1"}))
+            self.assertEqual(get_webhook_batch(5), [])
+            self.assertFalse(mark_webhook_completed("wh-1", {"ok": True}))
+            self.assertFalse(mark_webhook_failed("wh-1", "gateway down"))
+            self.assertEqual(get_queue_stats(), {"error": "Redis is unavailable"})
+
+
+class RetryWebhookViewTests(SimpleTestCase):
+
+    def setUp(self):
+        self.redis = FakeStrictRedis(decode_responses=True)
+        for module in (webhook_queue, admin_views):
+            patcher = patch.object(module, "redis_client", self.redis)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def retry(self, webhook_id):
+        request = RequestFactory().post(f"/payment/admin/retry-webhook/{webhook_id}/")
+        request.user = SimpleNamespace(is_active=True, is_staff=True)
+        return admin_views.retry_webhook(request, webhook_id)
+
+    def test_failed_webhook_is_requeued(self):
+        webhook_id = enqueue_webhook("paystack", "ref-1", "success", {"reference": "ref-1"})
+        self.redis.zrem(WEBHOOK_QUEUE_KEY, webhook_id)
+        mark_webhook_failed(webhook_id, "gateway down", retry=False)
+
+        response = self.retry(webhook_id)
+
+        self.assertEqual(response.status_code, 200)
+        new_id = json.loads(response.content)["webhook_id"]
+        self.assertEqual(self.redis.zrange(WEBHOOK_QUEUE_KEY, 0, -1), [new_id])
+        requeued = json.loads(self.redis.get(f"{WEBHOOK_DATA_PREFIX}{new_id}"))
+        self.assertEqual(requeued["reference"], "ref-1")
+        # The gateway's status survives mark_webhook_failed overwriting "status"
+        self.assertEqual(requeued["gateway_status"], "success")
+        self.assertEqual(requeued["status"], "success")
+        self.assertEqual(self.redis.llen(WEBHOOK_FAILED_KEY), 0)
+        self.assertIsNone(self.redis.get(f"{WEBHOOK_DATA_PREFIX}{webhook_id}"))
+
+    def test_unknown_webhook_is_not_found(self):
+        self.assertEqual(self.retry("missing").status_code, 404)
@@ -7,6 +7,15 @@ with support for:
 2. Prioritizing webhooks based on type and age
 3. Handling retries with exponential backoff
 4. Monitoring queue health and performance
+
+The queue lives in Redis data structures (a sorted set, lists and a stats
+hash) that Django's cache API does not expose, so the module talks to
+``core.redis.cache.redis_client`` directly.
+
+Workers claim batches without a global lock: ``get_webhook_batch`` pops the
+lowest scored ids, marks them as processing and reads their payloads in a
+single server-side script, so any number of workers can claim concurrently
+and no webhook is handed to two of them.
 """
 
 import json
@@ -17,10 +26,10 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, Union  
 
 from django.conf import settings
-from django.core.cache import cache
 from django.utils import timezone
+from redis.exceptions import ResponseError
 
-from core.redis_lock import redis_lock
+from core.redis.cache import redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +39,8 @@ WEBHOOK_PROCESSING_KEY = "payment:webhook_processing"
 WEBHOOK_FAILED_KEY = "payment:webhook_failed"
 WEBHOOK_COMPLETED_KEY = "payment:webhook_completed"
 WEBHOOK_DATA_PREFIX = "payment:webhook_data:"
-WEBHOOK_STATS_KEY = "payment:webhook_stats"
+# A hash of running totals (the old JSON string under "payment:webhook_stats" expires)
+WEBHOOK_STATS_KEY = "payment:webhook_stats:totals"
 
 # Expiration times
 QUEUE_EXPIRATION = 60 * 60 * 24 * 7  # 7 days
@@ -55,7 +65,7 @@ def enqueue_webhook(
     status: str,
     raw_data: Dict[str, Any],
     priority: int = PRIORITY_NORMAL,
-) -> str:
+) -> Optional[str]:
     """
     Add a webhook to the processing queue.
     
@@ -67,8 +77,12 @@ def enqueue_webhook(
         priority: Priority level (0=high, 1=normal, 2=low)
         
     Returns:
-        Webhook ID
+        Webhook ID, or None if Redis is unavailable
     """
+    if redis_client is None:
+        logger.warning(f"Redis is unavailable, webhook for {payment_method} payment {reference} not queued")
+        return None
+
     # Generate webhook ID
     webhook_id = str(uuid.uuid4())
     
@@ -78,6 +92,8 @@ def enqueue_webhook(
         "payment_method": payment_method,
         "reference": reference,
         "status": status,
+        # "status" tracks the queue state from here on; keep the gateway's own
+        "gateway_status": status,
         "raw_data": raw_data,
         "priority": priority,
         "enqueued_at": timezone.now().isoformat(),
@@ -88,16 +104,16 @@ def enqueue_webhook(
     
     # Store webhook data
     data_key = f"{WEBHOOK_DATA_PREFIX}{webhook_id}"
-    cache.set(data_key, json.dumps(webhook_data), DATA_EXPIRATION)
+    redis_client.set(data_key, json.dumps(webhook_data), ex=DATA_EXPIRATION)
     
     # Add to queue with priority score
     # Lower score = higher priority
     score = priority * 1000 + int(time.time())
-    cache.zadd(WEBHOOK_QUEUE_KEY, {webhook_id: score})
+    redis_client.zadd(WEBHOOK_QUEUE_KEY, {webhook_id: score})
     
     # Set expiration on queue if not already set
-    if not cache.ttl(WEBHOOK_QUEUE_KEY):
-        cache.expire(WEBHOOK_QUEUE_KEY, QUEUE_EXPIRATION)
+    if redis_client.ttl(WEBHOOK_QUEUE_KEY) < 0:
+        redis_client.expire(WEBHOOK_QUEUE_KEY, QUEUE_EXPIRATION)
     
     # Update stats
     update_webhook_stats("enqueued")
@@ -106,62 +122,119 @@ def enqueue_webhook(
     return webhook_id
 
 
+# Claims a batch in one round trip: pop the lowest scored ids, mark each as
+# processing and return the ids with their payloads. Runs atomically on the
+# server, so concurrent workers never receive the same webhook.
+# KEYS: queue, stats hash
+# ARGV: batch size, processing key prefix, data key prefix, started_at, processing TTL
+CLAIM_BATCH_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1], ARGV[1])
+if #popped == 0 then
+    return {{}, {}}
+end
+local ids = {}
+local data_keys = {}
+for i = 1, #popped, 2 do
+    local webhook_id = popped[i]
+    ids[#ids + 1] = webhook_id
+    data_keys[#data_keys + 1] = ARGV[3] .. webhook_id
+    local marker = cjson.encode({webhook_id = webhook_id, started_at = ARGV[4]})
+    redis.call('SET', ARGV[2] .. webhook_id, marker, 'EX', ARGV[5])
+end
+redis.call('HINCRBY', KEYS[2], 'processing_total', #ids)
+redis.call('HSET', KEYS[2], 'last_updated', ARGV[4])
+return {ids, redis.call('MGET', unpack(data_keys))}
+"""
+
+# Set to False the first time the server rejects scripts (e.g. FakeRedis
+# without Lua support); claims then use ZPOPMIN plus a pipeline
+_scripting_available = True
+
+
+def _claim_with_script(batch_size: int, started_at: str) -> Tuple[List[str], List[Optional[str]]]:
+    ids, payloads = redis_client.eval(
+        CLAIM_BATCH_SCRIPT,
+        2,
+        WEBHOOK_QUEUE_KEY,
+        WEBHOOK_STATS_KEY,
+        batch_size,
+        f"{WEBHOOK_PROCESSING_KEY}:",
+        WEBHOOK_DATA_PREFIX,
+        started_at,
+        PROCESSING_EXPIRATION,
+    )
+    return ids, payloads
+
+
+def _claim_with_pipeline(batch_size: int, started_at: str) -> Tuple[List[str], List[Optional[str]]]:
+    # ZPOPMIN alone decides ownership; the pipeline that follows only marks
+    # and reads what this worker already owns. A worker that dies between
+    # the two round trips leaves its ids unmarked, which the script avoids.
+    popped = redis_client.zpopmin(WEBHOOK_QUEUE_KEY, batch_size)
+    ids = [webhook_id for webhook_id, _ in popped]
+    if not ids:
+        return [], []
+
+    pipe = redis_client.pipeline(transaction=False)
+    for webhook_id in ids:
+        pipe.set(
+            f"{WEBHOOK_PROCESSING_KEY}:{webhook_id}",
+            json.dumps({"webhook_id": webhook_id, "started_at": started_at}),
+            ex=PROCESSING_EXPIRATION,
+        )
+    pipe.hincrby(WEBHOOK_STATS_KEY, "processing_total", len(ids))
+    pipe.hset(WEBHOOK_STATS_KEY, "last_updated", started_at)
+    pipe.mget([f"{WEBHOOK_DATA_PREFIX}{webhook_id}" for webhook_id in ids])
+    return ids, pipe.execute()[-1]
+
+
 def get_webhook_batch(batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
     """
-    Get a batch of webhooks to process.
-    
+    Claim a batch of webhooks to process.
+
+    The batch is moved from the queue to processing and its payloads are
+    read in one round trip, without a global lock, so several workers can
+    call this at the same time.
+
     Args:
         batch_size: Maximum number of webhooks to retrieve
-        
+
     Returns:
         List of webhook data dictionaries
     """
+    global _scripting_available
+
+    if redis_client is None:
+        logger.warning("Redis is unavailable, no webhooks claimed")
+        return []
+
     # Ensure batch size is within limits
     batch_size = max(MIN_BATCH_SIZE, min(batch_size, MAX_BATCH_SIZE))
-    
-    # Get lock to prevent multiple workers from processing the same webhooks
-    with redis_lock("webhook_batch_lock", timeout=30):
-        # Get webhook IDs from queue, ordered by score (priority)
-        webhook_ids = cache.zrange(WEBHOOK_QUEUE_KEY, 0, batch_size - 1)
-        
-        if not webhook_ids:
-            return []
-        
-        # Move webhooks to processing set
-        for webhook_id in webhook_ids:
-            # Remove from queue
-            cache.zrem(WEBHOOK_QUEUE_KEY, webhook_id)
-            
-            # Add to processing set with expiration time
-            processing_data = {
-                "webhook_id": webhook_id,
-                "started_at": timezone.now().isoformat(),
-            }
-            cache.set(
-                f"{WEBHOOK_PROCESSING_KEY}:{webhook_id}",
-                json.dumps(processing_data),
-                PROCESSING_EXPIRATION,
-            )
-        
-        # Get webhook data for each ID
-        webhooks = []
-        for webhook_id in webhook_ids:
-            data_key = f"{WEBHOOK_DATA_PREFIX}{webhook_id}"
-            webhook_data_json = cache.get(data_key)
-            
-            if webhook_data_json:
-                try:
-                    webhook_data = json.loads(webhook_data_json)
-                    webhooks.append(webhook_data)
-                except json.JSONDecodeError:
-                    logger.error(f"Failed to parse webhook data for {webhook_id}")
-            else:
-                logger.error(f"Webhook data not found for {webhook_id}")
-        
-        # Update stats
-        update_webhook_stats("processing", len(webhooks))
-        
-        return webhooks
+    started_at = timezone.now().isoformat()
+
+    ids, payloads = None, None
+    if _scripting_available:
+        try:
+            ids, payloads = _claim_with_script(batch_size, started_at)
+        except ResponseError as e:
+            if "unknown command" not in str(e).lower():
+                raise
+            logger.warning("Redis scripting unavailable, claiming webhooks with ZPOPMIN")
+            _scripting_available = False
+    if ids is None:
+        ids, payloads = _claim_with_pipeline(batch_size, started_at)
+
+    webhooks = []
+    for webhook_id, webhook_data_json in zip(ids, payloads):
+        if not webhook_data_json:
+            logger.error(f"Webhook data not found for {webhook_id}")
+            continue
+        try:
+            webhooks.append(json.loads(webhook_data_json))
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse webhook data for {webhook_id}")
+
+    return webhooks
 
 
 def mark_webhook_completed(webhook_id: str, result: Dict[str, Any]) -> bool:
@@ -175,10 +248,14 @@ def mark_webhook_completed(webhook_id: str, result: Dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    if redis_client is None:
+        logger.warning(f"Redis is unavailable, webhook {webhook_id} not marked as completed")
+        return False
+
     try:
         # Get webhook data
         data_key = f"{WEBHOOK_DATA_PREFIX}{webhook_id}"
-        webhook_data_json = cache.get(data_key)
+        webhook_data_json = redis_client.get(data_key)
         
         if not webhook_data_json:
             logger.error(f"Webhook data not found for {webhook_id}")
@@ -192,10 +269,10 @@ def mark_webhook_completed(webhook_id: str, result: Dict[str, Any]) -> bool:
         webhook_data["status"] = "completed"
         
         # Store updated data
-        cache.set(data_key, json.dumps(webhook_data), DATA_EXPIRATION)
+        redis_client.set(data_key, json.dumps(webhook_data), ex=DATA_EXPIRATION)
         
         # Remove from processing
-        cache.delete(f"{WEBHOOK_PROCESSING_KEY}:{webhook_id}")
+        redis_client.delete(f"{WEBHOOK_PROCESSING_KEY}:{webhook_id}")
         
         # Add to completed set
         completed_data = {
@@ -205,14 +282,14 @@ def mark_webhook_completed(webhook_id: str, result: Dict[str, Any]) -> bool:
             "completed_at": webhook_data["completed_at"],
             "result": result,
         }
-        cache.lpush(WEBHOOK_COMPLETED_KEY, json.dumps(completed_data))
+        redis_client.lpush(WEBHOOK_COMPLETED_KEY, json.dumps(completed_data))
         
         # Trim completed list to prevent it from growing too large
-        cache.ltrim(WEBHOOK_COMPLETED_KEY, 0, 999)  # Keep last 1000 entries
+        redis_client.ltrim(WEBHOOK_COMPLETED_KEY, 0, 999)  # Keep last 1000 entries
         
         # Set expiration on completed list if not already set
-        if not cache.ttl(WEBHOOK_COMPLETED_KEY):
-            cache.expire(WEBHOOK_COMPLETED_KEY, QUEUE_EXPIRATION)
+        if redis_client.ttl(WEBHOOK_COMPLETED_KEY) < 0:
+            redis_client.expire(WEBHOOK_COMPLETED_KEY, QUEUE_EXPIRATION)
         
         # Update stats
         update_webhook_stats("completed")
@@ -236,10 +313,14 @@ def mark_webhook_failed(webhook_id: str, error: str, retry: bool = True) -> bool
     Returns:
         True if successful, False otherwise
     """
+    if redis_client is None:
+        logger.warning(f"Redis is unavailable, webhook {webhook_id} not marked as failed")
+        return False
+
     try:
         # Get webhook data
         data_key = f"{WEBHOOK_DATA_PREFIX}{webhook_id}"
-        webhook_data_json = cache.get(data_key)
+        webhook_data_json = redis_client.get(data_key)
         
         if not webhook_data_json:
             logger.error(f"Webhook data not found for {webhook_id}")
@@ -268,14 +349,14 @@ def mark_webhook_failed(webhook_id: str, error: str, retry: bool = True) -> bool
                 "attempts": webhook_data["attempts"],
                 "error": error,
             }
-            cache.lpush(WEBHOOK_FAILED_KEY, json.dumps(failed_data))
+            redis_client.lpush(WEBHOOK_FAILED_KEY, json.dumps(failed_data))
             
             # Trim failed list to prevent it from growing too large
-            cache.ltrim(WEBHOOK_FAILED_KEY, 0, 999)  # Keep last 1000 entries
+            redis_client.ltrim(WEBHOOK_FAILED_KEY, 0, 999)  # Keep last 1000 entries
             
             # Set expiration on failed list if not already set
-            if not cache.ttl(WEBHOOK_FAILED_KEY):
-                cache.expire(WEBHOOK_FAILED_KEY, QUEUE_EXPIRATION)
+            if redis_client.ttl(WEBHOOK_FAILED_KEY) < 0:
+                redis_client.expire(WEBHOOK_FAILED_KEY, QUEUE_EXPIRATION)
             
             # Update stats
             update_webhook_stats("failed")
@@ -292,7 +373,7 @@ def mark_webhook_failed(webhook_id: str, error: str, retry: bool = True) -> bool
             
             # Requeue with delay
             score = webhook_data.get("priority", PRIORITY_NORMAL) * 1000 + int(time.time() + delay)
-            cache.zadd(WEBHOOK_QUEUE_KEY, {webhook_id: score})
+            redis_client.zadd(WEBHOOK_QUEUE_KEY, {webhook_id: score})
             
             # Update stats
             update_webhook_stats("retried")
@@ -302,10 +383,10 @@ def mark_webhook_failed(webhook_id: str, error: str, retry: bool = True) -> bool
             )
         
         # Store updated data
-        cache.set(data_key, json.dumps(webhook_data), DATA_EXPIRATION)
+        redis_client.set(data_key, json.dumps(webhook_data), ex=DATA_EXPIRATION)
         
         # Remove from processing
-        cache.delete(f"{WEBHOOK_PROCESSING_KEY}:{webhook_id}")
+        redis_client.delete(f"{WEBHOOK_PROCESSING_KEY}:{webhook_id}")
         
         return True
     except Exception as e:
@@ -325,7 +406,7 @@ def retry_failed_webhooks(max_count: int = 100) -> int:
     """
     try:
         # Get failed webhooks
-        failed_webhooks = cache.lrange(WEBHOOK_FAILED_KEY, 0, max_count - 1)
+        failed_webhooks = redis_client.lrange(WEBHOOK_FAILED_KEY, 0, max_count - 1)
         
         if not failed_webhooks:
             return 0
@@ -342,7 +423,7 @@ def retry_failed_webhooks(max_count: int = 100) -> int:
                 
                 # Get full webhook data
                 data_key = f"{WEBHOOK_DATA_PREFIX}{webhook_id}"
-                webhook_data_json = cache.get(data_key)
+                webhook_data_json = redis_client.get(data_key)
                 
                 if not webhook_data_json:
                     continue
@@ -355,14 +436,14 @@ def retry_failed_webhooks(max_count: int = 100) -> int:
                 webhook_data["status"] = "retrying"
                 
                 # Store updated data
-                cache.set(data_key, json.dumps(webhook_data), DATA_EXPIRATION)
+                redis_client.set(data_key, json.dumps(webhook_data), ex=DATA_EXPIRATION)
                 
                 # Requeue with high priority
                 score = PRIORITY_HIGH * 1000 + int(time.time())
-                cache.zadd(WEBHOOK_QUEUE_KEY, {webhook_id: score})
+                redis_client.zadd(WEBHOOK_QUEUE_KEY, {webhook_id: score})
                 
                 # Remove from failed list
-                cache.lrem(WEBHOOK_FAILED_KEY, 1, webhook_json)
+                redis_client.lrem(WEBHOOK_FAILED_KEY, 1, webhook_json)
                 
                 requeued_count += 1
                 
@@ -379,6 +460,9 @@ def retry_failed_webhooks(max_count: int = 100) -> int:
         return 0
 
 
+STATS_ACTIONS = ("enqueued", "completed", "failed", "retried", "requeued", "processing")
+
+
 def get_queue_stats() -> Dict[str, Any]:
     """
     Get webhook queue statistics.
@@ -386,41 +470,32 @@ def get_queue_stats() -> Dict[str, Any]:
     Returns:
         Dictionary with queue statistics
     """
+    if redis_client is None:
+        return {"error": "Redis is unavailable"}
+
     try:
         # Get counts
-        queued_count = cache.zcard(WEBHOOK_QUEUE_KEY) or 0
-        processing_keys = cache.keys(f"{WEBHOOK_PROCESSING_KEY}:*")
+        queued_count = redis_client.zcard(WEBHOOK_QUEUE_KEY) or 0
+        processing_keys = list(redis_client.scan_iter(f"{WEBHOOK_PROCESSING_KEY}:*"))
         processing_count = len(processing_keys) if processing_keys else 0
-        failed_count = cache.llen(WEBHOOK_FAILED_KEY) or 0
-        completed_count = cache.llen(WEBHOOK_COMPLETED_KEY) or 0
-        
-        # Get stats from Redis
-        stats_json = cache.get(WEBHOOK_STATS_KEY)
-        stats = json.loads(stats_json) if stats_json else {
-            "enqueued_total": 0,
-            "completed_total": 0,
-            "failed_total": 0,
-            "retried_total": 0,
-            "requeued_total": 0,
-            "processing_total": 0,
-            "last_updated": timezone.now().isoformat(),
-        }
+        failed_count = redis_client.llen(WEBHOOK_FAILED_KEY) or 0
+        completed_count = redis_client.llen(WEBHOOK_COMPLETED_KEY) or 0
+        
+        # Running totals are kept in a hash by update_webhook_stats
+        stats = redis_client.hgetall(WEBHOOK_STATS_KEY) or {}
         
         # Combine current counts with total stats
-        return {
+        result = {
             "queued": queued_count,
             "processing": processing_count,
             "failed": failed_count,
             "completed": completed_count,
-            "enqueued_total": stats.get("enqueued_total", 0),
-            "completed_total": stats.get("completed_total", 0),
-            "failed_total": stats.get("failed_total", 0),
-            "retried_total": stats.get("retried_total", 0),
-            "requeued_total": stats.get("requeued_total", 0),
-            "processing_total": stats.get("processing_total", 0),
-            "last_updated": stats.get("last_updated", timezone.now().isoformat()),
-            "current_time": timezone.now().isoformat(),
         }
+        for action in STATS_ACTIONS:
+            result[f"{action}_total"] = int(stats.get(f"{action}_total", 0))
+        result["last_updated"] = stats.get("last_updated", timezone.now().isoformat())
+        result["current_time"] = timezone.now().isoformat()
+        return result
     except Exception as e:
         logger.exception(f"Error getting queue stats: {str(e)}")
         return {"error": str(e)}
@@ -429,6 +504,9 @@ def get_queue_stats() -> Dict[str, Any]:
 def update_webhook_stats(action: str, count: int = 1) -> bool:
     """
     Update webhook statistics.
+
+    Counters are incremented in place with HINCRBY, so concurrent workers
+    never overwrite each other's updates.
     
     Args:
         action: Action type (enqueued, completed, failed, retried, requeued, processing)
@@ -437,39 +515,14 @@ def update_webhook_stats(action: str, count: int = 1) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    if action not in STATS_ACTIONS or redis_client is None:
+        return False
     try:
-        # Get current stats
-        stats_json = cache.get(WEBHOOK_STATS_KEY)
-        stats = json.loads(stats_json) if stats_json else {
-            "enqueued_total": 0,
-            "completed_total": 0,
-            "failed_total": 0,
-            "retried_total": 0,
-            "requeued_total": 0,
-            "processing_total": 0,
-            "last_updated": timezone.now().isoformat(),
-        }
-        
-        # Update stats based on action
-        if action == "enqueued":
-            stats["enqueued_total"] = stats.get("enqueued_total", 0) + count
-        elif action == "completed":
-            stats["completed_total"] = stats.get("completed_total", 0) + count
-        elif action == "failed":
-            stats["failed_total"] = stats.get("failed_total", 0) + count
-        elif action == "retried":
-            stats["retried_total"] = stats.get("retried_total", 0) + count
-        elif action == "requeued":
-            stats["requeued_total"] = stats.get("requeued_total", 0) + count
-        elif action == "processing":
-            stats["processing_total"] = stats.get("processing_total", 0) + count
-        
-        # Update timestamp
-        stats["last_updated"] = timezone.now().isoformat()
-        
-        # Store updated stats
-        cache.set(WEBHOOK_STATS_KEY, json.dumps(stats), STATS_EXPIRATION)
-        
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hincrby(WEBHOOK_STATS_KEY, f"{action}_total", count)
+        pipe.hset(WEBHOOK_STATS_KEY, "last_updated", timezone.now().isoformat())
+        pipe.expire(WEBHOOK_STATS_KEY, STATS_EXPIRATION)
+        pipe.execute()
         return True
     except Exception as e:
         logger.exception(f"Error updating webhook stats: {str(e)}")
@@ -485,7 +538,7 @@ def cleanup_stale_processing() -> int:
     """
     try:
         # Get processing keys
-        processing_keys = cache.keys(f"{WEBHOOK_PROCESSING_KEY}:*")
+        processing_keys = list(redis_client.scan_iter(f"{WEBHOOK_PROCESSING_KEY}:*"))
         
         if not processing_keys:
             return 0
@@ -498,7 +551,7 @@ def cleanup_stale_processing() -> int:
                 webhook_id = key.split(":")[-1]
                 
                 # Get processing data
-                processing_data_json = cache.get(key)
+                processing_data_json = redis_client.get(key)
                 
                 if not processing_data_json:
                     continue
@@ -510,11 +563,11 @@ def cleanup_stale_processing() -> int:
                 if timezone.now() - started_at > timedelta(minutes=10):
                     # Get webhook data
                     data_key = f"{WEBHOOK_DATA_PREFIX}{webhook_id}"
-                    webhook_data_json = cache.get(data_key)
+                    webhook_data_json = redis_client.get(data_key)
                     
                     if not webhook_data_json:
                         # Remove stale processing key
-                        cache.delete(key)
+                        redis_client.delete(key)
                         continue
                     
                     webhook_data = json.loads(webhook_data_json)
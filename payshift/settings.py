@@ -84,6 +84,10 @@ MIDDLEWARE = [
     'core.error_handler.ErrorHandlingMiddleware',
 ]
 
+# Request latency histograms with DB/Redis breakdown, scraped from /core/metrics/
+if os.getenv('METRICS_ENABLED', 'True') == 'True':
+    MIDDLEWARE.insert(0, 'core.metrics.MetricsMiddleware')
+
 ROOT_URLCONF = 'payshift.urls'
 
 TEMPLATES = [
@@ -104,17 +108,83 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'payshift.wsgi.application'
 
-# Database configuration - SQLite only
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / os.getenv('SQLITE_DB_PATH', 'db.sqlite3'),
-        'OPTIONS': {
-            'timeout': 20,
-        },
+# Database configuration
+# DB_ENGINE selects the backend: 'sqlite' (default, local development) or
+# 'postgres'. With Postgres, connections are kept open between requests
+# (DB_CONN_MAX_AGE) and health-checked before reuse; point POSTGRES_HOST at
+# PgBouncer (transaction pooling) and set DB_PGBOUNCER=True to pool them.
+DB_ENGINE = os.getenv('DB_ENGINE', 'sqlite').lower()
+
+if DB_ENGINE in ('postgres', 'postgresql'):
+    def _postgres_database(host, port):
+        return {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.getenv('POSTGRES_DB', 'payshift_db'),
+            'USER': os.getenv('POSTGRES_USER', 'postgres'),
+            'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'postgres'),
+            'HOST': host,
+            'PORT': port,
+            'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+            'CONN_HEALTH_CHECKS': True,
+            # Server-side cursors do not survive transaction pooling
+            'DISABLE_SERVER_SIDE_CURSORS': os.getenv('DB_PGBOUNCER', 'False') == 'True',
+            'OPTIONS': {
+                'connect_timeout': 10,
+            },
+        }
+
+    DATABASES = {
+        'default': _postgres_database(
+            os.getenv('POSTGRES_HOST', 'localhost'), os.getenv('POSTGRES_PORT', '5432')
+        ),
+    }
+
+    # Read replica for read-only endpoints (see core.db_router)
+    if os.getenv('DB_REPLICA_HOST'):
+        DATABASES['replica'] = _postgres_database(
+            os.getenv('DB_REPLICA_HOST'), os.getenv('DB_REPLICA_PORT', '5432')
+        )
+        DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / os.getenv('SQLITE_DB_PATH', 'db.sqlite3'),
+            'OPTIONS': {
+                'timeout': 20,
+            },
+        }
     }
+
+DATABASE_ROUTERS = ['core.db_router.ReadReplicaRouter']
+
+# SQLite tuning applied to every new connection (see core.db_tuning).
+# WAL lets readers run alongside the single writer; synchronous=NORMAL is
+# crash-safe in WAL mode and only fsyncs at checkpoints.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024))),  # 256 MB
+    'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', '-64000')),  # Negative = KiB, so 64 MB
+    'temp_store': 'MEMORY',
 }
 
+# Write-behind queue for high-frequency inserts (location history, activity
+# logs, notifications); see core.write_behind. Rows are bulk inserted every
+# WRITE_BEHIND_FLUSH_INTERVAL seconds by a background thread per process.
+WRITE_BEHIND_ENABLED = os.getenv('WRITE_BEHIND_ENABLED', 'False') == 'True'
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv('WRITE_BEHIND_FLUSH_INTERVAL', '1.0'))
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv('WRITE_BEHIND_BATCH_SIZE', '500'))
+WRITE_BEHIND_MAX_PENDING = int(os.getenv('WRITE_BEHIND_MAX_PENDING', '10000'))
+
+# Live location ingestion (see jobchat.location_pipeline). Every ping is
+# broadcast, but a LocationHistory row is only written once the user has
+# moved LOCATION_MIN_DISTANCE_M metres or LOCATION_MIN_INTERVAL seconds
+# have passed since the last written one.
+LOCATION_MIN_DISTANCE_M = float(os.getenv('LOCATION_MIN_DISTANCE_M', '25'))
+LOCATION_MIN_INTERVAL = float(os.getenv('LOCATION_MIN_INTERVAL', '30'))
+LOCATION_LATEST_TTL = int(os.getenv('LOCATION_LATEST_TTL', '3600'))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -279,6 +349,33 @@ CACHE_TTL_APPLICATIONS = int(os.getenv('CACHE_TTL_APPLICATIONS', '300'))  # 5 mi
 # Google Maps API Key
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 
+# Background job geocoding (see jobs.geocoding_queue). Each provider gets a
+# token bucket of (requests per second, burst) shared by all workers, and is
+# skipped for GEOCODING_BREAKER_COOLDOWN seconds after
+# GEOCODING_BREAKER_THRESHOLD consecutive failures.
+GEOCODING_RATE_LIMITS = {
+    'google': (float(os.getenv('GEOCODING_GOOGLE_RATE', '50')), 50),
+    'nominatim': (float(os.getenv('GEOCODING_NOMINATIM_RATE', '1')), 1),
+    'mapbox': (float(os.getenv('GEOCODING_MAPBOX_RATE', '10')), 10),
+}
+GEOCODING_BREAKER_THRESHOLD = int(os.getenv('GEOCODING_BREAKER_THRESHOLD', '5'))
+GEOCODING_BREAKER_COOLDOWN = int(os.getenv('GEOCODING_BREAKER_COOLDOWN', '60'))
+GEOCODING_QUEUE_BATCH_SIZE = int(os.getenv('GEOCODING_QUEUE_BATCH_SIZE', '50'))
+
+# Geocoding cache hits are served from a per-process copy of the hottest
+# entries and counted in memory, written to Redis every
+# GEOCODE_HIT_FLUSH_INTERVAL seconds (see jobs.geocoding_cache).
+GEOCODE_L1_MAX_ENTRIES = int(os.getenv('GEOCODE_L1_MAX_ENTRIES', '2000'))
+GEOCODE_HIT_FLUSH_INTERVAL = int(os.getenv('GEOCODE_HIT_FLUSH_INTERVAL', '10'))
+
+# Request and operation metrics (see core.metrics). Each process adds its
+# counters to Redis every METRICS_FLUSH_INTERVAL seconds; /core/metrics/
+# requires "Authorization: Bearer <METRICS_TOKEN>" when a token is set and a
+# staff session otherwise.
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True') == 'True'
+METRICS_FLUSH_INTERVAL = int(os.getenv('METRICS_FLUSH_INTERVAL', '5'))
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
 # External URLs
 FRONTEND_URL = os.getenv("FRONTEND_URL")
 BASE_URL = os.getenv("BASE_URL")
@@ -433,6 +530,16 @@ FLUTTERWAVE_WEBHOOK_HASH = os.getenv(
     "FLUTTERWAVE_WEBHOOK_HASH", "test_hash_for_development"
 )
 PAYSTACK_SECRET_KEY = os.getenv("PAYSTACK_SECRET_KEY", "sk_test_ef9e10ac4bf5dcd69617a61636d21c88528afb1d")
+PAYSTACK_BASE_URL = os.getenv("PAYSTACK_BASE_URL", "https://api.paystack.co")
+FLUTTERWAVE_BASE_URL = os.getenv("FLUTTERWAVE_BASE_URL", "https://api.flutterwave.com/v3")
+
+# Gateway HTTP calls share pooled keep-alive sessions (see payment.services).
+# CONCURRENCY bounds in-flight verification requests per batch and sizes the
+# connection pool; TIMEOUT is the per-request read timeout in seconds.
+PAYSTACK_CONCURRENCY = int(os.getenv("PAYSTACK_CONCURRENCY", "10"))
+PAYSTACK_TIMEOUT = float(os.getenv("PAYSTACK_TIMEOUT", "10"))
+FLUTTERWAVE_CONCURRENCY = int(os.getenv("FLUTTERWAVE_CONCURRENCY", "5"))
+FLUTTERWAVE_TIMEOUT = float(os.getenv("FLUTTERWAVE_TIMEOUT", "15"))
 
 # ==
 # 📌 Django Debug Toolbar Configuration (Phase 2.2d)
@@ -75,6 +75,7 @@ from core.exceptions import (
     AuthenticationError,
     AuthorizationError,
 )
+from core.db_router import use_read_replica
 from core.logging_utils import log_endpoint, logger as core_logger, api_logger
 
 # Import caching utilities for Phase 2.2c
@@ -234,6 +235,7 @@ def create_rating(request, payload: ReviewCreateSchema):
 @log_endpoint(core_logger)
 @cache_api_response(timeout=CACHE_TTL_REVIEWS, prefix='reviews:user')
 @rating_router.get("/reviews/{user_id}", tags=["Review"])
+@use_read_replica
 def get_user_ratings_and_reviews(request, user_id: int, filter: str = "all"):
     """
     GET /reviews/{user_id}?filter={filter} - Get user ratings and filtered reviews
@@ -336,6 +338,7 @@ def get_user_ratings_and_reviews(request, user_id: int, filter: str = "all"):
 @log_endpoint(core_logger)
 @cache_api_response(timeout=CACHE_TTL_REVIEWS, prefix='reviews:reviewer')
 @rating_router.get("/ratings/reviewer_{user_id}/", tags=["Review"])
+@use_read_replica
 def get_reviews_by_user(request, user_id: int):
     """
     GET /ratings/reviewer_{user_id}/ - Get reviews submitted by a user (where they are the reviewer)
@@ -4,9 +4,18 @@ from django.conf import settings
 from django.core.cache import cache
 from django.core.serializers.json import DjangoJSONEncoder
 
+from core.redis.cache_tags import delete_pattern
+from core.redis.local_cache import local_cache
+from core.redis_settings import L1_CACHE_DEFAULT_TIMEOUT, L1_CACHE_ENABLED
+
 
 class GamificationCache:
-    """Handles caching for gamification-related data."""
+    """
+    Handles caching for gamification-related data.
+
+    Achievement and badge definitions are read far more often than they
+    change, so they are also kept in the in-process L1 cache.
+    """
 
     @staticmethod
     def _get_redis():
@@ -23,42 +32,52 @@ class GamificationCache:
         """Deserialize data from Redis storage."""
         return json.loads(data) if data else None
 
+    @staticmethod
+    def _set_definition(key, data):
+        """Cache a definition in Redis and the local tier."""
+        redis = GamificationCache._get_redis()
+        serialized = GamificationCache._serialize(data)
+        redis.set(key, serialized, ex=3600)  # Cache for 1 hour
+        if L1_CACHE_ENABLED and local_cache.listen(redis):
+            local_cache.invalidate(keys=[key], client=redis)
+            local_cache.set(key, serialized, L1_CACHE_DEFAULT_TIMEOUT)
+
+    @staticmethod
+    def _get_definition(key):
+        """Get a cached definition, trying the local tier first."""
+        redis = GamificationCache._get_redis()
+        use_local = L1_CACHE_ENABLED and local_cache.listen(redis)
+        data = local_cache.get(key) if use_local else None
+        if data is None:
+            data = redis.get(key)
+            if use_local and data is not None:
+                local_cache.set(key, data, L1_CACHE_DEFAULT_TIMEOUT)
+        return GamificationCache._deserialize(data)
+
     @staticmethod
     def cache_achievement(achievement_id, data):
         """Cache an achievement."""
-        redis = GamificationCache._get_redis()
-        key = f"achievement:{achievement_id}"
-        redis.set(key, GamificationCache._serialize(data))
-        redis.expire(key, 3600)  # Cache for 1 hour
+        GamificationCache._set_definition(f"achievement:{achievement_id}", data)
 
     @staticmethod
     def get_achievement(achievement_id):
         """Get a cached achievement."""
-        redis = GamificationCache._get_redis()
-        key = f"achievement:{achievement_id}"
-        data = redis.get(key)
-        return GamificationCache._deserialize(data)
+        return GamificationCache._get_definition(f"achievement:{achievement_id}")
 
     @staticmethod
     def cache_badge(badge_id, data):
         """Cache a badge."""
-        redis = GamificationCache._get_redis()
-        key = f"badge:{badge_id}"
-        redis.set(key, GamificationCache._serialize(data))
-        redis.expire(key, 3600)  # Cache for 1 hour
+        GamificationCache._set_definition(f"badge:{badge_id}", data)
 
     @staticmethod
     def get_badge(badge_id):
         """Get a cached badge."""
-        redis = GamificationCache._get_redis()
-        key = f"badge:{badge_id}"
-        data = redis.get(key)
-        return GamificationCache._deserialize(data)
+        return GamificationCache._get_definition(f"badge:{badge_id}")
 
     @staticmethod
     def clear_pattern(pattern):
         """Clear all keys matching a pattern."""
         redis = GamificationCache._get_redis()
-        keys = redis.keys(pattern)
-        if keys:
-            redis.delete(*keys)
+        if L1_CACHE_ENABLED:
+            local_cache.invalidate(patterns=[pattern], client=redis)
+        return delete_pattern(pattern, client=redis)
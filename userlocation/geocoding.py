@@ -0,0 +1,185 @@
+"""
+Asynchronous reverse geocoding for UserLocation.
+
+Saving a UserLocation used to call Nominatim inline whenever the address was
+empty, which could hold the request for up to the 10 second timeout. Now the
+save only schedules ``enrich_location`` (a Celery task) once the
+transaction commits, and the task fills in the address:
+
+1. The coordinates are looked up in the reverse geocoding cache
+   (``jobs.geocoding_cache.get_cached_address``), keyed by rounded
+   coordinates so nearby points share one provider call.
+2. On a miss, Nominatim is called once the shared "nominatim" token bucket
+   of ``jobs.geocoding.acquire_provider_token`` allows it, so every worker
+   and the forward geocoder stay within one request budget. The result is
+   cached. "No address here" is cached as well; timeouts and errors are not,
+   so they are retried.
+3. The address is written with a queryset ``update``, so ``save()`` (and its
+   signals) do not run again.
+
+Rows whose task was lost stay pending (empty address) and are picked up by
+``python manage.py backfill_location_addresses``.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from geopy.exc import GeocoderTimedOut
+from geopy.geocoders import Nominatim
+
+from jobs.geocoding import acquire_provider_token
+from jobs.geocoding_cache import cache_address, get_cached_address, get_reverse_cache_address
+
+logger = logging.getLogger(__name__)
+
+# Constants
+REVERSE_GEOCODE_TIMEOUT = getattr(settings, 'REVERSE_GEOCODE_TIMEOUT', 10)  # 10 seconds
+
+
+class ReverseGeocodingError(Exception):
+    """The provider could not be reached; the lookup should be retried later."""
+
+
+def pending_locations_filter() -> Q:
+    """Filter matching UserLocation rows that still need an address."""
+    return Q(address__isnull=True) | Q(address="")
+
+
+def _query_provider(latitude: float, longitude: float) -> Optional[str]:
+    if not acquire_provider_token("nominatim"):
+        raise ReverseGeocodingError("Nominatim rate limit reached")
+    try:
+        geolocator = Nominatim(user_agent="payshift-location-resolver", timeout=REVERSE_GEOCODE_TIMEOUT)
+        location = geolocator.reverse((latitude, longitude), exactly_one=True, language="en")
+    except GeocoderTimedOut as e:
+        raise ReverseGeocodingError("Geocoding service timed out") from e
+    except Exception as e:
+        raise ReverseGeocodingError(str(e)) from e
+    return location.address if location else None
+
+
+def reverse_geocode(latitude: float, longitude: float) -> Optional[str]:
+    """
+    Resolve coordinates to an address, going through the cache first.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+
+    Returns:
+        The address, or None if the provider has none for this point
+
+    Raises:
+        ReverseGeocodingError: If the provider could not be reached
+    """
+    cached = get_cached_address(latitude, longitude)
+    if cached is not None:
+        return cached.get("address")
+
+    address = _query_provider(latitude, longitude)
+    cache_address(latitude, longitude, address)
+    return address
+
+
+@shared_task(
+    name="userlocation.geocoding.enrich_location",
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def enrich_location(self, location_id: int) -> Optional[str]:
+    """
+    Fill in the address of a UserLocation that does not have one yet.
+
+    Provider errors are retried; rows still pending after the last retry are
+    left to the backfill command.
+
+    Args:
+        location_id: ID of the UserLocation
+
+    Returns:
+        The address written, or None if nothing was written
+    """
+    from userlocation.models import UserLocation
+
+    location = (
+        UserLocation.objects.filter(pending_locations_filter(), id=location_id)
+        .only("id", "latitude", "longitude")
+        .first()
+    )
+    if location is None or location.coordinates is None:
+        return None
+
+    try:
+        address = reverse_geocode(location.latitude, location.longitude)
+    except ReverseGeocodingError as e:
+        logger.warning(f"Reverse geocoding failed for location {location_id}: {str(e)}")
+        self.retry(exc=e)
+        return None
+
+    if address:
+        # Only fill rows that are still pending at the same coordinates
+        UserLocation.objects.filter(
+            pending_locations_filter(),
+            id=location_id,
+            latitude=location.latitude,
+            longitude=location.longitude,
+        ).update(address=address)
+    return address
+
+
+def enrich_locations(locations: Iterable) -> Dict[str, int]:
+    """
+    Fill in addresses for a batch of pending UserLocation rows.
+
+    Rows are grouped by their reverse geocoding cache cell first, so each
+    cell is resolved once however many rows fall into it.
+
+    Args:
+        locations: UserLocation instances with latitude and longitude loaded
+
+    Returns:
+        Counts of rows "enriched", "empty" (no address exists) and "failed"
+    """
+    from userlocation.models import UserLocation
+
+    cells = defaultdict(list)
+    for location in locations:
+        if location.coordinates is not None:
+            cells[get_reverse_cache_address(location.latitude, location.longitude)].append(location)
+
+    counts = {"enriched": 0, "empty": 0, "failed": 0}
+    for rows in cells.values():
+        try:
+            address = reverse_geocode(rows[0].latitude, rows[0].longitude)
+        except ReverseGeocodingError as e:
+            logger.warning(f"Reverse geocoding failed for {len(rows)} locations: {str(e)}")
+            counts["failed"] += len(rows)
+            continue
+
+        if not address:
+            counts["empty"] += len(rows)
+            continue
+        counts["enriched"] += UserLocation.objects.filter(
+            pending_locations_filter(), id__in=[row.id for row in rows]
+        ).update(address=address)
+    return counts
+
+
+def schedule_enrichment(location_id: int) -> None:
+    """Queue ``enrich_location`` once the current transaction commits."""
+    transaction.on_commit(lambda: _dispatch(location_id))
+
+
+def _dispatch(location_id: int) -> None:
+    try:
+        enrich_location.delay(location_id)
+    except Exception as e:
+        # The backfill command picks the row up later
+        logger.error(f"Failed to queue reverse geocoding for location {location_id}: {str(e)}")
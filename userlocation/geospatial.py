@@ -1,14 +1,15 @@
-import math
 from typing import Dict, List, Tuple
 
 from django.db.models import Avg, Count, QuerySet
 from django.utils import timezone
 
-from jobs.models import Application, Job, User, UserLocation
+from core.spatial_index import haversine_km, nearby
+from jobs.models import Application, Job, User
+from userlocation.models import UserLocation
 
 
 class GeospatialMatcher:
-    """Handles geospatial matching between jobs and applicants using Haversine formula."""
+    """Handles geospatial matching between jobs and applicants using the shared spatial index."""
 
     def __init__(self, max_distance_km: float = 10.0):
         self.max_distance_km = max_distance_km
@@ -18,15 +19,7 @@ class GeospatialMatcher:
         self, lat1: float, lon1: float, lat2: float, lon2: float
     ) -> float:
         """Calculate the Haversine distance between two points in kilometers."""
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
-        return self.earth_radius_km * c
+        return haversine_km(lat1, lon1, lat2, lon2)
 
     def find_nearby_applicants(
         self, job: Job, max_distance: float = None
@@ -38,38 +31,26 @@ class GeospatialMatcher:
         # Use provided max_distance or default
         max_distance = max_distance or self.max_distance_km
 
-        # Get all active applicants with their locations
-        applicants = Application.objects.filter(
-            status="active", is_online=True
-        ).select_related("applicant", "applicant__profile")
+        # Latest location of every active applicant, prefiltered by geohash cell
+        locations = UserLocation.objects.filter(
+            user__is_active=True, user__profile__role="applicant"
+        ).select_related("user__profile")
 
         nearby_applicants = []
-        for applicant in applicants:
-            # Get applicant's last known location
-            location = (
-                UserLocation.objects.filter(user=applicant.applicant)
-                .order_by("-last_location_update")
-                .first()
+        for location, distance in nearby(
+            locations, job.latitude, job.longitude, max_distance
+        ):
+            profile = location.user.profile
+            nearby_applicants.append(
+                {
+                    "applicant_id": location.user_id,
+                    "distance_km": round(distance, 2),
+                    "rating": profile.rating or 0,
+                    "is_premium": getattr(profile, "is_premium", False),
+                    "last_active": location.last_updated,
+                }
             )
 
-            if not location or not location.latitude or not location.longitude:
-                continue
-
-            distance = self.haversine_distance(
-                job.latitude, job.longitude, location.latitude, location.longitude
-            )
-
-            if distance <= max_distance:
-                nearby_applicants.append(
-                    {
-                        "applicant_id": applicant.applicant_id,
-                        "distance_km": round(distance, 2),
-                        "rating": applicant.applicant.profile.rating or 0,
-                        "is_premium": applicant.applicant.profile.is_premium,
-                        "last_active": location.last_location_update,
-                    }
-                )
-
         # Sort by distance, then by premium status, then by rating
         return sorted(
             nearby_applicants,
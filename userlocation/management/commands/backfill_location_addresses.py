@@ -0,0 +1,62 @@
+"""
+Management command to fill in missing UserLocation addresses.
+
+UserLocation.save queues reverse geocoding in the background; run this to
+enrich rows whose task was lost or failed, or rows created before that.
+Provider calls share the Nominatim rate limit with the background tasks
+(see jobs.geocoding.acquire_provider_token), and rows sharing a reverse
+geocoding cache cell cost a single lookup.
+"""
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from userlocation.geocoding import enrich_locations, pending_locations_filter
+from userlocation.models import UserLocation
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Reverse geocode UserLocation rows that have no address yet'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch_size', type=int, default=100, help='Rows loaded per batch')
+        parser.add_argument('--limit', type=int, help='Stop after this many rows')
+        parser.add_argument('--pause', type=float, default=0, help='Seconds to sleep between batches')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        limit = options.get('limit')
+        totals = {"enriched": 0, "empty": 0, "failed": 0}
+        seen = 0
+        last_id = 0
+
+        while limit is None or seen < limit:
+            size = batch_size if limit is None else min(batch_size, limit - seen)
+            batch = list(
+                UserLocation.objects.filter(pending_locations_filter(), id__gt=last_id)
+                .order_by('id')
+                .only('id', 'latitude', 'longitude')[:size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+            seen += len(batch)
+
+            counts = enrich_locations(batch)
+            for key, value in counts.items():
+                totals[key] += value
+            self.stdout.write(
+                f"Up to id {last_id}: {counts['enriched']} enriched, "
+                f"{counts['empty']} without address, {counts['failed']} failed"
+            )
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {seen} locations: {totals['enriched']} enriched, "
+            f"{totals['empty']} without address, {totals['failed']} failed"
+        ))
@@ -4,9 +4,8 @@ from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
-from geopy.exc import GeocoderTimedOut
-from geopy.geocoders import Nominatim
 
+from core.spatial_index import GEOHASH_MAX_LENGTH, geohash_or_blank
 from jobs.models import Job
 # RedisSyncMixin functionality is now part of RedisCachedModelMixin
 
@@ -109,6 +108,10 @@ class UserLocation(models.Model):
     address = models.TextField(
         blank=True, null=True, help_text="Full address from reverse geocoding"
     )
+    geohash = models.CharField(
+        max_length=GEOHASH_MAX_LENGTH, blank=True, default="", db_index=True,
+        help_text="Spatial index cell derived from latitude/longitude",
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     last_updated = models.DateTimeField(
         auto_now=True, db_index=True, verbose_name="Last Updated"
@@ -137,21 +140,20 @@ class UserLocation(models.Model):
         return None
 
     def reverse_geocode(self):
-        """Convert coordinates to human-readable address."""
+        """
+        Convert coordinates to human-readable address.
+
+        Blocks on the provider on a cache miss; saves use the background
+        enrichment in userlocation.geocoding instead.
+        """
+        from userlocation.geocoding import ReverseGeocodingError, reverse_geocode
+
         if not self.coordinates:
             return None
 
         try:
-            geolocator = Nominatim(user_agent="payshift-location-resolver", timeout=10)
-            location = geolocator.reverse(
-                self.coordinates, exactly_one=True, language="en"
-            )
-            return location.address if location else None
-        except GeocoderTimedOut:
-            # logger.warning("Geocoding service timed out")
-            return None
-        except Exception as e:
-            # logger.error(f"Geocoding error: {str(e)}")
+            return reverse_geocode(self.latitude, self.longitude)
+        except ReverseGeocodingError:
             return None
 
     @classmethod
@@ -178,11 +180,19 @@ class UserLocation(models.Model):
             ]
 
     def save(self, *args, **kwargs):
-        """Auto-populate address from coordinates if missing."""
-        if self.coordinates and not self.address:
-            self.address = self.reverse_geocode()
+        """Save, then fill in a missing address in the background."""
+        # Keep the spatial index cell in step with the coordinates
+        self.geohash = geohash_or_blank(self.latitude, self.longitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"}.intersection(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
         super().save(*args, **kwargs)
 
+        if self.coordinates and not self.address:
+            from userlocation.geocoding import schedule_enrichment
+
+            schedule_enrichment(self.pk)
+
     # to_dict method removed (was only for Redis caching)
 
 
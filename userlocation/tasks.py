@@ -0,0 +1,8 @@
+"""
+Celery tasks for the userlocation app.
+
+The tasks live next to the code they run; importing them here registers
+them with Celery's autodiscovery.
+"""
+
+from .geocoding import enrich_location  # noqa: F401
@@ -1,3 +1,80 @@
+"""
+Tests for background reverse geocoding of UserLocation.
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-# Create your tests here.
+from userlocation import geocoding
+from userlocation.geocoding import ReverseGeocodingError, enrich_location, enrich_locations, reverse_geocode
+from userlocation.models import UserLocation
+
+User = get_user_model()
+
+
+@patch("userlocation.geocoding.cache_address")
+@patch("userlocation.geocoding.get_cached_address", return_value=None)
+class ReverseGeocodingTests(TestCase):
+
+    def create_location(self, username, latitude, longitude):
+        user = User.objects.create_user(username=username, email=f"{username}@example.com", password="pass12345")
+        with patch("userlocation.geocoding._dispatch"):
+            return UserLocation.objects.create(user=user, latitude=latitude, longitude=longitude)
+
+    def test_save_does_not_call_the_provider(self, get_cached, cache_address):
+        user = User.objects.create_user(username="loc_save", email="loc_save@example.com", password="pass12345")
+        with patch("userlocation.geocoding._query_provider") as provider, \
+                patch("userlocation.geocoding._dispatch") as dispatch, \
+                self.captureOnCommitCallbacks(execute=True):
+            location = UserLocation.objects.create(user=user, latitude=6.5244, longitude=3.3792)
+
+        provider.assert_not_called()
+        dispatch.assert_called_once_with(location.id)
+        self.assertIsNone(location.address)
+
+    def test_enrich_location_fills_address(self, get_cached, cache_address):
+        location = self.create_location("loc_enrich", 6.5244, 3.3792)
+        with patch("userlocation.geocoding._query_provider", return_value="Ikeja, Lagos"):
+            self.assertEqual(enrich_location(location.id), "Ikeja, Lagos")
+
+        location.refresh_from_db()
+        self.assertEqual(location.address, "Ikeja, Lagos")
+        cache_address.assert_called_once_with(6.5244, 3.3792, "Ikeja, Lagos")
+
+    def test_nearby_points_share_one_lookup(self, get_cached, cache_address):
+        first = self.create_location("loc_a", 6.52441, 3.37921)
+        second = self.create_location("loc_b", 6.52443, 3.37919)  # Same 4-decimal cell
+        third = self.create_location("loc_c", 9.0765, 7.3986)
+
+        with patch("userlocation.geocoding._query_provider", side_effect=["Lagos", "Abuja"]) as provider:
+            counts = enrich_locations([first, second, third])
+
+        self.assertEqual(provider.call_count, 2)
+        self.assertEqual(counts, {"enriched": 3, "empty": 0, "failed": 0})
+
+    def test_provider_errors_leave_rows_pending(self, get_cached, cache_address):
+        location = self.create_location("loc_fail", 6.5244, 3.3792)
+        with patch("userlocation.geocoding._query_provider", side_effect=ReverseGeocodingError("timed out")):
+            counts = enrich_locations([location])
+
+        self.assertEqual(counts["failed"], 1)
+        cache_address.assert_not_called()
+        location.refresh_from_db()
+        self.assertIsNone(location.address)
+
+    def test_dispatch_queues_the_celery_task(self, get_cached, cache_address):
+        with patch.object(geocoding.enrich_location, "delay") as delay:
+            geocoding._dispatch(42)
+
+        delay.assert_called_once_with(42)
+
+    def test_provider_calls_share_the_nominatim_budget(self, get_cached, cache_address):
+        with patch("userlocation.geocoding.acquire_provider_token", return_value=False) as acquire, \
+                patch("userlocation.geocoding.Nominatim") as nominatim:
+            with self.assertRaises(ReverseGeocodingError):
+                reverse_geocode(6.5244, 3.3792)
+
+        acquire.assert_called_once_with("nominatim")
+        nominatim.assert_not_called()
+        cache_address.assert_not_called()